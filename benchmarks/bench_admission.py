@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Runaway agent flood: moves reaching the arm and stop latency, with and without admission.
+
+``--loops`` concurrent client loops post unwaited ``/move`` jogs as fast as they can for
+``--duration`` seconds against the bridge app (realtime Piper mock, in-process ASGI
+transport), while a monitor reads ``/status`` every 20 ms; at the end an operator posts
+``/stop`` into the flood. Without admission control every jog becomes a motion command to
+the arm; with the default limits the flood is cut to the client's bucket and the rest get
+429. The table shows the motion commands sent (the 200s), the answers the flood got, and
+the latency of the status reads and the stop that had to get through it.
+
+Usage:
+    python3 benchmarks/bench_admission.py [--loops 8] [--duration 2]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections import Counter
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+
+JOGS = ([0.05] + [0.0] * 5, [0.0] * 6)
+OFF = {"CLAWARM_CLIENT_RATE": "0", "CLAWARM_ARM_RATE": "0", "CLAWARM_QUEUE_DEPTH": "100000"}
+SCENARIOS = {"no admission control": OFF, "default limits": {}}
+
+
+async def flood(client: AsyncClient, deadline: float, codes: Counter) -> None:
+    i = 0
+    while time.monotonic() < deadline:
+        jog = {"mode": "J", "target": JOGS[i % 2], "wait": False}
+        codes[(await client.post("/move", json=jog)).status_code] += 1
+        i += 1
+
+
+async def timed(client: AsyncClient, method: str, path: str, **kwargs) -> float:
+    start = time.perf_counter()
+    await client.request(method, path, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+async def monitor(client: AsyncClient, deadline: float) -> list[float]:
+    latencies = []
+    while time.monotonic() < deadline:
+        latencies.append(await timed(client, "GET", "/status"))
+        await asyncio.sleep(0.02)
+    return latencies
+
+
+async def operator(client: AsyncClient, deadline: float) -> float:
+    await asyncio.sleep(deadline - time.monotonic() - 0.1)
+    return await timed(client, "POST", "/stop", json={"action": "disable"})
+
+
+async def run(label: str, env: dict, loops: int, duration: float) -> None:
+    for name in OFF:
+        os.environ.pop(name, None)
+    os.environ.update(env)
+    srv._manager, srv._admission = None, None
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        codes: Counter = Counter()
+        deadline = time.monotonic() + duration
+        *_, reads, stop = await asyncio.gather(
+            *(flood(c, deadline, codes) for _ in range(loops)),
+            monitor(c, deadline),
+            operator(c, deadline),
+        )
+        queue = (await c.get("/metrics")).json()["admission"]["queue"]
+        await c.post("/disconnect")
+
+    answers = ", ".join(f"{n} x {code}" for code, n in sorted(codes.items()))
+    print(f"{label}")
+    print(f"  motion commands sent: {codes[200] / duration:8.1f}/s  ({answers})")
+    print(f"  /status latency mean {statistics.fmean(reads):7.2f} ms  max {max(reads):7.2f} ms")
+    print(f"  /stop latency {stop:7.2f} ms")
+    print(f"  queue: max depth {queue['max_depth']}, wait p95 {queue['wait_p95_ms']} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args()
+    arm_manager.MODE_SWITCH_DELAY = 0
+    print(f"{args.loops} flooding loops for {args.duration:g}s")
+    for label, env in SCENARIOS.items():
+        await run(label, env, args.loops, args.duration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
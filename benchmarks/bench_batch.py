@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Agent intent latency: status → move → status as three requests vs one POST /batch.
+
+Runs against the bridge app on the in-process ASGI transport (mock driver) and adds
+``--rtt`` ms of simulated network round trip to every request. That stands in for the
+distance between the agent host and the bridge.
+
+Usage:
+    python3 benchmarks/bench_batch.py [--intents 50] [--rtt 0 2 20]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+
+TARGETS = ([0.2] + [0.0] * 5, [0.0] * 6)
+
+
+class Client:
+    def __init__(self, client: AsyncClient, rtt: float) -> None:
+        self.client, self.rtt, self.requests = client, rtt, 0
+
+    async def call(self, method: str, path: str, **kwargs):
+        self.requests += 1
+        await asyncio.sleep(self.rtt)
+        return (await self.client.request(method, path, **kwargs)).json()
+
+
+async def separate(c: Client, target: list[float]) -> None:
+    await c.call("GET", "/status")
+    await c.call("POST", "/move", json={"mode": "J", "target": target})
+    await c.call("GET", "/status")
+
+
+async def batched(c: Client, target: list[float]) -> None:
+    ops = [{"op": "status"}, {"op": "move", "mode": "J", "target": target}, {"op": "status"}]
+    result = await c.call("POST", "/batch", json={"ops": ops})
+    assert result["ok"], result
+
+
+async def run(intents: int, rtt: float) -> None:
+    srv._manager = None
+    strategies = (("3 requests", separate), ("POST /batch", batched))
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as hc:
+        await hc.post("/connect", json={"robot": "piper"})
+        clients = [Client(hc, rtt) for _ in strategies]
+        totals = [0.0] * len(strategies)
+        # Interleaved so both see the same move-duration calibration.
+        for i in range(intents):
+            for k, (_, intent) in enumerate(strategies):
+                start = time.perf_counter()
+                await intent(clients[k], TARGETS[(i * len(strategies) + k) % 2])
+                totals[k] += time.perf_counter() - start
+        for (label, _), c, total in zip(strategies, clients, totals):
+            print(f"  {label:>12}: {total / intents * 1e3:8.2f} ms per intent, "
+                  f"{c.requests / intents:.0f} request(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intents", type=int, default=50)
+    parser.add_argument("--rtt", type=float, nargs="+", default=[0.0, 2.0, 20.0])
+    args = parser.parse_args()
+    arm_manager.MODE_SWITCH_DELAY = 0
+    for rtt in args.rtt:
+        print(f"simulated RTT {rtt:g} ms")
+        asyncio.run(run(args.intents, rtt / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Cycle time of the pick-and-place path with and without corner blending.
+
+Runs against the realtime mock driver (motions take simulated time), comparing:
+
+* ``ArmManager.move(wait=True)`` per waypoint (the pre-sequence behaviour),
+* ``ArmManager.move_sequence`` stopping at every waypoint (``blend_radius=0``),
+* ``ArmManager.move_sequence`` with corner blending.
+
+Usage:
+    python3 benchmarks/bench_blending.py [--speed 30] [--blend 0.02]
+"""
+
+import argparse
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from bridge import arm_manager  # noqa: E402
+from bridge.arm_manager import ArmManager  # noqa: E402
+from bridge.models import MotionMode, MoveStep, RobotType  # noqa: E402
+
+APPROACH_HEIGHT = 0.35
+GRASP_HEIGHT = 0.15
+PICK_XY = (0.30, 0.10)
+PLACE_XY = (0.30, -0.10)
+ORIENTATION = (0.0, 3.14159, 0.0)
+
+
+def make_pose(x, y, z):
+    return [x, y, z, *ORIENTATION]
+
+
+PATH = [
+    make_pose(*PICK_XY, APPROACH_HEIGHT),
+    make_pose(*PICK_XY, GRASP_HEIGHT),
+    make_pose(*PICK_XY, APPROACH_HEIGHT),
+    make_pose(*PLACE_XY, APPROACH_HEIGHT),
+    make_pose(*PLACE_XY, GRASP_HEIGHT),
+    make_pose(*PLACE_XY, APPROACH_HEIGHT),
+]
+
+
+def _manager(speed: int) -> ArmManager:
+    mgr = ArmManager()
+    mgr.connect(RobotType.NERO)
+    mgr._driver.set_speed_percent(speed)
+    mgr.move(MotionMode.P, PATH[-1])
+    return mgr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speed", type=int, default=30)
+    parser.add_argument("--blend", type=float, default=0.02)
+    args = parser.parse_args()
+
+    arm_manager.MODE_SWITCH_DELAY = 0.0
+    mgr = _manager(args.speed)
+    steps = [MoveStep(mode=MotionMode.P, target=pose) for pose in PATH]
+
+    start = time.monotonic()
+    for pose in PATH:
+        mgr.move(MotionMode.P, pose, wait=True, timeout=10.0)
+    legacy = time.monotonic() - start
+
+    stopped = mgr.move_sequence(steps, blend_radius=0.0, timeout=10.0)
+    blended = mgr.move_sequence(steps, blend_radius=args.blend, timeout=10.0)
+
+    print(f"pick-and-place, {len(PATH)} waypoints, speed {args.speed}%")
+    print(f"  {'move(wait=True) per waypoint':32}: {legacy:7.3f} s")
+    print(f"  {'sequence, no blending':32}: {stopped['cycle_time']:7.3f} s")
+    label = f"sequence, blend {args.blend * 1000:.0f} mm"
+    print(
+        f"  {label:32}: {blended['cycle_time']:7.3f} s"
+        f"  ({blended['blended']} corners blended, "
+        f"{100 * (1 - blended['cycle_time'] / legacy):.0f}% faster than move(wait=True))"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Encode/decode time and payload size: Pydantic JSON vs the msgpack fast path.
+
+Measures the per-request codec work of ``GET /status`` (response encoding) and of
+``POST /move`` / ``POST /move/sequence`` (request decoding + validation).
+
+Usage:
+    python3 benchmarks/bench_codec.py [--waypoints 1000]
+"""
+
+import argparse
+import json
+import timeit
+
+import msgpack
+
+from bridge import codec
+from bridge.models import MoveRequest, MoveSequenceRequest, StatusResponse
+
+STATUS = {
+    "connected": True,
+    "enabled": True,
+    "robot_type": "nero",
+    "dof": 7,
+    "joint_angles": [0.1234567, -0.5, 1.0471975, -1.2, 0.5, -0.25, 0.0001],
+    "flange_pose": [0.312345, -0.1, 0.4567, 0.0, 3.14159, 0.001],
+    "motion_status": 0,
+}
+
+
+def _bench(label: str, fn, payload_size: int, number: int) -> None:
+    seconds = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:38} {seconds * 1e6:9.2f} us   {payload_size:8d} bytes")
+
+
+def _packed_status() -> bytes:
+    packed = dict(STATUS)
+    for key in ("joint_angles", "flange_pose"):
+        packed[key] = codec.pack_floats(packed[key])
+    return msgpack.packb(packed, use_bin_type=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--waypoints", type=int, default=1000)
+    args = parser.parse_args()
+
+    print("GET /status response encoding")
+    status_json = StatusResponse(**STATUS).model_dump_json().encode()
+    _bench("json  (StatusResponse)", lambda: StatusResponse(**STATUS).model_dump_json(),
+           len(status_json), 20000)
+    _bench("msgpack (packed arrays)", _packed_status, len(_packed_status()), 20000)
+
+    print("POST /move request decoding + validation")
+    move = {"mode": "J", "target": STATUS["joint_angles"], "speed_percent": 30}
+    move_json = json.dumps(move).encode()
+    move_packed = msgpack.packb({**move, "target": codec.pack_floats(move["target"])})
+    _bench("json  (MoveRequest.model_validate_json)",
+           lambda: MoveRequest.model_validate_json(move_json), len(move_json), 20000)
+    _bench("msgpack (codec.parse_move)",
+           lambda: codec.parse_move(msgpack.unpackb(move_packed)), len(move_packed), 20000)
+
+    print(f"POST /move/sequence request decoding + validation ({args.waypoints} waypoints)")
+    poses = [[0.3 + i * 1e-4, 0.1, 0.3, 0.0, 3.14159, 0.0] for i in range(args.waypoints)]
+    seq = {"steps": [{"mode": "L", "target": p} for p in poses], "blend_radius": 0.005}
+    seq_json = json.dumps(seq).encode()
+    seq_packed = msgpack.packb(
+        {**seq, "steps": [{"mode": "L", "target": codec.pack_floats(p)} for p in poses]}
+    )
+    _bench("json  (MoveSequenceRequest)",
+           lambda: MoveSequenceRequest.model_validate_json(seq_json), len(seq_json), 50)
+    _bench("msgpack (codec.parse_sequence, steps)",
+           lambda: codec.parse_sequence(msgpack.unpackb(seq_packed)), len(seq_packed), 50)
+    columnar = msgpack.packb({
+        "mode": "L",
+        "stride": 6,
+        "targets": codec.pack_floats([v for p in poses for v in p]),
+        "blend_radius": 0.005,
+    })
+    _bench("msgpack (codec.parse_sequence, packed)",
+           lambda: codec.parse_sequence(msgpack.unpackb(columnar)), len(columnar), 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Reading the status of a fleet: one request per bridge vs the gateway's fan-out.
+
+Starts ``--bridges`` mock-mode bridges and a ``clawarm-gateway`` in front of them, each a
+subprocess, and reads every arm's status ``--rounds`` times in three ways:
+
+- per bridge, new connection: the agent loops over the bridges and opens a connection for
+  each request (``urllib``);
+- per bridge, keep-alive: the same loop over pooled ``httpx`` connections;
+- gateway: one keep-alive ``GET /fleet/status``, which the gateway fans out concurrently
+  over its own pooled connections.
+
+Then it repeats with ``--hung`` more bridges that accept connections but never answer
+(hung hosts), read with a ``--timeout`` per bridge: once with ejection disabled, and once
+through a gateway that ejects after 2 failures and so stops waiting on them.
+
+Everything shares one machine, and on loopback a request costs about as much CPU as its
+round trip, so the healthy case shows the cost of the extra hop rather than the gain of
+fanning out over a real network.
+
+Usage:
+    python3 benchmarks/bench_gateway.py [--bridges 4] [--hung 2] [--rounds 50] [--timeout 0.5]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import httpx
+
+HOST = "127.0.0.1"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def spawn(code: str, *args: str, **env: str) -> subprocess.Popen:
+    env = dict(os.environ, **env)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    return subprocess.Popen([sys.executable, "-c", code, *args], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_up(url: str) -> None:
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not start")
+            time.sleep(0.2)
+
+
+def per_bridge_urllib(urls: list[str], timeout: float) -> None:
+    for url in urls:
+        try:
+            urllib.request.urlopen(f"{url}/status", timeout=timeout).read()
+        except OSError:
+            pass
+
+
+def per_bridge_pooled(client: httpx.Client, urls: list[str], timeout: float) -> None:
+    for url in urls:
+        try:
+            client.get(f"{url}/status", timeout=timeout)
+        except httpx.TimeoutException:
+            pass
+
+
+def timed(fn, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def measure(urls: list[str], gateway: str, rounds: int, timeout: float,
+            direct: bool) -> dict:
+    with httpx.Client() as client:
+        results = {}
+        if direct:
+            results["per bridge, new connection"] = timed(
+                lambda: per_bridge_urllib(urls, timeout), rounds
+            )
+            results["per bridge, keep-alive"] = timed(
+                lambda: per_bridge_pooled(client, urls, timeout), rounds
+            )
+        results["gateway /fleet/status"] = timed(
+            lambda: client.get(f"{gateway}/fleet/status", params={"timeout": timeout},
+                               timeout=timeout + 5),
+            rounds,
+        )
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bridges", type=int, default=4)
+    parser.add_argument("--hung", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    args = parser.parse_args()
+
+    ports = [free_port() for _ in range(args.bridges)]
+    urls = [f"http://{HOST}:{port}" for port in ports]
+    hung = [socket.socket() for _ in range(args.hung)]
+    for sock in hung:
+        sock.bind((HOST, 0))
+        sock.listen(64)
+    hung_urls = [f"http://{HOST}:{sock.getsockname()[1]}" for sock in hung]
+    procs = [spawn("from bridge.server import main; main()", CLAWARM_MOCK="true",
+                   CLAWARM_HOST=HOST, CLAWARM_PORT=str(port)) for port in ports]
+    gateways = {}
+    try:
+        for url in urls:
+            wait_up(f"{url}/")
+        configs = (
+            ("healthy", urls, "1000000"),
+            (f"{args.hung} hung", urls + hung_urls, "1000000"),
+            (f"{args.hung} hung, ejected after 2 failures", urls + hung_urls, "2"),
+        )
+        for label, fleet, eject_after in configs:
+            port = free_port()
+            bridges = [f"--bridge=arm{i}={url}" for i, url in enumerate(fleet)]
+            procs.append(spawn("from bridge.gateway import main; main()", *bridges,
+                               "--port", str(port), "--eject-after", eject_after))
+            gateways[label] = (fleet, f"http://{HOST}:{port}", eject_after == "1000000")
+            wait_up(f"http://{HOST}:{port}/fleet")
+
+        for label, (fleet, gateway, direct) in gateways.items():
+            rounds = args.rounds if label == "healthy" else max(args.rounds // 10, 3)
+            print(f"{len(fleet)} bridges, {label} (median of {rounds} fleet reads)")
+            for name, ms in measure(fleet, gateway, rounds, args.timeout, direct).items():
+                print(f"  {name:>27}: {ms:8.2f} ms")
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+        for sock in hung:
+            sock.close()
+
+
+if __name__ == "__main__":
+    main()
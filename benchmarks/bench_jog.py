@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Jogging: client-side read + absolute move vs a server-side relative move.
+
+Jogs the flange in 1 cm tool-frame steps against the bridge app on the in-process ASGI
+transport (mock driver), with ``--rtt`` ms of simulated network round trip per request.
+The client-side jog reads ``/status``, applies the offset locally and sends an absolute
+``/move``, then reads ``/status`` again to learn where the arm ended up. The relative
+jog sends one ``/move`` with ``relative: true``, and the final joints and pose come back
+in its response.
+
+Usage:
+    python3 benchmarks/bench_jog.py [--jogs 50] [--rtt 0 2 20]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+from bridge.frames import apply_offset  # noqa: E402
+from bridge.models import Frame  # noqa: E402
+
+START = [0.3, 0.0, 0.3, 0.0, 0.0, 0.0]
+STEPS = ([0.0, 0.0, 0.01, 0.0, 0.0, 0.0], [0.0, 0.0, -0.01, 0.0, 0.0, 0.0])
+
+
+class Client:
+    def __init__(self, client: AsyncClient, rtt: float) -> None:
+        self.client, self.rtt, self.requests = client, rtt, 0
+
+    async def call(self, method: str, path: str, **kwargs):
+        self.requests += 1
+        await asyncio.sleep(self.rtt)
+        return (await self.client.request(method, path, **kwargs)).json()
+
+
+async def client_side(c: Client, step: list[float]) -> None:
+    pose = (await c.call("GET", "/status"))["flange_pose"]
+    target = apply_offset(pose, step, Frame.TOOL)
+    await c.call("POST", "/move", json={"mode": "L", "target": target})
+    await c.call("GET", "/status")
+
+
+async def relative(c: Client, step: list[float]) -> None:
+    move = {"mode": "L", "target": step, "relative": True, "frame": "tool"}
+    result = await c.call("POST", "/move", json=move)
+    assert result["data"]["flange_pose"] is not None, result
+
+
+async def run(jogs: int, rtt: float) -> None:
+    srv._manager = None
+    strategies = (("read + move", client_side), ("relative", relative))
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as hc:
+        await hc.post("/connect", json={"robot": "piper"})
+        await hc.post("/move", json={"mode": "L", "target": START})
+        clients = [Client(hc, rtt) for _ in strategies]
+        totals = [0.0] * len(strategies)
+        # Interleaved so both see the same move-duration calibration.
+        for i in range(jogs):
+            for k, (_, jog) in enumerate(strategies):
+                start = time.perf_counter()
+                await jog(clients[k], STEPS[(i * len(strategies) + k) % 2])
+                totals[k] += time.perf_counter() - start
+        for (label, _), c, total in zip(strategies, clients, totals):
+            print(f"  {label:>12}: {total / jogs * 1e3:8.2f} ms per jog, "
+                  f"{c.requests / jogs:.0f} request(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jogs", type=int, default=50)
+    parser.add_argument("--rtt", type=float, nargs="+", default=[0.0, 2.0, 20.0])
+    args = parser.parse_args()
+    arm_manager.MODE_SWITCH_DELAY = 0
+    for rtt in args.rtt:
+        print(f"simulated RTT {rtt:g} ms")
+        asyncio.run(run(args.jogs, rtt / 1000))
+
+
+if __name__ == "__main__":
+    main()
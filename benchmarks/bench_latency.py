@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Per-stage command-to-motion latency of moves, polled vs feedback-stamped.
+
+Runs ``ArmManager`` with ``CanBusDriver`` against the scripted fake arm of the test suite
+(``tests/fake_can_arm.py``) on a python-can ``virtual`` bus. The fake arm starts moving as
+soon as the last frame of a command arrives and broadcasts status every ``--period``
+seconds, like the real arm's feedback stream.
+
+Each move is timed stage by stage (``bridge.latency``): validate, command, motion_start
+(driver call returned to the first status showing motion) and motion. It runs twice:
+
+- with the CAN frame timestamps (``CanBusDriver.status_time``), so motion start and finish
+  are the bus time of the first frame that showed them;
+- with ``status_time`` disabled, so they are the time of the status poll that saw them,
+  which adds the post-command delay and up to a poll interval.
+
+Prints the median and p95 of each stage and the mean cost of the timing itself per move.
+
+Usage:
+    python3 benchmarks/bench_latency.py [--moves 40] [--period 0.005]
+"""
+
+import argparse
+import statistics
+import time
+
+from bridge import arm_manager
+from bridge.drivers.can_driver import CanBusDriver
+from bridge.latency import STAGES, MoveTiming
+from bridge.models import MotionMode, RobotType
+from tests.fake_can_arm import FakeCanArm
+
+CHANNEL = "bench-latency"
+
+
+def run(moves: int, period: float, stamped: bool) -> dict[str, list[float]]:
+    arm = FakeCanArm(CHANNEL, motion_time=0.1, period=period)
+
+    def create_driver():
+        driver = CanBusDriver()
+        if not stamped:
+            driver.status_time = lambda: None
+        return driver
+
+    arm_manager._create_driver = create_driver
+    arm_manager.MODE_SWITCH_DELAY = 0
+    mgr = arm_manager.ArmManager()
+    mgr.connect(RobotType.PIPER, channel=CHANNEL, interface="virtual", adaptive=True)
+    stages: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    try:
+        for i in range(moves):
+            target = [0.05 * (i % 2), 0.0, 0.0, 0.0, 0.0, 0.0]
+            report = mgr.move(MotionMode.J, target, received=time.monotonic())
+            for stage, ms in report["latency"].items():
+                stages[stage].append(ms)
+    finally:
+        mgr.disconnect()
+        arm.close()
+    return stages
+
+
+def timing_cost(samples: int = 100000) -> float:
+    start = time.perf_counter()
+    for _ in range(samples):
+        timing = MoveTiming()
+        timing.validated = timing.returned = timing.moving = timing.finished = time.monotonic()
+        timing.stages()
+    return (time.perf_counter() - start) / samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=40)
+    parser.add_argument("--period", type=float, default=0.005)
+    args = parser.parse_args()
+
+    print(f"{args.moves} J moves on the fake CAN arm, feedback every {args.period * 1e3:g} ms")
+    print(f"  {'stage':>13}  {'stamped p50/p95 ms':>20}  {'polled p50/p95 ms':>20}")
+    stamped = run(args.moves, args.period, stamped=True)
+    polled = run(args.moves, args.period, stamped=False)
+    for stage in STAGES:
+        cells = []
+        for result in (stamped, polled):
+            values = sorted(result[stage])
+            p95 = values[int(0.95 * (len(values) - 1))]
+            cells.append(f"{statistics.median(values):9.2f} / {p95:8.2f}")
+        print(f"  {stage:>13}  {cells[0]:>20}  {cells[1]:>20}")
+    print(f"  timing bookkeeping: {timing_cost() * 1e6:.2f} us per move")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Per-call logging overhead on the driver hot path.
+
+Times ``MockArmDriver.move_j`` on the realtime mock (which only starts the simulated
+motion, so the call itself is cheap) under several logging setups:
+
+- logging off: the INFO record is never created (lower bound);
+- ``basicConfig``: what the bridge used before, a ``StreamHandler`` formatting and writing
+  on the calling thread;
+- stdlib ``QueueHandler``: writes off-thread, but still merges the arguments into the
+  message on the calling thread;
+- ``bridge.logs`` pipeline, without sampling and with the default rate per call site.
+
+Records go to ``--output`` (default ``/dev/null``, the cheapest possible sink; a terminal or
+a journald pipe makes the synchronous setups slower still). Each setup runs
+``--calls`` calls in a tight loop, like a servo loop would.
+
+Usage:
+    python3 benchmarks/bench_logs.py [--calls 20000] [--output /dev/null]
+"""
+
+import argparse
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+from bridge import logs
+from bridge.drivers.mock_driver import MockArmDriver
+
+TARGETS = [[0.001 * i, 0.2, -0.3, 0.0, 0.5, 0.0] for i in range(100)]
+
+
+def _reset_root() -> logging.Logger:
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    return root
+
+
+def _time_calls(driver: MockArmDriver, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        driver.move_j(TARGETS[i % len(TARGETS)])
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--output", default=os.devnull)
+    args = parser.parse_args()
+
+    driver = MockArmDriver(realtime=True)
+    driver.connect("piper", "can0", "socketcan")
+    sink = open(args.output, "w")
+    formatter = logging.Formatter(logs.TEXT_FORMAT)
+    results = {}
+
+    root = _reset_root()
+    root.setLevel(logging.WARNING)
+    results["logging off"] = _time_calls(driver, args.calls)
+
+    root.setLevel(logging.INFO)
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(formatter)
+    root.addHandler(handler)
+    results["basicConfig (sync)"] = _time_calls(driver, args.calls)
+
+    root = _reset_root()
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(records, handler)
+    listener.start()
+    root.addHandler(QueueHandler(records))
+    results["stdlib QueueHandler"] = _time_calls(driver, args.calls)
+    listener.stop()
+
+    _reset_root()
+    logs.install(fmt="json", rate=0, stream=sink)
+    results["pipeline, no sampling"] = _time_calls(driver, args.calls)
+    logs.flush()
+
+    _reset_root()
+    logs.install(fmt="json", stream=sink)
+    results[f"pipeline, {logs.DEFAULT_RATE:g}/s per site"] = _time_calls(driver, args.calls)
+    logs.flush()
+    _reset_root()
+
+    base = results["logging off"]
+    print(f"move_j on the realtime mock, {args.calls} calls, output {args.output}")
+    for label, per_call in results.items():
+        print(f"  {label:>28}: {per_call * 1e6:7.2f} us/call "
+              f"(logging {max(per_call - base, 0.0) * 1e6:6.2f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Waiting for an unwaited move: polling GET /status vs long-polling /motions/{id}/wait.
+
+Sends ``wait=false`` joint moves to the bridge app (realtime Piper mock, in-process ASGI
+transport) and waits for each to finish two ways. One is a client loop polling ``/status``
+every ``--interval`` ms until ``motion_status`` is 0 and the joints have arrived. The other
+is a single ``GET /motions/{id}/wait``. The table shows how late each noticed the end of the
+simulated motion and how many HTTP requests it took.
+
+Usage:
+    python3 benchmarks/bench_motion_wait.py [--moves 5] [--interval 20]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+
+TARGETS = ([0.3] + [0.0] * 5, [0.0] * 6)
+
+
+async def poll_status(client: AsyncClient, target: list[float], interval: float) -> int:
+    requests = 0
+    while True:
+        status = (await client.get("/status")).json()
+        requests += 1
+        arrived = all(abs(a - b) < 1e-6 for a, b in zip(status["joint_angles"], target))
+        if status["motion_status"] == 0 and arrived:
+            return requests
+        await asyncio.sleep(interval)
+
+
+async def run(moves: int, interval: float) -> None:
+    arm_manager.MODE_SWITCH_DELAY = 0
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        driver = srv._get_manager()._driver
+        results = {"poll /status": [], "/motions/{id}/wait": []}
+        for i in range(moves * 2):
+            target = TARGETS[i % 2]
+            resp = await c.post("/move", json={"mode": "J", "target": target, "wait": False})
+            end = driver._move_start + driver._move_duration
+            if i % 2 == 0:
+                requests = await poll_status(c, target, interval)
+                label = "poll /status"
+            else:
+                motion_id = resp.json()["data"]["motion_id"]
+                await c.get(f"/motions/{motion_id}/wait", params={"timeout": 10})
+                requests, label = 1, "/motions/{id}/wait"
+            results[label].append((time.monotonic() - end, requests))
+
+    print(f"{'strategy':>20} {'late (mean)':>12} {'requests (mean)':>16}")
+    for label, rows in results.items():
+        late = sum(r[0] for r in rows) / len(rows)
+        requests = sum(r[1] for r in rows) / len(rows)
+        print(f"{label:>20} {late * 1e3:>10.1f}ms {requests:>16.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=5, help="moves per strategy")
+    parser.add_argument("--interval", type=float, default=20.0, help="ms between /status polls")
+    args = parser.parse_args()
+    asyncio.run(run(args.moves, args.interval / 1000))
+
+
+if __name__ == "__main__":
+    main()
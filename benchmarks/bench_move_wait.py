@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Completion-detection latency and poll count: fixed 0.5 s + 100 ms grid vs adaptive waits.
+
+Runs joint moves of increasing size on the realtime mock (Piper, 30% speed) and measures,
+for each wait strategy, how long after the simulated motion actually ended the bridge
+noticed, and how many status polls it took.
+
+Usage:
+    python3 benchmarks/bench_move_wait.py
+"""
+
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from bridge import arm_manager  # noqa: E402
+from bridge.arm_manager import ArmManager  # noqa: E402
+from bridge.models import MotionMode, RobotType  # noqa: E402
+
+MOVES = (0.05, 0.2, 0.5, 1.0)
+SPEED = 30
+
+
+def fixed_grid_wait(driver, timeout: float = 3.0) -> bool:
+    """The previous strategy: sleep 0.5 s, then poll every 100 ms."""
+    time.sleep(0.5)
+    start = time.monotonic()
+    while True:
+        if driver.get_motion_status() == 0:
+            return True
+        if time.monotonic() - start > timeout:
+            return False
+        time.sleep(0.1)
+
+
+def main() -> None:
+    arm_manager.MODE_SWITCH_DELAY = 0
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    driver = mgr._driver
+    polls = []
+    original = driver.get_motion_status
+    driver.get_motion_status = lambda: polls.append(1) or original()
+
+    print(f"{'move rad':>8} {'motion':>7} {'fixed: late':>12} {'polls':>6} "
+          f"{'adaptive: late':>15} {'polls':>6} {'timeout':>8}")
+    for delta in MOVES:
+        target = [delta] + [0.0] * 5
+
+        mgr.move(MotionMode.J, [0.0] * 6, speed_percent=SPEED)
+        driver.set_speed_percent(SPEED)
+        polls.clear()
+        driver.move_j(target)
+        motion_end = driver._move_start + driver._move_duration
+        fixed_grid_wait(driver)
+        fixed_late, fixed_polls = time.monotonic() - motion_end, len(polls)
+
+        mgr.move(MotionMode.J, [0.0] * 6, speed_percent=SPEED)
+        polls.clear()
+        report = mgr.move(MotionMode.J, target, speed_percent=SPEED)
+        motion_end = driver._move_start + driver._move_duration
+        adaptive_late = time.monotonic() - motion_end
+
+        print(
+            f"{delta:>8.2f} {driver._move_duration:>6.2f}s {fixed_late * 1e3:>10.0f}ms "
+            f"{fixed_polls:>6} {adaptive_late * 1e3:>13.0f}ms {len(polls):>6} "
+            f"{report['timeout']:>7.2f}s"
+        )
+    mgr.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Reachability maps: build time per worker count, load time, and lookup cost.
+
+Builds the Piper map with ``--samples`` joint configurations using 1 and ``--workers``
+processes (the speed-up is bounded by the CPU count printed first), saves it, and times
+memory-mapping it back. Then compares the per-point cost of a map lookup with the existing
+workspace-box check, and reports how many positions inside the default workspace box the
+arm cannot actually reach, i.e. what the box alone lets through.
+
+Usage:
+    python3 benchmarks/bench_reachability.py [--samples 500000] [--workers 4]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from bridge.models import MotionMode, RobotType
+from bridge.reachability import DEFAULT_VOXEL, ReachabilityMap, build_map, save_map
+from bridge.safety import SafetyConfig, SafetyValidator, WorkspaceBounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    robot = RobotType.PIPER
+    print(f"{os.cpu_count()} CPU(s), {args.samples} samples, {DEFAULT_VOXEL * 100:g} cm voxels")
+
+    for workers in sorted({1, args.workers}):
+        start = time.perf_counter()
+        grid, meta = build_map(robot, args.samples, workers=workers)
+        print(f"  build, {workers} worker(s): {time.perf_counter() - start:6.2f} s "
+              f"({meta['reachable_voxels']} of {grid.size} voxels reachable)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = save_map(directory, grid, meta)
+        start = time.perf_counter()
+        rmap = ReachabilityMap.load(path)
+        print(f"  mmap load: {(time.perf_counter() - start) * 1e3:.2f} ms "
+              f"({grid.nbytes / 1e6:.1f} MB on disk)")
+
+        box = WorkspaceBounds()
+        lo = np.array([box.x_min, box.y_min, box.z_min])
+        hi = np.array([box.x_max, box.y_max, box.z_max])
+        points = np.random.default_rng(0).uniform(lo, hi, size=(args.lookups, 3))
+        poses = [[*p, 0.0, np.pi, 0.0] for p in points.tolist()]
+
+        plain = SafetyValidator(SafetyConfig())
+        start = time.perf_counter()
+        for pose in poses:
+            plain.validate_cartesian_move(pose)
+        box_us = (time.perf_counter() - start) / len(poses) * 1e6
+
+        start = time.perf_counter()
+        for p in points:
+            rmap.lookup(p)
+        lookup_us = (time.perf_counter() - start) / len(points) * 1e6
+
+        start = time.perf_counter()
+        values = rmap.lookup_many(points)
+        batch_us = (time.perf_counter() - start) / len(points) * 1e6
+
+        mapped = SafetyValidator(SafetyConfig(reachability={robot: rmap}))
+        reachable = [pose for pose, value in zip(poses, values) if value >= 0]
+        start = time.perf_counter()
+        for pose in reachable:
+            mapped.validate_move(robot, MotionMode.P, pose)
+        checked_us = (time.perf_counter() - start) / len(reachable) * 1e6
+        print(f"  per point: box check {box_us:.2f} us, map lookup {lookup_us:.2f} us, "
+              f"batched lookup {batch_us:.3f} us, full P validation with map {checked_us:.2f} us")
+        print(f"  inside the workspace box but unreachable: {(values < 0).mean():.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Example scripts: fixed sleeps and 100 ms polling vs ``clawarm.runtime`` waits.
+
+Runs each script in ``examples/`` twice on the realtime mock, where moves take simulated
+time. The first run uses the hand-written version from before ``clawarm.runtime``,
+fetched from git at ``--legacy-rev``. It connects with 1 s sleeps around the mode switch,
+sleeps 0.5 s after every move and then polls every 100 ms. It talks to an SDK-shaped
+stand-in for ``pyAgxArm`` over the same mock. The second run uses the current script,
+which imports ``clawarm.runtime``. Reports wall-clock time per script, how much of it
+the simulated arm spent idle, and how many moves were cut short because the script sent
+the next command before the previous motion had finished.
+
+Usage:
+    python3 benchmarks/bench_runtime.py [--repeats 3] [--legacy-rev 286eb9e]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import runpy
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from bridge.drivers.mock_driver import MockArmDriver  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES = ("hello_arm.py", "pick_and_place.py", "draw_circle.py")
+
+
+class _Msg:
+    def __init__(self, msg) -> None:
+        self.msg = msg
+
+
+class MockSdkArm:
+    """The slice of the pyAgxArm arm API the legacy examples use, over the mock driver."""
+
+    MOTION_MODE = types.SimpleNamespace(J="J", JS="JS", P="P", L="L", C="C")
+
+    def __init__(self, cfg: dict) -> None:
+        self._cfg = cfg
+        self._driver = MockArmDriver(realtime=True)
+
+    def connect(self) -> None:
+        self._driver.connect(self._cfg["robot"], self._cfg["channel"], self._cfg["interface"])
+
+    def __getattr__(self, name: str):
+        return getattr(self._driver, name)
+
+    def get_arm_status(self):
+        return _Msg(types.SimpleNamespace(motion_status=self._driver.get_motion_status()))
+
+    def get_joint_angles(self):
+        return _Msg(self._driver.get_joint_angles())
+
+    def get_flange_pose(self):
+        return _Msg(self._driver.get_flange_pose())
+
+
+def _install_sdk_stub() -> None:
+    sdk = types.ModuleType("pyAgxArm")
+    sdk.create_agx_arm_config = lambda **cfg: cfg
+    sdk.AgxArmFactory = types.SimpleNamespace(create_arm=MockSdkArm)
+    sys.modules["pyAgxArm"] = sdk
+
+
+class MotionLog:
+    """Counts simulated motion time and preempted moves on every realtime mock driver."""
+
+    def __init__(self) -> None:
+        self.motion = 0.0
+        self.cut_short = 0
+        start_motion = MockArmDriver._start_motion
+
+        def recording(driver, joints, target):
+            driver._advance()
+            if driver._motion_status != 0:  # still moving: the rest of that motion is dropped
+                self.cut_short += 1
+                self.motion -= driver._move_duration - (time.monotonic() - driver._move_start)
+            start_motion(driver, joints, target)
+            self.motion += driver._move_duration
+
+        MockArmDriver._start_motion = recording
+
+
+def _legacy_source(name: str, rev: str) -> str:
+    return subprocess.run(
+        ["git", "show", f"{rev}:examples/{name}"], cwd=ROOT, check=True,
+        capture_output=True, text=True,
+    ).stdout
+
+
+def _timed(run, log: MotionLog) -> tuple[float, float, int]:
+    """Wall-clock seconds, idle seconds and moves cut short for one run."""
+    argv = sys.argv
+    sys.argv = ["example"]
+    log.motion, log.cut_short = 0.0, 0
+    try:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+        wall = time.perf_counter() - start
+        return wall, wall - log.motion, log.cut_short
+    finally:
+        sys.argv = argv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--legacy-rev", default="286eb9e",
+                        help="git revision with the pre-runtime examples")
+    args = parser.parse_args()
+    _install_sdk_stub()
+    log = MotionLog()
+
+    print(f"{'':>18} {'------- legacy -------':>23}  {'------- runtime ------':>23}")
+    print(f"{'script':>18} {'wall s':>7} {'idle s':>7} {'cut':>7}  {'wall s':>7} {'idle s':>7} "
+          f"{'cut':>7}")
+    for name in EXAMPLES:
+        code = compile(_legacy_source(name, args.legacy_rev), name, "exec")
+        path = str(ROOT / "examples" / name)
+        runs = {"legacy": [], "runtime": []}
+        for _ in range(args.repeats):
+            runs["legacy"].append(_timed(lambda: exec(code, {"__name__": "__main__"}), log))
+            runs["runtime"].append(_timed(lambda: runpy.run_path(path, run_name="__main__"), log))
+        cells = []
+        for results in runs.values():
+            wall, idle, cut = (sum(column) / args.repeats for column in zip(*results))
+            cells.append(f"{wall:>7.2f} {idle:>7.2f} {cut:>7.0f}")
+        print(f"{name:>18} {cells[0]}  {cells[1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Running a generated script: standalone (own connection) vs inside the bridge.
+
+The script makes three short joint moves with ``clawarm.runtime``. Three runs are compared
+on the realtime mock:
+
+- standalone, fixed delays: its own connection with the 1 s sleeps around the mode
+  switch that scripts used to paste (``ArmManager.connect`` without ``adaptive``);
+- standalone, runtime: its own connection through ``runtime.connect`` (adaptive);
+- ``POST /scripts/run``: sent to a bridge that is already connected (in-process ASGI
+  transport), with the response streamed back.
+
+For each, reports the time until the first motion command reaches the driver and the
+total wall-clock time. On hardware the standalone runs also pay for opening the CAN
+channel, and they cannot run at all while the bridge holds it.
+
+Usage:
+    python3 benchmarks/bench_scripts.py [--repeats 5]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import server as srv  # noqa: E402
+from bridge.arm_manager import manager_from_env  # noqa: E402
+from bridge.drivers.mock_driver import MockArmDriver  # noqa: E402
+from bridge.models import RobotType  # noqa: E402
+from bridge.scripts import check_script  # noqa: E402
+from clawarm import runtime  # noqa: E402
+
+SCRIPT = """\
+from clawarm import runtime
+
+with runtime.connect("piper", speed=80) as arm:
+    for angle in (0.1, -0.1, 0.0):
+        arm.move_j([angle] + [0.0] * (arm.dof - 1))
+"""
+
+first_command: list[float] = []
+_start_motion = MockArmDriver._start_motion
+
+
+def _recording(driver, joints, target):
+    first_command.append(time.perf_counter())
+    _start_motion(driver, joints, target)
+
+
+MockArmDriver._start_motion = _recording
+
+
+def fixed_delays() -> None:
+    mgr = manager_from_env()
+    mgr.connect(RobotType.PIPER)
+    arm = runtime.Arm(mgr)
+    arm.set_speed(80)
+    with arm:
+        for angle in (0.1, -0.1, 0.0):
+            arm.move_j([angle] + [0.0] * (arm.dof - 1))
+
+
+def standalone() -> None:
+    exec(check_script(SCRIPT), {"__name__": "__main__"})
+
+
+async def in_bridge(client: AsyncClient) -> None:
+    resp = await client.post("/scripts/run", json={"source": SCRIPT})
+    assert '"ok": true' in resp.text, resp.text
+
+
+def _time(run) -> tuple[float, float]:
+    first_command.clear()
+    start = time.perf_counter()
+    run()
+    return first_command[0] - start, time.perf_counter() - start
+
+
+async def main_async(repeats: int) -> None:
+    results: dict[str, list[tuple[float, float]]] = {
+        "standalone, fixed delays": [], "standalone, runtime": [], "POST /scripts/run": [],
+    }
+    srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        for _ in range(repeats):
+            results["standalone, fixed delays"].append(_time(fixed_delays))
+            results["standalone, runtime"].append(_time(standalone))
+            first_command.clear()
+            start = time.perf_counter()
+            await in_bridge(c)
+            results["POST /scripts/run"].append(
+                (first_command[0] - start, time.perf_counter() - start)
+            )
+    for label, runs in results.items():
+        setup = sum(r[0] for r in runs) / repeats
+        total = sum(r[1] for r in runs) / repeats
+        print(f"  {label:>25}: first command after {setup * 1e3:7.1f} ms, "
+              f"total {total * 1e3:7.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Self-collision check throughput: batched numpy capsule model vs one call per configuration.
+
+Usage:
+    python3 benchmarks/bench_self_collision.py [--robot nero]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bridge.kinematics import ARM_MODELS
+from bridge.models import RobotType
+
+BATCHES = (1, 100, 1000, 10000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--robot", default="nero", choices=[r.value for r in RobotType])
+    args = parser.parse_args()
+
+    model = ARM_MODELS[RobotType(args.robot)]
+    rng = np.random.default_rng(0)
+    print(f"{args.robot}: {len(model.capsules)} capsules, {len(model.pairs)} pairs checked")
+    print(f"{'configs':>8} {'batched':>10} {'per config':>11} {'one by one':>11}")
+    for n in BATCHES:
+        q = rng.uniform(-2.0, 2.0, (n, model.dof))
+        start = time.perf_counter()
+        model.self_collisions(q)
+        batched = time.perf_counter() - start
+
+        loop_n = min(n, 1000)
+        start = time.perf_counter()
+        for row in q[:loop_n]:
+            model.self_collisions(row[None])
+        single = (time.perf_counter() - start) / loop_n
+
+        print(f"{n:>8} {batched * 1e3:>8.2f}ms {batched / n * 1e6:>9.2f}us {single * 1e6:>9.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Drawing shapes: per-segment /move calls from the client vs one POST /shapes.
+
+Draws a circle, a 3-turn spiral, a rounded rectangle and a small raster fill against the
+bridge app on the in-process ASGI transport (mock driver), with ``--rtt`` ms of simulated
+network round trip per request. The client-side strategy sends the compiled segments one
+``/move`` at a time, like ``examples/draw_circle.py`` does by hand. That is a lower bound
+for a real client, which would also have to do the geometry. The other strategy sends the
+shape parameters once. Also reports how long compiling the shapes takes.
+
+Usage:
+    python3 benchmarks/bench_shapes.py [--repeats 5] [--rtt 0 2 20]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+from bridge.shapes import compile_shapes  # noqa: E402
+
+PLANE = {"origin": [0.0, 0.0, 0.25], "rotation": [0.0, 0.0, 0.0]}
+SHAPES = [
+    {"kind": "circle", "center": [0.3, 0.0], "radius": 0.05, "start_angle": 0.0,
+     "clockwise": False},
+    {"kind": "spiral", "center": [0.3, 0.0], "start_radius": 0.01, "end_radius": 0.06,
+     "turns": 3.0, "start_angle": 0.0, "clockwise": False},
+    {"kind": "polyline", "points": [[0.22, -0.06], [0.38, -0.06], [0.38, 0.06], [0.22, 0.06]],
+     "corner_radius": 0.01, "closed": True},
+    {"kind": "raster", "corner": [0.25, -0.03], "width": 0.1, "height": 0.06, "spacing": 0.01,
+     "angle": 0.0},
+]
+
+
+class Client:
+    def __init__(self, client: AsyncClient, rtt: float) -> None:
+        self.client, self.rtt, self.requests = client, rtt, 0
+
+    async def call(self, method: str, path: str, **kwargs):
+        self.requests += 1
+        await asyncio.sleep(self.rtt)
+        return (await self.client.request(method, path, **kwargs)).json()
+
+
+async def per_segment(c: Client) -> None:
+    steps, _ = compile_shapes(SHAPES, PLANE["origin"], PLANE["rotation"])
+    for step in steps:
+        move = {"mode": step.mode.value, "target": step.target}
+        if step.mid_point is not None:
+            move.update(mid_point=step.mid_point, end_point=step.end_point)
+        result = await c.call("POST", "/move", json=move)
+        assert result["ok"], result
+
+
+async def one_request(c: Client) -> None:
+    result = await c.call("POST", "/shapes", json={"shapes": SHAPES, "plane": PLANE})
+    assert result["ok"] and result["data"]["completed"], result
+
+
+async def run(repeats: int, rtt: float) -> None:
+    srv._manager = None
+    strategies = (("per-segment /move", per_segment), ("POST /shapes", one_request))
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as hc:
+        await hc.post("/connect", json={"robot": "piper"})
+        clients = [Client(hc, rtt) for _ in strategies]
+        totals = [0.0] * len(strategies)
+        # Interleaved so both see the same move-duration calibration.
+        for _ in range(repeats):
+            for k, (_, draw) in enumerate(strategies):
+                start = time.perf_counter()
+                await draw(clients[k])
+                totals[k] += time.perf_counter() - start
+        for (label, _), c, total in zip(strategies, clients, totals):
+            print(f"  {label:>18}: {total / repeats * 1e3:8.1f} ms per drawing, "
+                  f"{c.requests / repeats:.0f} request(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--rtt", type=float, nargs="+", default=[0.0, 2.0, 20.0])
+    args = parser.parse_args()
+    arm_manager.MODE_SWITCH_DELAY = 0
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        steps, summary = compile_shapes(SHAPES, PLANE["origin"], PLANE["rotation"])
+    per_compile = (time.perf_counter() - start) / rounds
+    parts = ", ".join(f"{s['kind']}: {s['lines']}L {s['arcs']}C" for s in summary["shapes"])
+    print(f"{len(SHAPES)} shapes -> {summary['segments']} segments ({parts}), "
+          f"compiled in {per_compile * 1e3:.2f} ms")
+    for rtt in args.rtt:
+        print(f"simulated RTT {rtt:g} ms")
+        asyncio.run(run(args.repeats, rtt / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""RDP simplification of dense Cartesian paths: compression, error, cost and cycle time.
+
+Builds a hand-drawn-style path (a spiral with sub-millimeter jitter, orientation held
+pointing down with a slow twist) and simplifies it at several tolerances. Reports the
+compression ratio, the max position / orientation error, and how long the simplification
+takes. Then runs the first ``--execute`` poses as a ``/move/sequence`` of L moves on the
+realtime mock, with and without ``simplify_tolerance``, and compares commands sent and
+cycle time.
+
+Usage:
+    python3 benchmarks/bench_simplify.py [--points 1000 10000] [--execute 200]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from bridge import arm_manager  # noqa: E402
+from bridge.models import MotionMode, RobotType  # noqa: E402
+from bridge.sequence import Step  # noqa: E402
+from bridge.simplify import simplify_path  # noqa: E402
+
+TOLERANCES = (0.0001, 0.0005, 0.001, 0.002)  # meters
+ORIENTATION_TOLERANCE = 0.01  # radians
+
+
+def drawn_spiral(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0.0, 1.0, n)
+    theta = 6 * np.pi * t
+    radius = 0.02 + 0.04 * t
+    poses = np.column_stack([
+        0.3 + radius * np.cos(theta),
+        radius * np.sin(theta),
+        np.full(n, 0.25),
+        np.zeros(n),
+        np.full(n, np.pi),
+        0.2 * t,  # slow twist about the tool axis
+    ])
+    poses[:, :3] += rng.normal(0.0, 0.00005, size=(n, 3))
+    return poses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--execute", type=int, default=200, help="poses to run on the mock")
+    args = parser.parse_args()
+
+    print(f"{'points':>7} {'tol mm':>7} {'kept':>6} {'ratio':>7} {'max err mm':>11} "
+          f"{'max rot mrad':>13} {'time ms':>8}")
+    for n in args.points:
+        poses = drawn_spiral(n)
+        for tolerance in TOLERANCES:
+            start = time.perf_counter()
+            result = simplify_path(poses, tolerance, ORIENTATION_TOLERANCE)
+            elapsed = time.perf_counter() - start
+            print(f"{n:>7} {tolerance * 1e3:>7.1f} {len(result.keep):>6} "
+                  f"{result.compression_ratio:>7.1f} {result.max_error * 1e3:>11.3f} "
+                  f"{result.max_orientation_error * 1e3:>13.2f} {elapsed * 1e3:>8.2f}")
+
+    arm_manager.MODE_SWITCH_DELAY = 0
+    mgr = arm_manager.ArmManager()
+    mgr.connect(RobotType.PIPER)
+    mgr.set_speed(80)
+    poses = drawn_spiral(args.execute)
+    steps = [Step(MotionMode.L, pose) for pose in poses.tolist()]
+    print(f"\nexecuting {args.execute} L waypoints (realtime mock)")
+    for tolerance in (0.0, 0.0005):
+        mgr.move(MotionMode.L, poses[0].tolist())
+        result = mgr.move_sequence(steps, timeout=5.0, simplify_tolerance=tolerance,
+                                   orientation_tolerance=ORIENTATION_TOLERANCE)
+        label = "every waypoint" if tolerance == 0 else f"tol {tolerance * 1e3:g} mm"
+        print(f"  {label:>15}: {result['steps']:>4} commands, "
+              f"cycle time {result['cycle_time']:.3f}s")
+    mgr.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Dry-running a sequence: POST /simulate vs running it on the realtime mock.
+
+Sends the same pick-and-place style sequence (joint moves, a point move, an L run with
+blended corners and an arc) to a connected bridge over the in-process ASGI transport:
+
+- ``POST /move/sequence`` on the realtime mock, the only dry run available before: it
+  takes as long as the motion;
+- ``POST /simulate``, which predicts the timeline without moving the arm.
+
+Reports the wall-clock time of each request, the cycle time each one reports, and how
+many safety violations the simulation finds in a variant with two bad steps (the real run
+stops at the first). The mock moves at its own fixed speeds, so its cycle time is not the
+hardware's; the simulation uses the calibrated hardware profiles.
+
+Usage:
+    python3 benchmarks/bench_simulate.py [--repeats 20]
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import statistics
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+
+DOWN = [0.0, math.pi, 0.0]
+SEQUENCE = [
+    {"mode": "J", "target": [0.3, 0.2, 0.0, 0.0, 0.0, 0.0]},
+    {"mode": "P", "target": [0.3, 0.0, 0.3, *DOWN]},
+    {"mode": "L", "target": [0.3, 0.1, 0.3, *DOWN]},
+    {"mode": "L", "target": [0.2, 0.1, 0.3, *DOWN]},
+    {"mode": "L", "target": [0.2, 0.0, 0.3, *DOWN]},
+    {"mode": "C", "target": [0.2, 0.0, 0.3, *DOWN], "mid_point": [0.25, 0.05, 0.3, *DOWN],
+     "end_point": [0.3, 0.0, 0.3, *DOWN]},
+    {"mode": "J", "target": [0.0] * 6},
+]
+UNSAFE = SEQUENCE[:2] + [{"mode": "L", "target": [1.5, 0.1, 0.3, *DOWN]}] + SEQUENCE[3:6] + [
+    {"mode": "J", "target": [9.0, 0.0, 0.0, 0.0, 0.0, 0.0]},
+]
+PAYLOAD = {"steps": SEQUENCE, "blend_radius": 0.02, "timeout": 10.0}
+
+
+async def _timed(client: AsyncClient, path: str, payload: dict) -> tuple[float, dict]:
+    start = time.perf_counter()
+    resp = await client.post(path, json=payload)
+    return time.perf_counter() - start, resp.json()
+
+
+async def main_async(repeats: int) -> None:
+    arm_manager.MODE_SWITCH_DELAY = 0
+    srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        await c.post("/move", json={"mode": "J", "target": [0.0] * 6})
+
+        wall, body = await _timed(c, "/move/sequence", PAYLOAD)
+        print(f"  /move/sequence (mock): {wall * 1e3:9.1f} ms wall, "
+              f"cycle time {body['data']['cycle_time']:.3f} s")
+
+        await _timed(c, "/simulate", PAYLOAD)  # warm-up
+        walls = []
+        for _ in range(repeats):
+            wall, body = await _timed(c, "/simulate", PAYLOAD)
+            walls.append(wall)
+        data = body["data"]
+        print(f"  /simulate:             {statistics.median(walls) * 1e3:9.1f} ms wall "
+              f"(median of {repeats}), predicted cycle time {data['cycle_time']:.3f} s, "
+              f"peak joint velocity {max(data['peak_joint_velocities']):.2f} rad/s")
+
+        wall, body = await _timed(c, "/move/sequence", {**PAYLOAD, "steps": UNSAFE})
+        print(f"  unsafe variant, /move/sequence: HTTP 422 after {wall * 1e3:.1f} ms, "
+              f"first violation only: {body['detail']}")
+        wall, body = await _timed(c, "/simulate", {**PAYLOAD, "steps": UNSAFE})
+        print(f"  unsafe variant, /simulate: {len(body['data']['violations'])} violations "
+              f"in {wall * 1e3:.1f} ms")
+        for violation in body["data"]["violations"]:
+            print(f"    step {violation['step']} ({violation['check']}): {violation['error']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.repeats))
+
+
+if __name__ == "__main__":
+    main()
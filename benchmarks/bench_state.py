@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Allocations per status read, layer by layer.
+
+Reads the arm status ``--reads`` times at each layer of ``GET /status`` on the mock driver:
+
+- driver: ``get_joint_angles()`` and ``get_flange_pose()``;
+- telemetry: ``TelemetryBlock.read()``, how workers read the status from the driver owner;
+- manager: ``ArmManager.aget_status()``;
+- endpoint: ``GET /status`` as JSON through the app (in-process ASGI transport).
+
+tracemalloc only sees memory that is still allocated, so for the first three layers every
+result is kept and the table shows the blocks and bytes each read leaves allocated, which
+is what a read hands to the layer above. For the endpoint the results are response bodies,
+so the table shows the peak of transient allocations during one request instead. Times are
+measured separately, without tracemalloc.
+
+Usage:
+    python3 benchmarks/bench_state.py [--reads 2000]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import time
+import tracemalloc
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+from bridge.telemetry import TelemetryBlock  # noqa: E402
+
+
+def retained(read, reads: int) -> tuple[float, float]:
+    """Blocks and bytes still allocated per call while all results are kept."""
+    results = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(reads):
+        results.append(read())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff) - 1  # the results list itself
+    size = sum(stat.size_diff for stat in diff)
+    return blocks / reads, size / reads
+
+
+def per_call(read, reads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reads):
+        read()
+    return (time.perf_counter() - start) / reads
+
+
+async def endpoint(client: AsyncClient, reads: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(reads):
+        await client.get("/status")
+    elapsed = (time.perf_counter() - start) / reads
+    tracemalloc.start()
+    peaks = []
+    for _ in range(50):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        await client.get("/status")
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return sorted(peaks)[len(peaks) // 2], elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=2000)
+    args = parser.parse_args()
+    arm_manager.MODE_SWITCH_DELAY = 0
+
+    async with AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench") as c:
+        await c.post("/connect", json={"robot": "nero"})
+        await c.post("/move", json={"mode": "J", "target": [0.1] * 7})
+        mgr = srv._get_manager()
+        driver = mgr._driver
+        block = TelemetryBlock(create=True)
+        block.publish(mgr.get_status())
+
+        layers = {
+            "driver": lambda: (driver.get_joint_angles(), driver.get_flange_pose()),
+            "telemetry": block.read,
+        }
+        print(f"{'layer':>10} {'blocks/read':>12} {'bytes/read':>11} {'us/read':>9}")
+        for name, read in layers.items():
+            blocks, size = retained(read, args.reads)
+            elapsed = per_call(read, args.reads)
+            print(f"{name:>10} {blocks:12.1f} {size:11.0f} {elapsed * 1e6:9.2f}")
+        # aget_status runs on an event loop; drive it on its own loop in a worker thread
+        blocks, size, elapsed = await asyncio.to_thread(_measure_async, mgr, args.reads)
+        print(f"{'manager':>10} {blocks:12.1f} {size:11.0f} {elapsed * 1e6:9.2f}")
+        peak, elapsed = await endpoint(c, args.reads)
+        print(f"{'endpoint':>10} {'':>12} {peak:11.0f} {elapsed * 1e6:9.2f}  (peak bytes)")
+        block.close()
+        await c.post("/disconnect")
+
+
+def _measure_async(mgr, reads: int) -> tuple[float, float, float]:
+    loop = asyncio.new_event_loop()
+    try:
+        def read():
+            return loop.run_until_complete(mgr.aget_status())
+
+        blocks, size = retained(read, reads)
+        return blocks, size, per_call(read, reads)
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Concurrent /status readers: one driver call per reader vs single-flight coalescing.
+
+Each driver getter sleeps ``--latency`` ms (an SDK round trip) on the adapter's single
+driver thread, so uncoalesced readers queue up behind each other.
+
+Usage:
+    python3 benchmarks/bench_status_coalescing.py [--readers 50] [--latency 1.0]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from bridge.arm_manager import ArmManager  # noqa: E402
+from bridge.coalesce import ReadCoalescer  # noqa: E402
+from bridge.drivers.async_adapter import ThreadedDriverAdapter  # noqa: E402
+from bridge.drivers.mock_driver import MockArmDriver  # noqa: E402
+from bridge.models import RobotType  # noqa: E402
+
+
+class SlowDriver(MockArmDriver):
+    latency = 0.001
+
+    def get_joint_angles(self):
+        time.sleep(self.latency)
+        return super().get_joint_angles()
+
+    def get_flange_pose(self):
+        time.sleep(self.latency)
+        return super().get_flange_pose()
+
+    def get_motion_status(self):
+        time.sleep(self.latency)
+        return super().get_motion_status()
+
+
+async def uncoalesced_status(mgr: ArmManager) -> dict:
+    adriver = mgr._adriver
+    return mgr._status_dict(
+        await adriver.get_joint_angles(),
+        await adriver.get_flange_pose(),
+        await adriver.get_motion_status(),
+    )
+
+
+async def run(mgr: ArmManager, readers: int, rounds: int, coalesce: bool, freshness: float):
+    mgr._reads = ReadCoalescer(freshness)
+    read = mgr.aget_status if coalesce else (lambda: uncoalesced_status(mgr))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(read() for _ in range(readers)))
+    elapsed = time.perf_counter() - start
+    calls = mgr._reads.driver_calls if coalesce else 3 * readers * rounds
+    return elapsed / rounds, calls / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=1.0, help="ms per driver read")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    SlowDriver.latency = args.latency / 1000
+    mgr = ArmManager()
+    driver = SlowDriver()
+    driver.connect("nero", "can0", "socketcan")
+    driver.enable()
+    mgr._driver, mgr._adriver = driver, ThreadedDriverAdapter(driver)
+    mgr._robot_type = RobotType.NERO
+
+    print(f"{args.readers} concurrent readers, {args.latency} ms per driver read")
+    for label, coalesce, freshness in (
+        ("per-reader calls", False, 0.0),
+        ("coalesced", True, 0.0),
+    ):
+        per_round, calls = asyncio.run(run(mgr, args.readers, args.rounds, coalesce, freshness))
+        print(f"{label:>22}: {per_round * 1e3:7.1f} ms per burst, {calls:6.1f} driver calls")
+    mgr._adriver.close()
+
+
+if __name__ == "__main__":
+    main()
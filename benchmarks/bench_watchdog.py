@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Moves during a CAN link outage, with and without the feedback watchdog.
+
+Drops the realtime mock's simulated link (``MockArmDriver.drop_link``) and sends a joint
+move over the in-process ASGI transport while it is down:
+
+- without the watchdog (``CLAWARM_FEEDBACK_TIMEOUT=0``) the move is lost on the wire,
+  and the bridge reports it completed once the unchanged idle status has outlasted the
+  stale-status window, with the arm still where it was;
+- with the watchdog the bridge has already marked the arm degraded and answers 503.
+
+Then measures recovery: for outages of several lengths (all longer than the feedback
+timeout, so each one is detected), the time from the link coming back to fresh feedback
+on a new connection, from the recovery time reported under ``watchdog`` in
+``GET /metrics``. With backoff, later attempts are further apart, so this grows with the
+outage.
+
+Usage:
+    python3 benchmarks/bench_watchdog.py [--outage 1.0] [--timeout 0.5]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["CLAWARM_MOCK"] = "true"
+os.environ["CLAWARM_MOCK_REALTIME"] = "true"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from bridge import arm_manager  # noqa: E402
+from bridge import server as srv  # noqa: E402
+from bridge.drivers.mock_driver import MockArmDriver  # noqa: E402
+
+MOVE = {"mode": "J", "target": [0.5, 0.0, 0.0, 0.0, 0.0, 0.0]}
+
+
+async def _watchdog(client: AsyncClient) -> dict:
+    return (await client.get("/metrics")).json()["watchdog"]
+
+
+async def _until(client: AsyncClient, state: str) -> dict:
+    while (snap := await _watchdog(client))["state"] != state:
+        await asyncio.sleep(0.01)
+    return snap
+
+
+async def _session(feedback_timeout: float):
+    os.environ["CLAWARM_FEEDBACK_TIMEOUT"] = str(feedback_timeout)
+    srv._manager = None
+    client = AsyncClient(transport=ASGITransport(app=srv.app), base_url="http://bench")
+    await client.post("/connect", json={"robot": "piper"})
+    return client
+
+
+async def move_during_outage(feedback_timeout: float, outage: float) -> None:
+    client = await _session(feedback_timeout)
+    MockArmDriver.drop_link(outage)
+    if feedback_timeout:
+        await _until(client, "degraded")
+    start = time.perf_counter()
+    resp = await client.post("/move", json=MOVE)
+    wall = time.perf_counter() - start
+    body = resp.json()
+    if resp.status_code == 200:
+        outcome = (f"HTTP 200, completed={body['data']['completed']} "
+                   f"(arm at {body['data']['joint_angles'][0]:.2f} rad, target 0.50)")
+    else:
+        outcome = f"HTTP {resp.status_code}, Retry-After {resp.headers.get('Retry-After')}"
+    label = f"watchdog {feedback_timeout:g} s" if feedback_timeout else "no watchdog"
+    print(f"  {label:>16}: {wall * 1e3:8.1f} ms, {outcome}")
+    await asyncio.sleep(outage)
+    await client.post("/disconnect")
+    await client.aclose()
+
+
+async def recovery(feedback_timeout: float, outages: list[float]) -> None:
+    client = await _session(feedback_timeout)
+    for outage in outages:
+        MockArmDriver.drop_link(outage)
+        await _until(client, "degraded")
+        snap = await _until(client, "ok")
+        print(f"  outage {outage:4.1f} s: recovered {snap['last_recovery_s']:.3f} s after "
+              f"detection, {snap['last_recovery_s'] + feedback_timeout - outage:+.3f} s "
+              f"after the link came back, {snap['reconnect_attempts']} attempts so far")
+    await client.post("/disconnect")
+    await client.aclose()
+
+
+async def main_async(outage: float, timeout: float) -> None:
+    arm_manager.MODE_SWITCH_DELAY = 0
+    print(f"Joint move sent during a {outage:g} s outage:")
+    await move_during_outage(0.0, outage)
+    await move_during_outage(timeout, outage)
+    print(f"Recovery with the watchdog ({timeout:g} s feedback timeout):")
+    await recovery(timeout, [1.0, 2.0, 4.0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outage", type=float, default=1.0)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.outage, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""GET /status throughput against uvicorn worker count.
+
+The baseline is one worker with the arm in the server process, as before. The other runs
+use the driver owner process (``--owner``, implied by more than one worker), so workers
+read status from shared memory. Each configuration runs ``clawarm-bridge`` (mock driver)
+in a subprocess and connects a Nero. Then ``--connections`` keep-alive clients issue
+GET /status for ``--duration`` seconds.
+The load generator shares the machine, so scaling is bounded by the number of free cores.
+
+Usage:
+    python3 benchmarks/bench_workers.py [--workers 1 2 4] [--connections 32] [--duration 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+HOST = "127.0.0.1"
+REQUEST = f"GET /status HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode()
+
+
+def start_server(workers: int, owner: bool, port: int) -> subprocess.Popen:
+    env = dict(os.environ, CLAWARM_MOCK="true", CLAWARM_PORT=str(port), CLAWARM_HOST=HOST)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "from bridge.server import main; main()",
+         "--workers", str(workers), *(["--owner"] if owner else [])],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://{HOST}:{port}/", timeout=1).read()
+            break
+        except OSError:
+            time.sleep(0.2)
+    else:
+        proc.kill()
+        raise RuntimeError("server did not start")
+    body = json.dumps({"robot": "nero"}).encode()
+    req = urllib.request.Request(
+        f"http://{HOST}:{port}/connect", body, {"Content-Type": "application/json"}
+    )
+    urllib.request.urlopen(req, timeout=30).read()
+    return proc
+
+
+async def client(port: int, deadline: float) -> int:
+    done = 0
+    while time.perf_counter() < deadline:
+        reader, writer = await asyncio.open_connection(HOST, port)
+        try:
+            while time.perf_counter() < deadline:
+                writer.write(REQUEST)
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = next(
+                    int(line.split(b":")[1])
+                    for line in head.split(b"\r\n")
+                    if line.lower().startswith(b"content-length")
+                )
+                await reader.readexactly(length)
+                done += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # the server closed the connection; open another
+        finally:
+            writer.close()
+    return done
+
+
+async def load(port: int, connections: int, duration: float) -> float:
+    deadline = time.perf_counter() + duration
+    counts = await asyncio.gather(*(client(port, deadline) for _ in range(connections)))
+    return sum(counts) / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=8431)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU(s), {args.connections} connections, {args.duration:.0f} s each")
+    configs = [(1, False)] + [(workers, True) for workers in args.workers]
+    for workers, owner in configs:
+        proc = start_server(workers, owner, args.port)
+        try:
+            asyncio.run(load(args.port, args.connections, 1.0))  # warm-up
+            rate = asyncio.run(load(args.port, args.connections, args.duration))
+        finally:
+            proc.terminate()
+            proc.wait(30)
+        mode = "owner + shared memory" if owner else "in-process arm"
+        print(f"{workers:>3} worker(s) ({mode:>21}): {rate:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
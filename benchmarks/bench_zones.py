@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Zone query cost vs zone count: AABB tree vs a linear scan over every zone.
+
+Random boxes, spheres and cylinders are scattered through the default workspace; each
+query is a point check (``validate_cartesian_move``) or a 5 cm segment check
+(``validate_cartesian_segment``).
+
+Usage:
+    python3 benchmarks/bench_zones.py [--queries 2000]
+"""
+
+import argparse
+import random
+import time
+
+from bridge.zones import Box, Cylinder, Sphere, Zone, ZoneTree
+
+COUNTS = (1, 10, 100, 1000)
+
+
+def random_zones(n: int, rng: random.Random) -> list[Zone]:
+    zones = []
+    for i in range(n):
+        c = (rng.uniform(-0.9, 0.9), rng.uniform(-0.9, 0.9), rng.uniform(0.0, 1.1))
+        size = rng.uniform(0.005, 0.03)
+        kind = i % 3
+        if kind == 0:
+            shape = Box(tuple(v - size for v in c), tuple(v + size for v in c))
+        elif kind == 1:
+            shape = Sphere(c, size)
+        else:
+            shape = Cylinder(c[:2], size, c[2] - size, c[2] + size)
+        zones.append(Zone(f"z{i}", shape))
+    return zones
+
+
+def random_segments(n: int, rng: random.Random) -> list[tuple]:
+    segments = []
+    for _ in range(n):
+        a = (rng.uniform(-0.9, 0.9), rng.uniform(-0.9, 0.9), rng.uniform(0.0, 1.1))
+        b = tuple(v + rng.uniform(-0.03, 0.03) for v in a)
+        segments.append((a, b))
+    return segments
+
+
+def per_query_us(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(*item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    segments = random_segments(args.queries, rng)
+    points = [(a,) for a, _ in segments]
+
+    print(f"{'zones':>6} {'point tree':>11} {'point scan':>11} {'seg tree':>9} {'seg scan':>9}")
+    for n in COUNTS:
+        zones = random_zones(n, rng)
+        tree = ZoneTree(zones)
+
+        def scan_point(p, zones=zones):
+            return [z for z in zones if z.shape.contains(p)]
+
+        def scan_segment(a, b, zones=zones):
+            return [z for z in zones if z.shape.intersects_segment(a, b)]
+
+        print(
+            f"{n:>6} "
+            f"{per_query_us(tree.query_point, points):>9.1f}us "
+            f"{per_query_us(scan_point, points):>9.1f}us "
+            f"{per_query_us(tree.query_segment, segments):>7.1f}us "
+            f"{per_query_us(scan_segment, segments):>7.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
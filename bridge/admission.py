@@ -0,0 +1,261 @@
+"""Admission control for motion commands: token-bucket rate limits and a bounded queue.
+
+A runaway agent loop can post moves far faster than the arm can execute them, and each
+request holds a worker thread or the event loop and queues CAN commands. Motion endpoints
+(``/move``, ``/move/sequence``, ``/shapes``, ``/batch`` and ``/scripts/run``) are admitted
+in two steps:
+
+- Rate limits: a token bucket per client (the ``X-Client-ID`` header, else the peer
+  address) and one for the arm. A request that finds either bucket empty is rejected with
+  HTTP 429 and a ``Retry-After`` of when a token will be available.
+- Motion queue: the arm runs one command at a time and at most ``depth`` more wait for it,
+  in arrival order. When the queue is full, the ``reject`` policy answers the new command
+  with 429; ``drop_oldest`` admits it and answers the oldest waiting command with 429.
+  A script holds the slot until it ends, and each of its moves also takes a token (the
+  script waits for one rather than failing).
+
+Stop commands bypass both: ``/stop`` is never throttled, and it cancels every waiting
+command (HTTP 409) so nothing queued before it runs after it.
+
+Queue depth, rejections and the time commands waited for the arm are reported under
+``admission`` in ``GET /metrics``. Everything runs on the event loop, so none of it needs
+locks. With several HTTP workers, the driver owner process holds the ``Admission`` and
+every worker admits through it (``bridge.owner.RemoteAdmission``), so the limits and the
+queue apply to the arm as a whole. The server uses the ``a``-prefixed methods, which for
+``RemoteAdmission`` make the owner call off the event loop.
+
+Configured from the environment: ``CLAWARM_CLIENT_RATE`` / ``CLAWARM_CLIENT_BURST``,
+``CLAWARM_ARM_RATE`` / ``CLAWARM_ARM_BURST`` (commands per second and bucket size; a rate of
+``0`` disables the limit), ``CLAWARM_QUEUE_DEPTH`` and ``CLAWARM_QUEUE_POLICY``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import statistics
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+DEFAULT_CLIENT_RATE = 10.0
+DEFAULT_CLIENT_BURST = 20
+DEFAULT_ARM_RATE = 20.0
+DEFAULT_ARM_BURST = 40
+DEFAULT_QUEUE_DEPTH = 8
+POLICIES = ("reject", "drop_oldest")
+MAX_CLIENTS = 1024  # client buckets kept; the least recently used are dropped beyond this
+WAIT_HISTORY = 1000  # queue wait times kept for the mean, p95 and max
+
+
+class Throttled(RuntimeError):
+    """Raised when a command is over a rate limit or does not fit in the motion queue."""
+
+    def __init__(self, message: str, retry_after: float = 1.0) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class Cancelled(RuntimeError):
+    """Raised for a command that was waiting in the motion queue when the arm was stopped."""
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``burst``; starts full."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+
+    def delay(self) -> float:
+        """Seconds until a token is available; 0 if one is available now."""
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._stamp) * self.rate, self.burst)
+        self._stamp = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+
+class MotionQueue:
+    """The arm's command slot and up to ``depth`` commands waiting for it."""
+
+    def __init__(self, depth: int = DEFAULT_QUEUE_DEPTH, policy: str = "reject") -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy {policy!r}; expected one of {POLICIES}")
+        self.depth = depth
+        self.policy = policy
+        self._busy = False
+        self._waiting: deque[asyncio.Future] = deque()
+        self._waits: deque[float] = deque(maxlen=WAIT_HISTORY)
+        self._max_depth = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._dropped = 0
+        self._cancelled = 0
+
+    async def acquire(self) -> None:
+        """Wait for the command slot; pair with ``release``.
+
+        Raises ``Throttled`` if the queue is full (or this command is later dropped for a
+        newer one) and ``Cancelled`` if the arm is stopped while it waits.
+        """
+        start = time.monotonic()
+        if self._busy:
+            if len(self._waiting) >= self.depth:
+                if self.policy == "reject" or not self._waiting:
+                    self._rejected += 1
+                    raise Throttled(f"Motion queue full ({len(self._waiting)} waiting)")
+                self._dropped += 1
+                self._waiting.popleft().set_exception(
+                    Throttled("Dropped from the motion queue for a newer command")
+                )
+            turn = asyncio.get_running_loop().create_future()
+            self._waiting.append(turn)
+            self._max_depth = max(self._max_depth, len(self._waiting))
+            try:
+                await turn
+            except asyncio.CancelledError:  # the client went away
+                if turn.cancelled():
+                    if turn in self._waiting:
+                        self._waiting.remove(turn)
+                elif turn.exception() is None:  # handed the slot as it was cancelled
+                    self.release()
+                raise
+        self._busy = True
+        self._admitted += 1
+        self._waits.append(time.monotonic() - start)
+
+    def release(self) -> None:
+        """Hand the slot to the oldest waiting command, or free it."""
+        while self._waiting:
+            turn = self._waiting.popleft()
+            if not turn.done():
+                turn.set_result(None)
+                return
+        self._busy = False
+
+    async def arelease(self) -> None:
+        """``release``, awaitable like ``RemoteAdmission``'s queue."""
+        self.release()
+
+    def clear(self, reason: str) -> int:
+        """Cancel every waiting command with ``reason``; returns how many there were."""
+        cancelled = 0
+        while self._waiting:
+            turn = self._waiting.popleft()
+            if not turn.done():
+                turn.set_exception(Cancelled(reason))
+                cancelled += 1
+        self._cancelled += cancelled
+        return cancelled
+
+    async def aclear(self, reason: str) -> int:
+        return self.clear(reason)
+
+    def snapshot(self) -> dict:
+        waits = sorted(self._waits)
+        return {
+            "depth": len(self._waiting),
+            "max_depth": self._max_depth,
+            "limit": self.depth,
+            "policy": self.policy,
+            "busy": self._busy,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "dropped": self._dropped,
+            "cancelled": self._cancelled,
+            "wait_mean_ms": _ms(statistics.fmean(waits)) if waits else None,
+            "wait_p95_ms": _ms(waits[math.ceil(0.95 * len(waits)) - 1]) if waits else None,
+            "wait_max_ms": _ms(waits[-1]) if waits else None,
+        }
+
+
+class Admission:
+    """Per-client and per-arm rate limits plus the arm's ``MotionQueue``."""
+
+    def __init__(
+        self,
+        client_rate: float = DEFAULT_CLIENT_RATE,
+        client_burst: int = DEFAULT_CLIENT_BURST,
+        arm_rate: float = DEFAULT_ARM_RATE,
+        arm_burst: int = DEFAULT_ARM_BURST,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+        queue_policy: str = "reject",
+    ) -> None:
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.queue = MotionQueue(queue_depth, queue_policy)
+        self._arm = TokenBucket(arm_rate, arm_burst) if arm_rate > 0 else None
+        self._clients: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._throttled = {"client": 0, "arm": 0}
+
+    @classmethod
+    def from_env(cls) -> "Admission":
+        """Build from the ``CLAWARM_*`` variables."""
+        return cls(
+            client_rate=float(os.environ.get("CLAWARM_CLIENT_RATE", str(DEFAULT_CLIENT_RATE))),
+            client_burst=int(os.environ.get("CLAWARM_CLIENT_BURST", str(DEFAULT_CLIENT_BURST))),
+            arm_rate=float(os.environ.get("CLAWARM_ARM_RATE", str(DEFAULT_ARM_RATE))),
+            arm_burst=int(os.environ.get("CLAWARM_ARM_BURST", str(DEFAULT_ARM_BURST))),
+            queue_depth=int(os.environ.get("CLAWARM_QUEUE_DEPTH", str(DEFAULT_QUEUE_DEPTH))),
+            queue_policy=os.environ.get("CLAWARM_QUEUE_POLICY", "reject").lower(),
+        )
+
+    def check(self, client: str) -> None:
+        """Take a token from ``client``'s bucket and the arm's, or raise ``Throttled``.
+
+        Tokens are only taken when both buckets have one, so a rejected command costs the
+        client nothing.
+        """
+        bucket = self._client_bucket(client)
+        delays = {
+            "client": bucket.delay() if bucket else 0.0,
+            "arm": self._arm.delay() if self._arm else 0.0,
+        }
+        scope = max(delays, key=delays.get)
+        if delays[scope]:
+            self._throttled[scope] += 1
+            who = f"client {client!r}" if scope == "client" else "the arm"
+            raise Throttled(f"Rate limit exceeded for {who}", retry_after=delays[scope])
+        for bucket in (bucket, self._arm):
+            if bucket:
+                bucket.take()
+
+    async def acheck(self, client: str) -> None:
+        """``check``, awaitable like ``RemoteAdmission.acheck``."""
+        self.check(client)
+
+    def snapshot(self) -> dict:
+        return {
+            "client_rate": self.client_rate or None,
+            "client_burst": self.client_burst if self.client_rate else None,
+            "arm_rate": self._arm.rate if self._arm else None,
+            "arm_burst": self._arm.burst if self._arm else None,
+            "clients": len(self._clients),
+            "throttled": dict(self._throttled),
+            "queue": self.queue.snapshot(),
+        }
+
+    async def asnapshot(self) -> dict:
+        return self.snapshot()
+
+    def _client_bucket(self, client: str) -> Optional[TokenBucket]:
+        if self.client_rate <= 0:
+            return None
+        bucket = self._clients.get(client)
+        if bucket is None:
+            bucket = self._clients[client] = TokenBucket(self.client_rate, self.client_burst)
+            if len(self._clients) > MAX_CLIENTS:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client)
+        return bucket
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
@@ -2,32 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import os
+import threading
 import time
 from typing import Optional
 
-from .drivers.base import ArmDriver
+from .batch import run_batch
+from .coalesce import ReadCoalescer
+from .drivers.async_adapter import as_async_driver
+from .drivers.base import ArmDriver, AsyncArmDriver
 from .drivers.mock_driver import MockArmDriver
-from .models import DOF_MAP, MotionMode, RobotType
-from .safety import SafetyConfig, SafetyValidator
+from .estimator import MotionEstimate, MotionEstimator
+from .frames import resolve_relative
+from .kinematics import ARM_MODELS
+from .latency import LatencyHistograms, MoveTiming, feedback_moment
+from .models import DOF_MAP, Frame, MotionMode, MoveStep, RobotType
+from .notify import Motion, MotionTracker, StatusFeed
+from .reachability import load_maps
+from .safety import DEFAULT_MAX_SPEED_PERCENT, SafetyConfig, SafetyValidator
+from .sequence import (
+    SequenceExecutor,
+    Step,
+    at_target,
+    entry_segments,
+    indexed_cartesian_runs,
+)
+from .simplify import DEFAULT_ORIENTATION_TOLERANCE, simplify_steps
+from .simulate import simulate_sequence
+from .watchdog import DEFAULT_STALE_AFTER, MAX_BACKOFF, FeedbackWatchdog
+from .zones import load_zones
 
 logger = logging.getLogger(__name__)
 
 MODE_SWITCH_DELAY = 1.0
 POST_MOVE_DELAY = 0.01
-MOTION_POLL_INTERVAL = 0.1
-DEFAULT_TIMEOUT = 3.0
+MOTION_POLL_INTERVAL = 0.01  # dense polling once the predicted finish is near
+DEFAULT_TIMEOUT = 3.0  # used when no duration estimate is available
+EARLY_WAKE = 0.8  # sleep through this fraction of the predicted duration before polling
+TIMEOUT_FACTOR = 1.5  # adaptive deadline: predicted duration * factor + slack
+TIMEOUT_SLACK = 1.0
+STALE_STATUS_WINDOW = 0.5  # a zero status this soon after a command may be the previous one
+STATUS_WATCH_INTERVAL = 0.02  # driver read rate while /status?changed_since callers wait
+READY_POLL_INTERVAL = 0.01  # telemetry checks while an adaptive connect waits for the arm
+LOCK_POLL_INTERVAL = 0.005  # retries of the manager lock from the event loop
 
 
 def _use_mock() -> bool:
     return os.environ.get("CLAWARM_MOCK", "").lower() in ("1", "true", "yes")
 
 
+def _mock_realtime() -> bool:
+    return os.environ.get("CLAWARM_MOCK_REALTIME", "").lower() in ("1", "true", "yes")
+
+
 def _create_driver() -> ArmDriver:
     if _use_mock():
         logger.info("Using MockArmDriver (CLAWARM_MOCK is set)")
-        return MockArmDriver()
+        return MockArmDriver(realtime=_mock_realtime())
+    if os.environ.get("CLAWARM_DRIVER", "").lower() == "can":
+        from .drivers.can_driver import CanBusDriver
+        logger.info("Using CanBusDriver (CLAWARM_DRIVER=can)")
+        return CanBusDriver()
     try:
         from .drivers.agx_driver import AgxArmDriver
         return AgxArmDriver()
@@ -36,13 +74,74 @@ def _create_driver() -> ArmDriver:
         return MockArmDriver()
 
 
+def manager_from_env() -> ArmManager:
+    """Build an ``ArmManager`` from the ``CLAWARM_*`` environment variables."""
+    safety_val = os.environ.get("CLAWARM_SAFETY", "true").lower()
+    safety_enabled = safety_val not in ("0", "false", "no")
+    max_speed = int(os.environ.get("CLAWARM_MAX_SPEED", "80"))
+    can_monitor = os.environ.get("CLAWARM_CANSTAT", "").lower() in ("1", "true", "yes")
+    zones_file = os.environ.get("CLAWARM_ZONES")
+    zones = load_zones(zones_file) if zones_file else []
+    reachability_dir = os.environ.get("CLAWARM_REACHABILITY")
+    reachability = load_maps(reachability_dir) if reachability_dir else {}
+    return ArmManager(
+        SafetyConfig(
+            enabled=safety_enabled,
+            max_speed_percent=max_speed,
+            zones=zones,
+            reachability=reachability,
+            min_manipulability=float(os.environ.get("CLAWARM_MIN_MANIPULABILITY", "0")),
+        ),
+        can_monitor=can_monitor,
+        motion_log=os.environ.get("CLAWARM_MOTION_LOG"),
+        read_freshness=float(os.environ.get("CLAWARM_READ_FRESHNESS", "0")),
+        feedback_timeout=float(
+            os.environ.get("CLAWARM_FEEDBACK_TIMEOUT", str(DEFAULT_STALE_AFTER))
+        ),
+        reconnect_max_backoff=float(
+            os.environ.get("CLAWARM_RECONNECT_MAX_BACKOFF", str(MAX_BACKOFF))
+        ),
+        reconnect_enable=os.environ.get("CLAWARM_RECONNECT_ENABLE", "").lower()
+        in ("1", "true", "yes"),
+    )
+
+
 class ArmManager:
     """Manages a single arm driver instance with safety validation."""
 
-    def __init__(self, safety_config: SafetyConfig | None = None) -> None:
+    def __init__(
+        self,
+        safety_config: SafetyConfig | None = None,
+        can_monitor: bool = False,
+        motion_log: str | None = None,
+        read_freshness: float = 0.0,
+        feedback_timeout: float = 0.0,
+        reconnect_max_backoff: float = MAX_BACKOFF,
+        reconnect_enable: bool = False,
+    ) -> None:
         self._driver: Optional[ArmDriver] = None
+        self._adriver: Optional[AsyncArmDriver] = None
         self._robot_type: Optional[RobotType] = None
         self._safety = SafetyValidator(safety_config)
+        self._can_monitor_enabled = can_monitor
+        self._can_monitor = None
+        self._estimator = MotionEstimator(log_path=motion_log)
+        self._reads = ReadCoalescer(read_freshness)
+        self._latency = LatencyHistograms()
+        self._speed_percent = DEFAULT_MAX_SPEED_PERCENT
+        self._motions = MotionTracker()
+        self._feed = StatusFeed()
+        self._status_watcher: Optional[asyncio.Task] = None
+        self._watchers: set[asyncio.Task] = set()
+        self._feedback_timeout = feedback_timeout
+        self._reconnect_max_backoff = reconnect_max_backoff
+        self._reconnect_enable = reconnect_enable
+        self._watchdog: Optional[FeedbackWatchdog] = None
+        self._link: Optional[tuple[RobotType, str, str, bool]] = None  # connect's arguments
+        # Held by connect/disconnect, reconnects and motion commands until they are sent, so
+        # the watchdog never swaps the driver under a command. Not taken by stop.
+        self._lock = threading.Lock()
+        self._want_enabled = False  # enabled by the operator; a reconnect leaves it disabled
 
     @property
     def connected(self) -> bool:
@@ -52,6 +151,21 @@ class ArmManager:
     def enabled(self) -> bool:
         return self.connected and getattr(self._driver, "is_enabled", False)
 
+    @property
+    def needs_enable(self) -> bool:
+        """True when the operator enabled the arm but it is disabled, e.g. after a reconnect."""
+        return self._want_enabled and self.connected and not self.enabled
+
+    @property
+    def degraded(self) -> bool:
+        """True while feedback is stale and the watchdog is reconnecting."""
+        return self._watchdog is not None and self._watchdog.degraded
+
+    def require_fresh(self) -> None:
+        """Raise ``ArmDegradedError`` while the arm is degraded (see ``bridge.watchdog``)."""
+        if self._watchdog is not None:
+            self._watchdog.check()
+
     @property
     def robot_type(self) -> Optional[RobotType]:
         return self._robot_type
@@ -60,20 +174,65 @@ class ArmManager:
     def dof(self) -> Optional[int]:
         return DOF_MAP.get(self._robot_type) if self._robot_type else None
 
-    def connect(self, robot: RobotType, channel: str = "can0", interface: str = "socketcan") -> str:
-        if self.connected:
-            self.disconnect()
-
-        self._driver = _create_driver()
+    def connect(
+        self,
+        robot: RobotType,
+        channel: str = "can0",
+        interface: str = "socketcan",
+        adaptive: bool = False,
+    ) -> str:
+        """Connect, switch to normal mode and enable.
+
+        By default the mode switch is surrounded by fixed ``MODE_SWITCH_DELAY`` sleeps. With
+        ``adaptive=True`` it is sent as soon as the arm reports its status (at most
+        ``MODE_SWITCH_DELAY`` later) instead of after the first sleep. The sleep after the
+        switch is always kept: the arm needs it to settle into the new mode.
+
+        With a ``feedback_timeout``, a ``FeedbackWatchdog`` then watches the link and
+        reconnects with the same arguments when feedback goes stale.
+        """
+        self._stop_watchdog()
+        with self._lock:
+            if self.connected:
+                self._close()
+            return self._connect(robot, channel, interface, adaptive)
+
+    def _connect(self, robot: RobotType, channel: str, interface: str, adaptive: bool) -> str:
+        self._adriver = as_async_driver(_create_driver())
+        self._driver = self._adriver.sync  # the locked view every other thread calls
         self._driver.connect(robot.value, channel, interface)
         self._robot_type = robot
+        self._open(adaptive)
+        self._want_enabled = True
+
+        if self._can_monitor_enabled:
+            self._start_can_monitor(channel, interface)
+
+        self._link = (robot, channel, interface, adaptive)
+        if self._feedback_timeout > 0:
+            self._watchdog = FeedbackWatchdog(
+                self._feedback_freshness,
+                self._reconnect,
+                stale_after=self._feedback_timeout,
+                max_backoff=self._reconnect_max_backoff,
+            )
+            self._watchdog.start()
 
-        time.sleep(MODE_SWITCH_DELAY)
+        return f"Connected to {robot.value} on {channel} (dof={DOF_MAP.get(robot, '?')})"
+
+    def _open(self, adaptive: bool, enable: bool = True) -> None:
+        """Switch the freshly connected driver to normal mode, enable it, apply the speed."""
+        if adaptive:
+            deadline = time.monotonic() + MODE_SWITCH_DELAY
+            while self._driver.get_motion_status() is None and time.monotonic() < deadline:
+                time.sleep(READY_POLL_INTERVAL)
+        else:
+            time.sleep(MODE_SWITCH_DELAY)
         self._driver.set_normal_mode()
         time.sleep(MODE_SWITCH_DELAY)
 
         retries = 0
-        while not self._driver.enable():
+        while enable and not self._driver.enable():
             time.sleep(0.01)
             retries += 1
             if retries > 500:
@@ -81,36 +240,179 @@ class ArmManager:
 
         default_speed = self._safety.validate_speed(80)
         self._driver.set_speed_percent(default_speed)
-
-        return f"Connected to {robot.value} on {channel} (dof={DOF_MAP.get(robot, '?')})"
+        self._speed_percent = default_speed
+
+    def _feedback_freshness(self):
+        driver = self._driver
+        return driver.feedback_freshness() if driver is not None else None
+
+    def _reconnect(self) -> None:
+        """Watchdog callback: reopen the link ``connect`` was called with.
+
+        The arm comes back disabled, with ``needs_enable`` set in the status if it was
+        enabled when the link dropped; only with ``reconnect_enable`` is it enabled again.
+        The speed setting is kept. Motions in flight are lost with the old link. The swap waits
+        for a command being sent to finish sending.
+        """
+        with self._lock:
+            self._swap_link()
+
+    def _swap_link(self) -> None:
+        robot, channel, interface, adaptive = self._link
+        speed = self._speed_percent
+        old, old_async = self._driver, self._adriver
+        if old is not None and old.is_connected:
+            try:
+                old.disconnect()
+            except Exception as exc:
+                logger.debug("Closing the stale link failed: %s", exc)
+        if self._can_monitor is not None:
+            self._can_monitor.stop()
+            self._can_monitor = None
+        self._motions.stop_all()
+        self._reads.invalidate()
+
+        adriver = as_async_driver(_create_driver())
+        driver = adriver.sync
+        driver.connect(robot.value, channel, interface)
+        self._driver = driver
+        self._adriver = adriver
+        if old_async is not None:
+            old_async.close()
+        self._open(adaptive, enable=self._want_enabled and self._reconnect_enable)
+        driver.set_speed_percent(speed)
+        self._speed_percent = speed
+        if self._can_monitor_enabled:
+            self._start_can_monitor(channel, interface)
+
+    @contextlib.asynccontextmanager
+    async def _acommand(self):
+        """Hold the manager lock from the event loop, retrying instead of blocking it."""
+        while not self._lock.acquire(blocking=False):
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+    def _stop_watchdog(self) -> None:
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            self._watchdog = None
 
     def disconnect(self) -> str:
+        self._stop_watchdog()
+        with self._lock:
+            return self._close()
+
+    def _close(self) -> str:
+        self._link = None
         if not self._driver:
             return "Not connected"
         if self.enabled:
-            retries = 0
-            while not self._driver.disable():
-                time.sleep(0.01)
-                retries += 1
-                if retries > 100:
-                    break
+            self.disable()
+        if self._can_monitor is not None:
+            self._can_monitor.stop()
+            self._can_monitor = None
         self._driver.disconnect()
+        self._adriver.close()
         self._driver = None
+        self._adriver = None
         self._robot_type = None
+        self._reads.invalidate()
+        self._motions.stop_all()
         return "Disconnected"
 
+    def _start_can_monitor(self, channel: str, interface: str) -> None:
+        try:
+            from .canstat import CanMonitor
+            self._can_monitor = CanMonitor(channel, interface)
+        except Exception as exc:
+            logger.warning("CAN monitor unavailable on %s (%s): %s", channel, interface, exc)
+
+    def metrics(self) -> dict:
+        """Operational metrics for ``GET /metrics``; sections are None when not collected."""
+        return {
+            "can": self._can_monitor.snapshot() if self._can_monitor else None,
+            "motion_estimator": self._estimator.calibration(),
+            "reads": self._reads.snapshot(),
+            "watchdog": self._watchdog.snapshot() if self._watchdog else None,
+            "latency": self._latency.snapshot(),
+        }
+
     def get_status(self) -> dict:
         if not self._driver or not self._driver.is_connected:
-            return {"connected": False, "enabled": False}
-
+            return self._observed({"connected": False, "enabled": False})
+
+        return self._observed(self._status_dict(
+            self._driver.get_joint_angles(),
+            self._driver.get_flange_pose(),
+            self._driver.get_motion_status(),
+        ))
+
+    async def aget_status(self) -> dict:
+        """Like ``get_status`` but awaits the driver reads instead of blocking.
+
+        Concurrent callers share driver reads through the ``ReadCoalescer``.
+        """
+        adriver = self._adriver
+        if adriver is None or not adriver.is_connected:
+            return self._observed({"connected": False, "enabled": False})
+
+        reads = self._reads
+        return self._observed(self._status_dict(
+            await reads.read("joint_angles", adriver.get_joint_angles),
+            await reads.read("flange_pose", adriver.get_flange_pose),
+            await reads.read("motion_status", adriver.get_motion_status),
+        ))
+
+    def _observed(self, status: dict) -> dict:
+        """Number the status in the change feed; ``seq`` changes whenever the status does."""
+        status["seq"] = self._feed.observe(status)
+        return status
+
+    async def await_status(self, since: int, timeout: float) -> dict:
+        """Status as soon as its ``seq`` differs from ``since``, else the latest after
+        ``timeout`` seconds. Waiters share one driver read every ``STATUS_WATCH_INTERVAL``.
+        """
+        status = await self.aget_status()
+        if status["seq"] != since:
+            return status
+        waiter = self._feed.waiter()
+        task = self._status_watcher
+        loop = asyncio.get_running_loop()
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._status_watcher = loop.create_task(self._watch_status())
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._feed.discard(waiter)
+        return self._feed.latest
+
+    async def _watch_status(self) -> None:
+        while self._feed.waiting:
+            await asyncio.sleep(STATUS_WATCH_INTERVAL)
+            await self.aget_status()
+
+    def wait_motion(self, motion_id: int, timeout: float) -> Optional[dict]:
+        """Block until the motion settles or ``timeout`` passes; None for an unknown ID."""
+        return self._motions.wait(motion_id, timeout)
+
+    async def await_motion(self, motion_id: int, timeout: float) -> Optional[dict]:
+        return await self._motions.await_motion(motion_id, timeout)
+
+    def _status_dict(self, joint_angles, flange_pose, motion_status) -> dict:
         return {
             "connected": True,
             "enabled": getattr(self._driver, "is_enabled", False),
+            "needs_enable": self.needs_enable,
             "robot_type": self._robot_type.value if self._robot_type else None,
             "dof": self.dof,
-            "joint_angles": self._driver.get_joint_angles(),
-            "flange_pose": self._driver.get_flange_pose(),
-            "motion_status": self._driver.get_motion_status(),
+            "joint_angles": joint_angles,
+            "flange_pose": flange_pose,
+            "motion_status": motion_status,
         }
 
     def move(
@@ -121,61 +423,583 @@ class ArmManager:
         end_point: list[float] | None = None,
         speed_percent: int | None = None,
         wait: bool = True,
-        timeout: float = DEFAULT_TIMEOUT,
-    ) -> str:
+        timeout: float | None = None,
+        relative: bool = False,
+        frame: Frame = Frame.BASE,
+        received: float | None = None,
+    ) -> dict:
+        """Validate and send a move; returns its ``motion`` report (see ``motion_message``).
+
+        With ``timeout=None`` the wait deadline is derived from the predicted duration.
+        Every move gets a ``motion_id``; an unwaited move is watched in the background and
+        can be waited on with ``wait_motion``.
+
+        With ``relative=True`` the target (and arc points) are offsets from the telemetry
+        read just before sending (``frame`` applies to Cartesian modes). The report carries
+        the resolved absolute ``target`` and, once waited, the final joints and pose.
+
+        ``received`` is when the request arrived (``time.monotonic()``); the report's
+        ``latency`` times each stage from there (see ``bridge.latency``).
+        """
+        timing = MoveTiming(received)
+        with self._lock:  # until the move is sent, so the watchdog cannot swap the link
+            current = self._telemetry_getter(mode, self._driver)() if self.connected else None
+            if relative:
+                target, mid_point, end_point = _resolve(mode, frame, current, target, mid_point,
+                                                        end_point)
+            speed = self._prepare_move(mode, target, mid_point, end_point, speed_percent,
+                                       self._validation_start(mode, current))
+            estimate = self._estimate(mode, target, mid_point, end_point, current, speed)
+            timing.validated = time.monotonic()
+
+            if speed is not None:
+                self._driver.set_speed_percent(speed)
+                self._speed_percent = speed
+            self._driver.set_motion_mode(mode.value)
+            name, args = _motion_call(mode, target, mid_point, end_point)
+            sent = time.monotonic()
+            getattr(self._driver, name)(*args)
+            timing.returned = time.monotonic()
+            self._reads.invalidate()
+            report = _motion_report(mode, target, estimate, wait, timeout)
+            motion = self._motions.start(report)
+
+        time.sleep(POST_MOVE_DELAY)
+
+        step = Step(mode, target, mid_point, end_point)
+        if not wait:
+            threading.Thread(
+                target=self._watch_motion,
+                args=(motion, sent, _watch_timeout(estimate, timeout), estimate, step, timing),
+                daemon=True,
+            ).start()
+            report["latency"] = timing.stages()
+            return report
+        done = self._wait_motion_done(sent, report["timeout"], estimate, step, timing)
+        self._finish_motion(motion, estimate, done, time.monotonic() - sent, timing)
+        report["joint_angles"] = self._driver.get_joint_angles()
+        report["flange_pose"] = self._driver.get_flange_pose()
+        return report
+
+    async def amove(
+        self,
+        mode: MotionMode,
+        target: list[float],
+        mid_point: list[float] | None = None,
+        end_point: list[float] | None = None,
+        speed_percent: int | None = None,
+        wait: bool = True,
+        timeout: float | None = None,
+        relative: bool = False,
+        frame: Frame = Frame.BASE,
+        received: float | None = None,
+    ) -> dict:
+        """Like ``move`` but awaits driver calls and polls without blocking the loop."""
+        timing = MoveTiming(received)
+        async with self._acommand():
+            adriver = self._adriver
+            current = await self._telemetry_getter(mode, adriver)() if self.connected else None
+            if relative:
+                target, mid_point, end_point = _resolve(mode, frame, current, target, mid_point,
+                                                        end_point)
+            speed = self._prepare_move(mode, target, mid_point, end_point, speed_percent,
+                                       self._validation_start(mode, current))
+            estimate = self._estimate(mode, target, mid_point, end_point, current, speed)
+            timing.validated = time.monotonic()
+
+            if speed is not None:
+                await adriver.set_speed_percent(speed)
+                self._speed_percent = speed
+            await adriver.set_motion_mode(mode.value)
+            name, args = _motion_call(mode, target, mid_point, end_point)
+            sent = time.monotonic()
+            await getattr(adriver, name)(*args)
+            timing.returned = time.monotonic()
+            self._reads.invalidate()
+            report = _motion_report(mode, target, estimate, wait, timeout)
+            motion = self._motions.start(report)
+
+        await asyncio.sleep(POST_MOVE_DELAY)
+
+        step = Step(mode, target, mid_point, end_point)
+        if not wait:
+            task = asyncio.ensure_future(self._awatch_motion(
+                motion, sent, _watch_timeout(estimate, timeout), estimate, step, timing
+            ))
+            self._watchers.add(task)
+            task.add_done_callback(self._watchers.discard)
+            report["latency"] = timing.stages()
+            return report
+        done = await self._await_motion_done(sent, report["timeout"], estimate, step, timing)
+        self._finish_motion(motion, estimate, done, time.monotonic() - sent, timing)
+        report["joint_angles"] = await self._reads.read("joint_angles", adriver.get_joint_angles)
+        report["flange_pose"] = await self._reads.read("flange_pose", adriver.get_flange_pose)
+        return report
+
+    def _estimate(
+        self,
+        mode: MotionMode,
+        target: list[float],
+        mid_point: list[float] | None,
+        end_point: list[float] | None,
+        current: list[float] | None,
+        speed: int | None,
+    ) -> Optional[MotionEstimate]:
+        return self._estimator.estimate(
+            self._robot_type, mode, target, current,
+            speed if speed is not None else self._speed_percent, mid_point, end_point,
+        )
+
+    def _finish_motion(
+        self,
+        motion: Motion,
+        estimate: Optional[MotionEstimate],
+        done: bool,
+        elapsed: float,
+        timing: MoveTiming,
+    ) -> None:
+        stages = timing.stages()
+        self._latency.record(stages)
+        motion.report["latency"] = stages
+        if motion.done:
+            return  # superseded or stopped while we waited
+        motion.report["completed"] = done
+        motion.report["elapsed"] = round(elapsed, 4)
+        if done and estimate is not None:
+            self._estimator.record(self._robot_type, estimate, elapsed)
+        self._motions.finish(motion, done)
+
+    def _watch_motion(
+        self, motion: Motion, sent: float, timeout: float, estimate, step: Step,
+        timing: MoveTiming,
+    ) -> None:
+        try:
+            done = self._wait_motion_done(sent, timeout, estimate, step, timing, motion)
+        except Exception as exc:  # e.g. disconnected mid-watch
+            logger.debug("Watching motion %d failed: %s", motion.id, exc)
+            done = False
+        self._finish_motion(motion, estimate, done, time.monotonic() - sent, timing)
+
+    async def _awatch_motion(
+        self, motion: Motion, sent: float, timeout: float, estimate, step: Step,
+        timing: MoveTiming,
+    ) -> None:
+        try:
+            done = await self._await_motion_done(sent, timeout, estimate, step, timing, motion)
+        except Exception as exc:
+            logger.debug("Watching motion %d failed: %s", motion.id, exc)
+            done = False
+        self._finish_motion(motion, estimate, done, time.monotonic() - sent, timing)
+
+    def _prepare_move(
+        self,
+        mode: MotionMode,
+        target: list[float],
+        mid_point: list[float] | None,
+        end_point: list[float] | None,
+        speed_percent: int | None,
+        start: list[float] | None = None,
+    ) -> int | None:
+        """Check arm state and safety for a move; returns the clamped speed override."""
+        self.require_fresh()
         if not self.connected or not self.enabled:
             raise RuntimeError("Arm not connected or not enabled. Call /connect first.")
         if self._robot_type is None:
             raise RuntimeError("Robot type unknown")
+        if mode == MotionMode.C and (mid_point is None or end_point is None):
+            raise ValueError("Arc motion (C) requires mid_point and end_point")
 
-        self._safety.validate_move(self._robot_type, mode, target, mid_point, end_point)
+        self._safety.validate_move(self._robot_type, mode, target, mid_point, end_point, start)
 
-        if speed_percent is not None:
-            clamped = self._safety.validate_speed(speed_percent)
-            self._driver.set_speed_percent(clamped)
+        if speed_percent is None:
+            return None
+        return self._safety.validate_speed(speed_percent)
 
-        self._driver.set_motion_mode(mode.value)
+    @staticmethod
+    def _telemetry_getter(mode: MotionMode, driver):
+        """Getter for where a move in ``mode`` starts: joint angles for J/JS, else the pose."""
+        if mode in (MotionMode.J, MotionMode.JS):
+            return driver.get_joint_angles
+        return driver.get_flange_pose
+
+    def _validation_start(self, mode: MotionMode, current: list[float] | None):
+        """Start state to validate a move's path from, if its path is checked.
 
+        Joint moves are checked for self-collision along their interpolated path from the
+        current joints; linear moves through configured zones from the current pose.
+        """
         if mode in (MotionMode.J, MotionMode.JS):
-            self._driver.move_j(target)
-        elif mode == MotionMode.P:
-            self._driver.move_p(target)
-        elif mode == MotionMode.L:
-            self._driver.move_l(target)
-        elif mode == MotionMode.C:
-            if mid_point is None or end_point is None:
+            return current
+        if mode == MotionMode.L and self._safety.zones:
+            return current
+        return None
+
+    def move_sequence(
+        self,
+        steps: list[MoveStep | Step],
+        blend_radius: float = 0.0,
+        timeout: float | None = None,
+        simplify_tolerance: float = 0.0,
+        orientation_tolerance: Optional[float] = DEFAULT_ORIENTATION_TOLERANCE,
+    ) -> dict:
+        """Execute moves in order, blending corners between consecutive P/L moves.
+
+        Every step and the blended Cartesian path are validated before anything is sent;
+        runs of joint moves are checked for self-collision along their interpolated path.
+        With ``simplify_tolerance > 0`` runs of L moves are thinned out first (see
+        ``bridge.simplify``) and the result gains a ``simplification`` report.
+        Returns the ``SequenceResult`` as a dict (including ``cycle_time``).
+        """
+        with self._lock:  # for the whole run; it aborts as soon as the arm is degraded
+            return self._move_sequence(steps, blend_radius, timeout, simplify_tolerance,
+                                       orientation_tolerance)
+
+    def _move_sequence(
+        self,
+        steps: list[MoveStep | Step],
+        blend_radius: float,
+        timeout: float | None,
+        simplify_tolerance: float,
+        orientation_tolerance: Optional[float],
+    ) -> dict:
+        self.require_fresh()
+        if not self.connected or not self.enabled:
+            raise RuntimeError("Arm not connected or not enabled. Call /connect first.")
+        if self._robot_type is None:
+            raise RuntimeError("Robot type unknown")
+
+        checked: list[Step] = []
+        joints = self._driver.get_joint_angles()  # known only until a Cartesian step
+        for step in steps:
+            step = Step(step.mode, step.target, step.mid_point, step.end_point, step.speed_percent)
+            if step.mode == MotionMode.C and (step.mid_point is None or step.end_point is None):
                 raise ValueError("Arc motion (C) requires mid_point and end_point")
-            self._driver.move_c(target, mid_point, end_point)
+            is_joint = step.mode in (MotionMode.J, MotionMode.JS)
+            self._safety.validate_move(
+                self._robot_type, step.mode, step.target, step.mid_point, step.end_point,
+                joints if is_joint else None,
+            )
+            joints = step.target if is_joint else None
+            if step.speed_percent is not None:
+                speed = self._safety.validate_speed(step.speed_percent)
+                step = step._replace(speed_percent=speed)
+            checked.append(step)
+
+        start_pose = self._driver.get_flange_pose()
+        simplification = None
+        if simplify_tolerance > 0:
+            checked, simplification = simplify_steps(
+                checked, simplify_tolerance, orientation_tolerance, start_pose
+            )
+        for first, run in indexed_cartesian_runs(checked, start_pose):
+            self._safety.validate_cartesian_path(
+                run, blend_radius, self._robot_type,
+                from_start=first == 0 and start_pose is not None,
+            )
+        model = ARM_MODELS[self._robot_type]
+        for i, start in entry_segments(checked, start_pose, lambda q: model.points(q)[0, -1]):
+            self._safety.validate_move(self._robot_type, MotionMode.L, checked[i].target,
+                                       start=start)
+
+        speed = self._speed_percent
+
+        def step_timeout(step: Step) -> float:
+            nonlocal speed
+            if step.speed_percent is not None:
+                speed = step.speed_percent
+            current = (self._driver.get_joint_angles() if step.mode in (MotionMode.J, MotionMode.JS)
+                       else self._driver.get_flange_pose())
+            return adaptive_timeout(
+                self._estimate(step.mode, step.target, step.mid_point, step.end_point, current,
+                               speed)
+            )
+
+        executor = SequenceExecutor(
+            self._driver, blend_radius=blend_radius, timeout=timeout,
+            abort=lambda: self.degraded, step_timeout=step_timeout,
+        )
+        result = executor.run(checked).to_dict()
+        if simplification is not None:
+            result["simplification"] = simplification
+        speeds = [step.speed_percent for step in checked if step.speed_percent is not None]
+        if speeds:
+            self._speed_percent = speeds[-1]
+        return result
+
+    def simulate_sequence(
+        self,
+        steps: list[MoveStep | Step],
+        blend_radius: float = 0.0,
+        timeout: float | None = None,
+        simplify_tolerance: float = 0.0,
+        orientation_tolerance: Optional[float] = DEFAULT_ORIENTATION_TOLERANCE,
+        robot: Optional[RobotType] = None,
+        start_joints: Optional[list[float]] = None,
+    ) -> dict:
+        """Dry-run ``move_sequence`` on a simulated arm (see ``bridge.simulate``).
+
+        Starts from the connected arm's joints and pose, or from ``start_joints`` (default
+        all zero) when given, when ``robot`` is another robot or when nothing is connected.
+        Nothing is sent to the arm. Returns the ``SimulationResult`` as a dict.
+        """
+        robot = robot or self._robot_type
+        if robot is None:
+            raise RuntimeError("Arm not connected. Call /connect first or name a robot.")
+        joints = pose = None
+        if start_joints is None and self.connected and robot == self._robot_type:
+            joints = self._driver.get_joint_angles()
+            pose = self._driver.get_flange_pose()
+        if joints is None:
+            joints = list(start_joints) if start_joints is not None else [0.0] * DOF_MAP[robot]
+            if len(joints) != DOF_MAP[robot]:
+                raise ValueError(
+                    f"start_joints has {len(joints)} values, {robot.value} has "
+                    f"{DOF_MAP[robot]} joints"
+                )
+        return simulate_sequence(
+            robot, steps, self._safety, self._estimator, joints, pose, self._speed_percent,
+            blend_radius=blend_radius,
+            timeout=timeout,
+            simplify_tolerance=simplify_tolerance,
+            orientation_tolerance=orientation_tolerance,
+        ).to_dict()
+
+    def set_speed(self, speed_percent: int) -> int:
+        """Set the default speed for later moves (capped by safety); returns the value applied."""
+        with self._lock:
+            if not self.connected:
+                raise RuntimeError("Arm not connected. Call /connect first.")
+            speed = self._safety.validate_speed(speed_percent)
+            self._driver.set_speed_percent(speed)
+            self._speed_percent = speed
+            return speed
+
+    def run_batch(self, ops: list[dict]) -> dict:
+        """Run ``POST /batch`` operations in order; see ``bridge.batch.run_batch``."""
+        return run_batch(self, ops)
+
+    def enable(self) -> bool:
+        """Enable the arm, retrying like ``connect`` does; returns False if it never enables."""
+        self._want_enabled = True
+        retries = 0
+        while not self._driver.enable():
+            time.sleep(0.01)
+            retries += 1
+            if retries > 500:
+                return False
+        return True
 
-        time.sleep(POST_MOVE_DELAY)
+    def disable(self) -> bool:
+        self._want_enabled = False
+        retries = 0
+        while not self._driver.disable():
+            time.sleep(0.01)
+            retries += 1
+            if retries > 100:
+                return False
+        return True
 
-        if wait:
-            done = self._wait_motion_done(timeout)
-            return f"Motion {'completed' if done else 'timed out'} (mode={mode.value})"
-        return f"Motion command sent (mode={mode.value}, not waiting)"
+    async def aenable(self) -> bool:
+        """Like ``enable`` but awaits the driver."""
+        self._want_enabled = True
+        retries = 0
+        while not await self._adriver.enable():
+            await asyncio.sleep(0.01)
+            retries += 1
+            if retries > 500:
+                return False
+        return True
+
+    async def adisable(self) -> bool:
+        self._want_enabled = False
+        retries = 0
+        while not await self._adriver.disable():
+            await asyncio.sleep(0.01)
+            retries += 1
+            if retries > 100:
+                return False
+        return True
 
     def stop(self, emergency: bool = False) -> str:
         if not self._driver:
             return "Not connected"
+        self._motions.stop_all()
+        self._want_enabled = False
         if emergency:
             self._driver.emergency_stop()
+            self._reads.invalidate()
             return "EMERGENCY STOP executed"
-        if self.enabled:
-            retries = 0
-            while not self._driver.disable():
-                time.sleep(0.01)
-                retries += 1
-                if retries > 100:
-                    return "Failed to disable arm"
+        if self.enabled and not self.disable():
+            return "Failed to disable arm"
+        return "Arm disabled"
+
+    async def astop(self, emergency: bool = False) -> str:
+        if not self._adriver:
+            return "Not connected"
+        self._motions.stop_all()
+        self._want_enabled = False
+        if emergency:
+            await self._adriver.emergency_stop()
+            self._reads.invalidate()
+            return "EMERGENCY STOP executed"
+        if self.enabled and not await self.adisable():
+            return "Failed to disable arm"
         return "Arm disabled"
 
-    def _wait_motion_done(self, timeout: float) -> bool:
-        time.sleep(0.5)
-        start = time.monotonic()
+    def _wait_motion_done(
+        self,
+        sent: float,
+        timeout: float,
+        estimate: Optional[MotionEstimate],
+        step: Step,
+        timing: MoveTiming,
+        motion: Optional[Motion] = None,
+    ) -> bool:
+        """Poll until the arm is seen moving, sleep until close to the predicted finish,
+        then poll densely until done. Stamps ``moving`` and ``finished`` on ``timing``.
+
+        A background watcher passes its ``motion`` and gives up once it has been settled
+        some other way (superseded or stopped).
+        """
+        expected = estimate.duration if estimate else None
+        wake = time.monotonic() + _first_poll_delay(sent, expected, timeout)
         while True:
+            if (motion is not None and motion.done) or self.degraded:
+                return False
             status = self._driver.get_motion_status()
-            if status == 0:
+            now = time.monotonic()
+            if status is not None and status != 0:
+                if timing.moving is None:
+                    timing.moving = feedback_moment(self._driver.status_time(), now)
+            elif status == 0 and (
+                timing.moving is not None
+                or now - sent >= _stale_window(expected)
+                or at_target(step, self._driver.get_joint_angles(), self._driver.get_flange_pose())
+            ):
+                timing.finished = feedback_moment(self._driver.status_time(), now)
+                return True
+            if now - sent > timeout:
+                return False
+            time.sleep(_poll_delay(timing, wake))
+
+    async def _await_motion_done(
+        self,
+        sent: float,
+        timeout: float,
+        estimate: Optional[MotionEstimate],
+        step: Step,
+        timing: MoveTiming,
+        motion: Optional[Motion] = None,
+    ) -> bool:
+        expected = estimate.duration if estimate else None
+        wake = time.monotonic() + _first_poll_delay(sent, expected, timeout)
+        adriver = self._adriver
+        while True:
+            if (motion is not None and motion.done) or self.degraded:
+                return False
+            status = await self._reads.read("motion_status", adriver.get_motion_status)
+            now = time.monotonic()
+            if status is not None and status != 0:
+                if timing.moving is None:
+                    timing.moving = feedback_moment(await adriver.status_time(), now)
+            elif status == 0 and (
+                timing.moving is not None
+                or now - sent >= _stale_window(expected)
+                or await self._aat_target(step)
+            ):
+                timing.finished = feedback_moment(await adriver.status_time(), now)
                 return True
-            if time.monotonic() - start > timeout:
+            if now - sent > timeout:
                 return False
-            time.sleep(MOTION_POLL_INTERVAL)
+            await asyncio.sleep(_poll_delay(timing, wake))
+
+    async def _aat_target(self, step: Step) -> bool:
+        adriver = self._adriver
+        return at_target(step, await adriver.get_joint_angles(), await adriver.get_flange_pose())
+
+
+def _poll_delay(timing: MoveTiming, wake: float) -> float:
+    """Poll densely until the motion is seen starting, then sleep until ``wake``."""
+    if timing.moving is None:
+        return MOTION_POLL_INTERVAL
+    return max(wake - time.monotonic(), MOTION_POLL_INTERVAL)
+
+
+def _first_poll_delay(sent: float, expected: float | None, timeout: float) -> float:
+    """Seconds left until the first status poll is worth doing (never past the deadline)."""
+    if expected is None:
+        return 0.0
+    return max(min(EARLY_WAKE * expected, timeout) - (time.monotonic() - sent), 0.0)
+
+
+def _stale_window(expected: float | None) -> float:
+    """How long after a command a zero status is trusted without other evidence."""
+    if expected is None:
+        return STALE_STATUS_WINDOW
+    return min(expected, STALE_STATUS_WINDOW)
+
+
+def adaptive_timeout(estimate: Optional[MotionEstimate]) -> float:
+    """Wait deadline for a move: a margin over its predicted duration."""
+    if estimate is None:
+        return DEFAULT_TIMEOUT
+    return estimate.duration * TIMEOUT_FACTOR + TIMEOUT_SLACK
+
+
+def _watch_timeout(estimate: Optional[MotionEstimate], timeout: float | None) -> float:
+    """How long a background watcher follows an unwaited move."""
+    return timeout if timeout is not None else adaptive_timeout(estimate)
+
+
+def _resolve(mode: MotionMode, frame: Frame, current, target, mid_point, end_point):
+    if current is None:
+        raise RuntimeError("Arm not connected or not enabled. Call /connect first.")
+    return resolve_relative(mode, frame, current, target, mid_point, end_point)
+
+
+def _motion_report(
+    mode: MotionMode,
+    target: list[float],
+    estimate: Optional[MotionEstimate],
+    wait: bool,
+    timeout: float | None,
+) -> dict:
+    if wait and timeout is None:
+        timeout = round(adaptive_timeout(estimate), 4)
+    return {
+        "mode": mode.value,
+        "target": list(target),
+        "completed": None,
+        "estimated_duration": round(estimate.duration, 4) if estimate else None,
+        "timeout": timeout if wait else None,
+        "elapsed": None,
+        "joint_angles": None,  # final telemetry, filled in once a waited move ends
+        "flange_pose": None,
+    }
+
+
+def motion_message(report: dict) -> str:
+    """Human-readable summary of a ``move`` report."""
+    if report["completed"] is None:
+        return (
+            f"Motion command sent (id={report['motion_id']}, mode={report['mode']}, "
+            "not waiting)"
+        )
+    status = "completed" if report["completed"] else "timed out"
+    return f"Motion {status} (mode={report['mode']})"
+
+
+def _motion_call(
+    mode: MotionMode,
+    target: list[float],
+    mid_point: list[float] | None,
+    end_point: list[float] | None,
+) -> tuple[str, tuple]:
+    """Driver method name and arguments that execute a move in ``mode``."""
+    if mode in (MotionMode.J, MotionMode.JS):
+        return "move_j", (target,)
+    if mode == MotionMode.P:
+        return "move_p", (target,)
+    if mode == MotionMode.L:
+        return "move_l", (target,)
+    return "move_c", (target, mid_point, end_point)
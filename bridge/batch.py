@@ -0,0 +1,93 @@
+"""Batches of heterogeneous arm operations run in one request (``POST /batch``).
+
+An agent's status → move → status round trips become one request. Operations run in
+order on whichever process owns the arm, and the batch stops at the first failure. Each
+operation reports its own result and timing.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from .models import StopAction
+from .safety import SafetyError
+
+_MOVE_FIELDS = (
+    "mode", "target", "mid_point", "end_point", "speed_percent", "wait", "timeout", "relative",
+    "frame",
+)
+
+
+class BatchError(RuntimeError):
+    """An operation ran but did not succeed (e.g. a move timed out)."""
+
+
+def run_batch(mgr, ops: list[dict]) -> dict:
+    """Run ``ops`` (``BatchOp`` dicts) against ``mgr`` in order, stopping at the first error.
+
+    Returns ``{"completed", "failed_at", "elapsed", "ops"}`` where ``ops`` holds one entry
+    per operation that ran: ``op``, ``ok``, ``elapsed`` and ``result`` and/or ``error``.
+    """
+    start = time.perf_counter()
+    results: list[dict] = []
+    failed_at: Optional[int] = None
+    last_motion: Optional[int] = None
+    for index, op in enumerate(ops):
+        began = time.perf_counter()
+        entry: dict = {"op": op["op"], "ok": True}
+        try:
+            entry["result"] = result = _run_op(mgr, op, last_motion)
+            if op["op"] == "move":
+                last_motion = result["motion_id"]
+            _check(op, result)
+        except Exception as exc:
+            entry["ok"] = False
+            entry["error"] = _describe(exc)
+            failed_at = index
+        entry["elapsed"] = round(time.perf_counter() - began, 4)
+        results.append(entry)
+        if failed_at is not None:
+            break
+    return {
+        "completed": failed_at is None,
+        "failed_at": failed_at,
+        "elapsed": round(time.perf_counter() - start, 4),
+        "ops": results,
+    }
+
+
+def _run_op(mgr, op: dict, last_motion: Optional[int]):
+    kind = op["op"]
+    if kind == "status":
+        return mgr.get_status()
+    if kind == "speed":
+        return {"speed_percent": mgr.set_speed(op["speed_percent"])}
+    if kind == "move":
+        return mgr.move(**{key: op[key] for key in _MOVE_FIELDS})
+    if kind == "wait":
+        motion_id = op["motion_id"] if op["motion_id"] is not None else last_motion
+        if motion_id is None:
+            raise ValueError("'wait' needs a motion_id or an earlier move in the batch")
+        motion = mgr.wait_motion(motion_id, op["timeout"])
+        if motion is None:
+            raise ValueError(f"Unknown motion {motion_id}")
+        return motion
+    if kind == "stop":
+        return {"message": mgr.stop(emergency=op["action"] == StopAction.EMERGENCY_STOP)}
+    raise ValueError(f"Unknown batch operation: {kind}")
+
+
+def _check(op: dict, result: dict) -> None:
+    """Fail moves that timed out and waits that did not end in completion."""
+    if op["op"] == "move" and result["completed"] is False:
+        raise BatchError(f"Motion {result['motion_id']} timed out (mode={result['mode']})")
+    if op["op"] == "wait" and result["state"] != "completed":
+        state = result["state"]
+        if state == "running":
+            state = f"still running after {op['timeout']}s"
+        raise BatchError(f"Motion {result['motion_id']} {state.replace('_', ' ')}")
+
+
+def _describe(exc: Exception) -> str:
+    return f"Safety violation: {exc}" if isinstance(exc, SafetyError) else str(exc)
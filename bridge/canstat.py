@@ -0,0 +1,208 @@
+"""Passive CAN bus load and error-frame monitor.
+
+``BusMonitor`` is a python-can listener that tracks, over a sliding window, frames per
+second per arbitration ID, estimated bus utilization, error frames and gaps in the arm's
+feedback streams. ``CanMonitor`` runs it on its own bus handle so it never interferes
+with the driver. ``clawarm-canstat`` prints the same numbers from the command line.
+
+Timestamps come from python-can messages (seconds since the epoch), so rates and gaps
+reflect when frames were seen on the bus rather than when Python got around to them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import can
+
+from .drivers import can_protocol as proto
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BITRATE = 1_000_000
+DEFAULT_WINDOW = 1.0
+GAP_FACTOR = 3.0  # a gap is an inter-arrival time this many times the stream's usual period
+MIN_GAP = 0.005
+
+
+def frame_bits(dlc: int, extended: bool = False) -> int:
+    """Worst-case bits on the wire for a classic CAN data frame, including bit stuffing
+    and the 3-bit interframe space."""
+    if extended:
+        return 8 * dlc + 67 + (54 + 8 * dlc - 1) // 4
+    return 8 * dlc + 47 + (34 + 8 * dlc - 1) // 4
+
+
+class _Stream:
+    __slots__ = ("times", "last", "period", "gaps", "max_gap")
+
+    def __init__(self) -> None:
+        self.times: deque[float] = deque()
+        self.last: Optional[float] = None
+        self.period: Optional[float] = None
+        self.gaps = 0
+        self.max_gap = 0.0
+
+
+class BusMonitor(can.Listener):
+    """Collects per-ID frame rates, bus load, error frames and feedback stream gaps."""
+
+    def __init__(
+        self,
+        bitrate: int = DEFAULT_BITRATE,
+        window: float = DEFAULT_WINDOW,
+        feedback_ids: tuple[int, ...] = proto.FEEDBACK_IDS,
+    ) -> None:
+        self.bitrate = bitrate
+        self.window = window
+        self._feedback_ids = frozenset(feedback_ids)
+        self._streams: dict[int, _Stream] = {}
+        self._bits: deque[tuple[float, int]] = deque()
+        self._errors: deque[float] = deque()
+        self._frames = 0
+        self._error_frames = 0
+        self._lock = threading.Lock()
+
+    def on_message_received(self, msg: can.Message) -> None:
+        ts = msg.timestamp or time.time()
+        with self._lock:
+            if msg.is_error_frame:
+                self._error_frames += 1
+                self._errors.append(ts)
+                return
+            self._frames += 1
+            self._bits.append((ts, frame_bits(msg.dlc, msg.is_extended_id)))
+            stream = self._streams.get(msg.arbitration_id)
+            if stream is None:
+                stream = self._streams[msg.arbitration_id] = _Stream()
+            stream.times.append(ts)
+            if stream.last is not None:
+                self._track_gap(msg.arbitration_id, stream, ts - stream.last)
+            stream.last = ts
+
+    def _track_gap(self, arbitration_id: int, stream: _Stream, dt: float) -> None:
+        if arbitration_id not in self._feedback_ids:
+            return
+        if stream.period is not None and dt > max(GAP_FACTOR * stream.period, MIN_GAP):
+            stream.gaps += 1
+            stream.max_gap = max(stream.max_gap, dt)
+            return  # keep gaps out of the period estimate
+        stream.period = dt if stream.period is None else 0.9 * stream.period + 0.1 * dt
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window
+        for stream in self._streams.values():
+            while stream.times and stream.times[0] < horizon:
+                stream.times.popleft()
+        while self._bits and self._bits[0][0] < horizon:
+            self._bits.popleft()
+        while self._errors and self._errors[0] < horizon:
+            self._errors.popleft()
+
+    def snapshot(self, now: Optional[float] = None) -> dict:
+        """Current metrics; rates are averaged over the last ``window`` seconds."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._prune(now)
+            fps = {
+                f"0x{fid:03x}": len(s.times) / self.window
+                for fid, s in sorted(self._streams.items())
+                if s.times
+            }
+            bits = sum(b for _, b in self._bits)
+            gaps = {
+                f"0x{fid:03x}": {
+                    "gaps": s.gaps,
+                    "max_gap_ms": round(s.max_gap * 1000, 3),
+                    "silent_ms": round((now - s.last) * 1000, 3),
+                }
+                for fid, s in sorted(self._streams.items())
+                if fid in self._feedback_ids and s.last is not None
+            }
+            return {
+                "window_s": self.window,
+                "bitrate": self.bitrate,
+                "frames_total": self._frames,
+                "frames_per_second": sum(fps.values()),
+                "fps_by_id": fps,
+                "bus_load_percent": round(100.0 * bits / (self.bitrate * self.window), 2),
+                "error_frames_total": self._error_frames,
+                "error_frames_per_second": len(self._errors) / self.window,
+                "feedback_gaps": gaps,
+            }
+
+
+class CanMonitor:
+    """Runs a ``BusMonitor`` on its own (receive-only) handle to a CAN channel."""
+
+    def __init__(
+        self,
+        channel: str,
+        interface: str = "socketcan",
+        bitrate: int = DEFAULT_BITRATE,
+        window: float = DEFAULT_WINDOW,
+    ) -> None:
+        self.monitor = BusMonitor(bitrate=bitrate, window=window)
+        self._bus = can.Bus(interface=interface, channel=channel)
+        self._notifier = can.Notifier(self._bus, [self.monitor], timeout=0.1)
+        logger.info("CAN monitor listening on %s (%s)", channel, interface)
+
+    def snapshot(self) -> dict:
+        return self.monitor.snapshot()
+
+    def stop(self) -> None:
+        self._notifier.stop()
+        self._bus.shutdown()
+
+
+def _print_table(snap: dict, top: int) -> None:
+    print(
+        f"{snap['frames_per_second']:8.1f} fps  load {snap['bus_load_percent']:5.1f}%  "
+        f"errors {snap['error_frames_total']} ({snap['error_frames_per_second']:.1f}/s)"
+    )
+    rates = sorted(snap["fps_by_id"].items(), key=lambda kv: -kv[1])[:top]
+    for fid, fps in rates:
+        gap = snap["feedback_gaps"].get(fid)
+        extra = f"  gaps {gap['gaps']} (max {gap['max_gap_ms']:.1f} ms)" if gap else ""
+        print(f"    {fid}  {fps:8.1f} fps{extra}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="clawarm-canstat", description="Passive CAN bus load and error-frame monitor"
+    )
+    parser.add_argument("--channel", default="can0")
+    parser.add_argument("--interface", default="socketcan")
+    parser.add_argument("--bitrate", type=int, default=DEFAULT_BITRATE)
+    parser.add_argument("--interval", type=float, default=DEFAULT_WINDOW,
+                        help="seconds between reports (also the averaging window)")
+    parser.add_argument("--count", type=int, default=0, help="number of reports (0 = forever)")
+    parser.add_argument("--top", type=int, default=10, help="arbitration IDs to list")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per report")
+    args = parser.parse_args(argv)
+
+    mon = CanMonitor(args.channel, args.interface, args.bitrate, args.interval)
+    try:
+        reports = 0
+        while args.count == 0 or reports < args.count:
+            time.sleep(args.interval)
+            snap = mon.snapshot()
+            if args.json:
+                print(json.dumps(snap), flush=True)
+            else:
+                _print_table(snap, args.top)
+            reports += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mon.stop()
+
+
+if __name__ == "__main__":
+    main()
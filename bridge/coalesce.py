@@ -0,0 +1,87 @@
+"""Single-flight coalescing of concurrent driver reads.
+
+When several requests ask for the same reading at once, ``ReadCoalescer`` makes one driver
+call and hands its result to every caller. With a non-zero ``freshness`` window, a result
+is also reused by callers arriving shortly after it was taken. Counters report how many
+driver calls that saved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+
+class ReadCoalescer:
+    """Shares in-flight (and, within ``freshness`` seconds, recent) reads by key.
+
+    Reads must come from a single event loop. Each read runs as its own task, so a caller
+    being cancelled never cancels the read for the others. ``invalidate`` may be called
+    from any thread (commands run in the threadpool, reconnects in the watchdog's), so
+    the shared state is guarded by a lock.
+    """
+
+    def __init__(self, freshness: float = 0.0) -> None:
+        self.freshness = freshness
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.driver_calls = 0
+        self.coalesced = 0  # joined a read already in flight
+        self.cached = 0  # served from a result inside the freshness window
+
+    async def read(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.requests += 1
+        with self._lock:
+            hit = self._cache.get(key) if self.freshness > 0 else None
+            if hit is not None and time.monotonic() - hit[0] <= self.freshness:
+                self.cached += 1
+                return hit[1]
+
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self.driver_calls += 1
+                self._inflight[key] = task
+                task.add_done_callback(self._finisher(key, time.monotonic(), self._generation))
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finisher(self, key: str, started: float, generation: int):
+        def finish(task: asyncio.Task) -> None:
+            with self._lock:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                if task.cancelled() or task.exception() is not None:
+                    return
+                # Age the result from when the read started; skip it if a command has been
+                # issued since, as it may predate that command.
+                if generation == self._generation:
+                    self._cache[key] = (started, task.result())
+
+        return finish
+
+    def invalidate(self) -> None:
+        """Forget cached and in-flight results, e.g. after a command changes arm state."""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            self._inflight.clear()
+
+    def snapshot(self) -> dict:
+        return {
+            "freshness_s": self.freshness,
+            "requests": self.requests,
+            "driver_calls": self.driver_calls,
+            "coalesced": self.coalesced,
+            "cached": self.cached,
+            "calls_saved": self.requests - self.driver_calls,
+            "amplification": round(self.requests / self.driver_calls, 3)
+            if self.driver_calls
+            else None,
+        }
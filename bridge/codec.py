@@ -0,0 +1,325 @@
+"""Binary msgpack content negotiation for high-rate bridge endpoints.
+
+Clients opt in with ``Content-Type: application/msgpack`` (request body) and/or
+``Accept: application/msgpack`` (response body). On that path requests are decoded and
+validated by hand instead of through Pydantic models, and responses are packed directly.
+
+Joint angles and poses travel as packed arrays: msgpack ``bin`` values holding little-endian
+float64s (``struct`` format ``<Nd``). Requests may also send plain msgpack arrays of numbers.
+
+msgpack is an optional dependency (``pip install clawarm-bridge[msgpack]``). Without it,
+msgpack request bodies are rejected with 415 and ``Accept`` falls back to JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from .latency import RECEIVED
+from .models import (
+    LONG_POLL_MAX,
+    LONG_POLL_TIMEOUT,
+    Frame,
+    MotionMode,
+    MoveRequest,
+    MoveSequenceRequest,
+    MoveStep,
+)
+from .sequence import Step
+from .state import JointState, Pose, jsonable
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+MSGPACK = MSGPACK_MEDIA_TYPES[0]
+
+_MODES = {m.value: m for m in MotionMode}
+_FRAMES = {f.value: f for f in Frame}
+_ARRAY_FIELDS = ("joint_angles", "flange_pose")
+
+
+class CodecError(ValueError):
+    """Raised when a fast-path request payload fails validation."""
+
+
+# --- Packed float arrays ---
+
+
+def pack_floats(values: list[float] | JointState | Pose) -> bytes:
+    if isinstance(values, (JointState, Pose)):
+        return values.tobytes()
+    return struct.pack(f"<{len(values)}d", *values)
+
+
+def unpack_floats(data: bytes) -> list[float]:
+    if len(data) % 8:
+        raise CodecError(f"Packed float array length {len(data)} is not a multiple of 8")
+    return list(struct.unpack(f"<{len(data) // 8}d", data))
+
+
+# --- Negotiation ---
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def _media_type(header: Optional[str]) -> str:
+    return (header or "").split(";", 1)[0].strip().lower()
+
+
+def sends_msgpack(request: Request) -> bool:
+    return _media_type(request.headers.get("content-type")) in MSGPACK_MEDIA_TYPES
+
+
+def accepts_msgpack(request: Request) -> bool:
+    accept = request.headers.get("accept", "").lower()
+    return msgpack is not None and any(t in accept for t in MSGPACK_MEDIA_TYPES)
+
+
+def wants_fast_path(request: Request) -> bool:
+    return sends_msgpack(request) or accepts_msgpack(request)
+
+
+async def read_body(request: Request) -> dict:
+    """Decode a msgpack or JSON request body into a plain dict."""
+    body = await request.body()
+    try:
+        if sends_msgpack(request):
+            if msgpack is None:
+                raise HTTPException(status_code=415, detail="msgpack support is not installed")
+            payload = msgpack.unpackb(body, raw=False)
+        else:
+            payload = json.loads(body or b"{}")
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=f"Malformed request body: {exc}")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a map")
+    return payload
+
+
+def respond(request: Request, data: dict) -> Response:
+    """Encode ``data`` as msgpack when the client accepts it, else as JSON."""
+    if accepts_msgpack(request):
+        packed = dict(data)
+        for key in _ARRAY_FIELDS:
+            if packed.get(key) is not None:
+                packed[key] = pack_floats(packed[key])
+        content = msgpack.packb(packed, use_bin_type=True, default=jsonable)
+        return Response(content=content, media_type=MSGPACK)
+    return Response(content=json.dumps(data, default=jsonable), media_type="application/json")
+
+
+# --- Fast-path validation (mirrors the Pydantic request models) ---
+
+
+def _floats(payload: dict, key: str, required: bool = False) -> Optional[list[float]]:
+    value = payload.get(key)
+    if value is None:
+        if required:
+            raise CodecError(f"'{key}' is required")
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        return unpack_floats(bytes(value))
+    if isinstance(value, (list, tuple)) and all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in value
+    ):
+        return [float(v) for v in value]
+    raise CodecError(f"'{key}' must be a packed float array or a list of numbers")
+
+
+class _Bounds(NamedTuple):
+    default: Any
+    lo: float
+    hi: float
+    lo_open: bool = False  # lo itself is not allowed
+
+
+def _field_bounds(model: type, key: str) -> _Bounds:
+    """Default and ``ge``/``gt``/``le`` bounds of a numeric field of a request model."""
+    field = model.model_fields[key]
+    lo = hi = None
+    lo_open = False
+    for rule in field.metadata:
+        if getattr(rule, "ge", None) is not None:
+            lo = rule.ge
+        elif getattr(rule, "gt", None) is not None:
+            lo, lo_open = rule.gt, True
+        elif getattr(rule, "le", None) is not None:
+            hi = rule.le
+    return _Bounds(field.default, lo, hi, lo_open)
+
+
+# The fast path applies the same defaults and limits as the Pydantic request models.
+_SPEED = _field_bounds(MoveStep, "speed_percent")
+_MOVE_TIMEOUT = _field_bounds(MoveRequest, "timeout")
+_SEQUENCE = {
+    key: _field_bounds(MoveSequenceRequest, key)
+    for key in ("blend_radius", "timeout", "simplify_tolerance", "orientation_tolerance")
+}
+_CHANGED_SINCE = _Bounds(None, 0, 2**63)
+_LONG_POLL = _Bounds(None, 0.0, LONG_POLL_MAX)
+
+
+def _number(payload: dict, key: str, bounds: _Bounds, kind: type) -> Any:
+    value = payload.get(key, bounds.default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise CodecError(f"'{key}' must be a number")
+    if not math.isfinite(value):
+        raise CodecError(f"'{key}' must be a finite number")
+    if kind is int and value != int(value):
+        raise CodecError(f"'{key}' must be an integer")
+    lo, hi = bounds.lo, bounds.hi
+    if bounds.lo_open and not lo < value <= hi:
+        raise CodecError(f"'{key}' must be greater than {lo} and at most {hi}")
+    if not lo <= value <= hi:
+        raise CodecError(f"'{key}' must be between {lo} and {hi}")
+    return kind(value)
+
+
+def parse_step(payload: dict) -> dict:
+    """Validate a single move step; returns keyword arguments for ``ArmManager.move``."""
+    if not isinstance(payload, dict):
+        raise CodecError("Each step must be a map")
+    mode = _MODES.get(payload.get("mode"))
+    if mode is None:
+        raise CodecError(f"'mode' must be one of {', '.join(_MODES)}")
+    return {
+        "mode": mode,
+        "target": _floats(payload, "target", required=True),
+        "mid_point": _floats(payload, "mid_point"),
+        "end_point": _floats(payload, "end_point"),
+        "speed_percent": _number(payload, "speed_percent", _SPEED, int),
+    }
+
+
+def parse_move(payload: dict) -> dict:
+    """Validate a ``MoveRequest``-shaped payload without building the model."""
+    kwargs = parse_step(payload)
+    wait = payload.get("wait", True)
+    if not isinstance(wait, bool):
+        raise CodecError("'wait' must be a boolean")
+    kwargs["wait"] = wait
+    kwargs["timeout"] = _number(payload, "timeout", _MOVE_TIMEOUT, float)
+    relative = payload.get("relative", False)
+    if not isinstance(relative, bool):
+        raise CodecError("'relative' must be a boolean")
+    kwargs["relative"] = relative
+    frame = _FRAMES.get(payload.get("frame", Frame.BASE.value))
+    if frame is None:
+        raise CodecError(f"'frame' must be one of {', '.join(_FRAMES)}")
+    kwargs["frame"] = frame
+    return kwargs
+
+
+def _packed_steps(payload: dict) -> list[Step]:
+    """Expand the columnar form: one mode and a single packed array of all targets."""
+    mode = _MODES.get(payload.get("mode"))
+    if mode is None or mode == MotionMode.C:
+        raise CodecError("Packed 'targets' require 'mode' to be one of J, JS, P, L")
+    stride = payload.get("stride")
+    if not isinstance(stride, int) or isinstance(stride, bool) or not 1 <= stride <= 16:
+        raise CodecError("'stride' must be the number of values per target")
+    values = _floats(payload, "targets", required=True)
+    if not values or len(values) % stride:
+        raise CodecError(f"'targets' length {len(values)} is not a multiple of stride {stride}")
+    speed = _number(payload, "speed_percent", _SPEED, int)
+    return [Step(mode, values[i : i + stride], None, None, speed)
+            for i in range(0, len(values), stride)]
+
+
+def parse_sequence(payload: dict) -> dict:
+    """Validate a ``MoveSequenceRequest``-shaped payload.
+
+    Besides ``steps``, a sequence may be sent in columnar form — ``mode``, ``stride`` and a
+    single packed ``targets`` array — which is the cheapest encoding for long waypoint lists.
+    Steps become lightweight ``sequence.Step`` tuples rather than ``MoveStep`` models.
+    """
+    if "targets" in payload:
+        steps = _packed_steps(payload)
+    else:
+        raw = payload.get("steps")
+        if not isinstance(raw, list) or not raw:
+            raise CodecError("'steps' must be a non-empty list")
+        steps = [Step(**parse_step(step)) for step in raw]
+    return {
+        "steps": steps,
+        **{key: _number(payload, key, bounds, float) for key, bounds in _SEQUENCE.items()},
+    }
+
+
+def parse_status_query(params) -> dict:
+    """Validate the ``changed_since`` / ``timeout`` query parameters of ``GET /status``."""
+    query: dict[str, Any] = {}
+    for key, kind in (("changed_since", int), ("timeout", float)):
+        value = params.get(key)
+        try:
+            query[key] = kind(value) if value is not None else None
+        except ValueError:
+            raise CodecError(f"'{key}' must be a number") from None
+    return {
+        "changed_since": _number(query, "changed_since", _CHANGED_SINCE, int),
+        "timeout": _number(query, "timeout", _LONG_POLL, float)
+        if query["timeout"] is not None
+        else LONG_POLL_TIMEOUT,
+    }
+
+
+# --- Routing ---
+
+
+def fast_path(handler: Callable[[Request], Any]):
+    """Attach a msgpack fast-path ``handler`` to an endpoint served by ``NegotiatedRoute``."""
+
+    def decorate(endpoint):
+        endpoint.fast_path = handler
+        return endpoint
+
+    return decorate
+
+
+class NegotiatedRoute(APIRoute):
+    """Route class that dispatches msgpack requests to the endpoint's fast path.
+
+    JSON requests go through the regular FastAPI handler (and its Pydantic validation), so
+    the OpenAPI schema and behaviour of the JSON API are unchanged. Either way the request
+    is stamped with when it reached the route, before its body is read (``RECEIVED`` in
+    the ASGI scope, see ``bridge.latency``).
+    """
+
+    def get_route_handler(self):
+        default = super().get_route_handler()
+        handler = getattr(self.endpoint, "fast_path", None)
+        if handler is None:
+            return default
+
+        async def route_handler(request: Request) -> Response:
+            request.scope[RECEIVED] = time.monotonic()
+            if wants_fast_path(request):
+                return await handler(request)
+            return await default(request)
+
+        return route_handler
+
+
+MSGPACK_RESPONSE_OPENAPI = {
+    "responses": {"200": {"content": {MSGPACK: {"schema": {"type": "object"}}}}},
+}
+MSGPACK_OPENAPI = {
+    "requestBody": {"content": {MSGPACK: {"schema": {"type": "object"}}}},
+    **MSGPACK_RESPONSE_OPENAPI,
+}
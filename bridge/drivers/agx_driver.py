@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from .base import ArmDriver
+from ..state import JointState, Pose
+from .base import ArmDriver, FeedbackClock, Freshness
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ class AgxArmDriver(ArmDriver):
         self._enabled = False
         self._robot_type: Optional[str] = None
         self._dof: int = 7
+        self._feedback_clock = FeedbackClock()
 
     def connect(self, robot: str, channel: str, interface: str) -> None:
         try:
@@ -45,6 +47,7 @@ class AgxArmDriver(ArmDriver):
         )
         self._robot_obj = AgxArmFactory.create_arm(cfg)
         self._robot_obj.connect()
+        self._feedback_clock = FeedbackClock()
         self._robot_type = robot
         self._dof = _DOF.get(robot, 7)
         self._connected = True
@@ -104,15 +107,23 @@ class AgxArmDriver(ArmDriver):
     ) -> None:
         self._robot_obj.move_c(start, mid, end)
 
-    def get_joint_angles(self) -> Optional[list[float]]:
+    def get_joint_angles(self) -> Optional[JointState]:
         ja = self._robot_obj.get_joint_angles()
-        return list(ja.msg) if ja is not None else None
+        return JointState(ja.msg) if ja is not None else None
 
-    def get_flange_pose(self) -> Optional[list[float]]:
+    def feedback_freshness(self) -> Optional[Freshness]:
+        """From the ``timestamp`` and ``hz`` the SDK attaches to joint angle messages."""
+        ja = self._robot_obj.get_joint_angles()
+        if ja is not None and getattr(ja, "timestamp", None) is None:
+            return None  # an SDK version without message timestamps
+        stamp = ja.timestamp if ja is not None else None
+        return Freshness(self._feedback_clock.age(stamp), getattr(ja, "hz", None))
+
+    def get_flange_pose(self) -> Optional[Pose]:
         pose = self._robot_obj.get_flange_pose()
         if pose is None:
             return None
-        return list(pose) if isinstance(pose, (list, tuple)) else list(pose.msg)
+        return Pose(pose) if isinstance(pose, (list, tuple)) else Pose(pose.msg)
 
     def get_motion_status(self) -> Optional[int]:
         status = self._robot_obj.get_arm_status()
@@ -120,6 +131,10 @@ class AgxArmDriver(ArmDriver):
             return getattr(status.msg, "motion_status", None)
         return None
 
+    def status_time(self) -> Optional[float]:
+        status = self._robot_obj.get_arm_status()
+        return getattr(status, "timestamp", None) if status is not None else None
+
     def emergency_stop(self) -> None:
         self._robot_obj.electronic_emergency_stop()
         self._enabled = False
@@ -0,0 +1,140 @@
+"""Run a synchronous ``ArmDriver`` behind the ``AsyncArmDriver`` protocol."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from ..state import JointState, Pose
+from .base import ArmDriver, AsyncArmDriver
+from .mock_driver import AsyncMockArmDriver, MockArmDriver
+
+T = TypeVar("T")
+
+
+class LockedDriver:
+    """Proxy for a sync driver that holds ``lock`` for every method call.
+
+    Attributes that are not callable (``is_connected``, ``dof``) are read straight through.
+    """
+
+    def __init__(self, driver: ArmDriver, lock: threading.RLock) -> None:
+        self.driver = driver
+        self.lock = lock
+
+    def __getattr__(self, name: str):
+        value = getattr(self.driver, name)
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def locked(*args, **kwargs):
+            with self.lock:
+                return value(*args, **kwargs)
+
+        setattr(self, name, locked)  # later lookups skip __getattr__
+        return locked
+
+
+class ThreadedDriverAdapter:
+    """Adapts a sync driver by running every call on a dedicated single-thread executor.
+
+    Awaited calls run on one worker thread per arm, in the order they were awaited, while
+    the event loop stays free during blocking SDK calls. Code that calls the driver from
+    its own threads (threadpool handlers, scripts, motion watchers, the owner publisher)
+    must use ``sync``: it takes the same lock as the worker thread, so one call at a time
+    is inside the SDK. Calls from different threads are serialized, not ordered.
+    """
+
+    def __init__(self, driver: ArmDriver) -> None:
+        self.sync = LockedDriver(driver, threading.RLock())
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clawarm-arm")
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Run ``fn(*args)`` on the arm thread, ordered with all other driver calls."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    @property
+    def is_connected(self) -> bool:
+        return self.sync.is_connected
+
+    @property
+    def is_enabled(self) -> bool:
+        return getattr(self.sync, "is_enabled", False)
+
+    async def connect(self, robot: str, channel: str, interface: str) -> None:
+        await self.run(self.sync.connect, robot, channel, interface)
+
+    async def disconnect(self) -> None:
+        await self.run(self.sync.disconnect)
+
+    async def set_normal_mode(self) -> None:
+        await self.run(self.sync.set_normal_mode)
+
+    async def set_master_mode(self) -> None:
+        await self.run(self.sync.set_master_mode)
+
+    async def set_slave_mode(self) -> None:
+        await self.run(self.sync.set_slave_mode)
+
+    async def enable(self) -> bool:
+        return await self.run(self.sync.enable)
+
+    async def disable(self) -> bool:
+        return await self.run(self.sync.disable)
+
+    async def set_speed_percent(self, pct: int) -> None:
+        await self.run(self.sync.set_speed_percent, pct)
+
+    async def set_motion_mode(self, mode: str) -> None:
+        await self.run(self.sync.set_motion_mode, mode)
+
+    async def move_j(self, joints: list[float]) -> None:
+        await self.run(self.sync.move_j, joints)
+
+    async def move_p(self, pose: list[float]) -> None:
+        await self.run(self.sync.move_p, pose)
+
+    async def move_l(self, pose: list[float]) -> None:
+        await self.run(self.sync.move_l, pose)
+
+    async def move_c(
+        self, start: list[float], mid: list[float], end: list[float]
+    ) -> None:
+        await self.run(self.sync.move_c, start, mid, end)
+
+    async def get_joint_angles(self) -> Optional[JointState]:
+        return await self.run(self.sync.get_joint_angles)
+
+    async def get_flange_pose(self) -> Optional[Pose]:
+        return await self.run(self.sync.get_flange_pose)
+
+    async def get_motion_status(self) -> Optional[int]:
+        return await self.run(self.sync.get_motion_status)
+
+    async def status_time(self) -> Optional[float]:
+        return await self.run(self.sync.status_time)
+
+    async def emergency_stop(self) -> None:
+        await self.run(self.sync.emergency_stop)
+
+    async def reset(self) -> None:
+        await self.run(self.sync.reset)
+
+
+def as_async_driver(driver: ArmDriver) -> AsyncArmDriver:
+    """Return an awaitable view of ``driver``, native where one exists.
+
+    Sync callers should switch to the view's ``sync`` driver, which is locked where the
+    view runs on its own thread.
+    """
+    if isinstance(driver, MockArmDriver):
+        return AsyncMockArmDriver(driver)
+    return ThreadedDriverAdapter(driver)
@@ -1,9 +1,38 @@
-"""Abstract base class for arm drivers."""
+"""Abstract base class for arm drivers and the awaitable driver protocol."""
 
 from __future__ import annotations
 
+import math
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import NamedTuple, Optional, Protocol, runtime_checkable
+
+from ..state import JointState, Pose
+
+
+class Freshness(NamedTuple):
+    """How recent the arm's joint feedback is (see ``ArmDriver.feedback_freshness``)."""
+
+    age: float  # seconds since joint feedback last changed; inf if none since connect
+    hz: Optional[float] = None  # feedback rate, where the driver reports one
+
+
+class FeedbackClock:
+    """Turns a feedback timestamp that advances with every new frame into an age.
+
+    The age is measured locally from when the timestamp was last seen to change, so the
+    timestamp's own clock base does not matter.
+    """
+
+    def __init__(self) -> None:
+        self._stamp: Optional[float] = None
+        self._seen: Optional[float] = None
+
+    def age(self, stamp: Optional[float]) -> float:
+        now = time.monotonic()
+        if stamp is not None and stamp != self._stamp:
+            self._stamp, self._seen = stamp, now
+        return math.inf if self._seen is None else now - self._seen
 
 
 class ArmDriver(ABC):
@@ -55,10 +84,10 @@ class ArmDriver(ABC):
     ) -> None: ...
 
     @abstractmethod
-    def get_joint_angles(self) -> Optional[list[float]]: ...
+    def get_joint_angles(self) -> Optional[JointState]: ...
 
     @abstractmethod
-    def get_flange_pose(self) -> Optional[list[float]]: ...
+    def get_flange_pose(self) -> Optional[Pose]: ...
 
     @abstractmethod
     def get_motion_status(self) -> Optional[int]: ...
@@ -68,3 +97,75 @@ class ArmDriver(ABC):
 
     @abstractmethod
     def reset(self) -> None: ...
+
+    def feedback_freshness(self) -> Optional[Freshness]:
+        """Age of the latest joint feedback, or None if this driver cannot tell."""
+        return None
+
+    def status_time(self) -> Optional[float]:
+        """Receive time (``time.time()`` clock) of the feedback that first showed the current
+        motion status, or of the latest status feedback; None if the driver cannot tell."""
+        return None
+
+
+@runtime_checkable
+class AsyncArmDriver(Protocol):
+    """Awaitable counterpart of ``ArmDriver`` for use from the server's event loop.
+
+    Implementations either run natively on asyncio (``AsyncMockArmDriver``) or adapt a
+    sync driver (``ThreadedDriverAdapter``). Calls made on one instance are executed in the
+    order they were awaited. ``sync`` is the driver that threads outside the event loop
+    call, so their calls do not overlap the awaited ones.
+    """
+
+    sync: ArmDriver
+
+    @property
+    def is_connected(self) -> bool: ...
+
+    @property
+    def is_enabled(self) -> bool: ...
+
+    async def connect(self, robot: str, channel: str, interface: str) -> None: ...
+
+    async def disconnect(self) -> None: ...
+
+    async def set_normal_mode(self) -> None: ...
+
+    async def set_master_mode(self) -> None: ...
+
+    async def set_slave_mode(self) -> None: ...
+
+    async def enable(self) -> bool: ...
+
+    async def disable(self) -> bool: ...
+
+    async def set_speed_percent(self, pct: int) -> None: ...
+
+    async def set_motion_mode(self, mode: str) -> None: ...
+
+    async def move_j(self, joints: list[float]) -> None: ...
+
+    async def move_p(self, pose: list[float]) -> None: ...
+
+    async def move_l(self, pose: list[float]) -> None: ...
+
+    async def move_c(
+        self, start: list[float], mid: list[float], end: list[float]
+    ) -> None: ...
+
+    async def get_joint_angles(self) -> Optional[JointState]: ...
+
+    async def get_flange_pose(self) -> Optional[Pose]: ...
+
+    async def get_motion_status(self) -> Optional[int]: ...
+
+    async def status_time(self) -> Optional[float]: ...
+
+    async def emergency_stop(self) -> None: ...
+
+    async def reset(self) -> None: ...
+
+    def close(self) -> None:
+        """Release resources (threads) held by the async wrapper. The arm is untouched."""
+        ...
@@ -0,0 +1,258 @@
+"""Raw python-can driver with push-based feedback decoding.
+
+Motion commands are encoded straight into CAN frames (see ``can_protocol``). A
+``can.Notifier`` thread decodes joint, pose, status and motor feedback frames into a
+``FeedbackCache`` as they arrive, so every getter is a lock-protected cache read with no
+bus round trip.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import can
+
+from ..state import JointState, Pose
+from . import can_protocol as proto
+from .base import ArmDriver, FeedbackClock, Freshness
+
+logger = logging.getLogger(__name__)
+
+_DOF = {"nero": 7, "piper": 6, "piper_h": 6, "piper_l": 6, "piper_x": 6}
+
+
+@dataclass
+class FeedbackCache:
+    """Latest decoded feedback, shared between the notifier thread and callers."""
+
+    dof: int
+    joints: list[Optional[float]] = field(default_factory=list)
+    pose: list[Optional[float]] = field(default_factory=lambda: [None] * 6)
+    motion_status: Optional[int] = None
+    status_changed: Optional[float] = None  # bus timestamp of the last motion status change
+    arm_status: Optional[int] = None
+    error_code: int = 0
+    motor_enabled: list[bool] = field(default_factory=list)
+    timestamps: dict[int, float] = field(default_factory=dict)
+    frames: int = 0
+    # Built on first read after the listener changes joints / pose, then shared until it does
+    joint_state: Optional[JointState] = field(default=None, repr=False)
+    pose_state: Optional[Pose] = field(default=None, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.joints = [None] * self.dof
+        self.motor_enabled = [False] * self.dof
+
+    def joint_angles(self) -> Optional[JointState]:
+        with self.lock:
+            if self.joint_state is None and None not in self.joints:
+                self.joint_state = JointState(self.joints)
+            return self.joint_state
+
+    def flange_pose(self) -> Optional[Pose]:
+        with self.lock:
+            if self.pose_state is None and None not in self.pose:
+                self.pose_state = Pose(self.pose)
+            return self.pose_state
+
+    def all_enabled(self) -> bool:
+        with self.lock:
+            return all(self.motor_enabled)
+
+    def any_enabled(self) -> bool:
+        with self.lock:
+            return any(self.motor_enabled)
+
+    def last_seen(self, arbitration_id: int) -> Optional[float]:
+        """Bus timestamp of the last frame received with ``arbitration_id``."""
+        with self.lock:
+            return self.timestamps.get(arbitration_id)
+
+
+class FeedbackListener(can.Listener):
+    """Decodes feedback frames into a ``FeedbackCache`` on the notifier thread."""
+
+    def __init__(self, cache: FeedbackCache) -> None:
+        self._cache = cache
+        self._joint_ids = {fid: i for i, fid in enumerate(proto.ID_JOINT_FEEDBACK)}
+        self._pose_ids = {fid: i for i, fid in enumerate(proto.ID_POSE_FEEDBACK)}
+
+    def on_message_received(self, msg: can.Message) -> None:
+        if msg.is_error_frame or msg.is_remote_frame:
+            return
+        fid, data = msg.arbitration_id, msg.data
+        cache = self._cache
+        stamp = msg.timestamp or time.time()
+        with cache.lock:
+            if fid in self._joint_ids:
+                base = self._joint_ids[fid] * 2
+                pair = proto.unpack_pair(data)
+                for offset, value in enumerate(pair):
+                    if base + offset < cache.dof:
+                        cache.joints[base + offset] = proto.mdeg_to_rad(value)
+                cache.joint_state = None
+            elif fid in self._pose_ids:
+                index = self._pose_ids[fid]
+                cache.pose[index * 2 : index * 2 + 2] = proto.decode_pose_pair(index, data)
+                cache.pose_state = None
+            elif fid == proto.ID_ARM_STATUS:
+                cache.arm_status = data[1]
+                status = proto.motion_status_of(data)
+                if status != cache.motion_status:
+                    cache.status_changed = stamp
+                cache.motion_status = status
+                cache.error_code = int.from_bytes(bytes(data[6:8]), "big")
+            elif proto.ID_MOTOR_INFO_BASE <= fid < proto.ID_MOTOR_INFO_BASE + cache.dof:
+                enabled = bool(data[5] & proto.FOC_ENABLED_BIT)
+                cache.motor_enabled[fid - proto.ID_MOTOR_INFO_BASE] = enabled
+            else:
+                return
+            cache.timestamps[fid] = stamp
+            cache.frames += 1
+
+
+class CanBusDriver(ArmDriver):
+    """Talks to the arm directly over python-can instead of through pyAgxArm."""
+
+    def __init__(self) -> None:
+        self._bus: Optional[can.BusABC] = None
+        self._notifier: Optional[can.Notifier] = None
+        self._cache: Optional[FeedbackCache] = None
+        self._robot_type: Optional[str] = None
+        self._dof: int = 7
+        self._speed_pct: int = 80
+        self._motion_mode: str = "J"
+        self._feedback_clock = FeedbackClock()
+
+    def connect(self, robot: str, channel: str, interface: str) -> None:
+        self._dof = _DOF.get(robot, 7)
+        self._cache = FeedbackCache(dof=self._dof)
+        self._feedback_clock = FeedbackClock()
+        self._bus = can.Bus(interface=interface, channel=channel)
+        self._notifier = can.Notifier(self._bus, [FeedbackListener(self._cache)], timeout=0.1)
+        self._robot_type = robot
+        logger.info(
+            "CanDriver: connected robot=%s channel=%s interface=%s dof=%d",
+            robot, channel, interface, self._dof,
+        )
+
+    def disconnect(self) -> None:
+        if self._notifier is not None:
+            self._notifier.stop()
+        if self._bus is not None:
+            self._bus.shutdown()
+        self._notifier = None
+        self._bus = None
+        logger.info("CanDriver: disconnected")
+
+    @property
+    def is_connected(self) -> bool:
+        return self._bus is not None
+
+    @property
+    def feedback(self) -> Optional[FeedbackCache]:
+        return self._cache
+
+    def _send(self, arbitration_id: int, data: bytes) -> None:
+        self._bus.send(can.Message(arbitration_id=arbitration_id, data=data, is_extended_id=False))
+
+    def _send_motion_ctrl(self) -> None:
+        self._send(proto.ID_MOTION_CTRL, proto.motion_ctrl(self._motion_mode, self._speed_pct))
+
+    def set_normal_mode(self) -> None:
+        self._send_motion_ctrl()
+
+    def set_master_mode(self) -> None:
+        self._send(proto.ID_MASTER_SLAVE, bytes([proto.MASTER_MODE, 0, 0, 0, 0, 0, 0, 0]))
+
+    def set_slave_mode(self) -> None:
+        self._send(proto.ID_MASTER_SLAVE, bytes([proto.SLAVE_MODE, 0, 0, 0, 0, 0, 0, 0]))
+
+    def enable(self) -> bool:
+        """Request enable; returns True once every motor reports enabled in feedback."""
+        if self._cache.all_enabled():
+            return True
+        self._send(proto.ID_MOTOR_ENABLE, proto.motor_enable(True))
+        return False
+
+    def disable(self) -> bool:
+        """Request disable; returns True once no motor reports enabled in feedback."""
+        if not self._cache.any_enabled():
+            return True
+        self._send(proto.ID_MOTOR_ENABLE, proto.motor_enable(False))
+        return False
+
+    def set_speed_percent(self, pct: int) -> None:
+        self._speed_pct = max(1, min(100, pct))
+        self._send_motion_ctrl()
+
+    def set_motion_mode(self, mode: str) -> None:
+        self._motion_mode = mode
+        self._send_motion_ctrl()
+
+    def move_j(self, joints: list[float]) -> None:
+        for fid, data in proto.joint_frames(joints, proto.ID_JOINT_CMD):
+            self._send(fid, data)
+
+    def move_p(self, pose: list[float]) -> None:
+        for fid, data in proto.pose_frames(pose, proto.ID_POSE_CMD):
+            self._send(fid, data)
+
+    def move_l(self, pose: list[float]) -> None:
+        self.move_p(pose)
+
+    def move_c(
+        self, start: list[float], mid: list[float], end: list[float]
+    ) -> None:
+        for pose, index in ((start, proto.ARC_START), (mid, proto.ARC_MID), (end, proto.ARC_END)):
+            self.move_p(pose)
+            self._send(proto.ID_ARC_POINT, bytes([index, 0, 0, 0, 0, 0, 0, 0]))
+
+    def get_joint_angles(self) -> Optional[JointState]:
+        return self._cache.joint_angles() if self._cache else None
+
+    def get_flange_pose(self) -> Optional[Pose]:
+        return self._cache.flange_pose() if self._cache else None
+
+    def feedback_freshness(self) -> Optional[Freshness]:
+        stamp = self._cache.last_seen(proto.ID_JOINT_FEEDBACK[0]) if self._cache else None
+        return Freshness(self._feedback_clock.age(stamp))
+
+    def get_motion_status(self) -> Optional[int]:
+        if self._cache is None:
+            return None
+        with self._cache.lock:
+            return self._cache.motion_status
+
+    def status_time(self) -> Optional[float]:
+        """Bus timestamp of the first frame that showed the current motion status."""
+        if self._cache is None:
+            return None
+        with self._cache.lock:
+            return self._cache.status_changed
+
+    def emergency_stop(self) -> None:
+        self._send(proto.ID_EMERGENCY_STOP, bytes([proto.ESTOP, 0, 0, 0, 0, 0, 0, 0]))
+        logger.warning("CanDriver: EMERGENCY STOP triggered")
+
+    def reset(self) -> None:
+        self._send(proto.ID_EMERGENCY_STOP, bytes([proto.ESTOP_RESUME, 0, 0, 0, 0, 0, 0, 0]))
+        logger.info("CanDriver: reset after emergency stop")
+
+    @property
+    def robot_type(self) -> Optional[str]:
+        return self._robot_type
+
+    @property
+    def dof(self) -> int:
+        return self._dof
+
+    @property
+    def is_enabled(self) -> bool:
+        """Enabled state as reported by motor feedback, not by the last command sent."""
+        return self._cache is not None and self._cache.all_enabled()
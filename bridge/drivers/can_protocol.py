@@ -0,0 +1,128 @@
+"""AgileX arm CAN frame layout used by ``CanBusDriver``.
+
+Follows the Piper V2 CAN protocol: 1 Mbit/s classic CAN, standard 11-bit IDs, big-endian
+signed 32-bit fields. Angles are carried in 0.001°, positions in 0.001 mm. NERO's seventh
+joint travels in one extra command/feedback frame pair (``0x15A`` / ``0x2A8``).
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Optional
+
+# --- Command frames (host -> arm) ---
+
+ID_EMERGENCY_STOP = 0x150
+ID_MOTION_CTRL = 0x151
+ID_POSE_CMD = (0x152, 0x153, 0x154)
+ID_JOINT_CMD = (0x155, 0x156, 0x157, 0x15A)
+ID_ARC_POINT = 0x158
+ID_MASTER_SLAVE = 0x470
+ID_MOTOR_ENABLE = 0x471
+
+# --- Feedback frames (arm -> host) ---
+
+ID_ARM_STATUS = 0x2A1
+ID_POSE_FEEDBACK = (0x2A2, 0x2A3, 0x2A4)
+ID_JOINT_FEEDBACK = (0x2A5, 0x2A6, 0x2A7, 0x2A8)
+ID_MOTOR_INFO_BASE = 0x261  # 0x261 + motor index (0-based), low-speed driver info
+
+FEEDBACK_IDS = (
+    ID_ARM_STATUS,
+    *ID_POSE_FEEDBACK,
+    *ID_JOINT_FEEDBACK,
+    *range(ID_MOTOR_INFO_BASE, ID_MOTOR_INFO_BASE + 7),
+)
+
+# --- Field values ---
+
+CTRL_MODE_CAN = 0x01
+MOVE_MODE = {"P": 0x00, "J": 0x01, "L": 0x02, "C": 0x03, "JS": 0x01}
+ESTOP = 0x01
+ESTOP_RESUME = 0x02
+MOTOR_ALL = 0xFF
+MOTOR_DISABLE = 0x01
+MOTOR_ENABLE = 0x02
+MASTER_MODE = 0xFA
+SLAVE_MODE = 0xFC
+ARC_START, ARC_MID, ARC_END = 0x01, 0x02, 0x03
+FOC_ENABLED_BIT = 0x40  # byte 5 of the motor info frame
+
+_PAIR = struct.Struct(">ii")
+
+
+def rad_to_mdeg(value: float) -> int:
+    return round(math.degrees(value) * 1000)
+
+
+def mdeg_to_rad(value: int) -> float:
+    return math.radians(value / 1000)
+
+
+def m_to_um(value: float) -> int:
+    return round(value * 1e6)
+
+
+def um_to_m(value: int) -> float:
+    return value / 1e6
+
+
+def pack_pair(a: int, b: int) -> bytes:
+    return _PAIR.pack(a, b)
+
+
+def unpack_pair(data: bytes) -> tuple[int, int]:
+    return _PAIR.unpack_from(bytes(data))
+
+
+def joint_frames(joints: list[float], ids: tuple[int, ...]) -> list[tuple[int, bytes]]:
+    """Split joint angles (rad) over consecutive two-joint frames."""
+    values = [rad_to_mdeg(j) for j in joints]
+    if len(values) % 2:
+        values.append(0)
+    return [
+        (ids[i // 2], pack_pair(values[i], values[i + 1])) for i in range(0, len(values), 2)
+    ]
+
+
+def pose_frames(pose: list[float], ids: tuple[int, ...]) -> list[tuple[int, bytes]]:
+    """Encode ``[x, y, z, roll, pitch, yaw]`` (m / rad) as three frames."""
+    x, y, z, rx, ry, rz = pose[:6]
+    return [
+        (ids[0], pack_pair(m_to_um(x), m_to_um(y))),
+        (ids[1], pack_pair(m_to_um(z), rad_to_mdeg(rx))),
+        (ids[2], pack_pair(rad_to_mdeg(ry), rad_to_mdeg(rz))),
+    ]
+
+
+def decode_pose_pair(index: int, data: bytes) -> tuple[float, float]:
+    """Decode pose frame ``index`` (0-2) into two SI values."""
+    a, b = unpack_pair(data)
+    if index == 0:
+        return um_to_m(a), um_to_m(b)
+    if index == 1:
+        return um_to_m(a), mdeg_to_rad(b)
+    return mdeg_to_rad(a), mdeg_to_rad(b)
+
+
+def motion_ctrl(move_mode: str, speed_percent: int) -> bytes:
+    return bytes([CTRL_MODE_CAN, MOVE_MODE.get(move_mode, 0x01), speed_percent, 0, 0, 0, 0, 0])
+
+
+def motor_enable(enable: bool, motor: int = MOTOR_ALL) -> bytes:
+    return bytes([motor, MOTOR_ENABLE if enable else MOTOR_DISABLE, 0, 0, 0, 0, 0, 0])
+
+
+def arm_status(
+    motion_status: int, ctrl_mode: int = CTRL_MODE_CAN, arm: int = 0, err: int = 0
+) -> bytes:
+    return bytes([ctrl_mode, arm, 0, 0, motion_status, 0]) + err.to_bytes(2, "big")
+
+
+def motor_info(enabled: bool) -> bytes:
+    return bytes([0, 0, 0, 0, 0, FOC_ENABLED_BIT if enabled else 0, 0, 0])
+
+
+def motion_status_of(data: bytes) -> Optional[int]:
+    return data[4] if len(data) > 4 else None
@@ -2,36 +2,75 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import time
 from typing import Optional
 
-from .base import ArmDriver
+from ..state import JointState, Pose
+from .base import ArmDriver, Freshness
 
 logger = logging.getLogger(__name__)
 
 _DOF = {"nero": 7, "piper": 6, "piper_h": 6, "piper_l": 6, "piper_x": 6}
 
+# Realtime simulation speeds at 100% speed setting.
+_JOINT_SPEED = 1.5  # rad/s
+_CARTESIAN_SPEED = 0.25  # m/s
+_MIN_MOTION_TIME = 0.05
+
 
 class MockArmDriver(ArmDriver):
-    """Simulates a robotic arm in memory. All motions complete instantly."""
+    """Simulates a robotic arm in memory.
+
+    By default every ``move_*`` call blocks briefly and returns with the motion complete.
+    With ``realtime=True`` moves return immediately and telemetry interpolates towards the
+    target over a simulated duration, so a new command can be issued mid-motion just like
+    on hardware.
+
+    ``drop_link`` simulates losing the CAN link for a while: moves sent meanwhile are
+    lost, ``feedback_freshness`` reports feedback going stale and ``connect`` fails.
+    """
 
-    def __init__(self) -> None:
+    _link_down: tuple[float, float] = (0.0, 0.0)  # (since, until), shared like a bus
+
+    def __init__(self, realtime: bool = False) -> None:
+        self._realtime = realtime
         self._connected = False
         self._enabled = False
         self._robot: Optional[str] = None
         self._dof: int = 7
         self._speed_pct: int = 80
         self._motion_mode: str = "J"
-        self._joint_angles: list[float] = []
-        self._flange_pose: list[float] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        # Immutable snapshots, replaced on every change and handed out as they are
+        self._joint_angles = JointState(())
+        self._flange_pose = Pose([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
         self._motion_status: int = 0  # 0 = idle
         self._move_start: float = 0.0
+        self._move_duration: float = 0.0
+        self._move_from: list[float] = []
+        self._move_to: list[float] = []
+        self._move_joints: bool = True
+
+    @classmethod
+    def drop_link(cls, duration: float) -> None:
+        """Take the simulated link down for ``duration`` seconds, for every mock driver."""
+        now = time.monotonic()
+        cls._link_down = (now, now + duration)
+        logger.warning("MockDriver: CAN link down for %.2fs", duration)
+
+    @classmethod
+    def _link_lost_at(cls) -> Optional[float]:
+        since, until = cls._link_down
+        return since if since <= time.monotonic() < until else None
 
     def connect(self, robot: str, channel: str, interface: str) -> None:
+        if self._link_lost_at() is not None:
+            raise RuntimeError(f"MockDriver: no response from the arm on {channel}")
         self._robot = robot
         self._dof = _DOF.get(robot, 7)
-        self._joint_angles = [0.0] * self._dof
+        self._joint_angles = JointState([0.0] * self._dof)
         self._connected = True
         logger.info("MockDriver: connected robot=%s channel=%s dof=%d", robot, channel, self._dof)
 
@@ -71,46 +110,95 @@ class MockArmDriver(ArmDriver):
         self._motion_mode = mode
         logger.info("MockDriver: motion_mode=%s", mode)
 
-    def _simulate_move(self, target_joints: Optional[list[float]] = None) -> None:
+    def _begin_blocking_move(self, joints: bool, target: list[float]) -> float:
+        """Jump to ``target`` and mark the arm moving; returns how long the move lasts."""
         self._motion_status = 1  # moving
         self._move_start = time.monotonic()
-        if target_joints is not None:
-            self._joint_angles = list(target_joints)
+        if joints:
+            self._joint_angles = JointState(target)
+        else:
+            self._flange_pose = Pose(target)
         sim_duration = 0.1 * (100 / max(self._speed_pct, 1))
-        time.sleep(min(sim_duration, 0.5))
+        return min(sim_duration, 0.5)
+
+    def _start_motion(self, joints: bool, target: list[float]) -> None:
+        """Begin a realtime motion from the current (possibly mid-motion) state."""
+        self._advance()
+        start = self._joint_angles if joints else self._flange_pose
+        if joints:
+            distance = max((abs(b - a) for a, b in zip(start, target)), default=0.0)
+        else:
+            distance = math.dist(start[:3], target[:3])
+        speed = (_JOINT_SPEED if joints else _CARTESIAN_SPEED) * max(self._speed_pct, 1) / 100
+        self._move_joints = joints
+        self._move_from = list(start)
+        self._move_to = list(target)
+        self._move_start = time.monotonic()
+        self._move_duration = max(distance / speed, _MIN_MOTION_TIME)
+        self._motion_status = 1
+
+    def _advance(self) -> None:
+        """Update realtime telemetry to the current point along the active motion."""
+        if not self._realtime or self._motion_status == 0:
+            return
+        frac = (time.monotonic() - self._move_start) / self._move_duration
+        if frac >= 1.0:
+            current = list(self._move_to)
+            self._motion_status = 0
+        else:
+            current = [a + (b - a) * frac for a, b in zip(self._move_from, self._move_to)]
+        if self._move_joints:
+            self._joint_angles = JointState(current)
+        else:
+            self._flange_pose = Pose(current)
+
+    def _move(self, joints: bool, target: list[float]) -> None:
+        if self._link_lost_at() is not None:
+            return  # the command never reaches the arm
+        if self._realtime:
+            self._start_motion(joints, target)
+            return
+        time.sleep(self._begin_blocking_move(joints, target))
         self._motion_status = 0  # done
 
     def move_j(self, joints: list[float]) -> None:
         logger.info("MockDriver: move_j(%s)", joints)
-        self._simulate_move(joints)
+        self._move(True, joints)
 
     def move_p(self, pose: list[float]) -> None:
         logger.info("MockDriver: move_p(%s)", pose)
-        self._flange_pose = list(pose)
-        self._simulate_move()
+        self._move(False, pose)
 
     def move_l(self, pose: list[float]) -> None:
         logger.info("MockDriver: move_l(%s)", pose)
-        self._flange_pose = list(pose)
-        self._simulate_move()
+        self._move(False, pose)
 
     def move_c(
         self, start: list[float], mid: list[float], end: list[float]
     ) -> None:
         logger.info("MockDriver: move_c(start=%s, mid=%s, end=%s)", start, mid, end)
-        self._flange_pose = list(end)
-        self._simulate_move()
+        self._move(False, end)
 
-    def get_joint_angles(self) -> Optional[list[float]]:
-        return list(self._joint_angles) if self._connected else None
+    def get_joint_angles(self) -> Optional[JointState]:
+        self._advance()
+        return self._joint_angles if self._connected else None
 
-    def get_flange_pose(self) -> Optional[list[float]]:
-        return list(self._flange_pose) if self._connected else None
+    def get_flange_pose(self) -> Optional[Pose]:
+        self._advance()
+        return self._flange_pose if self._connected else None
 
     def get_motion_status(self) -> Optional[int]:
+        self._advance()
         return self._motion_status if self._connected else None
 
+    def feedback_freshness(self) -> Optional[Freshness]:
+        if not self._connected:
+            return None
+        lost_at = self._link_lost_at()
+        return Freshness(0.0 if lost_at is None else time.monotonic() - lost_at)
+
     def emergency_stop(self) -> None:
+        self._advance()
         self._enabled = False
         self._motion_status = 0
         logger.warning("MockDriver: EMERGENCY STOP")
@@ -130,3 +218,99 @@ class MockArmDriver(ArmDriver):
     @property
     def is_enabled(self) -> bool:
         return self._enabled
+
+
+class AsyncMockArmDriver:
+    """Native asyncio implementation of ``AsyncArmDriver`` backed by a ``MockArmDriver``.
+
+    State is shared with the wrapped sync driver, so sync and async callers see the same
+    arm. Simulated motion time is awaited with ``asyncio.sleep`` instead of blocking. The
+    mock is plain memory, so ``sync`` is the driver itself rather than a locked proxy.
+    """
+
+    def __init__(self, driver: Optional[MockArmDriver] = None) -> None:
+        self.sync = driver or MockArmDriver()
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def is_connected(self) -> bool:
+        return self.sync.is_connected
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.sync.is_enabled
+
+    async def connect(self, robot: str, channel: str, interface: str) -> None:
+        self.sync.connect(robot, channel, interface)
+
+    async def disconnect(self) -> None:
+        self.sync.disconnect()
+
+    async def set_normal_mode(self) -> None:
+        self.sync.set_normal_mode()
+
+    async def set_master_mode(self) -> None:
+        self.sync.set_master_mode()
+
+    async def set_slave_mode(self) -> None:
+        self.sync.set_slave_mode()
+
+    async def enable(self) -> bool:
+        return self.sync.enable()
+
+    async def disable(self) -> bool:
+        return self.sync.disable()
+
+    async def set_speed_percent(self, pct: int) -> None:
+        self.sync.set_speed_percent(pct)
+
+    async def set_motion_mode(self, mode: str) -> None:
+        self.sync.set_motion_mode(mode)
+
+    async def _move(self, joints: bool, target: list[float]) -> None:
+        driver = self.sync
+        if driver._link_lost_at() is not None:
+            return
+        if driver._realtime:
+            driver._start_motion(joints, target)
+            return
+        await asyncio.sleep(driver._begin_blocking_move(joints, target))
+        driver._motion_status = 0  # done
+
+    async def move_j(self, joints: list[float]) -> None:
+        logger.info("MockDriver: move_j(%s)", joints)
+        await self._move(True, joints)
+
+    async def move_p(self, pose: list[float]) -> None:
+        logger.info("MockDriver: move_p(%s)", pose)
+        await self._move(False, pose)
+
+    async def move_l(self, pose: list[float]) -> None:
+        logger.info("MockDriver: move_l(%s)", pose)
+        await self._move(False, pose)
+
+    async def move_c(
+        self, start: list[float], mid: list[float], end: list[float]
+    ) -> None:
+        logger.info("MockDriver: move_c(start=%s, mid=%s, end=%s)", start, mid, end)
+        await self._move(False, end)
+
+    async def get_joint_angles(self) -> Optional[JointState]:
+        return self.sync.get_joint_angles()
+
+    async def get_flange_pose(self) -> Optional[Pose]:
+        return self.sync.get_flange_pose()
+
+    async def get_motion_status(self) -> Optional[int]:
+        return self.sync.get_motion_status()
+
+    async def status_time(self) -> Optional[float]:
+        return self.sync.status_time()
+
+    async def emergency_stop(self) -> None:
+        self.sync.emergency_stop()
+
+    async def reset(self) -> None:
+        self.sync.reset()
@@ -0,0 +1,218 @@
+"""Motion duration estimator used for adaptive wait deadlines and poll scheduling.
+
+Durations are predicted from the displacement of a move, the speed percentage and a
+per-robot trapezoidal velocity profile (joint space for J/JS, Cartesian for P/L/C). Each
+completed move's actual duration is fed back through ``MotionEstimator.record``, which
+keeps a per-(robot, motion kind) correction factor — the median of actual / predicted over
+recent moves — so the nominal profiles converge on the real arm. Samples can be appended
+to a JSON-lines log and replayed at startup so calibration survives restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .models import MotionMode, RobotType
+from .safety import arc_points
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_WINDOW = 50  # recent samples per (robot, kind) used for the correction factor
+MIN_CALIBRATION_SAMPLES = 3
+MIN_SAMPLE_DURATION = 0.05  # shorter predictions are dominated by latency; don't learn from them
+SCALE_LIMITS = (0.2, 5.0)
+
+
+@dataclass(frozen=True)
+class VelocityProfile:
+    """Nominal limits at 100% speed; velocity and acceleration scale with the speed percent."""
+
+    joint_speed: float  # rad/s
+    joint_accel: float  # rad/s^2
+    linear_speed: float  # m/s
+    linear_accel: float  # m/s^2
+    angular_speed: float  # rad/s, orientation change during Cartesian moves
+    overhead: float  # s, command latency plus settling
+
+
+NERO_PROFILE = VelocityProfile(
+    joint_speed=2.5, joint_accel=5.0, linear_speed=0.5, linear_accel=1.0, angular_speed=1.5,
+    overhead=0.1,
+)
+
+PIPER_PROFILE = VelocityProfile(
+    joint_speed=3.0, joint_accel=6.0, linear_speed=0.5, linear_accel=1.5, angular_speed=2.0,
+    overhead=0.1,
+)
+
+VELOCITY_PROFILES: dict[RobotType, VelocityProfile] = {
+    RobotType.NERO: NERO_PROFILE,
+    RobotType.PIPER: PIPER_PROFILE,
+    RobotType.PIPER_H: PIPER_PROFILE,
+    RobotType.PIPER_L: PIPER_PROFILE,
+    RobotType.PIPER_X: PIPER_PROFILE,
+}
+
+
+def trapezoid_time(distance: float, speed: float, accel: float) -> float:
+    """Time to cover ``distance`` from rest to rest with a trapezoidal velocity profile."""
+    distance = abs(distance)
+    if distance == 0.0:
+        return 0.0
+    ramp = speed * speed / accel  # distance spent accelerating plus decelerating
+    if distance <= ramp:
+        return 2.0 * math.sqrt(distance / accel)
+    return distance / speed + speed / accel
+
+
+def ramp_time(distance: float, speed: float, accel: float) -> float:
+    """Time to cover the first (or, by symmetry, the last) ``distance`` of a trapezoidal
+    move from rest, for ``distance`` up to half the move."""
+    distance = abs(distance)
+    ramp = speed * speed / (2 * accel)  # distance covered while accelerating to ``speed``
+    if distance <= ramp:
+        return math.sqrt(2 * distance / accel)
+    return speed / accel + (distance - ramp) / speed
+
+
+def peak_speed(distance: float, speed: float, accel: float) -> float:
+    """Highest speed reached covering ``distance`` from rest to rest (``speed`` if it cruises)."""
+    return min(speed, math.sqrt(abs(distance) * accel))
+
+
+def _angle_delta(a: float, b: float) -> float:
+    return abs(math.remainder(b - a, 2 * math.pi))
+
+
+class MotionEstimate(NamedTuple):
+    kind: str  # "joint", "cartesian" or "arc": the calibration bucket
+    nominal: float  # seconds, from the profile alone
+    duration: float  # seconds, after calibration
+
+
+class MotionEstimator:
+    """Predicts move durations and learns a correction factor from actual ones."""
+
+    def __init__(
+        self,
+        profiles: dict[RobotType, VelocityProfile] | None = None,
+        log_path: str | Path | None = None,
+    ) -> None:
+        self._profiles = profiles or VELOCITY_PROFILES
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+        self._lock = threading.Lock()
+        self._log_path = Path(log_path) if log_path else None
+        if self._log_path is not None and self._log_path.exists():
+            self._replay(self._log_path)
+
+    def estimate(
+        self,
+        robot_type: RobotType,
+        mode: MotionMode,
+        target: list[float],
+        current: Optional[list[float]],
+        speed_percent: int,
+        mid_point: list[float] | None = None,
+        end_point: list[float] | None = None,
+    ) -> Optional[MotionEstimate]:
+        """Predict how long a move takes; ``current`` is the joint angles for J/JS and the
+        flange pose otherwise. Returns None when the starting state is unknown."""
+        profile = self._profiles.get(robot_type)
+        if profile is None or current is None:
+            return None
+        scale = max(speed_percent, 1) / 100
+
+        if mode in (MotionMode.J, MotionMode.JS):
+            kind = "joint"
+            # Joints move synchronously, so the move lasts as long as its largest joint change.
+            distance = max((abs(b - a) for a, b in zip(current, target)), default=0.0)
+            travel = trapezoid_time(distance, profile.joint_speed * scale,
+                                    profile.joint_accel * scale)
+        else:
+            kind = "arc" if mode == MotionMode.C else "cartesian"
+            end = end_point if mode == MotionMode.C and end_point else target
+            distance = math.dist(current[:3], target[:3])
+            if mode == MotionMode.C and mid_point and end_point:
+                arc = arc_points(target, mid_point, end_point)
+                distance += sum(math.dist(a, b) for a, b in zip(arc, arc[1:]))
+            rotation = max(
+                (_angle_delta(a, b) for a, b in zip(current[3:6], end[3:6])), default=0.0
+            )
+            travel = max(
+                trapezoid_time(distance, profile.linear_speed * scale,
+                               profile.linear_accel * scale),
+                rotation / (profile.angular_speed * scale),
+            )
+
+        nominal = travel + profile.overhead
+        return MotionEstimate(kind, nominal, nominal * self.scale(robot_type, kind))
+
+    def profile(self, robot_type: RobotType) -> Optional[VelocityProfile]:
+        return self._profiles.get(robot_type)
+
+    def scale(self, robot_type: RobotType, kind: str) -> float:
+        """Current correction factor (actual / predicted) for a robot and motion kind."""
+        with self._lock:
+            ratios = self._samples.get((robot_type.value, kind))
+            if not ratios or len(ratios) < MIN_CALIBRATION_SAMPLES:
+                return 1.0
+            return min(max(statistics.median(ratios), SCALE_LIMITS[0]), SCALE_LIMITS[1])
+
+    def record(self, robot_type: RobotType, estimate: MotionEstimate, actual: float) -> None:
+        """Feed back the measured duration of a completed move."""
+        if estimate.nominal < MIN_SAMPLE_DURATION:
+            return
+        self._add(robot_type.value, estimate.kind, estimate.nominal, actual)
+        if self._log_path is not None:
+            entry = {
+                "ts": round(time.time(), 3),
+                "robot": robot_type.value,
+                "kind": estimate.kind,
+                "nominal": round(estimate.nominal, 4),
+                "estimate": round(estimate.duration, 4),
+                "actual": round(actual, 4),
+            }
+            try:
+                with self._log_path.open("a") as fh:
+                    fh.write(json.dumps(entry) + "\n")
+            except OSError as exc:
+                logger.warning("Could not append to motion log %s: %s", self._log_path, exc)
+
+    def _add(self, robot: str, kind: str, nominal: float, actual: float) -> None:
+        with self._lock:
+            ratios = self._samples.setdefault((robot, kind), deque(maxlen=CALIBRATION_WINDOW))
+            ratios.append(actual / nominal)
+
+    def _replay(self, path: Path) -> None:
+        loaded = 0
+        for line in path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+                RobotType(entry["robot"])
+                if entry["nominal"] >= MIN_SAMPLE_DURATION:
+                    self._add(entry["robot"], entry["kind"], entry["nominal"], entry["actual"])
+                    loaded += 1
+            except (ValueError, KeyError, TypeError):
+                continue
+        logger.info("Motion estimator calibrated from %d logged moves in %s", loaded, path)
+
+    def calibration(self) -> dict:
+        """Correction factors and sample counts, keyed ``"<robot>/<kind>"``."""
+        with self._lock:
+            keys = list(self._samples)
+        return {
+            f"{robot}/{kind}": {
+                "scale": round(self.scale(RobotType(robot), kind), 4),
+                "samples": len(self._samples[(robot, kind)]),
+            }
+            for robot, kind in keys
+        }
@@ -0,0 +1,107 @@
+"""Pose math for ``[x, y, z, roll, pitch, yaw]`` and relative (jog) moves.
+
+Orientations are fixed-axis XYZ angles, as reported by ``get_flange_pose``: the rotation
+matrix is ``Rz(yaw) @ Ry(pitch) @ Rx(roll)``. Conversions are vectorized over leading
+axes, so ``rpy`` may be ``(3,)`` or ``(N, 3)``.
+
+A relative Cartesian offset ``[dx, dy, dz, droll, dpitch, dyaw]`` is applied at the flange:
+
+- ``base`` frame: translate along the base axes, rotate about base axes through the flange.
+- ``tool`` frame: translate along the flange's own axes, rotate about them.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from .models import Frame, MotionMode
+
+_GIMBAL_EPS = 1e-9
+
+
+def rpy_to_matrix(rpy) -> np.ndarray:
+    rpy = np.asarray(rpy, dtype=float)
+    cr, cp, cy = np.cos(rpy[..., 0]), np.cos(rpy[..., 1]), np.cos(rpy[..., 2])
+    sr, sp, sy = np.sin(rpy[..., 0]), np.sin(rpy[..., 1]), np.sin(rpy[..., 2])
+    rot = np.empty(rpy.shape[:-1] + (3, 3))
+    rot[..., 0, 0] = cy * cp
+    rot[..., 0, 1] = cy * sp * sr - sy * cr
+    rot[..., 0, 2] = cy * sp * cr + sy * sr
+    rot[..., 1, 0] = sy * cp
+    rot[..., 1, 1] = sy * sp * sr + cy * cr
+    rot[..., 1, 2] = sy * sp * cr - cy * sr
+    rot[..., 2, 0] = -sp
+    rot[..., 2, 1] = cp * sr
+    rot[..., 2, 2] = cp * cr
+    return rot
+
+
+def rpy_to_quaternion(rpy) -> np.ndarray:
+    """Unit quaternions ``[w, x, y, z]`` for the same rotations as ``rpy_to_matrix``."""
+    half = np.asarray(rpy, dtype=float) / 2.0
+    cr, cp, cy = np.cos(half[..., 0]), np.cos(half[..., 1]), np.cos(half[..., 2])
+    sr, sp, sy = np.sin(half[..., 0]), np.sin(half[..., 1]), np.sin(half[..., 2])
+    return np.stack([
+        cr * cp * cy + sr * sp * sy,
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+    ], axis=-1)
+
+
+def matrix_to_rpy(rot) -> np.ndarray:
+    """Inverse of ``rpy_to_matrix``; at pitch = ±90° the roll is folded into yaw."""
+    rot = np.asarray(rot, dtype=float)
+    pitch = np.arcsin(np.clip(-rot[..., 2, 0], -1.0, 1.0))
+    cp = np.sqrt(rot[..., 0, 0] ** 2 + rot[..., 1, 0] ** 2)
+    regular = cp > _GIMBAL_EPS
+    roll = np.where(regular, np.arctan2(rot[..., 2, 1], rot[..., 2, 2]), 0.0)
+    yaw = np.where(
+        regular,
+        np.arctan2(rot[..., 1, 0], rot[..., 0, 0]),
+        np.arctan2(-rot[..., 0, 1], rot[..., 1, 1]),
+    )
+    return np.stack([roll, pitch, yaw], axis=-1)
+
+
+def apply_offset(pose: list[float], offset: list[float], frame: Frame) -> list[float]:
+    """The pose reached by moving ``pose`` by ``offset`` in ``frame``."""
+    if len(offset) != 6:
+        raise ValueError("Relative Cartesian offsets are [dx, dy, dz, droll, dpitch, dyaw]")
+    position = np.asarray(pose[:3], dtype=float)
+    rot = rpy_to_matrix(pose[3:6])
+    step = np.asarray(offset[:3], dtype=float)
+    position = position + (rot @ step if frame == Frame.TOOL else step)
+    if not any(offset[3:]):
+        return [*position.tolist(), *pose[3:6]]  # keep the orientation exactly as it was
+    delta = rpy_to_matrix(offset[3:])
+    rot = rot @ delta if frame == Frame.TOOL else delta @ rot
+    return [*position.tolist(), *matrix_to_rpy(rot).tolist()]
+
+
+def resolve_relative(
+    mode: MotionMode,
+    frame: Frame,
+    current: list[float],
+    target: list[float],
+    mid_point: Optional[list[float]] = None,
+    end_point: Optional[list[float]] = None,
+) -> tuple[list[float], Optional[list[float]], Optional[list[float]]]:
+    """Turn offsets from ``current`` (joints for J/JS, else the flange pose) into absolute
+    ``(target, mid_point, end_point)``. Arc points are all offsets from the current pose.
+    """
+    if mode in (MotionMode.J, MotionMode.JS):
+        if frame != Frame.BASE:
+            raise ValueError("Relative joint moves have no frame; use frame='base'")
+        if len(target) != len(current):
+            raise ValueError(
+                f"Relative joint target has {len(target)} values, expected {len(current)}"
+            )
+        return [c + d for c, d in zip(current, target)], None, None
+    return (
+        apply_offset(current, target, frame),
+        apply_offset(current, mid_point, frame) if mid_point is not None else None,
+        apply_offset(current, end_point, frame) if end_point is not None else None,
+    )
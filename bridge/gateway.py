@@ -0,0 +1,363 @@
+"""Fleet gateway: one HTTP endpoint in front of many bridges (``clawarm-gateway``).
+
+A bridge drives one arm, so a fleet is a set of bridges on different hosts or ports. The
+gateway gives an agent one base URL for all of them:
+
+- ``/arms/{id}/...`` forwards the request to bridge ``id`` and streams its response back,
+  so ``POST /arms/left/move`` is ``POST /move`` on the ``left`` bridge. The method, query
+  string, body and the ``Content-Type``, ``Accept`` and ``X-Client-ID`` headers are passed
+  on. A caller without ``X-Client-ID`` is sent as its own address, so the bridge's rate
+  limits keep callers apart instead of seeing them all as the gateway.
+- ``GET /fleet/status`` asks every bridge for ``/status`` at once, each with its own timeout,
+  and returns one entry per arm. A slow or dead bridge costs its timeout, not the sum of
+  all of them.
+- ``GET /fleet`` lists the bridges with their health and request counters.
+
+Each bridge has its own ``httpx.AsyncClient``, so connections to it are pooled and kept
+alive. Every ``health_interval`` seconds the gateway reads ``GET /`` from each bridge. After
+``eject_after`` consecutive failures (health checks, or requests that could not connect or
+timed out), the bridge is ejected. Requests for an ejected bridge get 503 straight away,
+and fan-outs skip it. Health checks continue, and the first one that succeeds brings the
+bridge back.
+
+Bridges come from ``--bridge ID=URL`` (repeatable) or ``CLAWARM_GATEWAY_BRIDGES``
+(comma-separated ``ID=URL``). httpx is an optional dependency
+(``pip install clawarm-bridge[gateway]``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import math
+import os
+import re
+import time
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from . import logs
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+logger = logging.getLogger("clawarm.gateway")
+
+DEFAULT_PORT = 8410
+HEALTH_INTERVAL = 2.0
+HEALTH_TIMEOUT = 1.0
+FANOUT_TIMEOUT = 1.0
+PROXY_TIMEOUT = 120.0  # waited moves and sequences answer when the motion ends
+EJECT_AFTER = 2
+POOL_SIZE = 16  # connections kept per bridge
+FORWARDED_HEADERS = ("accept", "content-type", "x-client-id")
+HOP_BY_HOP = frozenset((
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+    "transfer-encoding", "upgrade", "content-length",
+))
+ARM_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def parse_bridges(specs: list[str]) -> dict[str, str]:
+    """``["left=http://host:8420", ...]`` → ``{"left": "http://host:8420"}``."""
+    bridges: dict[str, str] = {}
+    for spec in specs:
+        arm_id, sep, url = spec.strip().partition("=")
+        if not sep or not ARM_ID.match(arm_id) or not url.startswith(("http://", "https://")):
+            raise ValueError(f"Bad bridge {spec!r}; expected ID=http://host:port")
+        if arm_id in bridges:
+            raise ValueError(f"Bridge {arm_id!r} given twice")
+        bridges[arm_id] = url.rstrip("/")
+    return bridges
+
+
+class Backend:
+    """One bridge: its pooled client, health state and counters."""
+
+    def __init__(self, arm_id: str, url: str, timeout: float, pool_size: int) -> None:
+        self.id = arm_id
+        self.url = url
+        self.client = httpx.AsyncClient(
+            base_url=url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size,
+                                max_keepalive_connections=pool_size),
+        )
+        self.ejected = False
+        self.failures = 0  # consecutive
+        self.ejections = 0
+        self.requests = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.last_ok: Optional[float] = None
+
+    def succeeded(self) -> None:
+        if self.ejected:
+            logger.warning("Bridge %s (%s) is healthy again", self.id, self.url)
+        self.ejected = False
+        self.failures = 0
+        self.last_ok = time.monotonic()
+
+    def failed(self, error: str, eject_after: int) -> None:
+        self.failures += 1
+        self.errors += 1
+        self.last_error = error
+        if not self.ejected and self.failures >= eject_after:
+            self.ejected = True
+            self.ejections += 1
+            logger.warning("Ejecting bridge %s (%s) after %d failure(s): %s",
+                           self.id, self.url, self.failures, error)
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "state": "ejected" if self.ejected else "healthy",
+            "consecutive_failures": self.failures,
+            "ejections": self.ejections,
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "last_ok_s_ago": (
+                round(time.monotonic() - self.last_ok, 3) if self.last_ok is not None else None
+            ),
+        }
+
+
+class Gateway:
+    """The configured bridges, their health checks and the fan-out."""
+
+    def __init__(
+        self,
+        bridges: dict[str, str],
+        health_interval: float = HEALTH_INTERVAL,
+        health_timeout: float = HEALTH_TIMEOUT,
+        fanout_timeout: float = FANOUT_TIMEOUT,
+        proxy_timeout: float = PROXY_TIMEOUT,
+        eject_after: int = EJECT_AFTER,
+        pool_size: int = POOL_SIZE,
+    ) -> None:
+        if httpx is None:
+            raise RuntimeError(
+                "clawarm-gateway needs httpx: pip install clawarm-bridge[gateway]"
+            )
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.fanout_timeout = fanout_timeout
+        self.eject_after = eject_after
+        self.backends = {
+            arm_id: Backend(arm_id, url, proxy_timeout, pool_size)
+            for arm_id, url in bridges.items()
+        }
+        self._health_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Check every bridge once, then keep checking in the background."""
+        await self.check_health()
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+        await asyncio.gather(*(b.client.aclose() for b in self.backends.values()))
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*(self._probe(b) for b in self.backends.values()))
+
+    def backend(self, arm_id: str) -> Backend:
+        """The bridge for ``arm_id``; 404 if unknown, 503 while it is ejected."""
+        backend = self.backends.get(arm_id)
+        if backend is None:
+            raise HTTPException(status_code=404, detail=f"Unknown arm {arm_id!r}")
+        if backend.ejected:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Bridge {arm_id!r} is failing health checks: {backend.last_error}",
+                headers={"Retry-After": str(max(math.ceil(self.health_interval), 1))},
+            )
+        return backend
+
+    async def fleet_status(self, timeout: Optional[float] = None) -> dict:
+        """``/status`` of every healthy bridge, fetched concurrently."""
+        timeout = self.fanout_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        ids = list(self.backends)
+        results = await asyncio.gather(
+            *(self._status(self.backends[arm_id], timeout) for arm_id in ids)
+        )
+        arms = dict(zip(ids, results))
+        return {
+            "arms": arms,
+            "ok": sum(1 for arm in arms.values() if arm["ok"]),
+            "total": len(arms),
+            "elapsed_ms": _ms(time.perf_counter() - start),
+        }
+
+    def snapshot(self) -> dict:
+        backends = self.backends.values()
+        return {
+            "bridges": {b.id: b.snapshot() for b in backends},
+            "healthy": sum(1 for b in backends if not b.ejected),
+            "total": len(self.backends),
+            "health_interval_s": self.health_interval,
+            "eject_after": self.eject_after,
+        }
+
+    async def forward(self, backend: Backend, request: Request, path: str) -> StreamingResponse:
+        """Send ``request`` to ``backend`` as ``/path`` and stream the response back."""
+        headers = {k: v for k in FORWARDED_HEADERS if (v := request.headers.get(k)) is not None}
+        headers.setdefault("x-client-id", request.client.host if request.client else "unknown")
+        outgoing = backend.client.build_request(
+            request.method,
+            "/" + path,
+            params=request.query_params.multi_items(),
+            headers=headers,
+            content=await request.body(),
+        )
+        backend.requests += 1
+        try:
+            response = await backend.client.send(outgoing, stream=True)
+        except httpx.TimeoutException as exc:
+            backend.failed(f"timed out: {exc!r}", self.eject_after)
+            raise HTTPException(status_code=504, detail=f"Bridge {backend.id!r} timed out")
+        except httpx.TransportError as exc:
+            backend.failed(str(exc) or repr(exc), self.eject_after)
+            raise HTTPException(status_code=502, detail=f"Bridge {backend.id!r}: {exc}")
+        backend.succeeded()
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers={k: v for k, v in response.headers.items() if k.lower() not in HOP_BY_HOP},
+            background=BackgroundTask(response.aclose),
+        )
+
+    async def _status(self, backend: Backend, timeout: float) -> dict:
+        if backend.ejected:
+            return {"ok": False, "error": f"ejected: {backend.last_error}", "elapsed_ms": 0.0}
+        start = time.perf_counter()
+        backend.requests += 1
+        try:
+            response = await backend.client.get("/status", timeout=timeout)
+        except httpx.TimeoutException:
+            error = f"timed out after {timeout:g}s"
+        except httpx.TransportError as exc:
+            error = str(exc) or repr(exc)
+        else:
+            backend.succeeded()
+            elapsed = _ms(time.perf_counter() - start)
+            if response.is_success:
+                return {"ok": True, "status": response.json(), "elapsed_ms": elapsed}
+            return {"ok": False, "error": f"HTTP {response.status_code}", "elapsed_ms": elapsed}
+        backend.failed(error, self.eject_after)
+        return {"ok": False, "error": error, "elapsed_ms": _ms(time.perf_counter() - start)}
+
+    async def _probe(self, backend: Backend) -> None:
+        try:
+            response = await backend.client.get("/", timeout=self.health_timeout)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            backend.failed(str(exc) or repr(exc), self.eject_after)
+        else:
+            backend.succeeded()
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.check_health()
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def create_app(gateway: Gateway) -> FastAPI:
+    """The gateway's ASGI app; its lifespan starts the health checks and closes the pools."""
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await gateway.start()
+        try:
+            yield
+        finally:
+            await gateway.close()
+
+    app = FastAPI(
+        title="ClawArm Gateway",
+        description="One endpoint for a fleet of ClawArm bridges",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
+
+    @app.get("/fleet")
+    async def fleet():
+        return gateway.snapshot()
+
+    @app.get("/fleet/status")
+    async def fleet_status(
+        timeout: Optional[float] = Query(None, gt=0, le=30, description="Seconds per bridge"),
+    ):
+        return await gateway.fleet_status(timeout)
+
+    @app.api_route("/arms/{arm_id}/{path:path}",
+                   methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def arm(arm_id: str, path: str, request: Request):
+        return await gateway.forward(gateway.backend(arm_id), request, path)
+
+    return app
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="clawarm-gateway", description="One endpoint for a fleet of ClawArm bridges"
+    )
+    parser.add_argument("--bridge", action="append", metavar="ID=URL",
+                        help="a bridge to route /arms/ID/ to (repeatable)")
+    parser.add_argument("--host", default=os.environ.get("CLAWARM_GATEWAY_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int,
+                        default=int(os.environ.get("CLAWARM_GATEWAY_PORT", str(DEFAULT_PORT))))
+    parser.add_argument("--health-interval", type=float, default=HEALTH_INTERVAL)
+    parser.add_argument("--health-timeout", type=float, default=HEALTH_TIMEOUT)
+    parser.add_argument("--fanout-timeout", type=float, default=FANOUT_TIMEOUT,
+                        help="default per-bridge timeout of /fleet/status")
+    parser.add_argument("--proxy-timeout", type=float, default=PROXY_TIMEOUT)
+    parser.add_argument("--eject-after", type=int, default=EJECT_AFTER,
+                        help="consecutive failures before a bridge is ejected")
+    args = parser.parse_args(argv)
+
+    specs = args.bridge or [
+        s for s in os.environ.get("CLAWARM_GATEWAY_BRIDGES", "").split(",") if s.strip()
+    ]
+    try:
+        bridges = parse_bridges(specs)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not bridges:
+        parser.error("no bridges: pass --bridge ID=URL or set CLAWARM_GATEWAY_BRIDGES")
+
+    logs.install()
+    gateway = Gateway(
+        bridges,
+        health_interval=args.health_interval,
+        health_timeout=args.health_timeout,
+        fanout_timeout=args.fanout_timeout,
+        proxy_timeout=args.proxy_timeout,
+        eject_after=args.eject_after,
+    )
+    logger.info("ClawArm gateway for %d bridge(s) starting on %s:%d",
+                len(bridges), args.host, args.port)
+    uvicorn.run(create_app(gateway), host=args.host, port=args.port, log_level="info",
+                log_config=logs.uvicorn_log_config())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Nominal forward kinematics and the capsule-per-link self-collision model.
+
+Each ``RobotType`` maps to an ``ArmModel``: a serial chain of revolute joints (rotation
+axis plus the offset from the previous joint) with one capsule per link. Geometry is
+nominal — link lengths from the datasheets, the zero pose pointing straight up — which is
+enough to catch configurations that fold the arm into itself, not to plan clearances.
+
+Everything is vectorized over a batch of configurations: ``q`` has shape ``(N, dof)``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+
+import numpy as np
+
+from .models import RobotType
+
+Vec3 = tuple[float, float, float]
+
+TRAJECTORY_STEP = 0.02  # max joint change (rad) between checked configurations
+JACOBIAN_STEP = 1e-4  # radians, for the finite-difference Jacobian
+IK_TOLERANCE = 1e-4  # meters
+IK_ITERATIONS = 100
+IK_DAMPING = 0.01
+_EPS = 1e-12
+
+
+@dataclass(frozen=True)
+class Capsule:
+    """Segment between two chain points (indices into ``ArmModel.points``) plus a radius."""
+
+    name: str
+    start: int
+    end: int
+    radius: float
+
+
+@dataclass(frozen=True)
+class ArmModel:
+    axes: tuple[str, ...]  # "y" or "z" per joint, in the joint's own frame
+    offsets: tuple[Vec3, ...]  # translation from the previous joint to this one
+    tool: Vec3  # last joint to flange
+    capsules: tuple[Capsule, ...]
+
+    @property
+    def dof(self) -> int:
+        return len(self.axes)
+
+    @property
+    def pairs(self) -> list[tuple[int, int]]:
+        """Capsule pairs to check: every pair that is not joined at a joint."""
+        return [(i, j) for i, j in combinations(range(len(self.capsules)), 2) if j - i > 1]
+
+    def points(self, q: np.ndarray) -> np.ndarray:
+        """Chain points ``(N, dof + 2, 3)``: base, each joint origin, then the flange."""
+        q = np.atleast_2d(np.asarray(q, dtype=float))
+        n = q.shape[0]
+        rot = np.broadcast_to(np.eye(3), (n, 3, 3))
+        pos = np.zeros((n, 3))
+        out = [pos]
+        for k, (axis, offset) in enumerate(zip(self.axes, self.offsets)):
+            pos = pos + rot @ np.asarray(offset)
+            out.append(pos)
+            rot = rot @ _rotation(axis, q[:, k])
+        out.append(pos + rot @ np.asarray(self.tool))
+        return np.stack(out, axis=1)
+
+    def flange_jacobian(self, q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Flange positions ``(N, 3)`` and finite-difference position Jacobians ``(N, 3, dof)``."""
+        q = np.atleast_2d(np.asarray(q, dtype=float))
+        n, dof = q.shape
+        perturbed = np.concatenate([q] + [q + JACOBIAN_STEP * np.eye(dof)[k] for k in range(dof)])
+        flange = self.points(perturbed)[:, -1].reshape(dof + 1, n, 3)
+        return flange[0], (flange[1:] - flange[0]).transpose(1, 2, 0) / JACOBIAN_STEP
+
+    def clearances(self, q: np.ndarray) -> np.ndarray:
+        """Surface distance for every checked capsule pair, shape ``(N, len(pairs))``.
+
+        Negative values mean the capsules overlap.
+        """
+        pts = self.points(q)
+        caps = self.capsules
+        a, b = zip(*self.pairs)
+        start_a = pts[:, [caps[i].start for i in a]]
+        end_a = pts[:, [caps[i].end for i in a]]
+        start_b = pts[:, [caps[j].start for j in b]]
+        end_b = pts[:, [caps[j].end for j in b]]
+        radii = np.array([caps[i].radius + caps[j].radius for i, j in self.pairs])
+        return segment_distances(start_a, end_a, start_b, end_b) - radii
+
+    def self_collisions(self, q: np.ndarray) -> np.ndarray:
+        """Boolean mask ``(N,)`` of configurations where any two links overlap."""
+        return (self.clearances(q) < 0).any(axis=1)
+
+    def colliding_pair(self, q) -> tuple[str, str] | None:
+        """Names of the first overlapping link pair for a single configuration."""
+        hits = np.flatnonzero(self.clearances(q)[0] < 0)
+        if not hits.size:
+            return None
+        i, j = self.pairs[hits[0]]
+        return self.capsules[i].name, self.capsules[j].name
+
+
+def _rotation(axis: str, angles: np.ndarray) -> np.ndarray:
+    c, s = np.cos(angles), np.sin(angles)
+    rot = np.zeros((len(angles), 3, 3))
+    if axis == "z":
+        rot[:, 0, 0], rot[:, 0, 1], rot[:, 1, 0], rot[:, 1, 1], rot[:, 2, 2] = c, -s, s, c, 1.0
+    else:
+        rot[:, 0, 0], rot[:, 0, 2], rot[:, 2, 0], rot[:, 2, 2], rot[:, 1, 1] = c, s, -s, c, 1.0
+    return rot
+
+
+def _dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return np.einsum("...i,...i->...", u, v)
+
+
+def segment_distances(
+    p1: np.ndarray, q1: np.ndarray, p2: np.ndarray, q2: np.ndarray
+) -> np.ndarray:
+    """Closest distance between segments p1→q1 and p2→q2, broadcast over leading axes."""
+    d1, d2, r = q1 - p1, q2 - p2, p1 - p2
+    a = np.maximum(_dot(d1, d1), _EPS)
+    e = np.maximum(_dot(d2, d2), _EPS)
+    b, c, f = _dot(d1, d2), _dot(d1, r), _dot(d2, r)
+    denom = a * e - b * b
+    s = np.where(denom > _EPS, np.clip((b * f - c * e) / np.maximum(denom, _EPS), 0, 1), 0.0)
+    t = (b * s + f) / e
+    s = np.where(t < 0, np.clip(-c / a, 0, 1), np.where(t > 1, np.clip((b - c) / a, 0, 1), s))
+    t = np.clip(t, 0, 1)
+    gap = (p1 + d1 * s[..., None]) - (p2 + d2 * t[..., None])
+    return np.sqrt(_dot(gap, gap))
+
+
+def interpolate_joints(
+    start: list[float], end: list[float], max_step: float = TRAJECTORY_STEP
+) -> np.ndarray:
+    """Configurations along the straight joint-space path start → end (both included)."""
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    steps = max(1, int(np.ceil(np.abs(end - start).max(initial=0.0) / max_step)))
+    return start + np.linspace(0.0, 1.0, steps + 1)[:, None] * (end - start)
+
+
+def solve_position(
+    model: ArmModel,
+    position,
+    seed,
+    limits: list[tuple[float, float]] | None = None,
+) -> np.ndarray | None:
+    """Joint angles near ``seed`` that put the flange at ``position``, or None.
+
+    Damped least squares on the flange position only: orientation is ignored and the
+    redundant degrees of freedom stay close to ``seed``, so stepping ``seed`` along a path
+    follows the nearest solution like the arm's own interpolation would. Only as accurate as
+    the nominal geometry.
+    """
+    target = np.asarray(position[:3], dtype=float)
+    q = np.asarray(seed, dtype=float).copy()
+    lo, hi = np.array(limits).T if limits else (None, None)
+    damping = IK_DAMPING**2 * np.eye(3)
+    for _ in range(IK_ITERATIONS):
+        flange, jac = model.flange_jacobian(q)
+        error = target - flange[0]
+        if np.linalg.norm(error) <= IK_TOLERANCE:
+            return q
+        jac = jac[0]
+        q = q + jac.T @ np.linalg.solve(jac @ jac.T + damping, error)
+        if lo is not None:
+            q = np.clip(q, lo, hi)
+    return None
+
+
+NERO_MODEL = ArmModel(
+    axes=("z", "y", "z", "y", "z", "y", "z"),
+    offsets=((0, 0, 0), (0, 0, 0.20), (0, 0, 0), (0, 0, 0.30), (0, 0, 0), (0, 0, 0.28), (0, 0, 0)),
+    tool=(0, 0, 0.10),
+    capsules=(
+        Capsule("base", 0, 2, 0.060),
+        Capsule("upper_arm", 3, 4, 0.050),
+        Capsule("forearm", 5, 6, 0.045),
+        Capsule("hand", 7, 8, 0.040),
+    ),
+)
+
+PIPER_MODEL = ArmModel(
+    axes=("z", "y", "y", "z", "y", "z"),
+    offsets=((0, 0, 0), (0, 0, 0.123), (0, 0, 0.285), (0, 0, 0), (0, 0, 0.25), (0, 0, 0)),
+    tool=(0, 0, 0.091),
+    capsules=(
+        Capsule("base", 0, 2, 0.050),
+        Capsule("upper_arm", 2, 3, 0.045),
+        Capsule("forearm", 4, 5, 0.040),
+        Capsule("hand", 6, 7, 0.035),
+    ),
+)
+
+ARM_MODELS: dict[RobotType, ArmModel] = {
+    RobotType.NERO: NERO_MODEL,
+    RobotType.PIPER: PIPER_MODEL,
+    RobotType.PIPER_H: PIPER_MODEL,
+    RobotType.PIPER_L: PIPER_MODEL,
+    RobotType.PIPER_X: PIPER_MODEL,
+}
@@ -0,0 +1,134 @@
+"""Command-to-motion latency of moves, stage by stage.
+
+Every move carries a ``MoveTiming`` holding ``time.monotonic()`` stamps for:
+
+- ``received``: the request reached its route, before the body was parsed (``/move``
+  only; other callers start at the ``move`` call);
+- ``validated``: safety checks and the duration estimate are done;
+- ``returned``: the driver's motion call returned;
+- ``moving``: the first motion status showing the arm moving;
+- ``finished``: the motion status showing it done.
+
+Motion status is polled, so by itself ``moving`` and ``finished`` are late by up to a
+poll interval. Where the driver has receive timestamps for status feedback
+(``ArmDriver.status_time``: the SDK's message timestamps on pyAgxArm, frame timestamps on
+the raw CAN driver), they are taken from the feedback instead.
+
+The stages between consecutive stamps (``validate``, ``command``, ``motion_start``,
+``motion``) and ``total`` are reported in milliseconds: in the move report as
+``latency``, in a ``Server-Timing`` header on ``/move`` responses, and as per-stage
+histograms under ``latency`` in ``GET /metrics``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Optional
+
+RECEIVED = "clawarm.received"  # ASGI scope key for when the request reached its route
+STAGES = ("validate", "command", "motion_start", "motion", "total")
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+FEEDBACK_SKEW = 1.0  # a feedback stamp further off than this is on another clock
+
+_SPANS = (
+    ("validate", "received", "validated"),
+    ("command", "validated", "returned"),
+    ("motion_start", "returned", "moving"),
+    ("motion", "moving", "finished"),
+)
+
+
+class MoveTiming:
+    """Stage timestamps of one move; unset stages are None."""
+
+    __slots__ = ("received", "validated", "returned", "moving", "finished")
+
+    def __init__(self, received: Optional[float] = None) -> None:
+        self.received = received if received is not None else time.monotonic()
+        self.validated: Optional[float] = None
+        self.returned: Optional[float] = None
+        self.moving: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def stages(self) -> dict[str, float]:
+        """Milliseconds per stage that has both of its stamps, and ``total`` so far."""
+        stages = {}
+        for name, start, end in _SPANS:
+            a, b = getattr(self, start), getattr(self, end)
+            if a is not None and b is not None:
+                stages[name] = _ms(b - a)
+        last = self.finished or self.moving or self.returned or self.validated
+        if last is not None:
+            stages["total"] = _ms(last - self.received)
+        return stages
+
+
+def feedback_moment(stamp: Optional[float], observed: float) -> float:
+    """Monotonic time of the feedback read at ``observed``.
+
+    ``stamp`` is its receive time on the ``time.time()`` clock. Without one, or if it is
+    in the future or more than ``FEEDBACK_SKEW`` old (another clock base), the read time
+    is used.
+    """
+    if stamp is None:
+        return observed
+    moment = stamp - (time.time() - time.monotonic())
+    return moment if observed - FEEDBACK_SKEW <= moment <= observed else observed
+
+
+def server_timing(stages: dict[str, float]) -> str:
+    """``Server-Timing`` header value for a move's ``latency``."""
+    return ", ".join(f"{name};dur={ms:g}" for name, ms in stages.items())
+
+
+class LatencyHistograms:
+    """Per-stage latency histograms over fixed millisecond buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_MS) -> None:
+        self._buckets = buckets
+        self._counts = {stage: [0] * (len(buckets) + 1) for stage in STAGES}
+        self._sums = dict.fromkeys(STAGES, 0.0)
+        self._max = dict.fromkeys(STAGES, 0.0)
+        self._lock = threading.Lock()
+
+    def record(self, stages: dict[str, float]) -> None:
+        with self._lock:
+            for stage, ms in stages.items():
+                self._counts[stage][bisect.bisect_left(self._buckets, ms)] += 1
+                self._sums[stage] += ms
+                self._max[stage] = max(self._max[stage], ms)
+
+    def snapshot(self) -> dict:
+        """Counts per bucket (``le_ms`` upper bounds, the last one open) and summary stats;
+        percentiles are bucket upper bounds."""
+        with self._lock:
+            stages = {}
+            for stage in STAGES:
+                counts = self._counts[stage]
+                n = sum(counts)
+                stages[stage] = {
+                    "count": n,
+                    "mean_ms": round(self._sums[stage] / n, 3) if n else None,
+                    "max_ms": self._max[stage] if n else None,
+                    "p50_ms": self._percentile(stage, counts, n, 0.50),
+                    "p95_ms": self._percentile(stage, counts, n, 0.95),
+                    "p99_ms": self._percentile(stage, counts, n, 0.99),
+                    "counts": list(counts),
+                }
+            return {"le_ms": list(self._buckets), "stages": stages}
+
+    def _percentile(self, stage: str, counts: list[int], n: int, q: float) -> Optional[float]:
+        if not n:
+            return None
+        seen = 0
+        for bound, count in zip(self._buckets, counts):
+            seen += count
+            if seen >= q * n:
+                return min(bound, self._max[stage])
+        return self._max[stage]
+
+
+def _ms(seconds: float) -> float:
+    return round(max(seconds, 0.0) * 1000, 3)
@@ -0,0 +1,175 @@
+"""Off-thread JSON logging with per-call-site sampling.
+
+The drivers log every call (``move_j(%s)`` and friends). With ``logging.basicConfig``, each
+record is formatted and written to stderr on the calling thread, which at servo rates costs
+more than the call itself. ``install`` replaces the root handlers with a pipeline:
+
+- ``SamplingFilter`` runs on the calling thread. Below WARNING, each call site (file and
+  line) passes at most ``rate`` records per second. The rest are dropped before a handler
+  sees them, and the next record that passes from that site carries ``sampled_out``, the
+  count dropped since the last one. Warnings and errors always pass.
+- ``DeferredQueueHandler`` puts the record on a queue as it is. ``%``-style arguments are
+  not merged into the message there (unlike ``logging.handlers.QueueHandler``), so the
+  calling thread never formats.
+- A ``QueueListener`` thread formats what reaches it, as one JSON object per line
+  (``JsonFormatter``) or as plain text, and writes it to stderr.
+
+Records hold references to their arguments until the listener formats them, so only
+log values that are not mutated afterwards (the drivers log the lists they were sent).
+
+Configured from the environment: ``CLAWARM_LOG_LEVEL`` (default ``INFO``),
+``CLAWARM_LOG_FORMAT`` (``json`` or ``text``) and ``CLAWARM_LOG_RATE`` (records per
+second per call site, ``0`` disables sampling).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+DEFAULT_RATE = 20.0  # records per second per call site
+SAMPLING_PERIOD = 1.0
+TEXT_FORMAT = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
+
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class SamplingFilter(logging.Filter):
+    """Pass at most ``rate`` records per second from each call site below WARNING."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, period: float = SAMPLING_PERIOD) -> None:
+        super().__init__()
+        self._limit = rate * period
+        self._period = period
+        self._sites: dict[tuple[str, int], list] = {}  # site -> [window start, passed, dropped]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self._limit <= 0 or record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self._period:
+                dropped = site[2] if site is not None else 0
+                self._sites[key] = [now, 1, 0]
+            elif site[1] < self._limit:
+                site[1] += 1
+                dropped, site[2] = site[2], 0
+            else:
+                site[2] += 1
+                return False
+        if dropped:
+            record.sampled_out = dropped
+        return True
+
+
+class DeferredQueueHandler(QueueHandler):
+    """``QueueHandler`` that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, thread and message."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        sampled_out = getattr(record, "sampled_out", 0)
+        if sampled_out:
+            entry["sampled_out"] = sampled_out
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def pipeline_handler(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    rate: Optional[float] = None,
+    stream: Optional[TextIO] = None,
+) -> logging.Handler:
+    """Start this process's listener thread and return the handler that feeds it.
+
+    Arguments default to the environment. A previous pipeline is flushed and stopped.
+    """
+    global _listener
+    level = (level or os.environ.get("CLAWARM_LOG_LEVEL", "INFO")).upper()
+    fmt = (fmt or os.environ.get("CLAWARM_LOG_FORMAT", "json")).lower()
+    if rate is None:
+        rate = float(os.environ.get("CLAWARM_LOG_RATE", DEFAULT_RATE))
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = DeferredQueueHandler(records)
+    handler.setLevel(level)
+    handler.addFilter(SamplingFilter(rate))
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+        _listener = QueueListener(records, output)
+        _listener.start()
+    return handler
+
+
+def install(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    rate: Optional[float] = None,
+    stream: Optional[TextIO] = None,
+) -> None:
+    """Route the root logger through the pipeline (see ``pipeline_handler``)."""
+    handler = pipeline_handler(level, fmt, rate, stream)
+    root = logging.getLogger()
+    for old in root.handlers[:]:
+        root.removeHandler(old)
+    root.addHandler(handler)
+    root.setLevel(handler.level)
+
+
+def uvicorn_log_config() -> dict:
+    """``log_config`` for uvicorn: its loggers and ours share the pipeline in each worker."""
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {"pipeline": {"()": pipeline_handler}},
+        "root": {"level": os.environ.get("CLAWARM_LOG_LEVEL", "INFO").upper(),
+                 "handlers": ["pipeline"]},
+        "loggers": {name: {"level": "INFO"} for name in ("uvicorn", "uvicorn.access")},
+    }
+
+
+def flush() -> None:
+    """Write out everything queued so far (stops and restarts the listener)."""
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
+
+
+@atexit.register
+def _stop() -> None:
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
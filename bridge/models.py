@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
+
+from .state import JointState, Pose, plain
+
+LONG_POLL_TIMEOUT = 10.0  # default wait for /status?changed_since and /motions/{id}/wait
+LONG_POLL_MAX = 60.0
+MAX_BATCH_OPS = 64
+MAX_SHAPES = 32
+MAX_SCRIPT_CHARS = 64_000
+MAX_SCRIPT_TIMEOUT = 600.0
+DEFAULT_ORIENTATION_TOLERANCE = 0.01  # radians, for /move/sequence path simplification
 
 
 class RobotType(str, Enum):
@@ -33,6 +43,11 @@ class MotionMode(str, Enum):
     C = "C"
 
 
+class Frame(str, Enum):
+    BASE = "base"
+    TOOL = "tool"
+
+
 class StopAction(str, Enum):
     DISABLE = "disable"
     EMERGENCY_STOP = "emergency_stop"
@@ -47,7 +62,7 @@ class ConnectRequest(BaseModel):
     interface: str = Field(default="socketcan", description="CAN interface type")
 
 
-class MoveRequest(BaseModel):
+class MoveStep(BaseModel):
     mode: MotionMode
     target: list[float] = Field(description="Target joint angles or Cartesian pose")
     mid_point: Optional[list[float]] = Field(
@@ -59,28 +74,224 @@ class MoveRequest(BaseModel):
     speed_percent: Optional[int] = Field(
         default=None, ge=1, le=100, description="Override speed percentage"
     )
+
+
+class MoveRequest(MoveStep):
+    relative: bool = Field(
+        default=False,
+        description="Target (and arc points) are offsets from the current joints or pose",
+    )
+    frame: Frame = Field(
+        default=Frame.BASE, description="Frame of relative Cartesian offsets (base or tool)"
+    )
     wait: bool = Field(default=True, description="Wait for motion to complete")
-    timeout: float = Field(default=3.0, ge=0.1, le=30.0, description="Wait timeout in seconds")
+    timeout: Optional[float] = Field(
+        default=None,
+        ge=0.1,
+        le=30.0,
+        description="Wait timeout in seconds (default: predicted motion duration plus margin)",
+    )
+
+
+class MoveSequenceRequest(BaseModel):
+    steps: list[MoveStep] = Field(min_length=1, description="Moves to execute in order")
+    blend_radius: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=0.1,
+        description="Corner blend radius in meters for consecutive P/L moves (0 = stop at "
+        "every waypoint)",
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        ge=0.1,
+        le=30.0,
+        description="Per-step wait timeout in seconds (default: each step's predicted "
+        "duration plus margin)",
+    )
+    simplify_tolerance: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=0.05,
+        description="Drop L waypoints whose pose stays within this many meters of the "
+        "simplified path (0 = send every step)",
+    )
+    orientation_tolerance: float = Field(
+        default=DEFAULT_ORIENTATION_TOLERANCE,
+        gt=0.0,
+        le=0.5,
+        description="Allowed orientation deviation in radians when simplifying",
+    )
+
+
+class SimulateRequest(MoveSequenceRequest):
+    robot: Optional[RobotType] = Field(
+        default=None, description="Robot to simulate (default: the connected arm)"
+    )
+    start_joints: Optional[list[float]] = Field(
+        default=None,
+        description="Joint angles to start from (default: the connected arm's, else all zero)",
+    )
 
 
 class StopRequest(BaseModel):
     action: StopAction = StopAction.DISABLE
 
 
+class StatusOp(BaseModel):
+    op: Literal["status"]
+
+
+class SpeedOp(BaseModel):
+    op: Literal["speed"]
+    speed_percent: int = Field(ge=1, le=100, description="Default speed for later moves")
+
+
+class MoveOp(MoveRequest):
+    op: Literal["move"]
+
+
+class WaitOp(BaseModel):
+    op: Literal["wait"]
+    motion_id: Optional[int] = Field(
+        default=None, description="Motion to wait for (default: the batch's latest move)"
+    )
+    timeout: float = Field(default=LONG_POLL_TIMEOUT, ge=0.0, le=LONG_POLL_MAX)
+
+
+class StopOp(StopRequest):
+    op: Literal["stop"]
+
+
+BatchOp = Annotated[
+    Union[StatusOp, SpeedOp, MoveOp, WaitOp, StopOp], Field(discriminator="op")
+]
+
+
+class BatchRequest(BaseModel):
+    ops: list[BatchOp] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_OPS,
+        description="Operations to run in order; the batch stops at the first failure",
+    )
+
+
+Point2 = Annotated[list[float], Field(min_length=2, max_length=2)]
+Vector3 = Annotated[list[float], Field(min_length=3, max_length=3)]
+
+
+class Plane(BaseModel):
+    origin: Vector3 = Field(default=[0.0, 0.0, 0.0], description="Plane origin in meters")
+    rotation: Vector3 = Field(
+        default=[0.0, 0.0, 0.0],
+        description="Roll/pitch/yaw of the plane frame; shapes lie in its x-y plane",
+    )
+
+
+class CircleShape(BaseModel):
+    kind: Literal["circle"]
+    center: Point2
+    radius: float = Field(gt=0.0, le=1.0)
+    start_angle: float = Field(default=0.0, description="Where the circle starts, radians")
+    clockwise: bool = False
+
+
+class ArcShape(BaseModel):
+    kind: Literal["arc"]
+    center: Point2
+    radius: float = Field(gt=0.0, le=1.0)
+    start_angle: float = 0.0
+    sweep: float = Field(ge=-6.2832, le=6.2832, description="Signed sweep in radians")
+
+
+class SpiralShape(BaseModel):
+    kind: Literal["spiral"]
+    center: Point2
+    start_radius: float = Field(ge=0.0, le=1.0)
+    end_radius: float = Field(ge=0.0, le=1.0)
+    turns: float = Field(gt=0.0, le=50.0)
+    start_angle: float = 0.0
+    clockwise: bool = False
+
+
+class RasterShape(BaseModel):
+    kind: Literal["raster"]
+    corner: Point2
+    width: float = Field(gt=0.0, le=2.0, description="Length of each pass, meters")
+    height: float = Field(ge=0.0, le=2.0, description="Extent covered by the passes, meters")
+    spacing: float = Field(gt=0.0, le=1.0, description="Distance between passes, meters")
+    angle: float = Field(default=0.0, description="Pass direction in the plane, radians")
+
+
+class PolylineShape(BaseModel):
+    kind: Literal["polyline"]
+    points: list[Point2] = Field(min_length=2, max_length=1024)
+    corner_radius: float = Field(
+        default=0.0, ge=0.0, le=0.5, description="Round corners with arcs of this radius"
+    )
+    closed: bool = False
+
+
+Shape = Annotated[
+    Union[CircleShape, ArcShape, SpiralShape, RasterShape, PolylineShape],
+    Field(discriminator="kind"),
+]
+
+
+class ShapesRequest(BaseModel):
+    shapes: list[Shape] = Field(
+        min_length=1, max_length=MAX_SHAPES, description="Shapes to draw, in order"
+    )
+    plane: Plane = Field(default_factory=Plane)
+    orientation: Optional[Vector3] = Field(
+        default=None,
+        description="Tool roll/pitch/yaw held while drawing (default: pointing into the plane)",
+    )
+    tolerance: float = Field(
+        default=0.0005, gt=0.0, le=0.01, description="Max deviation of fitted arcs, meters"
+    )
+    speed_percent: Optional[int] = Field(default=None, ge=1, le=100)
+    timeout: Optional[float] = Field(
+        default=None,
+        ge=0.1,
+        le=30.0,
+        description="Per-segment wait timeout in seconds (default: each segment's predicted "
+        "duration plus margin)",
+    )
+
+
+class ScriptRequest(BaseModel):
+    source: str = Field(
+        min_length=1,
+        max_length=MAX_SCRIPT_CHARS,
+        description="Python script using clawarm.runtime; runtime.connect() returns the live arm",
+    )
+    timeout: float = Field(
+        default=60.0, gt=0.0, le=MAX_SCRIPT_TIMEOUT,
+        description="Abort the script after this many seconds",
+    )
+
+
 # --- Responses ---
 
 
 class StatusResponse(BaseModel):
     connected: bool
     enabled: bool
+    needs_enable: bool = False  # enabled before a reconnect, disabled since; see POST /enable
     robot_type: Optional[str] = None
     dof: Optional[int] = None
-    joint_angles: Optional[list[float]] = None
-    flange_pose: Optional[list[float]] = None
+    joint_angles: Optional[JointState] = None
+    flange_pose: Optional[Pose] = None
     motion_status: Optional[int] = None
+    seq: Optional[int] = None  # changes whenever the status does; see ?changed_since
 
 
 class ResultResponse(BaseModel):
     ok: bool
     message: str
     data: Optional[dict] = None
+
+    @field_serializer("data", mode="wrap", when_used="json")
+    def _plain_data(self, data: Optional[dict], handler):
+        return handler(plain(data))
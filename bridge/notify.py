@@ -0,0 +1,177 @@
+"""Completion and change notification: motion handles and the status change feed.
+
+Every move gets a ``Motion`` from the ``MotionTracker``. Its future resolves with the final
+report when the move completes, times out, is superseded by the next move or is stopped, so
+``GET /motions/{id}/wait`` can block on it instead of polling ``/status``.
+
+``StatusFeed`` numbers distinct status snapshots. ``GET /status?changed_since=<seq>`` waits
+on it until a snapshot with a different number has been observed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from enum import Enum
+from typing import Optional
+
+MOTION_HISTORY = 256  # finished motions kept for late waiters
+
+
+class MotionState(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    TIMED_OUT = "timed_out"
+    SUPERSEDED = "superseded"  # another move was sent before this one finished
+    STOPPED = "stopped"  # emergency stop or disconnect
+
+
+class Motion:
+    """One move command and its (eventual) outcome."""
+
+    def __init__(self, motion_id: int, report: dict) -> None:
+        self.id = motion_id
+        self.report = report
+        self.state = MotionState.RUNNING
+        self.future: Future = Future()
+
+    @property
+    def done(self) -> bool:
+        return self.state != MotionState.RUNNING
+
+    def snapshot(self) -> dict:
+        return {**self.report, "motion_id": self.id, "state": self.state.value}
+
+
+class MotionTracker:
+    """Hands out motion IDs and resolves each motion exactly once.
+
+    Thread-safe: moves are sent from the event loop or worker threads, and their outcome
+    is settled by whichever waiter or watcher sees it first.
+    """
+
+    def __init__(self, history: int = MOTION_HISTORY) -> None:
+        self._history = history
+        self._motions: OrderedDict[int, Motion] = OrderedDict()
+        self._ids = itertools.count(1)
+        self._current: Optional[Motion] = None
+        self._lock = threading.Lock()
+
+    def start(self, report: dict) -> Motion:
+        """Register a move that has just been sent; any move still running is superseded."""
+        with self._lock:
+            previous = self._current
+            motion = Motion(next(self._ids), report)
+            report["motion_id"] = motion.id
+            self._motions[motion.id] = motion
+            while len(self._motions) > self._history:
+                self._motions.popitem(last=False)
+            self._current = motion
+        if previous is not None:
+            self._settle(previous, MotionState.SUPERSEDED)
+        return motion
+
+    def finish(self, motion: Motion, completed: bool) -> None:
+        self._settle(motion, MotionState.COMPLETED if completed else MotionState.TIMED_OUT)
+
+    def stop_all(self) -> None:
+        with self._lock:
+            current, self._current = self._current, None
+        if current is not None:
+            self._settle(current, MotionState.STOPPED)
+
+    def _settle(self, motion: Motion, state: MotionState) -> None:
+        with self._lock:
+            if motion.done:
+                return
+            motion.state = state
+            if self._current is motion:
+                self._current = None
+        motion.future.set_result(motion.snapshot())
+
+    def get(self, motion_id: int) -> Optional[Motion]:
+        with self._lock:
+            return self._motions.get(motion_id)
+
+    def wait(self, motion_id: int, timeout: float) -> Optional[dict]:
+        """Block until the motion is settled or ``timeout`` passes; None if unknown."""
+        motion = self.get(motion_id)
+        if motion is None:
+            return None
+        try:
+            return motion.future.result(timeout)
+        except FutureTimeout:
+            return motion.snapshot()
+
+    async def await_motion(self, motion_id: int, timeout: float) -> Optional[dict]:
+        """Like ``wait`` without blocking the event loop."""
+        motion = self.get(motion_id)
+        if motion is None:
+            return None
+        try:
+            # Shielded: timing out must not cancel the shared future for other waiters.
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(motion.future)), timeout
+            )
+        except asyncio.TimeoutError:
+            return motion.snapshot()
+
+
+class StatusFeed:
+    """Sequence numbers for distinct status snapshots, with async waiters for the next one.
+
+    ``observe`` may be called from any thread; waiters are woken on their own loop.
+    """
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self._last: Optional[dict] = None
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def latest(self) -> Optional[dict]:
+        """The last observed status (with its ``seq``)."""
+        with self._lock:
+            return None if self._last is None else {**self._last, "seq": self.seq}
+
+    def observe(self, status: dict) -> int:
+        """Record a status read; returns its sequence number."""
+        with self._lock:
+            if status == self._last:
+                return self.seq
+            self._last = dict(status)
+            self.seq += 1
+            seq, waiters, self._waiters = self.seq, self._waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, seq)
+            except RuntimeError:  # the waiter's loop has been closed
+                pass
+        return seq
+
+    def waiter(self) -> asyncio.Future:
+        """A future resolved with the next new sequence number."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            self._waiters.append((loop, future))
+        return future
+
+    def discard(self, future: asyncio.Future) -> None:
+        with self._lock:
+            self._waiters = [(loop, f) for loop, f in self._waiters if f is not future]
+
+    @property
+    def waiting(self) -> bool:
+        with self._lock:
+            return bool(self._waiters)
+
+
+def _resolve(future: asyncio.Future, seq: int) -> None:
+    if not future.done():
+        future.set_result(seq)
@@ -0,0 +1,471 @@
+"""Driver owner process, so the HTTP server can run several uvicorn workers.
+
+Only one process may talk to the arm. ``DriverOwner`` starts that process, which holds the
+``ArmManager``. The owner publishes the arm status into a shared-memory ``TelemetryBlock``
+every few milliseconds and after every command. It takes commands over an authenticated
+local socket.
+
+Each HTTP worker uses a ``RemoteArmManager``, which has the same interface as
+``ArmManager``. Status reads come from shared memory without an IPC round trip. Commands go
+to the owner, which runs them one at a time. ``stop`` is the exception: it runs straight
+away, so it can interrupt a move that is still waiting. Motion waits also run outside the
+command lock.
+
+The owner also holds the arm's ``Admission`` (rate limits and motion queue), on an event
+loop thread of its own, and workers admit through a ``RemoteAdmission``. The limits and the
+queue are therefore per arm, not per worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, Optional
+
+from . import logs
+from .admission import Admission, Cancelled, Throttled
+from .models import DOF_MAP, RobotType
+from .safety import SafetyError
+from .telemetry import TelemetryBlock
+from .watchdog import ArmDegradedError
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_INTERVAL = 0.005
+STALE_AFTER = 1.0  # a block not updated for this long means the owner is gone
+CHANGE_POLL_INTERVAL = 0.005  # shared-memory check rate for /status?changed_since
+START_TIMEOUT = 30.0
+
+COMMANDS = frozenset({
+    "connect", "disconnect", "move", "move_sequence", "enable", "disable", "stop", "metrics",
+    "wait_motion", "set_speed", "run_batch", "simulate_sequence", "require_fresh",
+})
+ADMISSION_COMMANDS = frozenset({"admit", "acquire_slot", "release_slot", "clear_queue",
+                                "admission"})
+_UNLOCKED = frozenset({"stop", "metrics", "wait_motion", "simulate_sequence", "require_fresh"})
+_READ_ONLY = frozenset({"metrics", "wait_motion", "simulate_sequence", "require_fresh"})
+_ERRORS = {
+    cls.__name__: cls
+    for cls in (SafetyError, ArmDegradedError, Throttled, Cancelled, ValueError, RuntimeError)
+}
+
+ENV_ADDRESS = "CLAWARM_OWNER_ADDRESS"
+ENV_AUTHKEY = "CLAWARM_OWNER_AUTHKEY"
+ENV_TELEMETRY = "CLAWARM_TELEMETRY_SHM"
+
+
+class DriverOwner:
+    """Starts and stops the owner process and the shared-memory block it publishes to."""
+
+    def __init__(self, manager_factory: Optional[Callable] = None) -> None:
+        self._factory = manager_factory
+        self._dir: Optional[str] = None
+        self._block: Optional[TelemetryBlock] = None
+        self._process = None
+        self.address: Optional[str] = None
+        self.authkey = secrets.token_bytes(16)
+
+    def start(self) -> None:
+        self._dir = tempfile.mkdtemp(prefix="clawarm-")
+        self.address = os.path.join(self._dir, "owner.sock")
+        self._block = TelemetryBlock(create=True)
+        ctx = multiprocessing.get_context("spawn")
+        ready = ctx.Event()
+        self._process = ctx.Process(
+            target=_serve,
+            args=(self.address, self.authkey, self._block.name, self._factory, ready),
+            name="clawarm-owner",
+            daemon=True,
+        )
+        self._process.start()
+        deadline = time.monotonic() + START_TIMEOUT
+        while not ready.wait(0.05):
+            if not self._process.is_alive() or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError("Driver owner process did not start")
+        logger.info("Driver owner started (pid %d)", self._process.pid)
+
+    def env(self) -> dict[str, str]:
+        """Environment that lets worker processes build a ``RemoteArmManager``."""
+        return {
+            ENV_ADDRESS: self.address,
+            ENV_AUTHKEY: self.authkey.hex(),
+            ENV_TELEMETRY: self._block.name,
+        }
+
+    def remote(self) -> RemoteArmManager:
+        return RemoteArmManager(self.address, self.authkey, self._block.name)
+
+    def stop(self) -> None:
+        if self._process is not None:
+            if self._process.is_alive():
+                try:
+                    with Client(self.address, family="AF_UNIX", authkey=self.authkey) as conn:
+                        conn.send(("shutdown", (), {}))
+                        conn.recv()
+                except (OSError, EOFError):
+                    pass
+                self._process.join(5.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+        if self._block is not None:
+            self._block.close()
+            self._block = None
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    def __enter__(self) -> DriverOwner:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# --- Owner process ---
+
+
+def _serve(address, authkey, shm_name, factory, ready) -> None:
+    from .arm_manager import manager_from_env
+
+    logs.install()  # a spawned process starts without handlers
+    mgr = factory() if factory is not None else manager_from_env()
+    admission = _SharedAdmission()
+    block = TelemetryBlock(shm_name)
+    publish_lock = threading.Lock()
+    command_lock = threading.Lock()
+    shutdown = threading.Event()
+
+    def publish() -> None:
+        with publish_lock:
+            if shutdown.is_set():
+                return
+            try:
+                status = mgr.get_status()
+            except Exception as exc:
+                logger.warning("Status read failed: %s", exc)
+                return
+            block.publish(status)
+
+    def publisher() -> None:
+        while not shutdown.is_set():
+            publish()
+            time.sleep(PUBLISH_INTERVAL)
+
+    def handle(conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    method, args, kwargs = conn.recv()
+                except (EOFError, OSError):
+                    return
+                if method == "shutdown":
+                    shutdown.set()
+                    conn.send(("ok", None))
+                    return
+                if method in ADMISSION_COMMANDS:
+                    conn.send(_dispatch(admission, method, args, kwargs))
+                    continue
+                reply = _dispatch(mgr, method, args, kwargs, command_lock)
+                if method not in _READ_ONLY:
+                    publish()  # readers see the command's effect as soon as it returns
+                conn.send(reply)
+
+    def accept(listener: Listener) -> None:
+        while not shutdown.is_set():
+            try:
+                conn = listener.accept()
+            except OSError:
+                if shutdown.is_set():
+                    return
+                continue  # e.g. a client that failed authentication
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+    listener = Listener(address, family="AF_UNIX", authkey=authkey)
+    publish()
+    threading.Thread(target=publisher, daemon=True).start()
+    threading.Thread(target=accept, args=(listener,), daemon=True).start()
+    ready.set()
+    parent = multiprocessing.parent_process()
+    while not shutdown.wait(0.5):
+        if parent is not None and not parent.is_alive():
+            logger.warning("Bridge process exited; shutting down driver owner")
+            shutdown.set()
+    with command_lock:
+        mgr.disconnect()
+    listener.close()
+    admission.close()
+    with publish_lock:
+        block.publish({"connected": False})
+        block.close()
+
+
+class _SharedAdmission:
+    """The arm's ``Admission`` for every worker, run on its own event loop thread.
+
+    ``Admission`` and ``MotionQueue`` are only safe on one event loop; connection threads
+    hand their calls to it and block until it answers (``acquire_slot`` until the slot is
+    free).
+    """
+
+    def __init__(self) -> None:
+        self._admission = Admission.from_env()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="clawarm-admission",
+                         daemon=True).start()
+
+    def _call(self, fn: Callable, *args):
+        async def call():
+            return fn(*args)
+
+        return asyncio.run_coroutine_threadsafe(call(), self._loop).result()
+
+    def admit(self, client: str) -> None:
+        self._call(self._admission.check, client)
+
+    def acquire_slot(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._admission.queue.acquire(), self._loop).result()
+
+    def release_slot(self) -> None:
+        self._call(self._admission.queue.release)
+
+    def clear_queue(self, reason: str) -> int:
+        return self._call(self._admission.queue.clear, reason)
+
+    def admission(self) -> dict:
+        return self._call(self._admission.snapshot)
+
+    def close(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+def _dispatch(target, method: str, args, kwargs, lock: Optional[threading.Lock] = None) -> tuple:
+    if method not in COMMANDS | ADMISSION_COMMANDS:
+        return ("error", "ValueError", f"Unknown command: {method}", None)
+    try:
+        if lock is None or method in _UNLOCKED:
+            result = getattr(target, method)(*args, **kwargs)
+        else:
+            with lock:
+                result = getattr(target, method)(*args, **kwargs)
+    except Exception as exc:
+        return ("error", type(exc).__name__, str(exc), getattr(exc, "retry_after", None))
+    return ("ok", result)
+
+
+# --- Worker side ---
+
+
+class RemoteArmManager:
+    """``ArmManager`` stand-in for HTTP workers: reads from shared memory, commands over IPC."""
+
+    def __init__(self, address: str, authkey: bytes, shm_name: str) -> None:
+        self._address = address
+        self._authkey = authkey
+        self._block = TelemetryBlock(shm_name)
+        self._pool: list[Connection] = []
+        self._pool_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> RemoteArmManager:
+        return cls(
+            os.environ[ENV_ADDRESS],
+            bytes.fromhex(os.environ[ENV_AUTHKEY]),
+            os.environ[ENV_TELEMETRY],
+        )
+
+    # --- Reads (shared memory) ---
+
+    def _snapshot(self) -> tuple[int, float, dict]:
+        seq, updated, status = self._block.read()
+        if time.time() - updated > STALE_AFTER:
+            status = {"connected": False, "enabled": False, "seq": status["seq"]}
+        return seq, updated, status
+
+    @property
+    def connected(self) -> bool:
+        return self._snapshot()[2]["connected"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._snapshot()[2]["enabled"]
+
+    @property
+    def robot_type(self) -> Optional[RobotType]:
+        robot = self._snapshot()[2].get("robot_type")
+        return RobotType(robot) if robot else None
+
+    @property
+    def dof(self) -> Optional[int]:
+        robot = self.robot_type
+        return DOF_MAP.get(robot) if robot else None
+
+    def get_status(self) -> dict:
+        return self._snapshot()[2]
+
+    async def aget_status(self) -> dict:
+        return self._snapshot()[2]
+
+    async def await_status(self, since: int, timeout: float) -> dict:
+        """Like ``ArmManager.await_status``, watching the shared-memory block."""
+        deadline = time.monotonic() + timeout
+        while True:
+            status = self._snapshot()[2]
+            if status["seq"] != since or time.monotonic() >= deadline:
+                return status
+            await asyncio.sleep(CHANGE_POLL_INTERVAL)
+
+    # --- Commands (IPC to the owner) ---
+
+    def _call(self, method: str, *args, **kwargs):
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        try:
+            if conn is None:
+                conn = Client(self._address, family="AF_UNIX", authkey=self._authkey)
+            conn.send((method, args, kwargs))
+            reply = conn.recv()
+        except (OSError, EOFError) as exc:
+            if conn is not None:
+                conn.close()
+            raise RuntimeError(f"Driver owner unavailable: {exc}") from exc
+        with self._pool_lock:
+            self._pool.append(conn)
+        if reply[0] == "ok":
+            return reply[1]
+        _, name, message, retry_after = reply
+        error = _ERRORS.get(name, RuntimeError)
+        raise error(message) if retry_after is None else error(message, retry_after)
+
+    def connect(self, robot: RobotType, channel: str = "can0", interface: str = "socketcan"):
+        return self._call("connect", robot, channel, interface)
+
+    def disconnect(self) -> str:
+        return self._call("disconnect")
+
+    def move(self, *args, **kwargs) -> dict:
+        return self._call("move", *args, **kwargs)
+
+    async def amove(self, *args, **kwargs) -> dict:
+        return await asyncio.to_thread(self._call, "move", *args, **kwargs)
+
+    def move_sequence(self, *args, **kwargs) -> dict:
+        return self._call("move_sequence", *args, **kwargs)
+
+    def simulate_sequence(self, *args, **kwargs) -> dict:
+        return self._call("simulate_sequence", *args, **kwargs)
+
+    def require_fresh(self) -> None:
+        self._call("require_fresh")
+
+    def wait_motion(self, motion_id: int, timeout: float):
+        return self._call("wait_motion", motion_id, timeout)
+
+    async def await_motion(self, motion_id: int, timeout: float):
+        return await asyncio.to_thread(self._call, "wait_motion", motion_id, timeout)
+
+    def set_speed(self, speed_percent: int) -> int:
+        return self._call("set_speed", speed_percent)
+
+    def run_batch(self, ops: list[dict]) -> dict:
+        return self._call("run_batch", ops)
+
+    def enable(self) -> bool:
+        return self._call("enable")
+
+    def disable(self) -> bool:
+        return self._call("disable")
+
+    async def aenable(self) -> bool:
+        return await asyncio.to_thread(self._call, "enable")
+
+    async def adisable(self) -> bool:
+        return await asyncio.to_thread(self._call, "disable")
+
+    def stop(self, emergency: bool = False) -> str:
+        return self._call("stop", emergency)
+
+    async def astop(self, emergency: bool = False) -> str:
+        return await asyncio.to_thread(self._call, "stop", emergency)
+
+    def metrics(self) -> dict:
+        result = self._call("metrics")
+        seq, updated, _ = self._block.read()
+        result["telemetry"] = {"seq": seq, "age_s": round(time.time() - updated, 4)}
+        return result
+
+    def close(self) -> None:
+        with self._pool_lock:
+            for conn in self._pool:
+                conn.close()
+            self._pool.clear()
+        self._block.close()
+
+
+class RemoteAdmission:
+    """``Admission`` stand-in for HTTP workers: the owner admits for every worker.
+
+    The ``a``-prefixed methods run the owner call in a thread, off the event loop.
+    """
+
+    def __init__(self, remote: RemoteArmManager) -> None:
+        self._remote = remote
+        self.queue = _RemoteQueue(remote)
+
+    def check(self, client: str) -> None:
+        self._remote._call("admit", client)
+
+    async def acheck(self, client: str) -> None:
+        await asyncio.to_thread(self._remote._call, "admit", client)
+
+    def snapshot(self) -> dict:
+        return self._remote._call("admission")
+
+    async def asnapshot(self) -> dict:
+        return await asyncio.to_thread(self._remote._call, "admission")
+
+
+class _RemoteQueue:
+    """The owner's ``MotionQueue`` as seen from a worker."""
+
+    def __init__(self, remote: RemoteArmManager) -> None:
+        self._remote = remote
+
+    async def acquire(self) -> None:
+        call = asyncio.ensure_future(asyncio.to_thread(self._remote._call, "acquire_slot"))
+        try:
+            await asyncio.shield(call)
+        except asyncio.CancelledError:  # the client went away; pass the slot on when it comes
+            call.add_done_callback(self._release_unused)
+            raise
+
+    def _release_unused(self, call: asyncio.Future) -> None:
+        if not call.cancelled() and call.exception() is None:
+            asyncio.ensure_future(self.arelease())
+
+    def release(self) -> None:
+        self._remote._call("release_slot")
+
+    async def arelease(self) -> None:
+        """Release the slot; a failure is logged, not raised, since the command has run."""
+        try:
+            await asyncio.to_thread(self._remote._call, "release_slot")
+        except Exception as exc:
+            logger.warning("Releasing the motion queue slot failed: %s", exc)
+
+    def clear(self, reason: str) -> int:
+        return self._remote._call("clear_queue", reason)
+
+    async def aclear(self, reason: str) -> int:
+        return await asyncio.to_thread(self._remote._call, "clear_queue", reason)
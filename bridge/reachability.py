@@ -0,0 +1,217 @@
+"""Reachability voxel maps: which flange positions each arm can actually get to.
+
+``WorkspaceBounds`` is a box, so it accepts positions beyond the arm's reach (or inside
+its own base) that only fail on the hardware. A reachability map is a voxel grid over the
+arm's reach sphere built offline by sampling joint space within the joint limits, using the
+nominal kinematics in ``bridge.kinematics``. Self-colliding configurations are skipped.
+Each reached voxel stores the best translational manipulability seen there,
+``sqrt(det(J J^T))`` of the position Jacobian. Unreached voxels hold -1. Small holes left
+by sampling are closed (dilate, then erode).
+
+Grids are saved as ``<robot>.npy`` with a ``<robot>.json`` sidecar (origin, voxel size,
+sample count). At runtime they are memory-mapped, so a lookup is one index computation and
+one read, and only the pages that are touched are loaded. Build them with::
+
+    clawarm-reachability --out reachability/ [--robot nero piper] [--samples 2000000]
+
+and point ``CLAWARM_REACHABILITY`` at the directory. Only positions are mapped; whether an
+orientation is achievable there is not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .kinematics import ARM_MODELS, ArmModel
+from .models import RobotType
+
+DEFAULT_VOXEL = 0.02  # meters
+DEFAULT_SAMPLES = 2_000_000
+CHUNK = 50_000  # configurations per worker task
+UNREACHABLE = -1.0
+
+
+class ReachabilityMap:
+    """A voxel grid of manipulability values (``UNREACHABLE`` where the arm never got)."""
+
+    def __init__(self, grid: np.ndarray, origin, voxel: float) -> None:
+        self.grid = grid
+        self.origin = np.asarray(origin, dtype=float)
+        self.voxel = float(voxel)
+        self._origin = self.origin.tolist()  # plain floats for the scalar lookup
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ReachabilityMap":
+        """Memory-map ``<name>.npy`` using the metadata in ``<name>.json``."""
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".json").read_text())
+        return cls(np.load(path, mmap_mode="r"), meta["origin"], meta["voxel"])
+
+    def lookup(self, position) -> float:
+        """Manipulability at ``position`` (x, y, z); ``UNREACHABLE`` outside the map."""
+        i, j, k = (math.floor((p - o) / self.voxel) for p, o in zip(position, self._origin))
+        ni, nj, nk = self.grid.shape
+        if not (0 <= i < ni and 0 <= j < nj and 0 <= k < nk):
+            return UNREACHABLE
+        return self.grid.item(i, j, k)
+
+    def lookup_many(self, positions) -> np.ndarray:
+        """Vectorized ``lookup`` for an ``(N, 3)`` array of positions."""
+        index = np.floor((np.asarray(positions, dtype=float) - self.origin) / self.voxel)
+        index = index.astype(np.int64)
+        inside = ((index >= 0) & (index < self.grid.shape)).all(axis=1)
+        out = np.full(len(index), UNREACHABLE)
+        i, j, k = index[inside].T
+        out[inside] = self.grid[i, j, k]
+        return out
+
+
+def grid_geometry(model: ArmModel, voxel: float) -> tuple[np.ndarray, tuple[int, int, int]]:
+    """Origin and shape of a grid covering the arm's reach sphere."""
+    reach = sum(math.hypot(*offset) for offset in model.offsets) + math.hypot(*model.tool)
+    size = math.ceil(2 * reach / voxel) + 1
+    return np.full(3, -reach), (size, size, size)
+
+
+def manipulability(model: ArmModel, q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Flange positions ``(N, 3)`` and translational manipulability ``(N,)`` for ``q``."""
+    flange, jac = model.flange_jacobian(q)
+    det = np.linalg.det(jac @ jac.transpose(0, 2, 1))
+    return flange, np.sqrt(np.maximum(det, 0.0))
+
+
+def _sample_chunk(task: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """Worker: sample ``count`` configurations; return voxel indices and their best value."""
+    robot, seed, count, origin, voxel, shape = task
+    from .safety import JOINT_LIMITS_MAP  # safety imports this module's map type
+
+    model = ARM_MODELS[RobotType(robot)]
+    lo, hi = np.array(JOINT_LIMITS_MAP[RobotType(robot)].limits).T
+    q = np.random.default_rng(seed).uniform(lo, hi, size=(count, len(lo)))
+    q = q[~model.self_collisions(q)]
+    positions, values = manipulability(model, q)
+    index = np.floor((positions - origin) / voxel).astype(np.int64)
+    inside = ((index >= 0) & (index < shape)).all(axis=1)
+    flat = np.ravel_multi_index(index[inside].T, shape)
+    values = values[inside]
+    order = np.argsort(flat, kind="stable")
+    flat, values = flat[order], values[order]
+    starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+    return flat[starts], np.maximum.reduceat(values, starts)
+
+
+def build_map(
+    robot: RobotType,
+    samples: int = DEFAULT_SAMPLES,
+    voxel: float = DEFAULT_VOXEL,
+    workers: Optional[int] = None,
+    seed: int = 0,
+) -> tuple[np.ndarray, dict]:
+    """Sample ``samples`` configurations over a process pool; returns the grid and metadata."""
+    model = ARM_MODELS[robot]
+    origin, shape = grid_geometry(model, voxel)
+    tasks = [
+        (robot.value, seed + i, min(CHUNK, samples - start), origin, voxel, shape)
+        for i, start in enumerate(range(0, samples, CHUNK))
+    ]
+    grid = np.full(int(np.prod(shape)), UNREACHABLE)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for flat, values in map(_sample_chunk, tasks):
+            np.maximum.at(grid, flat, values)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for flat, values in pool.map(_sample_chunk, tasks):
+                np.maximum.at(grid, flat, values)
+    grid = _close(grid.reshape(shape)).astype(np.float32)
+    meta = {
+        "robot": robot.value,
+        "origin": origin.tolist(),
+        "voxel": voxel,
+        "samples": samples,
+        "reachable_voxels": int((grid >= 0).sum()),
+    }
+    return grid, meta
+
+
+def _shifted(values: np.ndarray, axis: int, step: int, fill) -> np.ndarray:
+    out = np.full_like(values, fill)
+    src = [slice(None)] * 3
+    dst = [slice(None)] * 3
+    src[axis] = slice(None, -step) if step > 0 else slice(-step, None)
+    dst[axis] = slice(step, None) if step > 0 else slice(None, step)
+    out[tuple(dst)] = values[tuple(src)]
+    return out
+
+
+def _close(grid: np.ndarray) -> np.ndarray:
+    """Morphological closing over the 6-neighbourhood; filled voxels take their best neighbour."""
+    neighbours = [(axis, step) for axis in range(3) for step in (1, -1)]
+    dilated = grid.copy()
+    for axis, step in neighbours:
+        dilated = np.maximum(dilated, _shifted(grid, axis, step, UNREACHABLE))
+    grown = dilated >= 0
+    closed = grown.copy()
+    for axis, step in neighbours:
+        closed &= _shifted(grown, axis, step, False)
+    return np.where(grid >= 0, grid, np.where(closed, dilated, UNREACHABLE))
+
+
+def save_map(directory: str | Path, grid: np.ndarray, meta: dict) -> Path:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{meta['robot']}.npy"
+    np.save(path, grid)
+    path.with_suffix(".json").write_text(json.dumps(meta, indent=2) + "\n")
+    return path
+
+
+def load_maps(directory: str | Path) -> dict[RobotType, ReachabilityMap]:
+    """Memory-map every map in ``directory``. Robot types that share a kinematic model
+    share a map, so one ``piper.npy`` covers all Piper variants."""
+    directory = Path(directory)
+    maps: dict[RobotType, ReachabilityMap] = {}
+    for robot in RobotType:
+        path = directory / f"{robot.value}.npy"
+        if path.exists():
+            maps[robot] = ReachabilityMap.load(path)
+    for robot in RobotType:
+        if robot not in maps:
+            twin = next((m for r, m in maps.items() if ARM_MODELS[r] is ARM_MODELS[robot]), None)
+            if twin is not None:
+                maps[robot] = twin
+    return maps
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="clawarm-reachability", description="Build reachability voxel maps"
+    )
+    parser.add_argument("--out", required=True, help="directory for <robot>.npy / .json")
+    parser.add_argument("--robot", nargs="+", default=[RobotType.NERO.value, RobotType.PIPER.value],
+                        choices=[r.value for r in RobotType])
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--voxel", type=float, default=DEFAULT_VOXEL, help="voxel edge, meters")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPUs)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for name in args.robot:
+        start = time.monotonic()
+        grid, meta = build_map(RobotType(name), args.samples, args.voxel, args.workers, args.seed)
+        path = save_map(args.out, grid, meta)
+        print(f"{path}: {grid.shape} voxels, {meta['reachable_voxels']} reachable, "
+              f"{time.monotonic() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
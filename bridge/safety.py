@@ -6,7 +6,12 @@ import logging
 import math
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from .kinematics import ARM_MODELS, interpolate_joints
 from .models import DOF_MAP, MotionMode, RobotType
+from .reachability import ReachabilityMap
+from .zones import Zone, ZoneSet
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +69,8 @@ JOINT_LIMITS_MAP: dict[RobotType, JointLimits] = {
 }
 
 DEFAULT_MAX_SPEED_PERCENT = 80
+ARC_SEGMENTS = 32  # chords used to check an arc (C) move against zones
+BLEND_SEGMENTS = 8  # chords used to check a blended corner against zones
 
 
 @dataclass
@@ -71,6 +78,90 @@ class SafetyConfig:
     enabled: bool = True
     max_speed_percent: int = DEFAULT_MAX_SPEED_PERCENT
     workspace_bounds: WorkspaceBounds = field(default_factory=WorkspaceBounds)
+    zones: list[Zone] = field(default_factory=list)
+    # Per-robot reachability maps (see ``bridge.reachability``); robots without one are only
+    # checked against the workspace box.
+    reachability: dict[RobotType, ReachabilityMap] = field(default_factory=dict)
+    min_manipulability: float = 0.0
+
+
+def blend_point(corner: list[float], toward: list[float], radius: float) -> list[float]:
+    """Point ``radius`` meters from ``corner`` towards ``toward``, clamped to half the segment.
+
+    Only the position (x, y, z) is interpolated; orientation is taken from ``corner``.
+    """
+    length = math.dist(corner[:3], toward[:3])
+    if length == 0.0:
+        return list(corner)
+    frac = min(radius, length / 2) / length
+    point = [c + (t - c) * frac for c, t in zip(corner[:3], toward[:3])]
+    return point + list(corner[3:])
+
+
+def arc_points(
+    start: list[float], mid: list[float], end: list[float], segments: int = ARC_SEGMENTS
+) -> list[list[float]]:
+    """Positions along the circular arc start → mid → end, ``segments + 1`` points.
+
+    Collinear (or coincident) points degrade to the polyline start → mid → end.
+    """
+    a, b, c = (list(p[:3]) for p in (start, mid, end))
+    ab = [bi - ai for ai, bi in zip(a, b)]
+    ac = [ci - ai for ai, ci in zip(a, c)]
+    n = _cross(ab, ac)
+    nn = _dot(n, n)
+    if nn < 1e-18:
+        return [a, b, c]
+    # Circumcenter of the triangle a, b, c.
+    t = [
+        x * _dot(ac, ac) + y * _dot(ab, ab)
+        for x, y in zip(_cross(n, ab), _cross(ac, n))
+    ]
+    center = [ai + ti / (2 * nn) for ai, ti in zip(a, t)]
+    u = [ai - ci for ai, ci in zip(a, center)]
+    radius = math.sqrt(_dot(u, u))
+    u = [x / radius for x in u]
+    w = _cross([x / math.sqrt(nn) for x in n], u)  # in-plane, 90° ahead of u towards b
+
+    def angle(p):
+        d = [pi - ci for pi, ci in zip(p, center)]
+        return math.atan2(_dot(d, w), _dot(d, u)) % (2 * PI)
+
+    sweep = angle(c)
+    if angle(b) > sweep:  # mid lies on the other side: go the long way round
+        sweep -= 2 * PI
+    return [
+        [ci + radius * (math.cos(th) * ui + math.sin(th) * wi) for ci, ui, wi in zip(center, u, w)]
+        for th in (sweep * k / segments for k in range(segments + 1))
+    ]
+
+
+def _quadratic_points(a, corner, b, segments: int) -> list[list[float]]:
+    """Quadratic Bézier a → b with control point ``corner`` (the shape of a blend)."""
+    return [
+        [(1 - t) ** 2 * p + 2 * (1 - t) * t * q + t**2 * r for p, q, r in zip(a, corner, b)]
+        for t in (k / segments for k in range(segments + 1))
+    ]
+
+
+def _polyline_samples(path: list[list[float]], step: float) -> np.ndarray:
+    """Positions along a polyline, no more than ``step`` apart (vertices included)."""
+    points = np.asarray([p[:3] for p in path], dtype=float)
+    if len(points) < 2:
+        return points
+    pieces = [points[:1]]
+    for a, b in zip(points, points[1:]):
+        count = max(1, math.ceil(float(np.linalg.norm(b - a)) / step))
+        pieces.append(a + np.linspace(0.0, 1.0, count + 1)[1:, None] * (b - a))
+    return np.concatenate(pieces)
+
+
+def _dot(a, b) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b) -> list[float]:
+    return [a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]]
 
 
 class SafetyError(Exception):
@@ -82,6 +173,7 @@ class SafetyValidator:
 
     def __init__(self, config: SafetyConfig | None = None) -> None:
         self.config = config or SafetyConfig()
+        self.zones = ZoneSet(self.config.zones)
 
     def validate_speed(self, speed_percent: int) -> int:
         """Clamp speed to configured maximum. Returns the clamped value."""
@@ -120,6 +212,65 @@ class SafetyValidator:
                     f"[{lo:.4f}, {hi:.4f}] for {robot_type.value}"
                 )
 
+        model = ARM_MODELS.get(robot_type)
+        if model is not None:
+            pair = model.colliding_pair(joints)
+            if pair:
+                raise SafetyError(
+                    f"Self-collision between {pair[0]} and {pair[1]} for {robot_type.value}"
+                )
+
+    def validate_joint_trajectory(
+        self, robot_type: RobotType, trajectory, from_start: bool = False
+    ) -> None:
+        """Check a dense joint trajectory (``(N, dof)`` array or list of configurations)
+        against joint limits and self-collision, all configurations at once.
+
+        With ``from_start`` the first configuration is where the arm is now. If that is
+        already flagged (the capsule model is nominal, so a real pose can overlap in it),
+        the arm may move out: the configurations up to the first clear one only have to
+        keep the worst overlap from getting deeper than at the start. A straight joint-space
+        path can only bring a joint past its limit back towards the range.
+        """
+        if not self.config.enabled:
+            return
+
+        limits_def = JOINT_LIMITS_MAP.get(robot_type)
+        model = ARM_MODELS.get(robot_type)
+        if limits_def is None or model is None:
+            return
+
+        q = np.atleast_2d(np.asarray(trajectory, dtype=float))
+        expected_dof = DOF_MAP.get(robot_type, q.shape[1])
+        if q.shape[1] != expected_dof:
+            raise SafetyError(
+                f"Expected {expected_dof} joints for {robot_type.value}, got {q.shape[1]}"
+            )
+
+        lo, hi = np.array(limits_def.limits).T
+        out_of_range = ((q < lo) | (q > hi)).any(axis=1)
+        clearance = model.clearances(q).min(axis=1)
+        flagged = out_of_range | (clearance < 0)
+        leaving = 0
+        if from_start and flagged[0]:
+            leaving = int(np.argmin(flagged)) if not flagged.all() else len(q)
+            deeper = np.flatnonzero(clearance[:leaving] < min(clearance[0], 0.0))
+            if deeper.size:
+                k = int(deeper[0])
+                raise SafetyError(
+                    f"Trajectory point {k} of {len(q)}: links overlap more than at the "
+                    f"start ({clearance[k]:.4f} m < {clearance[0]:.4f} m) for "
+                    f"{robot_type.value}"
+                )
+        bad = leaving + np.flatnonzero(flagged[leaving:])
+        if bad.size:
+            # Re-run the scalar check on the first bad configuration for a precise message.
+            k = int(bad[0])
+            try:
+                self.validate_joint_move(robot_type, q[k].tolist())
+            except SafetyError as exc:
+                raise SafetyError(f"Trajectory point {k} of {len(q)}: {exc}") from None
+
     def validate_cartesian_move(self, pose: list[float]) -> None:
         """Check Cartesian position against workspace bounds."""
         if not self.config.enabled:
@@ -140,6 +291,122 @@ class SafetyValidator:
         if not (wb.z_min <= z <= wb.z_max):
             raise SafetyError(f"Z={z:.4f}m outside workspace [{wb.z_min}, {wb.z_max}]")
 
+        if self.zones:
+            violation = self.zones.point_violation((x, y, z))
+            if violation:
+                raise SafetyError(f"Position ({x:.4f}, {y:.4f}, {z:.4f}) {violation}")
+
+    def validate_cartesian_segment(
+        self, start: list[float], end: list[float], from_start: bool = False
+    ) -> None:
+        """Check a straight Cartesian segment against the workspace and zones.
+
+        The workspace box is convex, so a segment is inside whenever both endpoints are;
+        keep-out and keep-in zones are checked along the whole segment. With ``from_start``,
+        ``start`` is where the arm is now and is not checked itself: a move that leaves the
+        box or a keep-out zone it is already in is allowed, as long as it ends inside.
+        """
+        if not self.config.enabled:
+            return
+        if not from_start:
+            self.validate_cartesian_move(start)
+        self.validate_cartesian_move(end)
+        if self.zones:
+            violation = self.zones.segment_violation(
+                tuple(start[:3]), tuple(end[:3]), leaving=from_start
+            )
+            if violation:
+                raise SafetyError(f"Segment to ({end[0]:.4f}, {end[1]:.4f}, {end[2]:.4f}) "
+                                  f"{violation}")
+
+    def validate_cartesian_arc(
+        self, start: list[float], mid: list[float], end: list[float]
+    ) -> None:
+        """Check an arc move by validating chords along it (chords of a convex workspace
+        box never leave it, so this is exact for the box and approximate for zones)."""
+        if not self.config.enabled:
+            return
+        points = arc_points(start, mid, end)
+        for a, b in zip(points, points[1:]):
+            self.validate_cartesian_segment(a, b)
+
+    def validate_reachable(
+        self, robot_type: RobotType, *paths: list[list[float]], from_start: bool = False
+    ) -> None:
+        """Check that the arm can reach every position along the given polylines.
+
+        Each polyline is sampled at half the map's voxel size, so a straight move that cuts
+        through the unreachable core around the base is caught even if its ends are fine.
+        With ``from_start`` each polyline starts where the arm is now, and samples before the
+        first one that passes are not checked. Without a map for ``robot_type`` this is a
+        no-op.
+        """
+        rmap = self.config.reachability.get(robot_type)
+        if not self.config.enabled or rmap is None:
+            return
+        for path in paths:
+            if len(path) == 1:
+                (x, y, z), value = path[0][:3], rmap.lookup(path[0][:3])
+            else:
+                points = _polyline_samples(path, rmap.voxel / 2)
+                values = rmap.lookup_many(points)
+                if from_start:
+                    passing = np.flatnonzero(values >= max(self.config.min_manipulability, 0))
+                    first = int(passing[0]) if passing.size else len(values) - 1
+                    points, values = points[first:], values[first:]
+                worst = int(np.argmin(values))
+                (x, y, z), value = points[worst], values[worst]
+            if value < 0:
+                raise SafetyError(
+                    f"Position ({x:.4f}, {y:.4f}, {z:.4f}) is outside the reachable "
+                    f"workspace of {robot_type.value}"
+                )
+            if value < self.config.min_manipulability:
+                raise SafetyError(
+                    f"Position ({x:.4f}, {y:.4f}, {z:.4f}) is too close to a singularity "
+                    f"(manipulability {value:.4f} < {self.config.min_manipulability})"
+                )
+
+    def validate_cartesian_path(
+        self,
+        waypoints: list[list[float]],
+        blend_radius: float = 0.0,
+        robot_type: RobotType | None = None,
+        from_start: bool = False,
+    ) -> None:
+        """Validate a Cartesian waypoint path, including the corners cut by blending.
+
+        With ``from_start`` the first waypoint is where the arm is now: like a single linear
+        move, it is not checked itself, and the first segment may leave a violation it
+        starts in (see ``validate_cartesian_segment``).
+
+        A blended corner stays inside the triangle spanned by the waypoint and the two
+        points ``blend_radius`` away from it along the adjacent segments, so checking the
+        segments and the chord between those entry/exit points covers the blended path
+        against the workspace box. Zones can sit inside that triangle, so with zones
+        configured the blend itself is also checked as a quadratic curve through the corner.
+        """
+        if not self.config.enabled:
+            return
+
+        for pose in waypoints[1:] if from_start else waypoints:
+            self.validate_cartesian_move(pose)
+        for i, (start, end) in enumerate(zip(waypoints, waypoints[1:])):
+            self.validate_cartesian_segment(start, end, from_start=from_start and i == 0)
+        if robot_type is not None:
+            self.validate_reachable(robot_type, waypoints, from_start=from_start)
+
+        if blend_radius <= 0:
+            return
+        for prev, corner, nxt in zip(waypoints, waypoints[1:], waypoints[2:]):
+            entry = blend_point(corner, prev, blend_radius)
+            exit_ = blend_point(corner, nxt, blend_radius)
+            self.validate_cartesian_segment(entry, exit_)
+            if self.zones:
+                curve = _quadratic_points(entry, corner, exit_, BLEND_SEGMENTS)
+                for a, b in zip(curve, curve[1:]):
+                    self.validate_cartesian_segment(a, b)
+
     def validate_move(
         self,
         robot_type: RobotType,
@@ -147,18 +414,40 @@ class SafetyValidator:
         target: list[float],
         mid_point: list[float] | None = None,
         end_point: list[float] | None = None,
+        start: list[float] | None = None,
     ) -> None:
-        """Validate a move command based on its motion mode."""
+        """Validate a move command based on its motion mode.
+
+        ``start`` is where the arm is now, in the move's space: joint angles for J/JS, the
+        flange pose for L. When given, the move is checked along its path (the joint-space
+        interpolation, or the straight line) rather than only at the target. A start that
+        already fails a check does not by itself block the move, so the arm can always be
+        moved back out.
+        """
         if not self.config.enabled:
             return
 
         if mode in (MotionMode.J, MotionMode.JS):
             self.validate_joint_move(robot_type, target)
+            if start is not None and len(start) == len(target):
+                self.validate_joint_trajectory(
+                    robot_type, interpolate_joints(start, target), from_start=True
+                )
+        elif mode == MotionMode.L and start is not None:
+            self.validate_cartesian_segment(start, target, from_start=True)
+            self.validate_reachable(robot_type, [start, target], from_start=True)
         elif mode in (MotionMode.P, MotionMode.L):
             self.validate_cartesian_move(target)
+            self.validate_reachable(robot_type, [target])
         elif mode == MotionMode.C:
             self.validate_cartesian_move(target)
             if mid_point:
                 self.validate_cartesian_move(mid_point)
             if end_point:
                 self.validate_cartesian_move(end_point)
+            if mid_point and end_point and self.zones:
+                self.validate_cartesian_arc(target, mid_point, end_point)
+            if mid_point and end_point:
+                self.validate_reachable(robot_type, arc_points(target, mid_point, end_point))
+            else:
+                self.validate_reachable(robot_type, [target])
@@ -0,0 +1,319 @@
+"""Run generated motion scripts inside the bridge against the connected arm.
+
+A Skill-mode script normally opens its own pyAgxArm connection, waits through the mode
+switch and enables the arm. That costs seconds per run and cannot share the CAN channel
+with a running bridge. ``POST /scripts/run`` runs the same ``clawarm.runtime`` script in
+the bridge instead. ``runtime.connect()`` returns the bridge's live arm, so there is no
+setup, and every move still goes through ``ArmManager.move`` and ``SafetyValidator``.
+
+Scripts are checked before they run and execute in a restricted namespace:
+
+- imports are limited to ``ALLOWED_IMPORTS``; ``time`` only offers ``sleep``,
+  ``monotonic``, ``perf_counter`` and ``time``;
+- names and attributes starting with ``_`` (other than ``__name__``) and frame /
+  generator internals are rejected, and only ``SAFE_BUILTINS`` are available;
+- ``str.format`` / ``format_map`` only work on string literals, and not with fields that
+  index (``{0[key]}``) or reach underscore attributes (``{0._manager}``);
+- bare ``except:`` is rejected, so a script cannot swallow its own abort.
+
+This guards against mistakes in generated code, not against a hostile author: the
+bridge's API is already trusted with the arm. A script is aborted at its next line once
+its ``timeout`` passes or the client goes away. A move that is already running finishes
+first. One script runs at a time. The server holds the arm's motion queue slot for the
+whole run and passes an ``admit`` hook that charges each move to the rate limits.
+
+A single call into C runs no lines and holds the interpreter lock, so nothing (neither
+the timeout nor another thread) can interrupt it. ``range`` is capped at ``MAX_RANGE``
+items so ``sum(range(10**12))`` and the like fail at once; other long C-level operations
+(``10**10**9``, ``[0] * 10**10``) still stall the whole bridge until they return, and a
+bridge stuck that way needs a restart.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import string
+import sys
+import threading
+import time
+import traceback
+import types
+from typing import Callable, Optional
+
+from clawarm import runtime
+
+from .models import MotionMode, RobotType
+
+SCRIPT_FILENAME = "<script>"
+MAX_OUTPUT_EVENTS = 1000
+MAX_RANGE = 1_000_000  # items; a longer range would run in C, out of the timeout's reach
+
+ALLOWED_IMPORTS = frozenset({"math", "time", "clawarm", "clawarm.runtime"})
+BLOCKED_NAMES = frozenset({
+    "breakpoint", "compile", "delattr", "eval", "exec", "exit", "getattr", "globals",
+    "help", "input", "locals", "open", "quit", "setattr", "vars",
+})
+BLOCKED_ATTRIBUTES = frozenset({
+    "ag_frame", "cr_frame", "f_back", "f_builtins", "f_globals", "f_locals", "gi_code",
+    "gi_frame", "tb_frame", "tb_next",
+})
+FORMAT_METHODS = frozenset({"format", "format_map"})
+SAFE_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in (
+        "abs", "all", "any", "bool", "dict", "divmod", "enumerate", "filter", "float",
+        "frozenset", "int", "isinstance", "len", "list", "map", "max", "min",
+        "pow", "repr", "reversed", "round", "set", "sorted", "str", "sum", "tuple",
+        "zip", "ArithmeticError", "Exception", "IndexError", "KeyError", "RuntimeError",
+        "StopIteration", "TypeError", "ValueError", "ZeroDivisionError", "False", "None",
+        "True",
+    )
+}
+
+
+def _range(*args) -> range:
+    """``range`` capped at ``MAX_RANGE`` items."""
+    items = range(*args)
+    try:
+        too_long = len(items) > MAX_RANGE
+    except OverflowError:
+        too_long = True
+    if too_long:
+        raise ValueError(f"range() is limited to {MAX_RANGE} items in scripts")
+    return items
+
+
+class ScriptError(ValueError):
+    """Raised when a script is rejected before it runs."""
+
+
+class ScriptAborted(BaseException):
+    """Raised inside a script to stop it (timeout or client gone).
+
+    A ``BaseException`` so that ``except Exception`` in the script does not catch it.
+    """
+
+
+def check_script(source: str) -> types.CodeType:
+    """Parse and vet ``source``; returns its code object or raises ``ScriptError``."""
+    try:
+        tree = ast.parse(source, SCRIPT_FILENAME)
+    except SyntaxError as exc:
+        raise ScriptError(f"Syntax error on line {exc.lineno}: {exc.msg}") from exc
+    for node in ast.walk(tree):
+        problem = _problem(node)
+        if problem:
+            raise ScriptError(f"Line {getattr(node, 'lineno', '?')}: {problem}")
+    return compile(tree, SCRIPT_FILENAME, "exec")
+
+
+def _problem(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            if alias.name not in ALLOWED_IMPORTS:
+                return f"import of {alias.name!r} is not allowed"
+    elif isinstance(node, ast.ImportFrom):
+        if node.level or node.module not in ALLOWED_IMPORTS:
+            return f"import from {node.module!r} is not allowed"
+        if any(alias.name == "*" for alias in node.names):
+            return "star imports are not allowed"
+    elif isinstance(node, ast.Name):
+        if node.id in BLOCKED_NAMES:
+            return f"{node.id}() is not available in scripts"
+        if node.id.startswith("_") and node.id != "__name__":
+            return f"name {node.id!r} is not allowed"
+    elif isinstance(node, ast.Attribute):
+        if node.attr.startswith("_") or node.attr in BLOCKED_ATTRIBUTES:
+            return f"attribute {node.attr!r} is not allowed"
+        if node.attr in FORMAT_METHODS:
+            template = node.value
+            if not (isinstance(template, ast.Constant) and isinstance(template.value, str)):
+                return f"{node.attr}() is only allowed on string literals"
+            field = _unsafe_field(template.value)
+            if field is not None:
+                return f"format field {{{field}}} is not allowed"
+    elif isinstance(node, ast.ExceptHandler) and node.type is None:
+        return "bare except is not allowed; catch Exception instead"
+    elif isinstance(node, (ast.Global, ast.Nonlocal)):
+        for name in node.names:
+            if name.startswith("_"):
+                return f"name {name!r} is not allowed"
+    return None
+
+
+def _unsafe_field(template: str) -> Optional[str]:
+    """The first replacement field in ``template`` that indexes or reaches an attribute
+    scripts may not name, or None."""
+    try:
+        fields = list(string.Formatter().parse(template))
+    except ValueError:
+        return None  # malformed; format() raises at runtime
+    for _, field, spec, _ in fields:
+        if field and ("[" in field or any(
+            part.startswith("_") or part in BLOCKED_ATTRIBUTES for part in field.split(".")[1:]
+        )):
+            return field
+        nested = _unsafe_field(spec) if spec else None
+        if nested is not None:
+            return nested
+    return None
+
+
+class _BridgeArm(runtime.Arm):
+    """``runtime.Arm`` over the bridge's manager: reports moves, never disconnects."""
+
+    def __init__(self, manager, run: "ScriptRun") -> None:
+        super().__init__(manager)
+        self._run = run
+
+    def _send(self, mode: MotionMode, target, mid, end, speed, timeout) -> dict:
+        self._run.check()
+        self._run.admit()
+        report = super()._send(mode, target, mid, end, speed, timeout)
+        self._run.moves += 1
+        self._run.emit("move", motion=report)
+        return report
+
+    def close(self) -> None:
+        """The bridge keeps the arm connected and enabled after the script."""
+
+
+class ScriptRun:
+    """One execution of a checked script. ``execute`` blocks; call it in a worker thread.
+
+    ``emit`` receives event dicts: ``start``, ``output`` for each ``print``, ``move`` for each
+    motion report, and a final ``end`` with ``ok``, ``error``, ``moves`` and ``elapsed``. Every
+    event carries ``t``, seconds since the script started.
+
+    ``admit`` is called before each move and returns seconds to wait before it may be sent
+    (``0`` to send now); the script sleeps that long, still abortable, and asks again.
+    """
+
+    def __init__(
+        self,
+        code: types.CodeType,
+        manager,
+        emit: Callable[[dict], None],
+        timeout: float = 60.0,
+        admit: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self._code = code
+        self._manager = manager
+        self._emit = emit
+        self._timeout = timeout
+        self._admit = admit
+        self._cancelled = threading.Event()
+        self._abort_reason = ""
+        self._start = 0.0
+        self._outputs = 0
+        self.moves = 0
+
+    def emit(self, event: str, **fields) -> None:
+        self._emit({"event": event, "t": round(time.monotonic() - self._start, 4), **fields})
+
+    def cancel(self, reason: str = "client disconnected") -> None:
+        self._abort_reason = reason
+        self._cancelled.set()
+
+    def check(self) -> None:
+        if time.monotonic() - self._start > self._timeout:
+            self._abort_reason = f"timed out after {self._timeout:g}s"
+            self._cancelled.set()
+        if self._cancelled.is_set():
+            raise ScriptAborted(self._abort_reason)
+
+    def admit(self) -> None:
+        """Wait until ``admit`` lets the next move through."""
+        while self._admit is not None:
+            delay = self._admit()
+            if not delay:
+                return
+            self._sleep(delay)
+
+    def _print(self, *args, sep: str = " ", end: str = "\n") -> None:
+        self._outputs += 1
+        if self._outputs <= MAX_OUTPUT_EVENTS:
+            self.emit("output", text=sep.join(str(arg) for arg in args) + end.rstrip("\n"))
+        elif self._outputs == MAX_OUTPUT_EVENTS + 1:
+            self.emit("output", text=f"[output truncated after {MAX_OUTPUT_EVENTS} lines]")
+
+    def _sleep(self, seconds: float) -> None:
+        deadline = time.monotonic() + max(seconds, 0.0)
+        while not self._cancelled.wait(max(min(deadline - time.monotonic(), 0.1), 0.0)):
+            self.check()
+            if time.monotonic() >= deadline:
+                return
+        self.check()
+
+    def _connect(self, robot: Optional[str] = None, channel: str = "can0",
+                 interface: str = "socketcan", speed: Optional[int] = None) -> runtime.Arm:
+        connected = self._manager.robot_type
+        if robot is not None and RobotType(robot) != connected:
+            raise RuntimeError(
+                f"Script asks for {robot} but the bridge is connected to {connected.value}"
+            )
+        if speed is not None:
+            self._manager.set_speed(speed)
+        return _BridgeArm(self._manager, self)
+
+    def _namespace(self) -> dict:
+        runtime_shim = types.ModuleType("clawarm.runtime")
+        runtime_shim.connect = self._connect
+        runtime_shim.Arm = runtime.Arm
+        runtime_shim.SafetyError = runtime.SafetyError
+        package = types.ModuleType("clawarm")
+        package.runtime = runtime_shim
+        time_shim = types.ModuleType("time")
+        time_shim.sleep = self._sleep
+        time_shim.monotonic = time.monotonic
+        time_shim.perf_counter = time.perf_counter
+        time_shim.time = time.time
+        modules = {"math": sys.modules["math"], "time": time_shim, "clawarm": package,
+                   "clawarm.runtime": runtime_shim}
+
+        def import_(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name not in modules:
+                raise ImportError(f"import of {name!r} is not allowed")
+            return modules[name] if fromlist or "." not in name else modules[name.split(".")[0]]
+
+        safe = dict(SAFE_BUILTINS, print=self._print, range=_range, __import__=import_,
+                    __build_class__=builtins.__build_class__)
+        return {"__builtins__": safe, "__name__": "__main__"}
+
+    def _trace(self, frame, event, arg):
+        if frame.f_code.co_filename != SCRIPT_FILENAME:
+            return None
+        return self._trace_lines
+
+    def _trace_lines(self, frame, event, arg):
+        if event == "line":
+            self.check()
+        return self._trace_lines
+
+    def execute(self) -> dict:
+        """Run the script to completion, abort or error; returns (and emits) the end event."""
+        self._start = time.monotonic()
+        self.emit("start", robot=self._manager.robot_type.value)
+        error = None
+        sys.settrace(self._trace)
+        try:
+            exec(self._code, self._namespace())
+        except ScriptAborted as exc:
+            error = f"Aborted: {exc}"
+        except Exception as exc:
+            error = _describe(exc)
+        finally:
+            sys.settrace(None)
+        end = {"ok": error is None, "error": error, "moves": self.moves,
+               "elapsed": round(time.monotonic() - self._start, 4)}
+        self.emit("end", **end)
+        return end
+
+
+def _describe(exc: Exception) -> str:
+    """``line N: Type: message`` for the innermost script line in the traceback."""
+    lines = [f.lineno for f in traceback.extract_tb(exc.__traceback__)
+             if f.filename == SCRIPT_FILENAME]
+    where = f"line {lines[-1]}: " if lines else ""
+    return f"{where}{type(exc).__name__}: {exc}"
@@ -0,0 +1,277 @@
+"""Waypoint sequence executor with look-ahead corner blending.
+
+Instead of bringing the arm to a full stop at every waypoint, consecutive P/L moves can be
+blended: the next command is issued as soon as live telemetry shows the flange inside the
+blend zone (``blend_radius`` meters) of the current target.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, NamedTuple, Optional
+
+from .drivers.base import ArmDriver
+from .models import MotionMode
+
+logger = logging.getLogger(__name__)
+
+BLENDABLE_MODES = (MotionMode.P, MotionMode.L)
+TELEMETRY_POLL_INTERVAL = 0.005
+POSITION_TOLERANCE = 0.001  # meters
+JOINT_TOLERANCE = 0.002  # radians
+DEFAULT_STEP_TIMEOUT = 3.0  # seconds, when neither a timeout nor a per-step estimate is given
+
+
+class Step(NamedTuple):
+    """A validated move in a sequence (lightweight counterpart of ``models.MoveStep``)."""
+
+    mode: MotionMode
+    target: list[float]
+    mid_point: Optional[list[float]] = None
+    end_point: Optional[list[float]] = None
+    speed_percent: Optional[int] = None
+
+
+def final_pose(step: Step) -> list[float]:
+    """Where the step leaves the arm: the arc end point for C moves, else the target."""
+    if step.mode == MotionMode.C and step.end_point is not None:
+        return step.end_point
+    return step.target
+
+
+def at_target(
+    step: Step, joints: Optional[list[float]], pose: Optional[list[float]]
+) -> bool:
+    """Whether telemetry shows the arm at the step's final joints / position."""
+    if step.mode in (MotionMode.J, MotionMode.JS):
+        return joints is not None and all(
+            abs(a - b) <= JOINT_TOLERANCE for a, b in zip(joints, step.target)
+        )
+    return pose is not None and math.dist(pose[:3], final_pose(step)[:3]) <= POSITION_TOLERANCE
+
+
+def is_blendable(steps: list[Step], index: int) -> bool:
+    """Whether the corner at ``steps[index]`` can be blended into the next step.
+
+    Only consecutive moves of the same Cartesian mode are blended, so the motion mode
+    never changes while the arm is still travelling.
+    """
+    if index + 1 >= len(steps):
+        return False
+    step, nxt = steps[index], steps[index + 1]
+    if step.mode not in BLENDABLE_MODES or nxt.mode != step.mode:
+        return False
+    return index == 0 or steps[index - 1].mode == step.mode
+
+
+def cartesian_runs(steps: list[Step], start_pose: Optional[list[float]] = None):
+    """Yield waypoint lists for each run of consecutive same-mode P/L steps.
+
+    A run at the start of the sequence begins at ``start_pose`` (the current flange pose),
+    because its first corner is blended against the segment the arm travels to get there.
+    Validate such a run with ``from_start`` so the pose the arm is already in is not
+    checked as a target.
+    """
+    for _, run in indexed_cartesian_runs(steps, start_pose):
+        yield run
+
+
+def indexed_cartesian_runs(steps: list[Step], start_pose: Optional[list[float]] = None):
+    """Like ``cartesian_runs``, yielding ``(index of the run's first step, waypoints)``."""
+    run: list[list[float]] = []
+    first = 0
+    mode: Optional[MotionMode] = None
+    for i, step in enumerate(steps):
+        if step.mode in BLENDABLE_MODES and step.mode == mode:
+            run.append(step.target)
+            continue
+        if len(run) > 1:
+            yield first, run
+        mode = step.mode if step.mode in BLENDABLE_MODES else None
+        run = [step.target] if mode else []
+        first = i
+        if mode and i == 0 and start_pose is not None:
+            run.insert(0, start_pose)
+    if len(run) > 1:
+        yield first, run
+
+
+def entry_segments(
+    steps: list[Step],
+    start_pose: Optional[list[float]] = None,
+    flange_position: Optional[Callable[[list[float]], list[float]]] = None,
+):
+    """Yield ``(index, start)`` for each straight move into an L step or a C arc's start.
+
+    ``start`` is where the previous step leaves the arm: ``start_pose`` before the first
+    step, ``final_pose`` after a P/L/C step, and ``flange_position(joints)`` (with zero
+    orientation) after a J/JS step, or nothing when that is not given. An L step that
+    continues an L run is skipped, as are L steps at the front of the sequence: those
+    segments belong to the run ``indexed_cartesian_runs`` already yields.
+    """
+    previous = start_pose
+    for i, step in enumerate(steps):
+        continues_run = step.mode == MotionMode.L and (i == 0 or steps[i - 1].mode == step.mode)
+        if step.mode in (MotionMode.L, MotionMode.C) and previous is not None and not (
+            continues_run
+        ):
+            yield i, previous
+        if step.mode not in (MotionMode.J, MotionMode.JS):
+            previous = final_pose(step)
+        elif flange_position is not None:
+            previous = list(flange_position(step.target)) + [0.0, 0.0, 0.0]
+        else:
+            previous = None
+
+
+def corner_radius(
+    steps: list[Step], index: int, previous: Optional[list[float]], blend_radius: float
+) -> float:
+    """Effective blend radius at ``steps[index]``, clamped to half of each segment."""
+    if blend_radius <= 0 or previous is None or not is_blendable(steps, index):
+        return 0.0
+    corner = steps[index].target
+    incoming = math.dist(previous[:3], corner[:3])
+    outgoing = math.dist(corner[:3], steps[index + 1].target[:3])
+    return min(blend_radius, incoming / 2, outgoing / 2)
+
+
+@dataclass
+class SequenceResult:
+    steps: int
+    completed_steps: int
+    blended: int
+    cycle_time: float
+    blend_radius: float
+
+    @property
+    def completed(self) -> bool:
+        return self.completed_steps == self.steps
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["completed"] = self.completed
+        return data
+
+
+class SequenceExecutor:
+    """Runs a list of moves on a driver, blending corners between consecutive P/L moves.
+
+    Steps are expected to be validated (and speeds clamped) by the caller; see
+    ``ArmManager.move_sequence``. The run stops early, like on a timeout, once ``abort``
+    returns True.
+
+    ``timeout`` is the wait for every step. With ``timeout=None`` each step gets
+    ``step_timeout(step)``, called just before the step is issued (``ArmManager`` derives
+    it from the step's predicted duration), or ``DEFAULT_STEP_TIMEOUT`` without one.
+    """
+
+    def __init__(
+        self,
+        driver: ArmDriver,
+        blend_radius: float = 0.0,
+        timeout: Optional[float] = None,
+        poll_interval: float = TELEMETRY_POLL_INTERVAL,
+        abort: Optional[Callable[[], bool]] = None,
+        step_timeout: Optional[Callable[[Step], float]] = None,
+    ) -> None:
+        self._driver = driver
+        self._abort = abort
+        self._blend_radius = blend_radius
+        self._timeout = timeout
+        self._step_timeout = step_timeout
+        self._poll_interval = poll_interval
+
+    def run(self, steps: list[Step]) -> SequenceResult:
+        start = time.monotonic()
+        result = SequenceResult(
+            steps=len(steps),
+            completed_steps=0,
+            blended=0,
+            cycle_time=0.0,
+            blend_radius=self._blend_radius,
+        )
+        previous = self._driver.get_flange_pose()
+        mode: Optional[MotionMode] = None
+
+        for i, step in enumerate(steps):
+            if step.speed_percent is not None:
+                self._driver.set_speed_percent(step.speed_percent)
+            if step.mode != mode:
+                self._driver.set_motion_mode(step.mode.value)
+                mode = step.mode
+            timeout = self._timeout_for(step)
+            self._issue(step)
+
+            radius = corner_radius(steps, i, previous, self._blend_radius)
+            if radius > 0:
+                reached = self._wait_blend_zone(step, radius, timeout)
+                if reached:
+                    result.blended += 1
+            else:
+                reached = self._wait_settled(step, timeout)
+            if not reached:
+                logger.warning("Sequence step %d/%d timed out", i + 1, len(steps))
+                break
+            result.completed_steps += 1
+            previous = final_pose(step)
+
+        result.cycle_time = time.monotonic() - start
+        return result
+
+    def _timeout_for(self, step: Step) -> float:
+        if self._timeout is not None:
+            return self._timeout
+        if self._step_timeout is not None:
+            return self._step_timeout(step)
+        return DEFAULT_STEP_TIMEOUT
+
+    def _issue(self, step: Step) -> None:
+        if step.mode in (MotionMode.J, MotionMode.JS):
+            self._driver.move_j(step.target)
+        elif step.mode == MotionMode.P:
+            self._driver.move_p(step.target)
+        elif step.mode == MotionMode.L:
+            self._driver.move_l(step.target)
+        elif step.mode == MotionMode.C:
+            self._driver.move_c(step.target, step.mid_point, step.end_point)
+
+    def _wait_blend_zone(self, step: Step, radius: float, timeout: float) -> bool:
+        """Poll the flange pose until it is within ``radius`` of the step target."""
+        deadline = time.monotonic() + timeout
+        while True:
+            pose = self._driver.get_flange_pose()
+            if pose is not None and math.dist(pose[:3], step.target[:3]) <= radius:
+                return True
+            if time.monotonic() > deadline or self._aborted():
+                return False
+            time.sleep(self._poll_interval)
+
+    def _wait_settled(self, step: Step, timeout: float) -> bool:
+        """Wait for ``motion_status == 0`` once the arm has moved or reached the target.
+
+        A zero status read straight after issuing a command may still describe the previous
+        motion, so it only counts once motion was observed or telemetry matches the target.
+        """
+        deadline = time.monotonic() + timeout
+        seen_moving = False
+        while True:
+            status = self._driver.get_motion_status()
+            if status is not None and status != 0:
+                seen_moving = True
+            elif status == 0 and (seen_moving or self._at_target(step)):
+                return True
+            if time.monotonic() > deadline or self._aborted():
+                return False
+            time.sleep(self._poll_interval)
+
+    def _aborted(self) -> bool:
+        return self._abort is not None and self._abort()
+
+    def _at_target(self, step: Step) -> bool:
+        if step.mode in (MotionMode.J, MotionMode.JS):
+            return at_target(step, self._driver.get_joint_angles(), None)
+        return at_target(step, None, self._driver.get_flange_pose())
@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import contextlib
+import json
 import logging
+import math
 import os
+import signal
+import threading
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
-
-from .arm_manager import ArmManager
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from . import codec, logs
+from .admission import Admission, Cancelled, MotionQueue, Throttled
+from .arm_manager import ArmManager, manager_from_env, motion_message
+from .codec import MSGPACK_OPENAPI, MSGPACK_RESPONSE_OPENAPI, CodecError, NegotiatedRoute, fast_path
+from .latency import RECEIVED, server_timing
 from .models import (
+    LONG_POLL_MAX,
+    LONG_POLL_TIMEOUT,
+    BatchRequest,
     ConnectRequest,
     MoveRequest,
+    MoveSequenceRequest,
     ResultResponse,
+    ScriptRequest,
+    ShapesRequest,
+    SimulateRequest,
     StatusResponse,
     StopAction,
     StopRequest,
 )
-from .safety import SafetyConfig, SafetyError
+from .owner import ENV_ADDRESS, DriverOwner, RemoteAdmission, RemoteArmManager
+from .safety import SafetyError
+from .scripts import ScriptError, ScriptRun, check_script
+from .shapes import ShapeError, compile_shapes
+from .state import jsonable
+from .watchdog import ArmDegradedError
 
 logger = logging.getLogger("clawarm.bridge")
 
@@ -26,20 +51,71 @@ app = FastAPI(
     description="REST API for AI-driven robotic arm control via pyAgxArm",
     version="0.1.0",
 )
+app.router.route_class = NegotiatedRoute
 
-_manager: ArmManager | None = None
+_manager: ArmManager | RemoteArmManager | None = None
+_admission: Admission | RemoteAdmission | None = None
+_script_lock = threading.Lock()  # one script drives the arm at a time
 
 
-def _get_manager() -> ArmManager:
+def _get_manager() -> ArmManager | RemoteArmManager:
     global _manager
     if _manager is None:
-        safety_val = os.environ.get("CLAWARM_SAFETY", "true").lower()
-        safety_enabled = safety_val not in ("0", "false", "no")
-        max_speed = int(os.environ.get("CLAWARM_MAX_SPEED", "80"))
-        _manager = ArmManager(SafetyConfig(enabled=safety_enabled, max_speed_percent=max_speed))
+        if os.environ.get(ENV_ADDRESS):
+            _manager = RemoteArmManager.from_env()
+        else:
+            _manager = manager_from_env()
     return _manager
 
 
+def _get_admission() -> Admission | RemoteAdmission:
+    global _admission
+    if _admission is None:
+        mgr = _get_manager()
+        if isinstance(mgr, RemoteArmManager):
+            _admission = RemoteAdmission(mgr)  # one queue and arm bucket for all workers
+        else:
+            _admission = Admission.from_env()
+    return _admission
+
+
+def _client_id(request: Request) -> str:
+    return request.headers.get("x-client-id") or (
+        request.client.host if request.client else "unknown"
+    )
+
+
+async def _throttle(request: Request) -> None:
+    """429 if the requesting client or the arm is over its rate limit."""
+    try:
+        await _get_admission().acheck(_client_id(request))
+    except Throttled as exc:
+        raise _too_many(exc)
+
+
+async def _acquire_slot() -> MotionQueue:
+    """Wait for the arm's motion queue slot; 429 if the queue is full, 409 if stopped."""
+    queue = _get_admission().queue
+    try:
+        await queue.acquire()
+    except Throttled as exc:
+        raise _too_many(exc)
+    except Cancelled as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return queue
+
+
+@contextlib.asynccontextmanager
+async def _admitted(request: Request):
+    """Rate-limit a motion command, then hold the arm's motion queue slot while it runs."""
+    await _throttle(request)
+    queue = await _acquire_slot()
+    try:
+        yield
+    finally:
+        await queue.arelease()
+
+
 @app.get("/", response_model=ResultResponse)
 async def root():
     return ResultResponse(ok=True, message="ClawArm Bridge v0.1.0")
@@ -49,7 +125,7 @@ async def root():
 async def connect(req: ConnectRequest):
     try:
         mgr = _get_manager()
-        msg = mgr.connect(req.robot, req.channel, req.interface)
+        msg = await run_in_threadpool(mgr.connect, req.robot, req.channel, req.interface)
         return ResultResponse(ok=True, message=msg)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -58,24 +134,131 @@ async def connect(req: ConnectRequest):
 @app.post("/disconnect", response_model=ResultResponse)
 async def disconnect():
     mgr = _get_manager()
-    msg = mgr.disconnect()
+    msg = await run_in_threadpool(mgr.disconnect)
     return ResultResponse(ok=True, message=msg)
 
 
-@app.get("/status", response_model=StatusResponse)
-async def status():
+async def _status_data(changed_since: int | None = None, timeout: float = 0.0) -> dict:
     mgr = _get_manager()
-    data = mgr.get_status()
-    return StatusResponse(**data)
+    if changed_since is None:
+        return await mgr.aget_status()
+    return await mgr.await_status(changed_since, timeout)
+
+
+def _too_many(exc: Throttled) -> HTTPException:
+    retry_after = max(math.ceil(exc.retry_after), 1)
+    return HTTPException(status_code=429, detail=str(exc),
+                         headers={"Retry-After": str(retry_after)})
+
+
+def _unavailable(exc: ArmDegradedError) -> HTTPException:
+    retry_after = max(math.ceil(exc.retry_after), 1)
+    return HTTPException(status_code=503, detail=str(exc),
+                         headers={"Retry-After": str(retry_after)})
+
+
+async def _require_connected(mgr: ArmManager | RemoteArmManager) -> None:
+    """400 if the arm is not connected, or 503 while the watchdog is reconnecting it."""
+    if mgr.connected:
+        return
+    try:
+        await run_in_threadpool(mgr.require_fresh)
+    except ArmDegradedError as exc:
+        raise _unavailable(exc)
+    raise HTTPException(status_code=400, detail="Arm not connected. POST /connect first.")
 
 
-@app.post("/move", response_model=ResultResponse)
-async def move(req: MoveRequest):
+async def _run_move(**kwargs) -> ResultResponse:
     mgr = _get_manager()
-    if not mgr.connected:
-        raise HTTPException(status_code=400, detail="Arm not connected. POST /connect first.")
+    await _require_connected(mgr)
+    try:
+        report = await mgr.amove(**kwargs)
+    except ArmDegradedError as exc:
+        raise _unavailable(exc)
+    except SafetyError as exc:
+        raise HTTPException(status_code=422, detail=f"Safety violation: {exc}")
+    except ValueError as exc:  # e.g. a relative offset that does not fit the mode
+        raise HTTPException(status_code=422, detail=str(exc))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    return ResultResponse(ok=True, message=motion_message(report), data=report)
+
+
+async def _run_sequence(**kwargs) -> ResultResponse:
+    mgr = _get_manager()
+    await _require_connected(mgr)
+    try:
+        result = await run_in_threadpool(mgr.move_sequence, **kwargs)
+    except ArmDegradedError as exc:
+        raise _unavailable(exc)
+    except SafetyError as exc:
+        raise HTTPException(status_code=422, detail=f"Safety violation: {exc}")
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    status = "completed" if result["completed"] else "timed out"
+    msg = (
+        f"Sequence {status}: {result['completed_steps']}/{result['steps']} steps, "
+        f"{result['blended']} blended, cycle time {result['cycle_time']:.3f}s"
+    )
+    simplified = result.get("simplification")
+    if simplified:
+        msg += (
+            f", simplified {simplified['input_steps']} to {simplified['output_steps']} steps "
+            f"(max error {simplified['max_error'] * 1e3:.2f} mm)"
+        )
+    return ResultResponse(ok=True, message=msg, data=result)
+
+
+async def _parse_fast(request: Request, parse) -> dict:
+    payload = await codec.read_body(request)
+    try:
+        return parse(payload)
+    except CodecError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+async def _status_fast(request: Request):
     try:
-        msg = mgr.move(
+        query = codec.parse_status_query(request.query_params)
+    except CodecError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return codec.respond(request, await _status_data(**query))
+
+
+async def _move_fast(request: Request):
+    async with _admitted(request):
+        result = await _run_move(
+            received=request.scope.get(RECEIVED), **await _parse_fast(request, codec.parse_move)
+        )
+    response = codec.respond(request, result.model_dump())
+    response.headers["Server-Timing"] = server_timing(result.data["latency"])
+    return response
+
+
+async def _sequence_fast(request: Request):
+    async with _admitted(request):
+        result = await _run_sequence(**await _parse_fast(request, codec.parse_sequence))
+    return codec.respond(request, result.model_dump())
+
+
+@app.get("/status", response_model=StatusResponse, openapi_extra=MSGPACK_RESPONSE_OPENAPI)
+@fast_path(_status_fast)
+async def status(
+    changed_since: int | None = Query(
+        None, ge=0, description="Block until the status seq differs from this value"
+    ),
+    timeout: float = Query(LONG_POLL_TIMEOUT, ge=0, le=LONG_POLL_MAX),
+):
+    return StatusResponse(**await _status_data(changed_since, timeout))
+
+
+@app.post("/move", response_model=ResultResponse, openapi_extra=MSGPACK_OPENAPI)
+@fast_path(_move_fast)
+async def move(req: MoveRequest, request: Request, response: Response):
+    """Validate and send a move. ``Server-Timing`` carries the per-stage ``data.latency``."""
+    async with _admitted(request):
+        result = await _run_move(
+            received=request.scope.get(RECEIVED),
             mode=req.mode,
             target=req.target,
             mid_point=req.mid_point,
@@ -83,12 +266,178 @@ async def move(req: MoveRequest):
             speed_percent=req.speed_percent,
             wait=req.wait,
             timeout=req.timeout,
+            relative=req.relative,
+            frame=req.frame,
         )
-        return ResultResponse(ok=True, message=msg)
-    except SafetyError as exc:
-        raise HTTPException(status_code=422, detail=f"Safety violation: {exc}")
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    response.headers["Server-Timing"] = server_timing(result.data["latency"])
+    return result
+
+
+@app.post("/move/sequence", response_model=ResultResponse, openapi_extra=MSGPACK_OPENAPI)
+@fast_path(_sequence_fast)
+async def move_sequence(req: MoveSequenceRequest, request: Request):
+    async with _admitted(request):
+        return await _run_sequence(
+            steps=req.steps,
+            blend_radius=req.blend_radius,
+            timeout=req.timeout,
+            simplify_tolerance=req.simplify_tolerance,
+            orientation_tolerance=req.orientation_tolerance,
+        )
+
+
+@app.post("/simulate", response_model=ResultResponse)
+async def simulate(req: SimulateRequest):
+    """Dry-run a sequence: predicted timeline, cycle time, peak joint velocities and every
+    safety violation, without moving the arm (see ``bridge.simulate``)."""
+    mgr = _get_manager()
+    try:
+        result = await run_in_threadpool(
+            mgr.simulate_sequence,
+            steps=req.steps,
+            blend_radius=req.blend_radius,
+            timeout=req.timeout,
+            simplify_tolerance=req.simplify_tolerance,
+            orientation_tolerance=req.orientation_tolerance,
+            robot=req.robot,
+            start_joints=req.start_joints,
+        )
+    except RuntimeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    violations = result["violations"]
+    msg = (
+        f"Simulated {result['steps']} steps on {result['robot']}: cycle time "
+        f"{result['cycle_time']:.3f}s, "
+        + (f"{len(violations)} safety violation(s)" if violations else "no safety violations")
+    )
+    return ResultResponse(ok=result["safe"], message=msg, data=result)
+
+
+@app.post("/batch", response_model=ResultResponse)
+async def batch(req: BatchRequest, request: Request):
+    """Run operations in order in one round trip; stops at the first failing operation."""
+    mgr = _get_manager()
+    async with _admitted(request):
+        result = await run_in_threadpool(mgr.run_batch, [op.model_dump() for op in req.ops])
+    total = len(req.ops)
+    if result["completed"]:
+        msg = f"Batch completed: {total} ops in {result['elapsed']:.3f}s"
+    else:
+        failed = result["ops"][-1]
+        msg = (
+            f"Batch stopped at op {result['failed_at'] + 1}/{total} ({failed['op']}): "
+            f"{failed['error']}"
+        )
+    return ResultResponse(ok=result["completed"], message=msg, data=result)
+
+
+@app.post("/shapes", response_model=ResultResponse)
+async def shapes(req: ShapesRequest, request: Request):
+    """Compile parametric shapes to arcs and lines, validate them all, then run them."""
+    try:
+        steps, compiled = compile_shapes(
+            [shape.model_dump() for shape in req.shapes],
+            req.plane.origin,
+            req.plane.rotation,
+            req.orientation,
+            req.tolerance,
+            req.speed_percent,
+        )
+    except ShapeError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    async with _admitted(request):
+        resp = await _run_sequence(steps=steps, timeout=req.timeout)
+    resp.data["shapes"] = compiled["shapes"]
+    resp.message = f"{len(req.shapes)} shape(s) in {compiled['segments']} segments. {resp.message}"
+    return resp
+
+
+@app.post("/scripts/run")
+async def run_script(req: ScriptRequest, request: Request):
+    """Run a ``clawarm.runtime`` script against the connected arm (see ``bridge.scripts``).
+
+    Streams newline-delimited JSON events: ``start``, ``output`` per ``print``, ``move``
+    per motion report, and ``end`` with ``ok``, ``error``, ``moves`` and ``elapsed``.
+    Closing the response aborts the script at its next line. The script holds the motion
+    queue slot until it ends, so other motion commands wait or are turned away meanwhile,
+    and each of its moves takes a rate-limit token, waiting for one if the bucket is empty.
+    """
+    await _throttle(request)
+    mgr = _get_manager()
+    await _require_connected(mgr)
+    try:
+        code = check_script(req.source)
+    except ScriptError as exc:
+        raise HTTPException(status_code=422, detail=f"Script rejected: {exc}")
+    if not _script_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A script is already running")
+    try:
+        queue = await _acquire_slot()
+    except BaseException:
+        _script_lock.release()
+        raise
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    client = _client_id(request)
+
+    async def delay() -> float:
+        try:
+            await _get_admission().acheck(client)
+        except Throttled as exc:
+            return exc.retry_after
+        return 0.0
+
+    def admit() -> float:
+        return asyncio.run_coroutine_threadsafe(delay(), loop).result()
+
+    run = ScriptRun(code, mgr, lambda event: loop.call_soon_threadsafe(events.put_nowait, event),
+                    req.timeout, admit)
+
+    def execute() -> dict:
+        try:
+            return run.execute()
+        finally:
+            _script_lock.release()
+            asyncio.run_coroutine_threadsafe(queue.arelease(), loop)
+
+    task = asyncio.ensure_future(asyncio.to_thread(execute))
+
+    async def stream():
+        try:
+            while True:
+                event = await events.get()
+                yield json.dumps(event, default=jsonable) + "\n"
+                if event["event"] == "end":
+                    break
+            await task
+        finally:
+            run.cancel()  # no-op once the script has ended
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@app.get("/motions/{motion_id}/wait", response_model=ResultResponse)
+async def wait_motion(
+    motion_id: int, timeout: float = Query(LONG_POLL_TIMEOUT, ge=0, le=LONG_POLL_MAX)
+):
+    """Long-poll until the motion settles; ``data.state`` is still ``running`` on timeout."""
+    try:
+        motion = await _get_manager().await_motion(motion_id, timeout)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    if motion is None:
+        raise HTTPException(status_code=404, detail=f"Unknown motion {motion_id}")
+    return ResultResponse(ok=True, message=f"Motion {motion_id}: {motion['state']}", data=motion)
+
+
+@app.get("/metrics")
+async def metrics():
+    data = await run_in_threadpool(_get_manager().metrics)
+    data["admission"] = await _get_admission().asnapshot()
+    return data
 
 
 @app.post("/enable", response_model=ResultResponse)
@@ -96,14 +445,8 @@ async def enable():
     mgr = _get_manager()
     if not mgr.connected:
         raise HTTPException(status_code=400, detail="Arm not connected")
-    driver = mgr._driver
-    retries = 0
-    while not driver.enable():
-        import time
-        time.sleep(0.01)
-        retries += 1
-        if retries > 500:
-            raise HTTPException(status_code=500, detail="Failed to enable arm")
+    if not await mgr.aenable():
+        raise HTTPException(status_code=500, detail="Failed to enable arm")
     return ResultResponse(ok=True, message="Arm enabled")
 
 
@@ -112,39 +455,71 @@ async def disable():
     mgr = _get_manager()
     if not mgr.connected:
         raise HTTPException(status_code=400, detail="Arm not connected")
-    driver = mgr._driver
-    retries = 0
-    while not driver.disable():
-        import time
-        time.sleep(0.01)
-        retries += 1
-        if retries > 100:
-            raise HTTPException(status_code=500, detail="Failed to disable arm")
+    if not await mgr.adisable():
+        raise HTTPException(status_code=500, detail="Failed to disable arm")
     return ResultResponse(ok=True, message="Arm disabled")
 
 
 @app.post("/stop", response_model=ResultResponse)
 async def stop(req: StopRequest):
+    """Stop the arm; never rate-limited, and cancels the commands waiting to run."""
+    await _get_admission().queue.aclear("Cancelled by a stop command")
     mgr = _get_manager()
-    msg = mgr.stop(emergency=(req.action == StopAction.EMERGENCY_STOP))
+    msg = await mgr.astop(emergency=(req.action == StopAction.EMERGENCY_STOP))
     return ResultResponse(ok=True, message=msg)
 
 
+def _exit_on_signal(signum, frame):
+    raise SystemExit(128 + signum)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="ClawArm bridge server")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("CLAWARM_WORKERS", "1")),
+        help="HTTP worker processes; above 1 the arm runs in a separate driver owner process",
+    )
+    parser.add_argument(
+        "--owner",
+        action="store_true",
+        default=os.environ.get("CLAWARM_OWNER", "").lower() in ("1", "true", "yes"),
+        help="run the arm in a driver owner process even with a single worker",
+    )
+    args = parser.parse_args()
     host = os.environ.get("CLAWARM_HOST", "127.0.0.1")
     port = int(os.environ.get("CLAWARM_PORT", "8420"))
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-    )
+    logs.install()
 
     mock_mode = os.environ.get("CLAWARM_MOCK", "").lower() in ("1", "true", "yes")
     if mock_mode:
         logger.info("Starting in MOCK mode (no real hardware)")
 
     logger.info("ClawArm Bridge starting on %s:%d", host, port)
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    if args.workers <= 1 and not args.owner:
+        uvicorn.run(app, host=host, port=port, log_level="info",
+                    log_config=logs.uvicorn_log_config())
+        return
+
+    # uvicorn re-raises SIGTERM once it has shut down; make that unwind through the
+    # ``finally`` below so the owner process and its shared memory are cleaned up.
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    owner = DriverOwner()
+    owner.start()
+    os.environ.update(owner.env())  # inherited by the spawned workers
+    try:
+        uvicorn.run(
+            "bridge.server:app",
+            host=host,
+            port=port,
+            workers=max(args.workers, 1),
+            log_level="info",
+            log_config=logs.uvicorn_log_config(),
+        )
+    finally:
+        owner.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,254 @@
+"""Parametric shapes compiled to ``move_c`` arcs and ``move_l`` lines.
+
+``POST /shapes`` takes circles, arcs, spirals, raster fills and polylines in the 2-D
+coordinates of a plane, and turns them into the fewest sequence steps that trace them:
+
+- circles and arcs: one C move per half turn (a three-point arc cannot close on itself);
+- spirals: the smallest number of equal pieces whose three-point arcs stay within
+  ``tolerance`` of the spiral, found by fitting every piece at once with numpy;
+- raster fills: one L move per pass and per step-over;
+- polylines: one L move per edge, with corners rounded by tangent arcs (``corner_radius``).
+
+Each shape starts with a P move to its first point. The resulting steps are run by
+``ArmManager.move_sequence``, which safety-checks all of them before sending the first.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+import numpy as np
+
+from .frames import matrix_to_rpy, rpy_to_matrix
+from .models import MotionMode
+from .sequence import Step, final_pose
+
+MAX_SEGMENTS = 1024  # sequence steps per request
+MAX_ARC_SWEEP = math.pi
+SPIRAL_SAMPLES = 16  # per piece, for measuring the fit
+POINTING_INTO_PLANE = [0.0, math.pi, 0.0]  # tool frame relative to the plane frame
+_EPS = 1e-9
+
+
+class ShapeError(ValueError):
+    """Raised when a shape cannot be compiled (degenerate, or too many segments)."""
+
+
+# A shape compiles to its start point and a list of 2-D segments from there:
+# ("L", end) or ("C", mid, end), points as numpy arrays of shape (2,).
+
+
+def _polar(center, radius, angles) -> np.ndarray:
+    angles = np.asarray(angles, dtype=float)
+    offsets = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    return np.asarray(center, dtype=float) + np.asarray(radius, dtype=float)[..., None] * offsets
+
+
+def _arcs(center, radius: float, start: float, sweep: float) -> tuple[np.ndarray, list]:
+    if abs(sweep) < _EPS:
+        raise ShapeError("Arc sweep must not be zero")
+    count = math.ceil(abs(sweep) / MAX_ARC_SWEEP - 1e-9)
+    ends = start + sweep * np.arange(1, count + 1) / count
+    mids = ends - sweep / (2 * count)
+    mid_points = _polar(center, np.full(count, radius), mids)
+    end_points = _polar(center, np.full(count, radius), ends)
+    return _polar(center, radius, start), [("C", m, e) for m, e in zip(mid_points, end_points)]
+
+
+def _circle(shape: dict, tolerance: float):
+    sweep = -2 * math.pi if shape["clockwise"] else 2 * math.pi
+    return _arcs(shape["center"], shape["radius"], shape["start_angle"], sweep)
+
+
+def _arc(shape: dict, tolerance: float):
+    return _arcs(shape["center"], shape["radius"], shape["start_angle"], shape["sweep"])
+
+
+def _circumcircles(a: np.ndarray, b: np.ndarray, c: np.ndarray):
+    """Centers and radii of the circles through row-wise point triples (inf if collinear)."""
+    ab, ac = b - a, c - a
+    det = 2.0 * (ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+    ab2, ac2 = (ab ** 2).sum(axis=1), (ac ** 2).sum(axis=1)
+    safe = np.where(np.abs(det) < _EPS, np.inf, det)
+    offset = np.stack([ac[:, 1] * ab2 - ab[:, 1] * ac2, ab[:, 0] * ac2 - ac[:, 0] * ab2], axis=1)
+    center = a + offset / safe[:, None]
+    return center, np.linalg.norm(a - center, axis=1)
+
+
+def _spiral_fit(shape: dict, pieces: int):
+    """Three-point arcs for ``pieces`` equal pieces of the spiral and their max deviation."""
+    sign = -1.0 if shape["clockwise"] else 1.0
+    r0, r1 = shape["start_radius"], shape["end_radius"]
+
+    def point(t):
+        return _polar(shape["center"], r0 + (r1 - r0) * t,
+                      shape["start_angle"] + sign * 2 * math.pi * shape["turns"] * t)
+
+    knots = np.arange(pieces + 1) / pieces
+    starts, ends = point(knots[:-1]), point(knots[1:])
+    mids = point(knots[:-1] + 0.5 / pieces)
+    samples = knots[:-1, None] + np.linspace(0, 1, SPIRAL_SAMPLES)[None, :] / pieces
+    dense = point(samples)  # (pieces, samples, 2)
+    with np.errstate(invalid="ignore"):  # collinear triples have infinite circles
+        center, radius = _circumcircles(starts, mids, ends)
+        deviation = np.abs(np.linalg.norm(dense - center[:, None, :], axis=2) - radius[:, None])
+    error = float(np.nan_to_num(deviation, nan=np.inf).max())
+    return starts[0], [("C", m, e) for m, e in zip(mids, ends)], error
+
+
+def _spiral(shape: dict, tolerance: float):
+    if max(shape["start_radius"], shape["end_radius"]) < _EPS:
+        raise ShapeError("Spiral radius must not be zero at both ends")
+    # Each piece is a C move, so it must turn by at most half a revolution.
+    low = max(1, math.ceil(2 * shape["turns"] - 1e-9))
+    high = low
+    while _spiral_fit(shape, high)[2] > tolerance:
+        low, high = high + 1, high * 2
+        if high > MAX_SEGMENTS:
+            raise ShapeError(f"Spiral needs more than {MAX_SEGMENTS} arcs at this tolerance")
+    while low < high:  # smallest piece count within tolerance
+        middle = (low + high) // 2
+        if _spiral_fit(shape, middle)[2] <= tolerance:
+            high = middle
+        else:
+            low = middle + 1
+    start, segments, _ = _spiral_fit(shape, high)
+    return start, segments
+
+
+def _raster(shape: dict, tolerance: float):
+    passes = math.floor(shape["height"] / shape["spacing"] + 1e-9) + 1
+    if 2 * passes > MAX_SEGMENTS:
+        raise ShapeError(f"Raster needs {passes} passes; reduce height or increase spacing")
+    u = np.array([math.cos(shape["angle"]), math.sin(shape["angle"])])
+    v = np.array([-u[1], u[0]])
+    corner = np.asarray(shape["corner"], dtype=float)
+    rows = corner + np.arange(passes)[:, None] * shape["spacing"] * v
+    segments = []
+    for k, row in enumerate(rows):
+        near, far = (row, row + shape["width"] * u)[:: 1 if k % 2 == 0 else -1]
+        if k:
+            segments.append(("L", near))
+        segments.append(("L", far))
+    return rows[0], segments
+
+
+def _polyline(shape: dict, tolerance: float):
+    points = [np.asarray(p, dtype=float) for p in shape["points"]]
+    if shape["closed"]:
+        if np.linalg.norm(points[0] - points[-1]) < _EPS:
+            points.pop()
+        start = (points[0] + points[1]) / 2  # so the first vertex gets rounded too
+        points = [start, *points[1:], points[0], start]
+    points = _drop_redundant(points)
+    if len(points) < 2:
+        raise ShapeError("Polyline has no length")
+    segments: list = []
+    for prev, corner, nxt in zip(points, points[1:], points[2:]):
+        fillet = _fillet(prev, corner, nxt, shape["corner_radius"])
+        if fillet is None:
+            segments.append(("L", corner))
+        else:
+            entry, mid, exit_ = fillet
+            segments.extend([("L", entry), ("C", mid, exit_)])
+    segments.append(("L", points[-1]))
+    return points[0], segments
+
+
+def _drop_redundant(points: list[np.ndarray]) -> list[np.ndarray]:
+    """Remove repeated points and vertices where the polyline carries straight on."""
+    out: list[np.ndarray] = []
+    for point in points:
+        if out and np.linalg.norm(point - out[-1]) < _EPS:
+            continue
+        if len(out) >= 2:
+            d1, d2 = out[-1] - out[-2], point - out[-1]
+            cross = d1[0] * d2[1] - d1[1] * d2[0]
+            if abs(cross) < _EPS * np.linalg.norm(d1) * np.linalg.norm(d2) and d1 @ d2 > 0:
+                out[-1] = point
+                continue
+        out.append(point)
+    return out
+
+
+def _fillet(prev, corner, nxt, radius: float):
+    """Entry, middle and exit points of the tangent arc rounding ``corner``, or None."""
+    if radius <= 0:
+        return None
+    back, ahead = prev - corner, nxt - corner
+    len_back, len_ahead = np.linalg.norm(back), np.linalg.norm(ahead)
+    u1, u2 = back / len_back, ahead / len_ahead
+    angle = math.acos(max(-1.0, min(1.0, float(u1 @ u2))))  # interior angle
+    if angle < 1e-6 or math.pi - angle < 1e-6:
+        return None  # reversal: no arc fits
+    # Tangent distance, limited to half of each adjacent edge.
+    reach = min(radius / math.tan(angle / 2), len_back / 2, len_ahead / 2)
+    radius = reach * math.tan(angle / 2)
+    bisector = (u1 + u2) / np.linalg.norm(u1 + u2)
+    center = corner + bisector * radius / math.sin(angle / 2)
+    return corner + u1 * reach, center - bisector * radius, corner + u2 * reach
+
+
+_COMPILERS = {
+    "circle": _circle,
+    "arc": _arc,
+    "spiral": _spiral,
+    "raster": _raster,
+    "polyline": _polyline,
+}
+
+
+def compile_shapes(
+    shapes: list[dict],
+    origin: list[float],
+    rotation: list[float],
+    orientation: Optional[list[float]] = None,
+    tolerance: float = 0.0005,
+    speed_percent: Optional[int] = None,
+) -> tuple[list[Step], dict]:
+    """Compile shape dicts (``ShapesRequest.shapes`` dumps) to sequence steps.
+
+    Shape coordinates are meters in the plane given by ``origin`` and ``rotation``
+    (roll/pitch/yaw). The tool holds ``orientation`` throughout; by default it points into
+    the plane. ``speed_percent`` is applied from the first step. Returns the steps and a
+    summary with the number of lines and arcs per shape, and whether it needed a travel
+    move to its start.
+    """
+    plane = rpy_to_matrix(rotation)
+    if orientation is None and not any(rotation):
+        orientation = POINTING_INTO_PLANE
+    elif orientation is None:
+        orientation = matrix_to_rpy(plane @ rpy_to_matrix(POINTING_INTO_PLANE)).tolist()
+    origin_ = np.asarray(origin, dtype=float)
+
+    def pose(point) -> list[float]:
+        return [*(origin_ + plane[:, :2] @ point).tolist(), *orientation]
+
+    steps: list[Step] = []
+    summary = []
+    for shape in shapes:
+        start, segments = _COMPILERS[shape["kind"]](shape, tolerance)
+        current = pose(start)
+        travel = not steps or math.dist(final_pose(steps[-1])[:3], current[:3]) > _EPS
+        if travel:
+            steps.append(Step(MotionMode.P, current))
+        counts = {"L": 0, "C": 0}
+        for kind, *points in segments:
+            end = pose(points[-1])
+            if math.dist(end[:3], current[:3]) < _EPS:
+                continue  # e.g. two fillets meeting in the middle of an edge
+            if kind == "L":
+                steps.append(Step(MotionMode.L, end))
+            else:
+                steps.append(Step(MotionMode.C, current, pose(points[0]), end))
+            counts[kind] += 1
+            current = end
+        summary.append({
+            "kind": shape["kind"], "lines": counts["L"], "arcs": counts["C"], "travel": travel,
+        })
+        if len(steps) > MAX_SEGMENTS:
+            raise ShapeError(f"Shapes compile to more than {MAX_SEGMENTS} segments")
+    if speed_percent is not None:
+        steps[0] = steps[0]._replace(speed_percent=speed_percent)
+    return steps, {"segments": len(steps), "shapes": summary}
@@ -0,0 +1,173 @@
+"""Ramer–Douglas–Peucker simplification of dense Cartesian waypoint lists.
+
+Drawing and vision pipelines produce paths with thousands of nearly collinear poses. Sent
+one ``move_l`` at a time they flood the bus and the arm stutters between them. RDP keeps
+the fewest waypoints such that every dropped pose lies within ``tolerance`` meters of the
+segment that replaces it, and within ``orientation_tolerance`` radians of the orientation
+interpolated (slerp) along that segment.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .frames import rpy_to_quaternion
+from .models import DEFAULT_ORIENTATION_TOLERANCE, MotionMode
+from .sequence import Step, final_pose
+
+SIMPLIFIABLE_MODES = (MotionMode.L,)  # straight segments; P paths are not lines
+_EPS = 1e-12
+
+
+@dataclass
+class Simplification:
+    """Which poses RDP kept and how far the dropped ones are from the simplified path."""
+
+    keep: np.ndarray  # indices into the input poses, first and last included
+    points: int
+    max_error: float = 0.0  # meters
+    max_orientation_error: float = 0.0  # radians
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.points / len(self.keep)
+
+
+def simplify_path(
+    poses, tolerance: float, orientation_tolerance: Optional[float] = None
+) -> Simplification:
+    """Simplify ``poses`` (``(N, 6)`` x, y, z, roll, pitch, yaw); ``None`` ignores orientation.
+
+    The recursion is run level by level: each pass scores every still-undecided pose
+    against the segment between its kept neighbours, then splits every segment whose worst
+    pose is out of tolerance at that pose. A pass is a handful of numpy operations over the
+    whole path, and there are about as many passes as the recursion is deep.
+    """
+    poses = np.asarray(poses, dtype=float)
+    n = len(poses)
+    if n < 3:
+        return Simplification(np.arange(n), n)
+    positions = poses[:, :3]
+    quats = rpy_to_quaternion(poses[:, 3:6]) if orientation_tolerance is not None else None
+
+    index = np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    open_ = ~keep  # poses whose enclosing segment has not been accepted yet
+    result = Simplification(keep, n)
+    while open_.any():
+        left = np.maximum.accumulate(np.where(keep, index, 0))
+        right = np.minimum.accumulate(np.where(keep, index, n - 1)[::-1])[::-1]
+        points = np.flatnonzero(open_)
+        a, b = left[points], right[points]
+        dist, t = _segment_errors(positions[points], positions[a], positions[b])
+        score = dist / max(tolerance, _EPS)
+        angles = None
+        if quats is not None:
+            still = np.linalg.norm(positions[b] - positions[a], axis=1) < _EPS
+            t = np.where(still, (points - a) / (b - a), t)  # turning on the spot
+            angles = _orientation_errors(quats[a], quats[b], quats[points], t)
+            score = np.maximum(score, angles / max(orientation_tolerance, _EPS))
+
+        # Open poses come in index order, so each segment's poses are one contiguous group.
+        starts = np.flatnonzero(np.r_[True, a[1:] != a[:-1]])
+        counts = np.diff(np.r_[starts, len(a)])
+        group_max = np.maximum.reduceat(score, starts)
+        hits = np.flatnonzero(score == np.repeat(group_max, counts))
+        group = np.repeat(np.arange(len(starts)), counts)[hits]
+        worst = hits[np.r_[True, group[1:] != group[:-1]]]
+        split = worst[group_max > 1.0]
+        accepted = np.repeat(group_max <= 1.0, counts)
+        keep[points[split]] = True
+        if accepted.any():
+            result.max_error = max(result.max_error, float(dist[accepted].max()))
+            if angles is not None:
+                result.max_orientation_error = max(
+                    result.max_orientation_error, float(angles[accepted].max())
+                )
+        open_[points[accepted]] = False
+        open_[points[split]] = False
+    result.keep = np.flatnonzero(keep)
+    return result
+
+
+def _segment_errors(points: np.ndarray, a: np.ndarray, b: np.ndarray):
+    """Row-wise distances from ``points`` to segments ``a``-``b`` and the projection
+    parameters in [0, 1]."""
+    ab = b - a
+    length2 = np.einsum("ij,ij->i", ab, ab)
+    t = np.einsum("ij,ij->i", points - a, ab) / np.maximum(length2, _EPS)
+    t = np.where(length2 < _EPS, 0.0, np.clip(t, 0.0, 1.0))
+    return np.linalg.norm(points - (a + t[:, None] * ab), axis=1), t
+
+
+def _orientation_errors(qa: np.ndarray, qb: np.ndarray, q: np.ndarray, t: np.ndarray):
+    """Angles between quaternions ``q`` and the slerp from ``qa`` to ``qb`` at ``t``."""
+    cos = np.einsum("ij,ij->i", qa, qb)
+    qb = np.where(cos[:, None] < 0, -qb, qb)  # take the short way round
+    theta = np.arccos(np.clip(np.abs(cos), -1.0, 1.0))
+    sin = np.sin(theta)
+    near = sin < 1e-9
+    safe = np.where(near, 1.0, sin)
+    wa = np.where(near, 1.0 - t, np.sin((1.0 - t) * theta) / safe)
+    wb = np.where(near, t, np.sin(t * theta) / safe)
+    expected = wa[:, None] * qa + wb[:, None] * qb
+    expected /= np.linalg.norm(expected, axis=1)[:, None]
+    dot = np.abs(np.einsum("ij,ij->i", expected, q))
+    return 2.0 * np.arccos(np.clip(dot, -1.0, 1.0))
+
+
+def simplify_steps(
+    steps: list[Step],
+    tolerance: float,
+    orientation_tolerance: Optional[float] = DEFAULT_ORIENTATION_TOLERANCE,
+    start_pose: Optional[list[float]] = None,
+) -> tuple[list[Step], dict]:
+    """Simplify each run of consecutive L steps with the same speed; other steps pass through.
+
+    A run starts from where the arm will be: ``start_pose`` for a run at the beginning of
+    the sequence, the previous step's final pose after a Cartesian step. That anchor is
+    never sent, but lets the run's first waypoint be dropped too. After a joint move the
+    pose is not known, so the run's first waypoint is kept.
+    """
+    out: list[Step] = []
+    max_error = max_orientation_error = 0.0
+    i = 0
+    while i < len(steps):
+        step = steps[i]
+        j = i + 1
+        if step.mode in SIMPLIFIABLE_MODES:
+            while (j < len(steps) and steps[j].mode == step.mode
+                   and steps[j].speed_percent == step.speed_percent):
+                j += 1
+        run = steps[i:j]
+        if len(run) < 2:
+            out.extend(run)
+            i = j
+            continue
+        if i == 0:
+            anchor = start_pose
+        elif steps[i - 1].mode not in (MotionMode.J, MotionMode.JS):
+            anchor = final_pose(steps[i - 1])
+        else:
+            anchor = None
+        poses = [s.target for s in run] if anchor is None else [anchor] + [s.target for s in run]
+        result = simplify_path(poses, tolerance, orientation_tolerance)
+        offset = 0 if anchor is None else 1
+        out.extend(run[k - offset] for k in result.keep if k >= offset)
+        max_error = max(max_error, result.max_error)
+        max_orientation_error = max(max_orientation_error, result.max_orientation_error)
+        i = j
+    report = {
+        "input_steps": len(steps),
+        "output_steps": len(out),
+        "compression_ratio": round(len(steps) / len(out), 3),
+        "max_error": max_error,
+        "max_orientation_error": max_orientation_error,
+        "tolerance": tolerance,
+        "orientation_tolerance": orientation_tolerance,
+    }
+    return out, report
@@ -0,0 +1,291 @@
+"""Faster-than-real-time dry run of a move sequence (``POST /simulate``).
+
+``simulate_sequence`` plays a sequence on a simulated arm whose clock jumps from one move
+to the next instead of waiting for it. Each step is timed with the bridge's
+``MotionEstimator``, the same calibrated trapezoidal profiles that set the deadlines of real
+moves. Corners are blended where ``SequenceExecutor`` would blend them, and every check
+that ``ArmManager.move_sequence`` runs is run too. All violations are collected instead
+of stopping at the first.
+
+The simulated arm keeps both joint angles and flange pose. After a joint move the flange
+position comes from forward kinematics on the nominal model (``bridge.kinematics``). After
+a Cartesian move the joints come from position-only inverse kinematics, solved at samples
+along the path. A Cartesian move's peak joint velocities are its peak linear speed times
+the largest joint change per meter between those samples. They are estimates on nominal
+geometry and leave out orientation changes of the wrist.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .estimator import MotionEstimator, peak_speed, ramp_time, trapezoid_time
+from .kinematics import ARM_MODELS, solve_position
+from .models import MotionMode, RobotType
+from .safety import JOINT_LIMITS_MAP, SafetyError, SafetyValidator, arc_points
+from .sequence import (
+    Step,
+    corner_radius,
+    entry_segments,
+    final_pose,
+    indexed_cartesian_runs,
+)
+from .simplify import DEFAULT_ORIENTATION_TOLERANCE, simplify_steps
+
+PATH_SAMPLE = 0.01  # meters between IK solutions along a Cartesian path
+MAX_PATH_SAMPLES = 50
+
+
+@dataclass
+class TimelineEntry:
+    step: int
+    mode: str
+    speed_percent: int
+    start: float
+    duration: Optional[float]  # None when the start state is unknown
+    end: float
+    blended: bool
+    exceeds_timeout: bool
+    peak_joint_velocities: Optional[list[float]]  # rad/s per joint
+    peak_linear_velocity: Optional[float]  # m/s, Cartesian moves only
+
+
+@dataclass
+class SimulationResult:
+    robot: str
+    steps: int
+    cycle_time: float
+    blend_radius: float
+    peak_joint_velocities: Optional[list[float]]
+    violations: list[dict] = field(default_factory=list)
+    timeline: list[TimelineEntry] = field(default_factory=list)
+    simplification: Optional[dict] = None
+
+    @property
+    def safe(self) -> bool:
+        return not self.violations
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["safe"] = self.safe
+        if self.simplification is None:
+            del data["simplification"]
+        return data
+
+
+def simulate_sequence(
+    robot_type: RobotType,
+    steps: list[Step],
+    safety: SafetyValidator,
+    estimator: MotionEstimator,
+    joints: list[float],
+    pose: Optional[list[float]] = None,
+    speed_percent: int = 30,
+    blend_radius: float = 0.0,
+    timeout: Optional[float] = None,
+    simplify_tolerance: float = 0.0,
+    orientation_tolerance: Optional[float] = DEFAULT_ORIENTATION_TOLERANCE,
+) -> SimulationResult:
+    """Simulate ``steps`` from ``joints`` / ``pose``; nothing is sent to an arm.
+
+    ``pose`` defaults to the flange position at ``joints`` with zero orientation.
+    Violations are ``{"step", "check", "error"}``. ``check`` is ``"move"`` for checks of
+    a single step, indexed as given, and ``"path"`` for the blended path of a P/L run or
+    the straight entry into an L step or C arc, indexed like the timeline (which is after
+    simplification).
+    """
+    model = ARM_MODELS[robot_type]
+    if pose is None:
+        pose = model.points(joints)[0, -1].tolist() + [0.0, 0.0, 0.0]
+    violations: list[dict] = []
+
+    checked: list[Step] = []
+    start = joints  # known only until a Cartesian step, as in ArmManager.move_sequence
+    for i, step in enumerate(steps):
+        step = Step(step.mode, step.target, step.mid_point, step.end_point, step.speed_percent)
+        is_joint = step.mode in (MotionMode.J, MotionMode.JS)
+        try:
+            if step.mode == MotionMode.C and (step.mid_point is None or step.end_point is None):
+                raise ValueError("Arc motion (C) requires mid_point and end_point")
+            safety.validate_move(
+                robot_type, step.mode, step.target, step.mid_point, step.end_point,
+                start if is_joint else None,
+            )
+        except (SafetyError, ValueError) as exc:
+            violations.append({"step": i, "check": "move", "error": str(exc)})
+        start = step.target if is_joint else None
+        if step.speed_percent is not None:
+            step = step._replace(speed_percent=safety.validate_speed(step.speed_percent))
+        checked.append(step)
+
+    simplification = None
+    if simplify_tolerance > 0:
+        checked, simplification = simplify_steps(
+            checked, simplify_tolerance, orientation_tolerance, pose
+        )
+    for first, run in indexed_cartesian_runs(checked, pose):
+        try:
+            safety.validate_cartesian_path(run, blend_radius, robot_type, from_start=first == 0)
+        except SafetyError as exc:
+            violations.append({"step": first, "check": "path", "error": str(exc)})
+    for i, start in entry_segments(checked, pose, lambda q: model.points(q)[0, -1]):
+        try:
+            safety.validate_move(robot_type, MotionMode.L, checked[i].target, start=start)
+        except SafetyError as exc:
+            violations.append({"step": i, "check": "path", "error": str(exc)})
+
+    arm = _SimulatedArm(robot_type, model, estimator, joints, pose, speed_percent)
+    timeline = []
+    previous: Optional[list[float]] = pose
+    for i, step in enumerate(checked):
+        radius = corner_radius(checked, i, previous, blend_radius)
+        entry = arm.run(i, step, radius)
+        entry.exceeds_timeout = (
+            timeout is not None and entry.duration is not None and entry.duration > timeout
+        )
+        timeline.append(entry)
+        previous = final_pose(step)
+
+    peaks = [e.peak_joint_velocities for e in timeline if e.peak_joint_velocities is not None]
+    return SimulationResult(
+        robot=robot_type.value,
+        steps=len(checked),
+        cycle_time=round(arm.clock, 4),
+        blend_radius=blend_radius,
+        peak_joint_velocities=[round(max(v), 4) for v in zip(*peaks)] if peaks else None,
+        violations=violations,
+        timeline=timeline,
+        simplification=simplification,
+    )
+
+
+class _SimulatedArm:
+    """Joint angles, flange pose, speed and a clock, advanced one move at a time."""
+
+    def __init__(self, robot_type: RobotType, model, estimator: MotionEstimator,
+                 joints: Optional[list[float]], pose: list[float], speed: int) -> None:
+        self._robot_type = robot_type
+        self._model = model
+        self._limits = JOINT_LIMITS_MAP[robot_type].limits
+        self._estimator = estimator
+        self._profile = estimator.profile(robot_type)
+        self.joints = joints
+        self.pose = pose
+        self.speed = speed
+        self.clock = 0.0
+
+    def run(self, index: int, step: Step, blend: float) -> TimelineEntry:
+        if step.speed_percent is not None:
+            self.speed = step.speed_percent
+        is_joint = step.mode in (MotionMode.J, MotionMode.JS)
+        estimate = self._estimator.estimate(
+            self._robot_type, step.mode, step.target, self.joints if is_joint else self.pose,
+            self.speed, step.mid_point, step.end_point,
+        )
+        duration = joint_peaks = linear_peak = travelled = None
+        if estimate is not None:
+            scale = estimate.duration / estimate.nominal
+            duration = estimate.duration
+            if is_joint:
+                joint_peaks = self._joint_peaks(step.target, scale)
+            else:
+                linear_peak, joint_peaks, travelled = self._cartesian_peaks(
+                    step, estimate.nominal - self._profile.overhead, scale
+                )
+                if blend > 0:
+                    # The next move is sent on entering the blend zone: skip the last
+                    # ``blend`` meters of deceleration and the settling overhead.
+                    cut = ramp_time(blend, *self._linear_limits()) + self._profile.overhead
+                    duration = max(duration - cut * scale, 0.0)
+
+        start = self.clock
+        self.clock += duration or 0.0
+        if is_joint:
+            self.joints = list(step.target)
+            position = self._model.points(self.joints)[0, -1].tolist()
+            self.pose = position + list(self.pose[3:6])
+        else:
+            self.pose = list(final_pose(step))
+            self.joints = travelled
+        return TimelineEntry(
+            step=index,
+            mode=step.mode.value,
+            speed_percent=self.speed,
+            start=round(start, 4),
+            duration=round(duration, 4) if duration is not None else None,
+            end=round(self.clock, 4),
+            blended=blend > 0,
+            exceeds_timeout=False,
+            peak_joint_velocities=_rounded(joint_peaks),
+            peak_linear_velocity=round(float(linear_peak), 4) if linear_peak is not None else None,
+        )
+
+    def _joint_peaks(self, target: list[float], scale: float) -> list[float]:
+        """Joints move synchronously: each peaks in proportion to its share of the move."""
+        deltas = [abs(b - a) for a, b in zip(self.joints, target)]
+        largest = max(deltas, default=0.0)
+        if largest == 0.0:
+            return [0.0] * len(deltas)
+        fraction = self.speed / 100
+        peak = peak_speed(largest, self._profile.joint_speed * fraction,
+                          self._profile.joint_accel * fraction) / scale
+        return [peak * d / largest for d in deltas]
+
+    def _linear_limits(self) -> tuple[float, float]:
+        fraction = max(self.speed, 1) / 100
+        return self._profile.linear_speed * fraction, self._profile.linear_accel * fraction
+
+    def _cartesian_peaks(self, step: Step, travel: float, scale: float):
+        """Peak linear speed, peak joint velocities and the joints at the end of the move.
+
+        L and C moves follow their path, so the joints are solved along it. P moves are
+        interpolated in joint space, so only the target is solved.
+        """
+        path = [self.pose[:3], step.target[:3]]
+        if step.mode == MotionMode.C and step.mid_point and step.end_point:
+            path += arc_points(step.target, step.mid_point, step.end_point)[1:]
+        samples, spacing = _samples(path)
+        length = spacing * (len(samples) - 1)
+        speed, accel = self._linear_limits()
+        linear = peak_speed(length, speed, accel)
+        if travel > 0 and length > 0:
+            # Moves whose orientation change takes longer than the translation slow down.
+            linear *= min(trapezoid_time(length, speed, accel) / travel, 1.0)
+        linear /= scale
+        if self.joints is None:
+            return linear, None, None
+        if length == 0.0:
+            return linear, [0.0] * len(self.joints), self.joints
+        if step.mode == MotionMode.P:
+            samples, spacing = samples[[0, -1]], length
+        solutions = [np.asarray(self.joints, dtype=float)]
+        for point in samples[1:]:
+            q = solve_position(self._model, point, solutions[-1], self._limits)
+            if q is None:
+                return linear, None, None
+            solutions.append(q)
+        per_meter = np.abs(np.diff(solutions, axis=0)).max(axis=0) / spacing
+        return linear, (per_meter * linear).tolist(), solutions[-1].tolist()
+
+
+def _samples(path: list[list[float]]) -> tuple[np.ndarray, float]:
+    """Evenly spaced points along a polyline and their spacing in meters."""
+    points = np.asarray(path, dtype=float)
+    cumulative = np.concatenate(
+        [[0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))]
+    )
+    length = cumulative[-1]
+    if length == 0.0:
+        return points[:1], 0.0
+    count = min(max(math.ceil(length / PATH_SAMPLE), 1), MAX_PATH_SAMPLES)
+    at = np.linspace(0.0, length, count + 1)
+    samples = np.column_stack([np.interp(at, cumulative, points[:, k]) for k in range(3)])
+    return samples, length / count
+
+
+def _rounded(values: Optional[list[float]]) -> Optional[list[float]]:
+    return [round(float(v), 4) for v in values] if values is not None else None
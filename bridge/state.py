@@ -0,0 +1,153 @@
+"""Compact, immutable arm state values: ``JointState`` and ``Pose``.
+
+Drivers return these from ``get_joint_angles`` and ``get_flange_pose``. Each holds its
+values in one ``array('d')`` (a single buffer of doubles, not a list of float objects) and
+never changes after it is built. A driver can therefore hand out the same object until the
+arm moves, and ``ArmManager``, the status change feed, the safety validator and the motion
+reports all pass it on without copying. ``view()`` gives NumPy the buffer in place.
+
+They are read-only sequences of floats (``collections.abc.Sequence``) that act like tuples:
+``len``, indexing, iteration, ``in``, ``index`` and ``count``. Slices are tuples, ``+``
+concatenates with lists (giving a list) and with tuples or other states (giving a tuple),
+and they compare equal to lists and tuples with the same values.
+
+Values become JSON or msgpack only where they leave the bridge. Pydantic fields typed
+``JointState`` or ``Pose`` accept lists and serialize to lists. ``codec.respond`` packs them
+straight from the buffer, and ``plain`` turns any nested in a report into lists. The
+standard ``json`` module needs the encoder hook: ``json.dumps(value, default=jsonable)``.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterable
+
+import numpy as np
+from pydantic_core import core_schema
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class _Values(Sequence):
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Iterable[float]) -> None:
+        self._values = array("d", values)
+
+    @classmethod
+    def frombytes(cls, data: bytes):
+        """Build from little-endian float64s, e.g. a packed array from the wire."""
+        values = array("d")
+        values.frombytes(data)
+        if not _LITTLE_ENDIAN:
+            values.byteswap()
+        return cls._wrap(values)
+
+    @classmethod
+    def _wrap(cls, values: array):
+        """Take ownership of ``values`` without copying; nothing else may change it."""
+        state = cls.__new__(cls)
+        state._values = values
+        return state
+
+    def tolist(self) -> list[float]:
+        return self._values.tolist()
+
+    def tobytes(self) -> bytes:
+        """Little-endian float64s (the msgpack wire format)."""
+        if _LITTLE_ENDIAN:
+            return self._values.tobytes()
+        values = array("d", self._values)
+        values.byteswap()
+        return values.tobytes()
+
+    def view(self) -> np.ndarray:
+        """Read-only NumPy array over the same buffer (no copy)."""
+        view = np.frombuffer(self._values, dtype=float)
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._values[index])
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _Values):
+            return self._values == other._values
+        if isinstance(other, (list, tuple)):
+            return self._values.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # equal to lists, which are unhashable
+
+    def __add__(self, other):
+        if isinstance(other, list):
+            return self._values.tolist() + other
+        if isinstance(other, (tuple, _Values)):
+            return (*self._values, *other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, list):
+            return other + self._values.tolist()
+        if isinstance(other, tuple):
+            return (*other, *self._values)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._values.tolist()})"
+
+    def __reduce__(self):
+        return type(self)._wrap, (self._values,)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        from_list = core_schema.no_info_after_validator_function(
+            cls, core_schema.list_schema(core_schema.float_schema())
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_list],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.tolist, when_used="json"
+            ),
+        )
+
+
+class JointState(_Values):
+    """Joint angles in radians, one per joint."""
+
+    __slots__ = ()
+
+
+class Pose(_Values):
+    """Flange pose ``[x, y, z, roll, pitch, yaw]`` in meters and radians."""
+
+    __slots__ = ()
+
+
+def plain(value: Any) -> Any:
+    """``value`` with every ``JointState`` / ``Pose`` inside dicts and lists as a list."""
+    if isinstance(value, _Values):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [plain(v) for v in value]
+    return value
+
+
+def jsonable(value: Any) -> Any:
+    """Encoder hook for ``JointState`` and ``Pose``: ``json.dumps(value, default=jsonable)``,
+    and the same for ``msgpack.packb``."""
+    if isinstance(value, _Values):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,153 @@
+"""Seqlock-protected arm state in ``multiprocessing.shared_memory``.
+
+The driver owner process is the single writer: it publishes the status dict (the same
+fields as ``GET /status``, including its change ``seq``) into a fixed-layout block. Any
+number of HTTP worker processes read it without IPC. The block starts with a lock counter
+that the writer makes odd while it is writing and even once done. Readers retry whenever
+the counter is odd or has changed across their copy, so they never see a torn update.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+from .models import RobotType
+from .state import JointState, Pose
+
+MAX_JOINTS = 8
+READ_TIMEOUT = 0.1  # give up if the writer seems stuck mid-update for this long
+
+_ROBOTS = list(RobotType)
+_SEQ = struct.Struct("<Q")
+# updated, status seq, connected, enabled, needs enable, robot index, dof, has status, status,
+# joint count, joints, has pose, pose
+_PAYLOAD = struct.Struct(f"<dQBBBbBBiB{MAX_JOINTS}dB6d")
+BLOCK_SIZE = _SEQ.size + _PAYLOAD.size
+# Readers unpack the scalars up to the joint count and take the float arrays as raw bytes
+_HEADER = struct.Struct("<dQBBBbBBiB")
+_JOINTS_AT = _HEADER.size
+_HAS_POSE_AT = _JOINTS_AT + 8 * MAX_JOINTS
+_POSE_AT = _HAS_POSE_AT + 1
+
+
+class TelemetryError(RuntimeError):
+    """Raised when a consistent snapshot could not be read."""
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without registering it with a resource tracker, which
+    would unlink it when this process (or whoever started it) exits. Only the creator owns
+    the block."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class TelemetryBlock:
+    """One shared-memory status block: create it in the parent, attach everywhere else."""
+
+    def __init__(self, name: Optional[str] = None, create: bool = False) -> None:
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=BLOCK_SIZE)
+            self._shm.buf[:BLOCK_SIZE] = bytes(BLOCK_SIZE)
+        else:
+            self._shm = _attach(name)
+        self._owner = create
+        self._buf = self._shm.buf
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def seq(self) -> int:
+        """Current lock counter; advances by 2 with every published update."""
+        return _SEQ.unpack_from(self._buf, 0)[0]
+
+    # --- Writer (one process only) ---
+
+    def publish(self, status: dict) -> int:
+        """Write ``status``; returns the new (even) sequence number."""
+        joints = status.get("joint_angles")
+        pose = status.get("flange_pose")
+        motion_status = status.get("motion_status")
+        robot = status.get("robot_type")
+        joint_values = list(joints or [])[:MAX_JOINTS]
+        payload = _PAYLOAD.pack(
+            time.time(),
+            status.get("seq", 0),
+            bool(status.get("connected")),
+            bool(status.get("enabled")),
+            bool(status.get("needs_enable")),
+            _ROBOTS.index(RobotType(robot)) if robot else -1,
+            status.get("dof") or 0,
+            motion_status is not None,
+            motion_status if motion_status is not None else 0,
+            len(joint_values) if joints is not None else 0,
+            *(joint_values + [0.0] * (MAX_JOINTS - len(joint_values))),
+            pose is not None,
+            *(list(pose)[:6] if pose is not None else [0.0] * 6),
+        )
+        seq = self.seq
+        _SEQ.pack_into(self._buf, 0, seq + 1)  # odd: write in progress
+        self._buf[_SEQ.size : BLOCK_SIZE] = payload
+        _SEQ.pack_into(self._buf, 0, seq + 2)
+        return seq + 2
+
+    # --- Readers ---
+
+    def read(self) -> tuple[int, float, dict]:
+        """Consistent ``(seq, updated, status)`` snapshot; ``updated`` is the writer's
+        ``time.time()`` when it published."""
+        buf = self._buf
+        deadline = None
+        while True:
+            before = _SEQ.unpack_from(buf, 0)[0]
+            if not before & 1:
+                raw = bytes(buf[_SEQ.size : BLOCK_SIZE])
+                if _SEQ.unpack_from(buf, 0)[0] == before:
+                    return before, *_decode(raw)
+            # The writer may have been preempted mid-update: yield instead of spinning.
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + READ_TIMEOUT
+            elif now > deadline:
+                raise TelemetryError("Telemetry block kept changing while being read")
+            time.sleep(0)
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def _decode(raw: bytes) -> tuple[float, dict]:
+    values = _HEADER.unpack_from(raw)
+    updated, status_seq, connected, enabled, needs_enable, robot, dof = values[:7]
+    has_status, motion_status, n_joints = values[7:]
+    if not connected:
+        return updated, {"connected": False, "enabled": False, "seq": status_seq}
+    return updated, {
+        "connected": True,
+        "enabled": bool(enabled),
+        "needs_enable": bool(needs_enable),
+        "robot_type": _ROBOTS[robot].value if robot >= 0 else None,
+        "dof": dof or None,
+        "joint_angles": (
+            JointState.frombytes(raw[_JOINTS_AT : _JOINTS_AT + 8 * n_joints]) if n_joints else None
+        ),
+        "flange_pose": Pose.frombytes(raw[_POSE_AT:]) if raw[_HAS_POSE_AT] else None,
+        "motion_status": motion_status if has_status else None,
+        "seq": status_seq,
+    }
@@ -0,0 +1,201 @@
+"""Feedback staleness watchdog with automatic reconnect.
+
+When the CAN link drops, the drivers keep returning the last telemetry they had (or
+None), and a move only fails once its wait times out. ``FeedbackWatchdog`` reads the
+driver's ``feedback_freshness`` every ``interval`` seconds. Once joint feedback is older
+than ``stale_after``, it marks the arm degraded. ``ArmManager`` then rejects motion
+commands straight away with ``ArmDegradedError`` (HTTP 503 with ``Retry-After``), and
+motion waits that are in flight give up.
+
+The watchdog then reconnects with exponential backoff. The first attempt runs at once, and
+the wait before each later attempt doubles from ``backoff`` up to ``max_backoff``. The arm
+has recovered once feedback is fresh again after a reconnect. Recovery time runs from
+stale detection to that point, and is reported with the other counters in ``snapshot``
+(``GET /metrics`` under ``watchdog``). The reconnected arm stays disabled until an
+operator enables it, unless ``CLAWARM_RECONNECT_ENABLE`` is set.
+
+Configured from the environment: ``CLAWARM_FEEDBACK_TIMEOUT`` (``stale_after`` in seconds,
+``0`` disables the watchdog) and ``CLAWARM_RECONNECT_MAX_BACKOFF``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from .drivers.base import Freshness
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_AFTER = 0.5
+CHECK_INTERVAL = 0.05
+INITIAL_BACKOFF = 0.1
+MAX_BACKOFF = 5.0
+RECOVERY_HISTORY = 50  # recovery times kept for the mean and max
+
+
+class ArmDegradedError(RuntimeError):
+    """Raised for motion commands while feedback is stale and the arm is reconnecting."""
+
+    def __init__(self, message: str, retry_after: float = 1.0) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FeedbackWatchdog:
+    """Watches feedback freshness on its own thread and reconnects when it goes stale.
+
+    ``read`` returns the current driver's ``Freshness`` (None when the driver cannot tell,
+    which counts as fresh). ``reconnect`` reopens the link and raises if it cannot.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], Optional[Freshness]],
+        reconnect: Callable[[], None],
+        stale_after: float = DEFAULT_STALE_AFTER,
+        interval: float = CHECK_INTERVAL,
+        backoff: float = INITIAL_BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+    ) -> None:
+        self.stale_after = stale_after
+        self.interval = interval
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._read = read
+        self._reconnect = reconnect
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._freshness: Optional[Freshness] = None
+        self._degraded_since: Optional[float] = None
+        self._next_attempt: Optional[float] = None
+        self._stale_events = 0
+        self._attempts = 0
+        self._recoveries: deque[float] = deque(maxlen=RECOVERY_HISTORY)
+        self._recovered = 0
+        self._last_error: Optional[str] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="clawarm-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching; waits for a reconnect attempt in progress to finish."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    @property
+    def degraded(self) -> bool:
+        return self._degraded_since is not None
+
+    def check(self) -> None:
+        """Raise ``ArmDegradedError`` while the arm is degraded."""
+        with self._lock:
+            since, next_attempt = self._degraded_since, self._next_attempt
+            attempts = self._attempts
+        if since is None:
+            return
+        now = time.monotonic()
+        retry_after = max(next_attempt - now, 0.0) if next_attempt is not None else self.backoff
+        raise ArmDegradedError(
+            f"Arm feedback stale for {now - since:.1f}s; reconnecting "
+            f"({attempts} attempt(s) so far)",
+            retry_after=retry_after,
+        )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            freshness, since = self._freshness, self._degraded_since
+            recoveries = list(self._recoveries)
+            return {
+                "state": "ok" if since is None else "degraded",
+                "stale_after_s": self.stale_after,
+                "feedback_age_ms": _ms(freshness.age if freshness else None),
+                "feedback_hz": freshness.hz if freshness else None,
+                "degraded_for_s": round(now - since, 3) if since is not None else None,
+                "next_attempt_in_s": (
+                    round(max(self._next_attempt - now, 0.0), 3)
+                    if self._next_attempt is not None else None
+                ),
+                "stale_events": self._stale_events,
+                "reconnect_attempts": self._attempts,
+                "recoveries": self._recovered,
+                "last_recovery_s": round(recoveries[-1], 3) if recoveries else None,
+                "mean_recovery_s": round(statistics.fmean(recoveries), 3) if recoveries else None,
+                "max_recovery_s": round(max(recoveries), 3) if recoveries else None,
+                "last_error": self._last_error,
+            }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if self._fresh():
+                continue
+            with self._lock:
+                self._degraded_since = time.monotonic()
+                self._stale_events += 1
+            age = self._freshness.age if self._freshness else math.inf
+            logger.warning("Arm feedback stale (%.2fs old); reconnecting", age)
+            self._recover()
+
+    def _fresh(self) -> bool:
+        try:
+            freshness = self._read()
+        except Exception as exc:  # e.g. a driver torn down by a failed reconnect
+            logger.debug("Feedback read failed: %s", exc)
+            freshness = Freshness(math.inf)
+        with self._lock:
+            self._freshness = freshness
+        return freshness is None or freshness.age <= self.stale_after
+
+    def _recover(self) -> None:
+        delay = self.backoff
+        while not self._stop.is_set():
+            with self._lock:
+                self._attempts += 1
+                self._next_attempt = None
+            try:
+                self._reconnect()
+                recovered = self._await_fresh()
+                error = None if recovered else "no feedback after reconnecting"
+            except Exception as exc:
+                recovered, error = False, str(exc)
+            if recovered:
+                with self._lock:
+                    elapsed = time.monotonic() - self._degraded_since
+                    self._recoveries.append(elapsed)
+                    self._recovered += 1
+                    self._degraded_since = None
+                logger.warning("Arm feedback restored after %.2fs", elapsed)
+                return
+            with self._lock:
+                self._last_error = error
+                self._next_attempt = time.monotonic() + delay
+            logger.warning("Reconnect failed (%s); next attempt in %.2fs", error, delay)
+            if self._stop.wait(delay):
+                return
+            delay = min(delay * 2, self.max_backoff)
+
+    def _await_fresh(self) -> bool:
+        """Wait up to ``stale_after`` for feedback to arrive on the new link."""
+        deadline = time.monotonic() + self.stale_after
+        while not self._fresh():
+            if time.monotonic() >= deadline or self._stop.wait(self.interval):
+                return False
+        return True
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    if seconds is None or math.isinf(seconds):
+        return None
+    return round(seconds * 1000, 1)
@@ -0,0 +1,287 @@
+"""Keep-out / keep-in volumes and the AABB bounding-volume hierarchy used to query them.
+
+Zones are convex shapes (boxes, spheres, vertical cylinders) in the arm base frame, in
+meters. ``ZoneSet`` compiles them into one AABB tree per kind so point and segment checks
+from the safety layer visit O(log n) nodes instead of every zone.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Union
+
+Vec3 = tuple[float, float, float]
+
+LEAF_SIZE = 2
+KEEP_IN_RESOLUTION = 0.005  # meters between samples when a segment spans several keep-ins
+
+
+class ZoneKind(str, Enum):
+    KEEP_OUT = "keep_out"
+    KEEP_IN = "keep_in"
+
+
+# --- Shapes ---
+
+
+def _segment_slab(a: Vec3, b: Vec3, lo: Vec3, hi: Vec3) -> Optional[tuple[float, float]]:
+    """Parameter interval [t0, t1] ⊆ [0, 1] where segment a→b lies inside the box."""
+    t0, t1 = 0.0, 1.0
+    for i in range(3):
+        d = b[i] - a[i]
+        if d == 0.0:
+            if a[i] < lo[i] or a[i] > hi[i]:
+                return None
+            continue
+        ta, tb = (lo[i] - a[i]) / d, (hi[i] - a[i]) / d
+        if ta > tb:
+            ta, tb = tb, ta
+        t0, t1 = max(t0, ta), min(t1, tb)
+        if t0 > t1:
+            return None
+    return t0, t1
+
+
+def _point_segment_distance_sq(p, a, b) -> float:
+    ab = [bi - ai for ai, bi in zip(a, b)]
+    denom = sum(c * c for c in ab)
+    t = 0.0 if denom == 0.0 else sum((pi - ai) * c for pi, ai, c in zip(p, a, ab)) / denom
+    t = min(max(t, 0.0), 1.0)
+    return sum((pi - (ai + t * c)) ** 2 for pi, ai, c in zip(p, a, ab))
+
+
+@dataclass(frozen=True)
+class Box:
+    min: Vec3
+    max: Vec3
+
+    def aabb(self) -> tuple[Vec3, Vec3]:
+        return self.min, self.max
+
+    def contains(self, p: Vec3) -> bool:
+        return all(lo <= v <= hi for v, lo, hi in zip(p, self.min, self.max))
+
+    def intersects_segment(self, a: Vec3, b: Vec3) -> bool:
+        return _segment_slab(a, b, self.min, self.max) is not None
+
+
+@dataclass(frozen=True)
+class Sphere:
+    center: Vec3
+    radius: float
+
+    def aabb(self) -> tuple[Vec3, Vec3]:
+        r = self.radius
+        return (
+            tuple(c - r for c in self.center),
+            tuple(c + r for c in self.center),
+        )
+
+    def contains(self, p: Vec3) -> bool:
+        return math.dist(p, self.center) <= self.radius
+
+    def intersects_segment(self, a: Vec3, b: Vec3) -> bool:
+        return _point_segment_distance_sq(self.center, a, b) <= self.radius**2
+
+
+@dataclass(frozen=True)
+class Cylinder:
+    """Vertical (z-axis) cylinder: circle at ``center`` (x, y) extruded over [z_min, z_max]."""
+
+    center: tuple[float, float]
+    radius: float
+    z_min: float
+    z_max: float
+
+    def aabb(self) -> tuple[Vec3, Vec3]:
+        (x, y), r = self.center, self.radius
+        return (x - r, y - r, self.z_min), (x + r, y + r, self.z_max)
+
+    def contains(self, p: Vec3) -> bool:
+        return self.z_min <= p[2] <= self.z_max and math.dist(p[:2], self.center) <= self.radius
+
+    def intersects_segment(self, a: Vec3, b: Vec3) -> bool:
+        lo, hi = self.aabb()
+        span = _segment_slab(a, b, lo, hi)  # also clips the segment to [z_min, z_max]
+        if span is None:
+            return False
+        t0, t1 = span
+        pa = [a[i] + t0 * (b[i] - a[i]) for i in range(2)]
+        pb = [a[i] + t1 * (b[i] - a[i]) for i in range(2)]
+        return _point_segment_distance_sq(self.center, pa, pb) <= self.radius**2
+
+
+Shape = Union[Box, Sphere, Cylinder]
+
+
+@dataclass(frozen=True)
+class Zone:
+    name: str
+    shape: Shape
+    kind: ZoneKind = ZoneKind.KEEP_OUT
+
+
+# --- Bounding-volume hierarchy ---
+
+
+def _union(boxes: list[tuple[Vec3, Vec3]]) -> tuple[Vec3, Vec3]:
+    return (
+        tuple(min(b[0][i] for b in boxes) for i in range(3)),
+        tuple(max(b[1][i] for b in boxes) for i in range(3)),
+    )
+
+
+class _Node:
+    __slots__ = ("lo", "hi", "left", "right", "zones")
+
+    def __init__(self, lo, hi, left=None, right=None, zones=()) -> None:
+        self.lo, self.hi = lo, hi
+        self.left, self.right = left, right
+        self.zones = zones
+
+
+class ZoneTree:
+    """AABB tree over zones, built top-down by splitting at the median centroid along the
+    longest axis."""
+
+    def __init__(self, zones: list[Zone]) -> None:
+        self.zones = list(zones)
+        entries = [(z, z.shape.aabb()) for z in self.zones]
+        self._root = self._build(entries) if entries else None
+
+    def _build(self, entries) -> _Node:
+        lo, hi = _union([box for _, box in entries])
+        if len(entries) <= LEAF_SIZE:
+            return _Node(lo, hi, zones=tuple(z for z, _ in entries))
+        centroids = [[(b[0][i] + b[1][i]) / 2 for i in range(3)] for _, b in entries]
+        spans = [max(c[i] for c in centroids) - min(c[i] for c in centroids) for i in range(3)]
+        axis = spans.index(max(spans))
+        order = sorted(range(len(entries)), key=lambda k: centroids[k][axis])
+        mid = len(order) // 2
+        return _Node(
+            lo,
+            hi,
+            left=self._build([entries[k] for k in order[:mid]]),
+            right=self._build([entries[k] for k in order[mid:]]),
+        )
+
+    def _walk(self, box_test, zone_test) -> list[Zone]:
+        hits: list[Zone] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if not box_test(node.lo, node.hi):
+                continue
+            if node.left is None:
+                hits.extend(z for z in node.zones if zone_test(z.shape))
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+        return hits
+
+    def query_point(self, p: Vec3) -> list[Zone]:
+        """Zones containing ``p``."""
+        return self._walk(
+            lambda lo, hi: all(lo[i] <= p[i] <= hi[i] for i in range(3)),
+            lambda shape: shape.contains(p),
+        )
+
+    def query_segment(self, a: Vec3, b: Vec3) -> list[Zone]:
+        """Zones intersecting the segment a→b."""
+        return self._walk(
+            lambda lo, hi: _segment_slab(a, b, lo, hi) is not None,
+            lambda shape: shape.intersects_segment(a, b),
+        )
+
+
+class ZoneSet:
+    """Compiled keep-out and keep-in volumes with violation queries for the safety layer."""
+
+    def __init__(self, zones: list[Zone]) -> None:
+        self.keep_out = ZoneTree([z for z in zones if z.kind == ZoneKind.KEEP_OUT])
+        self.keep_in = ZoneTree([z for z in zones if z.kind == ZoneKind.KEEP_IN])
+
+    def __bool__(self) -> bool:
+        return bool(self.keep_out.zones or self.keep_in.zones)
+
+    def point_violation(self, p: Vec3) -> Optional[str]:
+        """Describe why ``p`` is not allowed, or None if it is."""
+        hits = self.keep_out.query_point(p)
+        if hits:
+            return f"inside keep-out zone '{hits[0].name}'"
+        if self.keep_in.zones and not self.keep_in.query_point(p):
+            return "outside every keep-in zone"
+        return None
+
+    def segment_violation(self, a: Vec3, b: Vec3, leaving: bool = False) -> Optional[str]:
+        """Describe why the straight segment a→b is not allowed, or None if it is.
+
+        With ``leaving``, ``a`` is where the arm is now and may already be inside a keep-out
+        zone or outside every keep-in zone: the segment may leave that keep-out zone (zones
+        are convex, so it cannot come back) and may reach a keep-in zone, but not go the
+        other way.
+        """
+        hits = self.keep_out.query_segment(a, b)
+        if leaving and hits:
+            inside = {id(z) for z in self.keep_out.query_point(a)}
+            hits = [z for z in hits if id(z) not in inside]
+        if hits:
+            return f"crosses keep-out zone '{hits[0].name}'"
+        if not self.keep_in.zones:
+            return None
+        # Zones are convex: a segment whose endpoints share a keep-in zone stays inside it.
+        if {id(z) for z in self.keep_in.query_point(a)} & {
+            id(z) for z in self.keep_in.query_point(b)
+        }:
+            return None
+        entered = not leaving
+        steps = max(1, math.ceil(math.dist(a, b) / KEEP_IN_RESOLUTION))
+        for k in range(steps + 1):
+            t = k / steps
+            p = tuple(a[i] + t * (b[i] - a[i]) for i in range(3))
+            if self.keep_in.query_point(p):
+                entered = True
+            elif entered:
+                return "leaves every keep-in zone"
+        return None
+
+
+# --- Loading ---
+
+
+def zone_from_dict(data: dict) -> Zone:
+    """Build a zone from ``{"name", "kind", "box"|"sphere"|"cylinder": {...}}``."""
+    kind = ZoneKind(data.get("kind", ZoneKind.KEEP_OUT.value))
+    name = data.get("name", "zone")
+    if "box" in data:
+        shape = Box(min=tuple(data["box"]["min"]), max=tuple(data["box"]["max"]))
+    elif "sphere" in data:
+        shape = Sphere(center=tuple(data["sphere"]["center"]), radius=data["sphere"]["radius"])
+    elif "cylinder" in data:
+        c = data["cylinder"]
+        shape = Cylinder(
+            center=tuple(c["center"]), radius=c["radius"], z_min=c["z_min"], z_max=c["z_max"]
+        )
+    else:
+        raise ValueError(f"Zone '{name}' needs one of 'box', 'sphere' or 'cylinder'")
+    return Zone(name=name, shape=shape, kind=kind)
+
+
+def load_zones(path: str | Path) -> list[Zone]:
+    """Load zones from a JSON file: ``{"zones": [...]}`` or a bare list.
+
+    Names must be unique, since violations name the zone they hit.
+    """
+    data = json.loads(Path(path).read_text())
+    entries = data["zones"] if isinstance(data, dict) else data
+    zones = [zone_from_dict(entry) for entry in entries]
+    seen: set[str] = set()
+    for zone in zones:
+        if zone.name in seen:
+            raise ValueError(f"Duplicate zone name '{zone.name}'")
+        seen.add(zone.name)
+    return zones
@@ -0,0 +1 @@
+"""ClawArm helpers for standalone arm scripts (see ``clawarm.runtime``)."""
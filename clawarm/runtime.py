@@ -0,0 +1,132 @@
+"""Connect, enable, move and wait helpers for scripts that drive an arm directly.
+
+Scripts generated by the ``agx-arm-codegen`` skill used to paste a ``wait_motion_done``
+that sleeps 0.5 s and then polls every 100 ms, and sleep 1 s on each side of the mode
+switch. Every move paid for that dead time whether it took 50 ms or 5 s. This module runs
+the same steps through the bridge's ``ArmManager``:
+
+- connecting switches mode as soon as the arm reports status instead of after a fixed
+  1 s, keeps the 1 s settle after the switch, and enables as soon as the arm accepts
+  (``ArmManager.connect(adaptive=True)``);
+- each move predicts its duration, sleeps through most of it, then polls every 10 ms,
+  with a deadline derived from the prediction instead of a fixed timeout;
+- each move goes through ``SafetyValidator`` first (joint limits, self-collision,
+  workspace, and any ``CLAWARM_ZONES`` / ``CLAWARM_REACHABILITY``). A rejected move raises
+  ``SafetyError`` before anything is sent.
+
+::
+
+    from clawarm import runtime
+
+    with runtime.connect("nero", channel="can0", speed=30) as arm:
+        arm.move_j([0.3, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        arm.move_p([0.3, 0.0, 0.3, 0.0, 3.1416, 0.0])
+
+The driver is chosen like the bridge's: pyAgxArm by default, the in-memory mock with
+``CLAWARM_MOCK=true``.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from bridge.arm_manager import ArmManager, manager_from_env
+from bridge.models import MotionMode, RobotType
+from bridge.safety import SafetyError
+from bridge.state import plain
+
+__all__ = ["Arm", "SafetyError", "connect"]
+
+DEFAULT_SPEED = 30  # percent; start low on a new setup
+
+
+def connect(
+    robot: str = "nero",
+    channel: str = "can0",
+    interface: str = "socketcan",
+    speed: int = DEFAULT_SPEED,
+) -> "Arm":
+    """Connect to the arm, switch to normal mode, enable it and set ``speed`` percent."""
+    manager = manager_from_env()
+    manager.connect(RobotType(robot), channel, interface, adaptive=True)
+    manager.set_speed(speed)
+    return Arm(manager)
+
+
+class Arm:
+    """A connected, enabled arm. Moves block until the arm reports it is done.
+
+    Move methods return True when the motion finished and False when it timed out.
+    ``timeout=None`` means a margin over the predicted duration.
+    """
+
+    def __init__(self, manager: ArmManager) -> None:
+        self._manager = manager
+
+    @property
+    def robot(self) -> str:
+        return self._manager.robot_type.value
+
+    @property
+    def dof(self) -> int:
+        return self._manager.dof
+
+    def move_j(self, joints, speed: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """Joint-space move; ``joints`` in radians, one per joint."""
+        return self._move(MotionMode.J, joints, speed=speed, timeout=timeout)
+
+    def move_js(self, joints, speed: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """Joint move without smoothing. Use with caution."""
+        return self._move(MotionMode.JS, joints, speed=speed, timeout=timeout)
+
+    def move_p(self, pose, speed: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """Point-to-point Cartesian move to ``[x, y, z, roll, pitch, yaw]`` (m, rad)."""
+        return self._move(MotionMode.P, pose, speed=speed, timeout=timeout)
+
+    def move_l(self, pose, speed: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """Straight-line Cartesian move."""
+        return self._move(MotionMode.L, pose, speed=speed, timeout=timeout)
+
+    def move_c(
+        self, start, mid, end, speed: Optional[int] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """Circular arc from ``start`` through ``mid`` to ``end``."""
+        return self._move(MotionMode.C, start, mid, end, speed=speed, timeout=timeout)
+
+    def _move(self, mode: MotionMode, target, mid=None, end=None, *, speed, timeout) -> bool:
+        return bool(self._send(mode, target, mid, end, speed, timeout)["completed"])
+
+    def _send(self, mode: MotionMode, target, mid, end, speed, timeout) -> dict:
+        """Run one move and return its motion report."""
+        return self._manager.move(
+            mode,
+            list(target),
+            list(mid) if mid is not None else None,
+            list(end) if end is not None else None,
+            speed_percent=speed,
+            timeout=timeout,
+        )
+
+    def set_speed(self, speed: int) -> int:
+        """Default speed for later moves (capped by the safety limit); returns the value set."""
+        return self._manager.set_speed(speed)
+
+    def joint_angles(self) -> Optional[list[float]]:
+        return plain(self._manager.get_status()["joint_angles"])
+
+    def flange_pose(self) -> Optional[list[float]]:
+        return plain(self._manager.get_status()["flange_pose"])
+
+    def emergency_stop(self) -> None:
+        """Cut power to the motors. Reconnect to recover."""
+        self._manager.stop(emergency=True)
+
+    def close(self) -> None:
+        """Disable the arm and disconnect."""
+        self._manager.disconnect()
+
+    def __enter__(self) -> "Arm":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
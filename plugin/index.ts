@@ -1,6 +1,9 @@
 import { BridgeClient } from "./src/bridge-client.js";
+import { registerArmBatch } from "./src/tools/arm-batch.js";
 import { registerArmConnect } from "./src/tools/arm-connect.js";
 import { registerArmMove } from "./src/tools/arm-move.js";
+import { registerArmScript } from "./src/tools/arm-script.js";
+import { registerArmShapes } from "./src/tools/arm-shapes.js";
 import { registerArmStatus } from "./src/tools/arm-status.js";
 import { registerArmStop } from "./src/tools/arm-stop.js";
 
@@ -18,5 +21,8 @@ export default {
     registerArmStatus(api, client);
     registerArmMove(api, client);
     registerArmStop(api, client);
+    registerArmBatch(api, client);
+    registerArmShapes(api, client);
+    registerArmScript(api, client);
   },
 };
@@ -18,6 +18,12 @@ export interface BridgeStatus {
   motion_status: number | null;
 }
 
+export interface ScriptEvent {
+  event: "start" | "output" | "move" | "end";
+  t: number;
+  [key: string]: unknown;
+}
+
 export class BridgeClient {
   private baseUrl: string;
 
@@ -30,6 +36,11 @@ export class BridgeClient {
     path: string,
     body?: unknown
   ): Promise<T> {
+    const resp = await this.send(method, path, body);
+    return resp.json() as Promise<T>;
+  }
+
+  private async send(method: string, path: string, body?: unknown): Promise<Response> {
     const url = `${this.baseUrl}${path}`;
     const opts: RequestInit = {
       method,
@@ -49,7 +60,7 @@ export class BridgeClient {
       } catch {}
       throw new Error(`Bridge ${method} ${path} failed (${resp.status}): ${detail}`);
     }
-    return resp.json() as Promise<T>;
+    return resp;
   }
 
   async connect(
@@ -76,10 +87,35 @@ export class BridgeClient {
     speed_percent?: number;
     wait?: boolean;
     timeout?: number;
+    relative?: boolean;
+    frame?: "base" | "tool";
   }): Promise<BridgeResult> {
     return this.request("POST", "/move", params);
   }
 
+  async batch(ops: Record<string, unknown>[]): Promise<BridgeResult> {
+    return this.request("POST", "/batch", { ops });
+  }
+
+  async shapes(params: {
+    shapes: Record<string, unknown>[];
+    plane?: { origin?: number[]; rotation?: number[] };
+    orientation?: number[];
+    tolerance?: number;
+    speed_percent?: number;
+  }): Promise<BridgeResult> {
+    return this.request("POST", "/shapes", params);
+  }
+
+  async runScript(source: string, timeout?: number): Promise<ScriptEvent[]> {
+    const resp = await this.send("POST", "/scripts/run", { source, timeout });
+    const text = await resp.text();
+    return text
+      .split("\n")
+      .filter((line) => line.trim())
+      .map((line) => JSON.parse(line) as ScriptEvent);
+  }
+
   async enable(): Promise<BridgeResult> {
     return this.request("POST", "/enable");
   }
@@ -0,0 +1,53 @@
+import { BridgeClient } from "../bridge-client.js";
+
+export function registerArmBatch(api: any, client: BridgeClient) {
+  api.registerTool({
+    name: "arm_batch",
+    description:
+      "Run several arm operations in order in one call: status, speed, move, wait, stop. " +
+      "Stops at the first failing operation and returns each operation's result and timing. " +
+      "Use it for multi-step intents (e.g. status, move, status) instead of separate calls.",
+    parameters: {
+      type: "object",
+      required: ["ops"],
+      properties: {
+        ops: {
+          type: "array",
+          minItems: 1,
+          maxItems: 64,
+          description:
+            'Operations, each with an "op" field. {"op":"status"}; ' +
+            '{"op":"speed","speed_percent":N}; {"op":"move", plus the arm_move parameters}; ' +
+            '{"op":"wait","motion_id"?:N,"timeout"?:s} waits for a wait=false move ' +
+            "(default: the batch's latest move); " +
+            '{"op":"stop","action"?:"disable"|"emergency_stop"}.',
+          items: {
+            type: "object",
+            required: ["op"],
+            properties: {
+              op: { type: "string", enum: ["status", "speed", "move", "wait", "stop"] },
+            },
+          },
+        },
+      },
+    },
+    async execute(params: { ops: Record<string, unknown>[] }) {
+      try {
+        const result = await client.batch(params.ops);
+        return {
+          content: [{ type: "text", text: JSON.stringify(result) }],
+        };
+      } catch (err: any) {
+        return {
+          content: [
+            {
+              type: "text",
+              text: JSON.stringify({ error: err.message }),
+              advice: "Check the operation list, bridge server and arm connection",
+            },
+          ],
+        };
+      }
+    },
+  });
+}
@@ -48,6 +48,19 @@ export function registerArmMove(api: any, client: BridgeClient) {
           description: "Wait for motion to complete (default true)",
           default: true,
         },
+        relative: {
+          type: "boolean",
+          description:
+            "Treat target (and arc points) as offsets from the current joints or pose, " +
+            "e.g. [0, 0, 0.01, 0, 0, 0] to jog 1 cm up. The response reports the final state.",
+          default: false,
+        },
+        frame: {
+          type: "string",
+          enum: ["base", "tool"],
+          description:
+            "Frame of relative Cartesian offsets: base axes or the tool's own axes (default base)",
+        },
       },
     },
     async execute(params: {
@@ -57,6 +70,8 @@ export function registerArmMove(api: any, client: BridgeClient) {
       end_point?: number[];
       speed_percent?: number;
       wait?: boolean;
+      relative?: boolean;
+      frame?: "base" | "tool";
     }) {
       try {
         const result = await client.move({
@@ -66,6 +81,8 @@ export function registerArmMove(api: any, client: BridgeClient) {
           end_point: params.end_point,
           speed_percent: params.speed_percent,
           wait: params.wait ?? true,
+          relative: params.relative,
+          frame: params.frame,
         });
         return {
           content: [{ type: "text", text: JSON.stringify(result) }],
@@ -0,0 +1,62 @@
+import { BridgeClient } from "../bridge-client.js";
+
+export function registerArmScript(api: any, client: BridgeClient) {
+  api.registerTool({
+    name: "arm_script",
+    description:
+      "Run a Python motion script (agx-arm-codegen style, using clawarm.runtime) inside the " +
+      "bridge against the already-connected arm. runtime.connect() returns the live arm, so " +
+      "there is no connection setup; every move is safety-checked. Returns the script's " +
+      "printed output, each move's result and timing, and the final outcome.",
+    parameters: {
+      type: "object",
+      required: ["source"],
+      properties: {
+        source: {
+          type: "string",
+          description:
+            "Script source. Imports are limited to math, time and clawarm.runtime; " +
+            "names starting with _ and open/eval/exec are not available.",
+        },
+        timeout: {
+          type: "number",
+          minimum: 0,
+          maximum: 600,
+          description: "Abort the script after this many seconds (default 60)",
+        },
+      },
+    },
+    async execute(params: { source: string; timeout?: number }) {
+      try {
+        const events = await client.runScript(params.source, params.timeout);
+        const end = events.find((e) => e.event === "end");
+        return {
+          content: [
+            {
+              type: "text",
+              text: JSON.stringify({
+                ok: end?.ok ?? false,
+                error: end?.error ?? null,
+                elapsed: end?.elapsed,
+                output: events.filter((e) => e.event === "output").map((e) => e.text),
+                moves: events.filter((e) => e.event === "move").map((e) => e.motion),
+              }),
+            },
+          ],
+        };
+      } catch (err: any) {
+        return {
+          content: [
+            {
+              type: "text",
+              text: JSON.stringify({ error: err.message }),
+              advice: err.message.includes("rejected")
+                ? "Remove the disallowed import or name and use clawarm.runtime for arm access."
+                : "Check the bridge server and arm connection (POST /connect first)",
+            },
+          ],
+        };
+      }
+    },
+  });
+}
@@ -0,0 +1,86 @@
+import { BridgeClient } from "../bridge-client.js";
+
+export function registerArmShapes(api: any, client: BridgeClient) {
+  api.registerTool({
+    name: "arm_shapes",
+    description:
+      "Draw shapes with the tool in one call: circle, arc, spiral, raster fill, polyline. " +
+      "Coordinates are meters in a plane (default: the base x-y plane at the plane origin). " +
+      "The bridge compiles them to arc and line moves, safety-checks all of them, then runs them.",
+    parameters: {
+      type: "object",
+      required: ["shapes"],
+      properties: {
+        shapes: {
+          type: "array",
+          minItems: 1,
+          maxItems: 32,
+          description:
+            'Shapes, each with a "kind". ' +
+            '{"kind":"circle","center":[u,v],"radius":r,"start_angle"?:rad,"clockwise"?:bool}; ' +
+            '{"kind":"arc","center":[u,v],"radius":r,"start_angle"?:rad,"sweep":rad}; ' +
+            '{"kind":"spiral","center":[u,v],"start_radius":r0,"end_radius":r1,"turns":n}; ' +
+            '{"kind":"raster","corner":[u,v],"width":w,"height":h,"spacing":s,"angle"?:rad}; ' +
+            '{"kind":"polyline","points":[[u,v],...],"corner_radius"?:r,"closed"?:bool}.',
+          items: {
+            type: "object",
+            required: ["kind"],
+            properties: {
+              kind: { type: "string", enum: ["circle", "arc", "spiral", "raster", "polyline"] },
+            },
+          },
+        },
+        plane: {
+          type: "object",
+          description: "Drawing plane: origin [x,y,z] in meters and rotation [roll,pitch,yaw]",
+          properties: {
+            origin: { type: "array", items: { type: "number" } },
+            rotation: { type: "array", items: { type: "number" } },
+          },
+        },
+        orientation: {
+          type: "array",
+          items: { type: "number" },
+          description: "Tool [roll,pitch,yaw] while drawing (default: pointing into the plane)",
+        },
+        tolerance: {
+          type: "number",
+          description: "Max deviation of the fitted arcs in meters (default 0.0005)",
+        },
+        speed_percent: {
+          type: "integer",
+          minimum: 1,
+          maximum: 100,
+          description: "Speed override (1-100%). Safety layer may cap this.",
+        },
+      },
+    },
+    async execute(params: {
+      shapes: Record<string, unknown>[];
+      plane?: { origin?: number[]; rotation?: number[] };
+      orientation?: number[];
+      tolerance?: number;
+      speed_percent?: number;
+    }) {
+      try {
+        const result = await client.shapes(params);
+        return {
+          content: [{ type: "text", text: JSON.stringify(result) }],
+        };
+      } catch (err: any) {
+        return {
+          content: [
+            {
+              type: "text",
+              text: JSON.stringify({ error: err.message }),
+              advice:
+                err.message.includes("Safety")
+                  ? "Part of a shape is outside the safe workspace. Move or shrink it."
+                  : "Check the shape parameters, bridge server and arm connection",
+            },
+          ],
+        };
+      }
+    },
+  });
+}
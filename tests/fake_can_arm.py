@@ -0,0 +1,124 @@
+"""Scripted fake arm that answers ``CanBusDriver`` commands on a python-can virtual bus."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import can
+
+from bridge.drivers import can_protocol as proto
+
+
+class FakeCanArm:
+    """Simulates the arm's side of the CAN protocol.
+
+    Joint and pose commands start a linear motion lasting ``motion_time`` seconds; feedback
+    frames (status, pose, joints, motor info) are broadcast every ``period`` seconds.
+    Motors report enabled after ``enable_after`` enable requests.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        dof: int = 6,
+        motion_time: float = 0.05,
+        period: float = 0.005,
+        enable_after: int = 2,
+    ) -> None:
+        self.dof = dof
+        self.motion_time = motion_time
+        self.period = period
+        self.enable_after = enable_after
+        self.enable_requests = 0
+        self.enabled = False
+        self.estopped = False
+        self.move_mode = None
+        self.speed_percent = None
+        self.commands: list[int] = []
+        self.joints = [0.0] * dof
+        self.pose = [0.3, 0.0, 0.3, 0.0, 3.14159, 0.0]
+        self._motion = None  # (start_time, "joints"|"pose", from, to)
+        self._pending_joints = [0] * (dof + dof % 2)
+        self._pending_pose = [0.0] * 6
+        self._lock = threading.Lock()
+        self._running = True
+        self._bus = can.Bus(interface="virtual", channel=channel)
+        self._notifier = can.Notifier(self._bus, [self._on_command], timeout=0.05)
+        self._thread = threading.Thread(target=self._publish_loop, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._running = False
+        self._thread.join()
+        self._notifier.stop()
+        self._bus.shutdown()
+
+    # --- Command handling ---
+
+    def _on_command(self, msg: can.Message) -> None:
+        fid, data = msg.arbitration_id, bytes(msg.data)
+        with self._lock:
+            self.commands.append(fid)
+            if fid == proto.ID_MOTOR_ENABLE:
+                self.enable_requests += data[1] == proto.MOTOR_ENABLE
+                if data[1] == proto.MOTOR_DISABLE:
+                    self.enabled = False
+                elif self.enable_requests >= self.enable_after and not self.estopped:
+                    self.enabled = True
+            elif fid == proto.ID_MOTION_CTRL:
+                self.move_mode, self.speed_percent = data[1], data[2]
+            elif fid == proto.ID_EMERGENCY_STOP:
+                self.estopped = data[0] == proto.ESTOP
+                if self.estopped:
+                    self.enabled = False
+                    self._motion = None
+            elif fid in proto.ID_JOINT_CMD:
+                index = proto.ID_JOINT_CMD.index(fid) * 2
+                self._pending_joints[index : index + 2] = proto.unpack_pair(data)
+                if index + 2 >= self.dof:
+                    target = [proto.mdeg_to_rad(v) for v in self._pending_joints[: self.dof]]
+                    self._start("joints", self.joints, target)
+            elif fid in proto.ID_POSE_CMD:
+                index = proto.ID_POSE_CMD.index(fid)
+                self._pending_pose[index * 2 : index * 2 + 2] = proto.decode_pose_pair(index, data)
+                if index == 2 and self.move_mode != proto.MOVE_MODE["C"]:
+                    self._start("pose", self.pose, list(self._pending_pose))
+            elif fid == proto.ID_ARC_POINT and data[0] == proto.ARC_END:
+                self._start("pose", self.pose, list(self._pending_pose))
+
+    def _start(self, kind: str, start: list[float], target: list[float]) -> None:
+        if self.enabled:
+            self._motion = (time.monotonic(), kind, list(start), target)
+
+    # --- Feedback ---
+
+    def _advance(self) -> int:
+        if self._motion is None:
+            return 0
+        started, kind, start, target = self._motion
+        frac = min((time.monotonic() - started) / self.motion_time, 1.0)
+        current = [a + (b - a) * frac for a, b in zip(start, target)]
+        if kind == "joints":
+            self.joints = current
+        else:
+            self.pose = current
+        if frac >= 1.0:
+            self._motion = None
+            return 0
+        return 1
+
+    def _publish_loop(self) -> None:
+        while self._running:
+            with self._lock:
+                status = self._advance()
+                frames = [(proto.ID_ARM_STATUS, proto.arm_status(status))]
+                frames += proto.pose_frames(self.pose, proto.ID_POSE_FEEDBACK)
+                frames += proto.joint_frames(self.joints, proto.ID_JOINT_FEEDBACK)
+                frames += [
+                    (proto.ID_MOTOR_INFO_BASE + i, proto.motor_info(self.enabled))
+                    for i in range(self.dof)
+                ]
+            for fid, data in frames:
+                self._bus.send(can.Message(arbitration_id=fid, data=data, is_extended_id=False))
+            time.sleep(self.period)
@@ -0,0 +1,130 @@
+"""Tests for admission control: rate limits and the motion queue (bridge.admission)."""
+
+import asyncio
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.admission import Admission, Cancelled, MotionQueue, Throttled
+from bridge.drivers.mock_driver import MockArmDriver
+from bridge.server import app
+
+MOVE = {"mode": "J", "target": [0.1] + [0.0] * 5, "wait": False}
+
+
+def test_rate_limits_per_client_and_per_arm():
+    admission = Admission(client_rate=10, client_burst=2, arm_rate=1, arm_burst=3)
+    admission.check("a")
+    admission.check("a")
+    with pytest.raises(Throttled, match="client 'a'") as exc:
+        admission.check("a")
+    assert 0 < exc.value.retry_after <= 0.1
+
+    admission.check("b")  # a's empty bucket does not limit b; b takes the arm's last token
+    with pytest.raises(Throttled, match="the arm") as exc:
+        admission.check("c")
+    assert 0.5 < exc.value.retry_after <= 1.0
+    assert admission.snapshot()["throttled"] == {"client": 1, "arm": 1}
+    assert admission.snapshot()["clients"] == 3
+
+    Admission(client_rate=0, arm_rate=0).check("a")  # 0 disables the limits
+
+
+async def test_queue_reject_policy_and_stop():
+    queue = MotionQueue(depth=1)
+    await queue.acquire()
+    waiting = asyncio.ensure_future(queue.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(Throttled, match="queue full"):
+        await queue.acquire()
+    assert queue.clear("stopped") == 1
+    with pytest.raises(Cancelled, match="stopped"):
+        await waiting
+    queue.release()
+
+    snap = queue.snapshot()
+    assert snap["busy"] is False and snap["depth"] == 0 and snap["max_depth"] == 1
+    assert (snap["admitted"], snap["rejected"], snap["cancelled"]) == (1, 1, 1)
+
+
+async def test_queue_drop_oldest_policy_runs_in_order():
+    queue = MotionQueue(depth=2, policy="drop_oldest")
+    order = []
+
+    async def command(name):
+        await queue.acquire()
+        order.append(name)
+        await asyncio.sleep(0.01)
+        queue.release()
+
+    first = asyncio.ensure_future(command("first"))
+    await asyncio.sleep(0)
+    waiting = [asyncio.ensure_future(command(name)) for name in ("a", "b", "c")]
+    await asyncio.gather(first, *waiting, return_exceptions=True)
+    with pytest.raises(Throttled, match="Dropped"):
+        waiting[0].result()
+    assert order == ["first", "b", "c"]
+
+    snap = queue.snapshot()
+    assert snap["dropped"] == 1 and snap["admitted"] == 3
+    assert snap["wait_max_ms"] >= 10 and snap["wait_p95_ms"] <= snap["wait_max_ms"]
+    with pytest.raises(ValueError, match="policy"):
+        MotionQueue(policy="lifo")
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setenv("CLAWARM_CLIENT_RATE", "1")
+    monkeypatch.setenv("CLAWARM_CLIENT_BURST", "3")
+    monkeypatch.setenv("CLAWARM_QUEUE_DEPTH", "1")
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(arm_manager, "_create_driver", lambda: MockArmDriver(realtime=True))
+    _srv._manager = None
+    _srv._admission = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+        await c.post("/disconnect")
+    _srv._manager = None
+    _srv._admission = None
+
+
+async def test_flood_is_throttled_but_stop_is_not(client: AsyncClient):
+    codes = [(await client.post("/move", json=MOVE)).status_code for _ in range(5)]
+    assert codes == [200, 200, 200, 429, 429]
+    resp = await client.post("/move", json=MOVE)
+    assert resp.headers["Retry-After"] == "1" and "Rate limit" in resp.json()["detail"]
+
+    other = {"X-Client-ID": "agent-2"}
+    assert (await client.post("/move", json=MOVE, headers=other)).status_code == 200
+    for _ in range(5):
+        assert (await client.post("/stop", json={"action": "emergency_stop"})).status_code == 200
+
+    admission = (await client.get("/metrics")).json()["admission"]
+    assert admission["throttled"]["client"] == 3 and admission["clients"] == 2
+    assert admission["queue"]["admitted"] == 4
+
+
+async def test_queued_moves_wait_and_are_cancelled_by_stop(client: AsyncClient):
+    await client.post("/enable")
+    slow = {"mode": "J", "target": [0.6] + [0.0] * 5, "speed_percent": 10, "timeout": 10}
+    running = asyncio.ensure_future(client.post("/move", json=slow))
+    await asyncio.sleep(0.1)
+    queued = asyncio.ensure_future(client.post("/move", json=MOVE))
+    await asyncio.sleep(0.05)
+    resp = await client.post("/move", json=MOVE)
+    assert resp.status_code == 429 and "queue full" in resp.json()["detail"]
+
+    assert (await client.post("/stop", json={"action": "emergency_stop"})).status_code == 200
+    resp = await queued
+    assert resp.status_code == 409 and "stop" in resp.json()["detail"]
+    assert (await running).status_code == 200
+
+    queue = (await client.get("/metrics")).json()["admission"]["queue"]
+    assert queue["depth"] == 0 and queue["busy"] is False
+    assert (queue["rejected"], queue["cancelled"]) == (1, 1)
@@ -0,0 +1,128 @@
+"""Tests for the async driver protocol, the thread adapter and the native async mock."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bridge.drivers.async_adapter import ThreadedDriverAdapter, as_async_driver
+from bridge.drivers.base import AsyncArmDriver
+from bridge.drivers.mock_driver import AsyncMockArmDriver, MockArmDriver
+
+
+class RecordingDriver(MockArmDriver):
+    """Mock driver that records which thread executed each call, and in what order."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, str]] = []
+
+    def set_speed_percent(self, pct: int) -> None:
+        time.sleep(0.02 if pct == 1 else 0.0)  # the first call is the slowest
+        self.calls.append((f"speed={pct}", threading.current_thread().name))
+        super().set_speed_percent(pct)
+
+
+@pytest.fixture
+def recording():
+    d = RecordingDriver()
+    d.connect("piper", "can0", "socketcan")
+    return d
+
+
+def test_as_async_driver_prefers_native_mock():
+    assert isinstance(as_async_driver(MockArmDriver()), AsyncMockArmDriver)
+    assert isinstance(as_async_driver(RecordingDriver()), AsyncMockArmDriver)
+
+
+def test_implementations_satisfy_protocol(recording: RecordingDriver):
+    assert isinstance(AsyncMockArmDriver(), AsyncArmDriver)
+    adapter = ThreadedDriverAdapter(recording)
+    assert isinstance(adapter, AsyncArmDriver)
+    adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_adapter_preserves_call_order(recording: RecordingDriver):
+    adapter = ThreadedDriverAdapter(recording)
+    await asyncio.gather(*(adapter.set_speed_percent(pct) for pct in range(1, 11)))
+    assert [c[0] for c in recording.calls] == [f"speed={p}" for p in range(1, 11)]
+    assert len({c[1] for c in recording.calls}) == 1
+    assert recording.calls[0][1].startswith("clawarm-arm")
+    adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_calls_from_other_threads_do_not_overlap(recording: RecordingDriver):
+    adapter = ThreadedDriverAdapter(recording)
+    inside, overlaps = [], []
+    original = recording.get_motion_status
+
+    def get_motion_status():
+        overlaps.append(len(inside))
+        inside.append(1)
+        time.sleep(0.002)
+        inside.pop()
+        return original()
+
+    recording.get_motion_status = get_motion_status
+
+    def poll():
+        for _ in range(20):
+            adapter.sync.get_motion_status()
+
+    threads = [threading.Thread(target=poll) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for _ in range(20):
+        await adapter.get_motion_status()
+    for thread in threads:
+        thread.join()
+    assert len(overlaps) == 80 and max(overlaps) == 0
+    assert adapter.sync.is_connected and adapter.sync.dof == 6
+    adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_adapter_does_not_block_loop(recording: RecordingDriver):
+    adapter = ThreadedDriverAdapter(recording)
+    await adapter.enable()
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await adapter.move_j([0.1] * 6)  # the mock blocks its thread for ~125 ms
+    task.cancel()
+    assert ticks >= 5
+    assert await adapter.get_joint_angles() == pytest.approx([0.1] * 6)
+    adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_async_mock_moves_and_shares_state():
+    driver = AsyncMockArmDriver()
+    await driver.connect("nero", "can0", "socketcan")
+    assert await driver.enable()
+    await driver.move_p([0.3, 0.0, 0.3, 0.0, 3.14, 0.0])
+    assert await driver.get_motion_status() == 0
+    assert driver.sync.get_flange_pose() == pytest.approx([0.3, 0.0, 0.3, 0.0, 3.14, 0.0])
+    await driver.emergency_stop()
+    assert not driver.is_enabled
+
+
+@pytest.mark.asyncio
+async def test_async_mock_realtime_motion():
+    driver = AsyncMockArmDriver(MockArmDriver(realtime=True))
+    await driver.connect("piper", "can0", "socketcan")
+    await driver.set_speed_percent(100)
+    await driver.move_j([0.15] * 6)
+    assert await driver.get_motion_status() == 1
+    await asyncio.sleep(0.15)
+    assert await driver.get_motion_status() == 0
+    assert await driver.get_joint_angles() == pytest.approx([0.15] * 6)
@@ -0,0 +1,102 @@
+"""Tests for POST /batch."""
+
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.server import app
+
+HOME = [0.0] * 6
+TARGET = [0.3] + [0.0] * 5
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+    _srv._manager = None
+
+
+async def test_batch_runs_ops_in_order(client: AsyncClient):
+    resp = await client.post("/batch", json={"ops": [
+        {"op": "status"},
+        {"op": "speed", "speed_percent": 100},
+        {"op": "move", "mode": "J", "target": TARGET},
+        {"op": "status"},
+    ]})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["ok"] is True and body["message"].startswith("Batch completed: 4 ops")
+    data = body["data"]
+    assert data["completed"] is True and data["failed_at"] is None
+    ops = data["ops"]
+    assert [op["op"] for op in ops] == ["status", "speed", "move", "status"]
+    assert all(op["ok"] and op["elapsed"] >= 0 for op in ops)
+    assert ops[1]["result"]["speed_percent"] == 80  # capped by the safety layer
+    assert ops[2]["result"]["completed"] is True
+    assert ops[3]["result"]["joint_angles"] == pytest.approx(TARGET)
+    assert data["elapsed"] >= sum(op["elapsed"] for op in ops)
+
+
+async def test_batch_stops_at_first_failure(client: AsyncClient):
+    resp = await client.post("/batch", json={"ops": [
+        {"op": "move", "mode": "J", "target": TARGET},
+        {"op": "move", "mode": "J", "target": [10.0] + [0.0] * 5},
+        {"op": "move", "mode": "J", "target": HOME},
+    ]})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["ok"] is False
+    assert body["message"].startswith("Batch stopped at op 2/3 (move): Safety violation")
+    data = body["data"]
+    assert data["failed_at"] == 1 and len(data["ops"]) == 2
+    assert "error" in data["ops"][1] and "result" not in data["ops"][1]
+
+    status = (await client.get("/status")).json()
+    assert status["joint_angles"] == pytest.approx(TARGET)  # the third move never ran
+
+
+async def test_wait_op_follows_unwaited_move(client: AsyncClient, monkeypatch):
+    monkeypatch.setenv("CLAWARM_MOCK_REALTIME", "true")
+    await client.post("/connect", json={"robot": "piper"})
+    resp = await client.post("/batch", json={"ops": [
+        {"op": "move", "mode": "J", "target": TARGET, "wait": False},
+        {"op": "wait", "timeout": 5},
+        {"op": "wait", "timeout": 0},  # already settled
+    ]})
+    data = resp.json()["data"]
+    assert data["completed"] is True
+    motion_id = data["ops"][0]["result"]["motion_id"]
+    assert data["ops"][1]["result"]["motion_id"] == motion_id
+    assert data["ops"][1]["result"]["state"] == "completed"
+
+    resp = await client.post("/batch", json={"ops": [
+        {"op": "move", "mode": "J", "target": HOME, "wait": False},
+        {"op": "wait", "timeout": 0},
+    ]})
+    assert "still running after 0.0s" in resp.json()["data"]["ops"][1]["error"]
+
+
+async def test_wait_without_motion_and_stop(client: AsyncClient):
+    resp = await client.post("/batch", json={"ops": [{"op": "wait"}]})
+    assert "needs a motion_id" in resp.json()["data"]["ops"][0]["error"]
+
+    resp = await client.post("/batch", json={"ops": [{"op": "stop"}, {"op": "status"}]})
+    ops = resp.json()["data"]["ops"]
+    assert ops[0]["result"]["message"] == "Arm disabled"
+    assert ops[1]["result"]["enabled"] is False
+
+
+async def test_batch_validation(client: AsyncClient):
+    assert (await client.post("/batch", json={"ops": []})).status_code == 422
+    assert (await client.post("/batch", json={"ops": [{"op": "jump"}]})).status_code == 422
+    too_many = {"ops": [{"op": "status"}] * 65}
+    assert (await client.post("/batch", json=too_many)).status_code == 422
@@ -73,6 +73,10 @@ async def test_connect_move_disconnect(client: AsyncClient):
     )
     assert resp.status_code == 200
     assert resp.json()["ok"] is True
+    motion = resp.json()["data"]
+    assert motion["completed"] is True
+    assert motion["estimated_duration"] > 0
+    assert motion["timeout"] > motion["estimated_duration"]
 
     resp = await client.post("/disconnect")
     assert resp.status_code == 200
@@ -114,3 +118,48 @@ async def test_safety_rejects_out_of_range_joints(client: AsyncClient):
     )
     assert resp.status_code == 422
     assert "Safety" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_move_sequence_blended(client: AsyncClient):
+    await client.post("/connect", json={"robot": "nero"})
+    steps = [
+        {"mode": "P", "target": [0.3, 0.1, 0.35, 0.0, 3.14, 0.0]},
+        {"mode": "P", "target": [0.3, 0.1, 0.15, 0.0, 3.14, 0.0]},
+        {"mode": "P", "target": [0.3, 0.1, 0.35, 0.0, 3.14, 0.0]},
+    ]
+    resp = await client.post("/move/sequence", json={"steps": steps, "blend_radius": 0.02})
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["completed"] is True
+    assert data["completed_steps"] == 3
+    assert data["cycle_time"] > 0
+
+
+@pytest.mark.asyncio
+async def test_move_sequence_safety_rejects(client: AsyncClient):
+    await client.post("/connect", json={"robot": "nero"})
+    steps = [
+        {"mode": "L", "target": [0.3, 0.1, 0.35, 0.0, 3.14, 0.0]},
+        {"mode": "L", "target": [0.3, 0.1, 1.50, 0.0, 3.14, 0.0]},
+    ]
+    resp = await client.post("/move/sequence", json={"steps": steps})
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_disable_enable(client: AsyncClient):
+    await client.post("/connect", json={"robot": "piper"})
+    resp = await client.post("/disable")
+    assert resp.status_code == 200
+    assert (await client.get("/status")).json()["enabled"] is False
+    resp = await client.post("/enable")
+    assert resp.status_code == 200
+    assert (await client.get("/status")).json()["enabled"] is True
+
+
+@pytest.mark.asyncio
+async def test_metrics(client: AsyncClient):
+    resp = await client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.json()["can"] is None  # CLAWARM_CANSTAT not set
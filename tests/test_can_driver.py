@@ -0,0 +1,140 @@
+"""End-to-end tests for the python-can driver on the virtual bus."""
+
+import itertools
+import time
+
+import pytest
+
+from bridge import arm_manager
+from bridge.arm_manager import ArmManager
+from bridge.drivers import can_protocol as proto
+from bridge.drivers.async_adapter import LockedDriver
+from bridge.drivers.can_driver import CanBusDriver
+from bridge.models import MotionMode, RobotType
+from tests.fake_can_arm import FakeCanArm
+
+_channels = itertools.count()
+
+
+def _wait_for(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture
+def channel():
+    return f"clawarm-test-{next(_channels)}"
+
+
+@pytest.fixture
+def fake_arm(channel):
+    arm = FakeCanArm(channel, dof=6)
+    yield arm
+    arm.close()
+
+
+@pytest.fixture
+def driver(channel, fake_arm):
+    d = CanBusDriver()
+    d.connect("piper", channel, "virtual")
+    assert _wait_for(lambda: d.get_joint_angles() is not None)
+    yield d
+    d.disconnect()
+
+
+def _enable(driver: CanBusDriver) -> None:
+    assert _wait_for(driver.enable)
+
+
+def test_joint_frames_roundtrip():
+    joints = [0.1, -0.2, 1.5, -1.5, 0.0, 2.6]
+    frames = proto.joint_frames(joints, proto.ID_JOINT_CMD)
+    assert [fid for fid, _ in frames] == [0x155, 0x156, 0x157]
+    decoded = [proto.mdeg_to_rad(v) for _, data in frames for v in proto.unpack_pair(data)]
+    assert decoded == pytest.approx(joints, abs=1e-4)
+
+
+def test_pose_frames_roundtrip():
+    pose = [0.312345, -0.1, 0.45, 0.01, 3.14159, -0.5]
+    frames = proto.pose_frames(pose, proto.ID_POSE_FEEDBACK)
+    decoded = [v for i, (_, data) in enumerate(frames) for v in proto.decode_pose_pair(i, data)]
+    assert decoded == pytest.approx(pose, abs=1e-5)
+
+
+def test_feedback_is_pushed_without_polling(driver: CanBusDriver):
+    frames = driver.feedback.frames
+    time.sleep(0.05)
+    assert driver.feedback.frames > frames
+    assert driver.feedback.last_seen(proto.ID_JOINT_FEEDBACK[0]) is not None
+    assert driver.feedback_freshness().age < 0.05
+    assert driver.get_flange_pose() == pytest.approx([0.3, 0.0, 0.3, 0.0, 3.14159, 0.0], abs=1e-5)
+
+
+def test_enable_waits_for_motor_feedback(driver: CanBusDriver, fake_arm: FakeCanArm):
+    assert not driver.is_enabled
+    _enable(driver)
+    assert fake_arm.enable_requests >= fake_arm.enable_after
+    assert driver.is_enabled
+    assert _wait_for(driver.disable)
+    assert not driver.is_enabled
+
+
+def test_move_j_reports_motion_then_completion(driver: CanBusDriver, fake_arm: FakeCanArm):
+    _enable(driver)
+    driver.set_speed_percent(40)
+    driver.set_motion_mode("J")
+    target = [0.2, -0.1, 0.3, 0.0, 0.1, -0.2]
+    sent = time.time()
+    driver.move_j(target)
+    assert _wait_for(lambda: driver.get_motion_status() == 1)
+    started = driver.status_time()  # the frame that first showed motion
+    assert sent <= started <= time.time()
+    assert _wait_for(lambda: driver.get_motion_status() == 0)
+    assert started < driver.status_time() <= time.time()
+    assert _wait_for(lambda: driver.get_joint_angles() == pytest.approx(target, abs=1e-4))
+    assert fake_arm.move_mode == proto.MOVE_MODE["J"]
+    assert fake_arm.speed_percent == 40
+
+
+def test_move_l_and_arc(driver: CanBusDriver):
+    _enable(driver)
+    driver.set_motion_mode("L")
+    pose = [0.35, 0.05, 0.25, 0.0, 3.14159, 0.0]
+    driver.move_l(pose)
+    assert _wait_for(lambda: driver.get_flange_pose() == pytest.approx(pose, abs=1e-5))
+
+    driver.set_motion_mode("C")
+    mid = [0.40, 0.10, 0.25, 0.0, 3.14159, 0.0]
+    end = [0.35, 0.15, 0.25, 0.0, 3.14159, 0.0]
+    driver.move_c(pose, mid, end)
+    assert _wait_for(lambda: driver.get_flange_pose() == pytest.approx(end, abs=1e-5))
+
+
+def test_emergency_stop(driver: CanBusDriver, fake_arm: FakeCanArm):
+    _enable(driver)
+    driver.emergency_stop()
+    assert _wait_for(lambda: not driver.is_enabled)
+    assert fake_arm.estopped
+    driver.reset()
+    assert _wait_for(lambda: not fake_arm.estopped)
+
+
+def test_arm_manager_over_virtual_bus(channel, fake_arm, monkeypatch):
+    monkeypatch.delenv("CLAWARM_MOCK", raising=False)
+    monkeypatch.setenv("CLAWARM_DRIVER", "can")
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0.05)
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER, channel, "virtual")
+    assert isinstance(mgr._driver, LockedDriver) and isinstance(mgr._driver.driver, CanBusDriver)
+    assert mgr._driver is mgr._adriver.sync
+    assert mgr.enabled
+
+    report = mgr.move(MotionMode.J, [0.3, 0.0, 0.0, 0.0, 0.0, 0.0], timeout=1.0)
+    assert report["completed"] is True
+    assert mgr.get_status()["joint_angles"][0] == pytest.approx(0.3, abs=1e-4)
+    mgr.disconnect()
+    assert not fake_arm.enabled
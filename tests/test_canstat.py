@@ -0,0 +1,113 @@
+"""Tests for the CAN bus load monitor."""
+
+import itertools
+import json
+import time
+
+import can
+import pytest
+
+from bridge import arm_manager, canstat
+from bridge.arm_manager import ArmManager
+from bridge.canstat import BusMonitor, CanMonitor, frame_bits
+from bridge.drivers import can_protocol as proto
+from bridge.models import RobotType
+from tests.fake_can_arm import FakeCanArm
+
+_channels = itertools.count()
+
+
+@pytest.fixture
+def channel():
+    return f"clawarm-canstat-{next(_channels)}"
+
+
+def _msg(fid, ts, dlc=8, error=False):
+    return can.Message(
+        arbitration_id=fid, data=bytes(dlc), timestamp=ts, is_extended_id=False,
+        is_error_frame=error,
+    )
+
+
+def test_frame_bits_worst_case():
+    assert frame_bits(8) == 135
+    assert frame_bits(0) == 55
+    assert frame_bits(8, extended=True) == 160
+
+
+def test_rates_and_bus_load():
+    mon = BusMonitor(bitrate=1_000_000, window=1.0)
+    now = 1000.0
+    for i in range(200):
+        mon.on_message_received(_msg(proto.ID_ARM_STATUS, now - 1.0 + i * 0.005))
+        mon.on_message_received(_msg(0x155, now - 1.0 + i * 0.005))
+    snap = mon.snapshot(now=now)
+    assert snap["fps_by_id"]["0x2a1"] == pytest.approx(200, abs=1)
+    assert snap["frames_per_second"] == pytest.approx(400, abs=2)
+    assert snap["bus_load_percent"] == pytest.approx(400 * 135 / 1e4, abs=0.5)
+    assert "0x155" not in snap["feedback_gaps"]  # commands are not feedback streams
+
+
+def test_error_frames_counted():
+    mon = BusMonitor()
+    now = time.time()
+    mon.on_message_received(_msg(0, now, dlc=0, error=True))
+    mon.on_message_received(_msg(0, now, dlc=0, error=True))
+    snap = mon.snapshot(now=now)
+    assert snap["error_frames_total"] == 2
+    assert snap["frames_total"] == 0
+
+
+def test_feedback_gap_detected():
+    mon = BusMonitor()
+    ts = 0.0
+    for _ in range(50):
+        ts += 0.005
+        mon.on_message_received(_msg(proto.ID_JOINT_FEEDBACK[0], ts))
+    ts += 0.120  # stream stalls for 120 ms
+    mon.on_message_received(_msg(proto.ID_JOINT_FEEDBACK[0], ts))
+    mon.on_message_received(_msg(proto.ID_JOINT_FEEDBACK[0], ts + 0.005))
+    gap = mon.snapshot(now=ts + 0.005)["feedback_gaps"]["0x2a5"]
+    assert gap["gaps"] == 1
+    assert gap["max_gap_ms"] == pytest.approx(120, abs=1)
+
+
+def test_monitor_on_virtual_bus(channel):
+    arm = FakeCanArm(channel, dof=6, period=0.005)
+    mon = CanMonitor(channel, "virtual", window=0.5)
+    try:
+        time.sleep(0.6)
+        snap = mon.snapshot()
+    finally:
+        mon.stop()
+        arm.close()
+    assert snap["fps_by_id"]["0x2a1"] > 50
+    assert snap["bus_load_percent"] > 0
+    assert snap["feedback_gaps"]["0x2a5"]["silent_ms"] < 100
+
+
+def test_cli_json_report(channel, capsys):
+    arm = FakeCanArm(channel, dof=6)
+    try:
+        canstat.main(["--channel", channel, "--interface", "virtual", "--interval", "0.2",
+                      "--count", "1", "--json"])
+    finally:
+        arm.close()
+    snap = json.loads(capsys.readouterr().out)
+    assert snap["frames_total"] > 0
+
+
+def test_manager_exposes_can_metrics(channel, monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0.0)
+    monkeypatch.setenv("CLAWARM_MOCK", "true")
+    mgr = ArmManager(can_monitor=True)
+    assert mgr.metrics()["can"] is None
+    arm = FakeCanArm(channel, dof=6)
+    try:
+        mgr.connect(RobotType.PIPER, channel, "virtual")
+        time.sleep(0.2)
+        assert mgr.metrics()["can"]["frames_total"] > 0
+        mgr.disconnect()
+        assert mgr.metrics()["can"] is None
+    finally:
+        arm.close()
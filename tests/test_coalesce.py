@@ -0,0 +1,136 @@
+"""Tests for single-flight coalescing of driver reads."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from bridge import arm_manager
+from bridge.arm_manager import ArmManager
+from bridge.coalesce import ReadCoalescer
+from bridge.drivers.async_adapter import ThreadedDriverAdapter
+from bridge.drivers.mock_driver import MockArmDriver
+from bridge.models import RobotType
+
+
+class SlowReads:
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.calls
+
+
+class SlowMockDriver(MockArmDriver):
+    """Mock whose getters take as long as an SDK round trip."""
+
+    def get_joint_angles(self):
+        time.sleep(0.005)
+        return super().get_joint_angles()
+
+
+async def test_concurrent_reads_share_one_call():
+    reads, fn = ReadCoalescer(), SlowReads()
+    results = await asyncio.gather(*(reads.read("joints", fn) for _ in range(10)))
+    assert results == [1] * 10
+    assert fn.calls == 1
+    snap = reads.snapshot()
+    assert snap["requests"] == 10 and snap["driver_calls"] == 1 and snap["coalesced"] == 9
+    assert snap["calls_saved"] == 9 and snap["amplification"] == 10.0
+
+    # Without a freshness window, a later read goes back to the driver.
+    assert await reads.read("joints", fn) == 2
+
+
+async def test_freshness_window():
+    reads, fn = ReadCoalescer(freshness=0.2), SlowReads(delay=0.0)
+    assert await reads.read("pose", fn) == 1
+    assert await reads.read("pose", fn) == 1
+    assert reads.cached == 1
+    reads.invalidate()
+    assert await reads.read("pose", fn) == 2
+
+    reads.freshness = 0.01
+    await asyncio.sleep(0.02)
+    assert await reads.read("pose", fn) == 3
+
+
+async def test_invalidate_from_another_thread():
+    reads, fn = ReadCoalescer(freshness=10.0), SlowReads(delay=0.001)
+    stop = threading.Event()
+
+    def commands():  # a threadpool move or the watchdog invalidating meanwhile
+        while not stop.is_set():
+            reads.invalidate()
+
+    thread = threading.Thread(target=commands)
+    thread.start()
+    try:
+        for _ in range(50):
+            await asyncio.gather(*(reads.read(key, fn) for key in ("a", "b", "a")))
+    finally:
+        stop.set()
+        thread.join()
+    pending = asyncio.ensure_future(reads.read("a", fn))
+    await asyncio.sleep(0)
+    await asyncio.to_thread(reads.invalidate)  # while that read is in flight
+    first = await pending
+    assert await reads.read("a", fn) == first + 1  # the in-flight result was not cached
+
+
+async def test_keys_are_independent():
+    reads, a, b = ReadCoalescer(), SlowReads(), SlowReads()
+    await asyncio.gather(reads.read("a", a), reads.read("b", b), reads.read("a", a))
+    assert (a.calls, b.calls) == (1, 1)
+
+
+async def test_errors_reach_every_waiter_and_are_not_cached():
+    reads = ReadCoalescer(freshness=1.0)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("bus off")
+
+    results = await asyncio.gather(
+        *(reads.read("status", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await reads.read("status", failing)
+    assert calls == 2
+
+
+async def test_cancelled_caller_does_not_cancel_shared_read():
+    reads, fn = ReadCoalescer(), SlowReads(delay=0.05)
+    first = asyncio.ensure_future(reads.read("joints", fn))
+    second = asyncio.ensure_future(reads.read("joints", fn))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == 1
+    assert fn.calls == 1
+
+
+async def test_status_readers_share_driver_calls(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    mgr = ArmManager()
+    await asyncio.to_thread(mgr.connect, RobotType.PIPER)
+    driver = SlowMockDriver()
+    driver.connect("piper", "can0", "socketcan")
+    mgr._driver, mgr._adriver = driver, ThreadedDriverAdapter(driver)
+
+    statuses = await asyncio.gather(*(mgr.aget_status() for _ in range(20)))
+    assert all(s["joint_angles"] == [0.0] * 6 for s in statuses)
+    reads = mgr.metrics()["reads"]
+    assert reads["requests"] == 60
+    assert reads["driver_calls"] <= 6
+    mgr._adriver.close()
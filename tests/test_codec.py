@@ -0,0 +1,169 @@
+"""Tests for msgpack content negotiation and fast-path validation."""
+
+import os
+
+import msgpack
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager, codec
+from bridge.models import Frame, MotionMode, MoveSequenceRequest
+from bridge.server import app
+
+MSGPACK_HEADERS = {"Content-Type": codec.MSGPACK, "Accept": codec.MSGPACK}
+
+
+@pytest.fixture(autouse=True)
+def _reset_manager(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0.0)
+    _srv._manager = None
+    yield
+    _srv._manager = None
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def test_pack_floats_roundtrip():
+    values = [0.1, -2.5, 3.14159, 0.0]
+    assert codec.unpack_floats(codec.pack_floats(values)) == values
+
+
+def test_unpack_floats_rejects_truncated():
+    with pytest.raises(codec.CodecError, match="multiple of 8"):
+        codec.unpack_floats(b"\x00" * 7)
+
+
+def test_parse_move_accepts_packed_and_list_targets():
+    packed = codec.parse_move({"mode": "J", "target": codec.pack_floats([0.1] * 7)})
+    listed = codec.parse_move({"mode": "J", "target": [0.1] * 7, "wait": False})
+    assert packed["target"] == listed["target"] == [0.1] * 7
+    assert packed["mode"] is MotionMode.J
+    assert packed["timeout"] is None  # adaptive deadline
+    assert listed["wait"] is False
+    assert packed["relative"] is False and packed["frame"] is Frame.BASE
+
+
+@pytest.mark.parametrize(
+    "payload, error",
+    [
+        ({"target": [0.0]}, "'mode'"),
+        ({"mode": "X", "target": [0.0]}, "'mode'"),
+        ({"mode": "J"}, "'target' is required"),
+        ({"mode": "J", "target": ["a"]}, "'target'"),
+        ({"mode": "J", "target": [0.0], "speed_percent": 101}, "'speed_percent'"),
+        ({"mode": "J", "target": [0.0], "speed_percent": 5.5}, "integer"),
+        ({"mode": "J", "target": [0.0], "speed_percent": float("inf")}, "finite"),
+        ({"mode": "J", "target": [0.0], "speed_percent": float("nan")}, "finite"),
+        ({"mode": "J", "target": [0.0], "timeout": float("nan")}, "finite"),
+        ({"mode": "J", "target": [0.0], "timeout": 0.0}, "'timeout'"),
+        ({"mode": "J", "target": [0.0], "wait": 1}, "'wait'"),
+        ({"mode": "J", "target": [0.0], "relative": "yes"}, "'relative'"),
+        ({"mode": "L", "target": [0.0], "frame": "world"}, "'frame'"),
+    ],
+)
+def test_parse_move_rejects_invalid(payload, error):
+    with pytest.raises(codec.CodecError, match=error):
+        codec.parse_move(payload)
+
+
+def test_parse_sequence_builds_steps():
+    parsed = codec.parse_sequence(
+        {"steps": [{"mode": "P", "target": [0.3, 0.0, 0.3, 0.0, 0.0, 0.0]}], "blend_radius": 0.01}
+    )
+    assert parsed["steps"][0].mode is MotionMode.P
+    assert parsed["blend_radius"] == 0.01
+    with pytest.raises(codec.CodecError, match="non-empty"):
+        codec.parse_sequence({"steps": []})
+
+
+def test_parse_sequence_matches_model_defaults_and_bounds():
+    steps = [{"mode": "P", "target": [0.3, 0.0, 0.3, 0.0, 0.0, 0.0]}]
+    parsed = codec.parse_sequence({"steps": steps})
+    model = MoveSequenceRequest(steps=steps)
+    for key in ("blend_radius", "timeout", "simplify_tolerance", "orientation_tolerance"):
+        assert parsed[key] == getattr(model, key)
+    with pytest.raises(codec.CodecError, match="greater than 0.0"):
+        codec.parse_sequence({"steps": steps, "orientation_tolerance": 0.0})
+    with pytest.raises(codec.CodecError, match="between 0.0 and 0.1"):
+        codec.parse_sequence({"steps": steps, "blend_radius": 0.2})
+
+
+def test_parse_sequence_columnar():
+    targets = [[0.3, 0.0, z, 0.0, 3.14, 0.0] for z in (0.3, 0.2, 0.1)]
+    parsed = codec.parse_sequence({
+        "mode": "L",
+        "stride": 6,
+        "targets": codec.pack_floats([v for t in targets for v in t]),
+        "speed_percent": 20,
+    })
+    assert [s.target for s in parsed["steps"]] == targets
+    assert all(s.speed_percent == 20 for s in parsed["steps"])
+    with pytest.raises(codec.CodecError, match="multiple of stride"):
+        codec.parse_sequence({"mode": "L", "stride": 4, "targets": [0.0] * 6})
+    with pytest.raises(codec.CodecError, match="J, JS, P, L"):
+        codec.parse_sequence({"mode": "C", "stride": 6, "targets": [0.0] * 6})
+
+
+@pytest.mark.asyncio
+async def test_status_msgpack(client: AsyncClient):
+    await client.post("/connect", json={"robot": "piper"})
+    resp = await client.get("/status", headers={"Accept": codec.MSGPACK})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == codec.MSGPACK
+    data = msgpack.unpackb(resp.content)
+    assert data["connected"] is True
+    assert codec.unpack_floats(data["joint_angles"]) == [0.0] * 6
+
+
+@pytest.mark.asyncio
+async def test_move_msgpack(client: AsyncClient):
+    await client.post("/connect", json={"robot": "nero"})
+    body = msgpack.packb({"mode": "J", "target": codec.pack_floats([0.2] + [0.0] * 6)})
+    resp = await client.post("/move", content=body, headers=MSGPACK_HEADERS)
+    assert resp.status_code == 200
+    assert msgpack.unpackb(resp.content)["ok"] is True
+
+    resp = await client.get("/status")
+    assert resp.json()["joint_angles"][0] == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_move_msgpack_safety_and_validation(client: AsyncClient):
+    await client.post("/connect", json={"robot": "nero"})
+    body = msgpack.packb({"mode": "J", "target": [5.0] + [0.0] * 6})
+    resp = await client.post("/move", content=body, headers=MSGPACK_HEADERS)
+    assert resp.status_code == 422
+    assert "Safety" in resp.json()["detail"]
+
+    body = msgpack.packb({"mode": "Q", "target": [0.0] * 7})
+    resp = await client.post("/move", content=body, headers=MSGPACK_HEADERS)
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_sequence_msgpack(client: AsyncClient):
+    await client.post("/connect", json={"robot": "nero"})
+    steps = [
+        {"mode": "L", "target": codec.pack_floats([0.3, 0.0, z, 0.0, 3.14, 0.0])}
+        for z in (0.3, 0.2, 0.3)
+    ]
+    body = msgpack.packb({"steps": steps, "blend_radius": 0.01})
+    resp = await client.post("/move/sequence", content=body, headers=MSGPACK_HEADERS)
+    assert resp.status_code == 200
+    assert msgpack.unpackb(resp.content)["data"]["completed"] is True
+
+
+@pytest.mark.asyncio
+async def test_json_clients_unaffected(client: AsyncClient):
+    resp = await client.get("/status")
+    assert resp.headers["content-type"] == "application/json"
+    resp = await client.post("/move", json={"mode": "Q", "target": []})
+    assert resp.status_code == 422
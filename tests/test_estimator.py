@@ -0,0 +1,122 @@
+"""Tests for the motion duration estimator and adaptive move waits."""
+
+import json
+import os
+
+import pytest
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from bridge import arm_manager
+from bridge.arm_manager import ArmManager, adaptive_timeout, motion_message
+from bridge.estimator import (
+    MIN_CALIBRATION_SAMPLES,
+    PIPER_PROFILE,
+    MotionEstimate,
+    MotionEstimator,
+    trapezoid_time,
+)
+from bridge.models import MotionMode, RobotType
+
+
+@pytest.fixture
+def realtime_manager(monkeypatch):
+    monkeypatch.setenv("CLAWARM_MOCK_REALTIME", "true")
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    yield mgr
+    mgr.disconnect()
+
+
+def test_trapezoid_time():
+    # Short move: never reaches full speed (triangular profile).
+    assert trapezoid_time(0.1, 1.0, 10.0) == pytest.approx(2 * (0.1 / 10.0) ** 0.5)
+    # Long move: accelerate, cruise, decelerate.
+    assert trapezoid_time(2.0, 1.0, 10.0) == pytest.approx(2.0 + 0.1)
+    assert trapezoid_time(0.0, 1.0, 10.0) == 0.0
+
+
+def test_estimate_scales_with_displacement_and_speed():
+    est = MotionEstimator()
+    start = [0.0] * 6
+    small = est.estimate(RobotType.PIPER, MotionMode.J, [0.1] + [0.0] * 5, start, 50)
+    large = est.estimate(RobotType.PIPER, MotionMode.J, [1.5] + [0.0] * 5, start, 50)
+    slow = est.estimate(RobotType.PIPER, MotionMode.J, [1.5] + [0.0] * 5, start, 10)
+    assert small.kind == "joint"
+    assert small.duration < large.duration < slow.duration
+    assert slow.nominal == pytest.approx(
+        trapezoid_time(1.5, PIPER_PROFILE.joint_speed * 0.1, PIPER_PROFILE.joint_accel * 0.1)
+        + PIPER_PROFILE.overhead
+    )
+    assert est.estimate(RobotType.PIPER, MotionMode.J, start, None, 50) is None
+
+
+def test_cartesian_and_arc_estimates():
+    est = MotionEstimator()
+    pose = [0.3, 0.0, 0.3, 0.0, 3.14, 0.0]
+    line = est.estimate(RobotType.NERO, MotionMode.L, [0.3, 0.2, 0.3, 0.0, 3.14, 0.0], pose, 80)
+    arc = est.estimate(
+        RobotType.NERO, MotionMode.C, pose, pose, 80,
+        mid_point=[0.4, 0.1, 0.3, 0.0, 3.14, 0.0], end_point=[0.3, 0.2, 0.3, 0.0, 3.14, 0.0],
+    )
+    assert line.kind == "cartesian" and arc.kind == "arc"
+    assert arc.duration > line.duration  # half circle of radius 0.1 is longer than the chord
+
+
+def test_calibration_from_recorded_moves(tmp_path):
+    log = tmp_path / "motions.jsonl"
+    est = MotionEstimator(log_path=log)
+    estimate = MotionEstimate("joint", 1.0, 1.0)
+    for _ in range(MIN_CALIBRATION_SAMPLES - 1):
+        est.record(RobotType.PIPER, estimate, 2.0)
+    assert est.scale(RobotType.PIPER, "joint") == 1.0  # not enough samples yet
+    est.record(RobotType.PIPER, estimate, 2.0)
+    assert est.scale(RobotType.PIPER, "joint") == pytest.approx(2.0)
+    assert est.scale(RobotType.PIPER, "cartesian") == 1.0
+
+    lines = [json.loads(line) for line in log.read_text().splitlines()]
+    assert len(lines) == MIN_CALIBRATION_SAMPLES and lines[0]["actual"] == 2.0
+
+    reloaded = MotionEstimator(log_path=log)
+    assert reloaded.scale(RobotType.PIPER, "joint") == pytest.approx(2.0)
+    assert reloaded.calibration() == {"piper/joint": {"scale": 2.0, "samples": 3}}
+    doubled = reloaded.estimate(RobotType.PIPER, MotionMode.J, [0.5] * 6, [0.0] * 6, 80)
+    assert doubled.duration == pytest.approx(2 * doubled.nominal)
+
+
+def test_adaptive_timeout():
+    assert adaptive_timeout(None) == arm_manager.DEFAULT_TIMEOUT
+    assert adaptive_timeout(MotionEstimate("joint", 10.0, 10.0)) > 10.0
+
+
+def test_slow_move_completes_with_adaptive_deadline(realtime_manager: ArmManager):
+    target = [0.1, 0.0, 0.0, 0.0, 0.0, 0.0]
+    timed_out = realtime_manager.move(MotionMode.J, target, speed_percent=10, timeout=0.2)
+    assert timed_out["completed"] is False
+    assert motion_message(timed_out) == "Motion timed out (mode=J)"
+
+    realtime_manager.move(MotionMode.J, [0.0] * 6, speed_percent=80)
+    report = realtime_manager.move(MotionMode.J, target, speed_percent=10)
+    assert report["completed"] is True
+    assert report["timeout"] > report["estimated_duration"] > 0.5
+    assert report["elapsed"] < report["timeout"]
+
+
+def test_polls_only_near_predicted_finish(realtime_manager: ArmManager):
+    driver = realtime_manager._driver
+    calls = []
+    original = driver.get_motion_status
+    driver.get_motion_status = lambda: calls.append(1) or original()
+    report = realtime_manager.move(MotionMode.J, [0.1] + [0.0] * 5, speed_percent=10)
+    assert report["completed"] is True
+    # ~0.7 s move: sleeping through 80% of the estimate leaves a handful of dense polls,
+    # where a fixed 100 ms grid would have needed at least seven.
+    assert len(calls) <= 5
+
+
+def test_unwaited_move_report(realtime_manager: ArmManager):
+    report = realtime_manager.move(MotionMode.J, [0.05] + [0.0] * 5, wait=False)
+    assert report["completed"] is None and report["timeout"] is None
+    assert report["estimated_duration"] > 0
+    assert motion_message(report) == "Motion command sent (id=1, mode=J, not waiting)"
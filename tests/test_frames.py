@@ -0,0 +1,120 @@
+"""Tests for pose math and relative (jog) moves."""
+
+import math
+import os
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.frames import (
+    apply_offset,
+    matrix_to_rpy,
+    resolve_relative,
+    rpy_to_matrix,
+    rpy_to_quaternion,
+)
+from bridge.models import Frame, MotionMode
+from bridge.server import app
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+    _srv._manager = None
+
+
+def test_rpy_round_trip_vectorized():
+    rng = np.random.default_rng(0)
+    rpy = rng.uniform([-math.pi, -1.5, -math.pi], [math.pi, 1.5, math.pi], size=(100, 3))
+    rot = rpy_to_matrix(rpy)
+    assert rot.shape == (100, 3, 3)
+    identity = np.broadcast_to(np.eye(3), rot.shape)
+    assert np.einsum("nij,nkj->nik", rot, rot) == pytest.approx(identity)
+    assert matrix_to_rpy(rot) == pytest.approx(rpy)
+
+
+def test_quaternions_match_matrices():
+    rpy = np.random.default_rng(1).uniform(-math.pi, math.pi, size=(50, 3))
+    w, x, y, z = rpy_to_quaternion(rpy).T
+    rot = np.stack([
+        1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y),
+        2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x),
+        2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y),
+    ], axis=1).reshape(-1, 3, 3)
+    assert rot == pytest.approx(rpy_to_matrix(rpy))
+
+
+def test_gimbal_lock_keeps_the_rotation():
+    rot = rpy_to_matrix([0.3, math.pi / 2, 0.2])
+    assert rpy_to_matrix(matrix_to_rpy(rot)) == pytest.approx(rot)
+
+
+def test_base_and_tool_offsets_differ_when_rotated():
+    pose = [0.3, 0.0, 0.2, 0.0, 0.0, math.pi / 2]  # flange x axis points along base y
+    step = [0.05, 0.0, 0.0, 0.0, 0.0, 0.0]
+    yaw = math.pi / 2
+    assert apply_offset(pose, step, Frame.BASE) == pytest.approx([0.35, 0.0, 0.2, 0, 0, yaw])
+    assert apply_offset(pose, step, Frame.TOOL) == pytest.approx([0.3, 0.05, 0.2, 0, 0, yaw])
+
+
+def test_rotation_offsets_compose_on_the_right_side():
+    pose = [0.3, 0.0, 0.2, 0.0, math.pi / 2, 0.0]
+    turn = [0.0, 0.0, 0.0, 0.0, 0.0, 0.4]
+    base = rpy_to_matrix(apply_offset(pose, turn, Frame.BASE)[3:])
+    tool = rpy_to_matrix(apply_offset(pose, turn, Frame.TOOL)[3:])
+    assert base == pytest.approx(rpy_to_matrix(turn[3:]) @ rpy_to_matrix(pose[3:]))
+    assert tool == pytest.approx(rpy_to_matrix(pose[3:]) @ rpy_to_matrix(turn[3:]))
+
+
+def test_resolve_relative_joint_moves():
+    target, mid, end = resolve_relative(MotionMode.J, Frame.BASE, [0.1] * 6, [0.2] + [0.0] * 5)
+    assert target == pytest.approx([0.3] + [0.1] * 5) and mid is None and end is None
+    with pytest.raises(ValueError, match="no frame"):
+        resolve_relative(MotionMode.J, Frame.TOOL, [0.0] * 6, [0.0] * 6)
+    with pytest.raises(ValueError, match="expected 6"):
+        resolve_relative(MotionMode.JS, Frame.BASE, [0.0] * 6, [0.0] * 7)
+    with pytest.raises(ValueError, match="droll"):
+        resolve_relative(MotionMode.L, Frame.BASE, [0.0] * 6, [0.0] * 3)
+
+
+async def test_relative_joint_move_reports_final_state(client: AsyncClient):
+    for _ in range(2):
+        resp = await client.post("/move", json={
+            "mode": "J", "target": [0.1] + [0.0] * 5, "relative": True,
+        })
+        assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["target"] == pytest.approx([0.2] + [0.0] * 5)
+    assert data["joint_angles"] == pytest.approx([0.2] + [0.0] * 5)
+    assert len(data["flange_pose"]) == 6
+
+
+async def test_relative_cartesian_move_in_tool_frame(client: AsyncClient):
+    start = [0.3, 0.0, 0.3, 0.0, 0.0, math.pi / 2]
+    await client.post("/move", json={"mode": "L", "target": start})
+    resp = await client.post("/move", json={
+        "mode": "L", "target": [0.05, 0.0, 0.0, 0.0, 0.0, 0.0], "relative": True, "frame": "tool",
+    })
+    data = resp.json()["data"]
+    assert data["flange_pose"] == pytest.approx([0.3, 0.05, 0.3, 0.0, 0.0, math.pi / 2])
+
+
+async def test_relative_moves_are_safety_checked_after_resolution(client: AsyncClient):
+    step = {"mode": "J", "target": [1.5] + [0.0] * 5, "relative": True}
+    assert (await client.post("/move", json=step)).status_code == 200
+    resp = await client.post("/move", json=step)  # 3.0 rad is past the base joint limit
+    assert resp.status_code == 422 and "Safety violation" in resp.json()["detail"]
+    status = (await client.get("/status")).json()
+    assert status["joint_angles"][0] == pytest.approx(1.5)
+
+    resp = await client.post("/move", json={**step, "frame": "tool"})
+    assert resp.status_code == 422 and "no frame" in resp.json()["detail"]
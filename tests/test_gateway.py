@@ -0,0 +1,182 @@
+"""Tests for the fleet gateway (bridge.gateway) against local mock-mode bridges."""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from bridge.gateway import Gateway, create_app, parse_bridges
+
+HOST = "127.0.0.1"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _start_bridge(port: int) -> subprocess.Popen:
+    env = dict(os.environ, CLAWARM_MOCK="true", CLAWARM_HOST=HOST, CLAWARM_PORT=str(port))
+    return subprocess.Popen(
+        [sys.executable, "-c", "from bridge.server import main; main()"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_up(port: int) -> None:
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            urllib.request.urlopen(f"http://{HOST}:{port}/", timeout=1).read()
+            return
+        except OSError:
+            assert time.monotonic() < deadline, f"bridge on port {port} did not start"
+            time.sleep(0.1)
+
+
+@pytest.fixture(scope="module")
+def bridges():
+    ports = {"left": _free_port(), "right": _free_port()}
+    procs = [_start_bridge(port) for port in ports.values()]
+    try:
+        for port in ports.values():
+            _wait_up(port)
+        yield {arm_id: f"http://{HOST}:{port}" for arm_id, port in ports.items()}
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+
+
+@pytest.fixture
+def silent_port():
+    """A port that accepts connections and never answers."""
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        sock.listen(8)
+        yield sock.getsockname()[1]
+
+
+async def _gateway_client(gateway: Gateway) -> AsyncClient:
+    await gateway.start()
+    return AsyncClient(transport=ASGITransport(app=create_app(gateway)), base_url="http://gw")
+
+
+async def test_callers_keep_their_own_rate_limit_buckets(bridges):
+    gateway = Gateway({"left": bridges["left"]})
+    await gateway.start()
+    app = create_app(gateway)
+
+    def caller(host: str) -> AsyncClient:
+        transport = ASGITransport(app=app, client=(host, 5000))
+        return AsyncClient(transport=transport, base_url="http://gw")
+
+    async def clients() -> int:
+        async with caller(HOST) as client:
+            return (await client.get("/arms/left/metrics")).json()["admission"]["clients"]
+
+    try:
+        async with caller(HOST) as client:
+            assert (await client.post("/arms/left/connect", json={"robot": "piper"})).is_success
+        before = await clients()
+        for host in ("10.0.0.1", "10.0.0.2", "10.0.0.1"):
+            async with caller(host) as client:
+                resp = await client.post("/arms/left/move",
+                                         json={"mode": "J", "target": [0.0] * 6})
+                assert resp.status_code == 200
+        async with caller("10.0.0.3") as client:
+            await client.post("/arms/left/move", json={"mode": "J", "target": [0.0] * 6},
+                              headers={"X-Client-ID": "agent-7"})  # named, not addressed
+        assert await clients() == before + 3  # 10.0.0.1, 10.0.0.2 and agent-7
+    finally:
+        await gateway.close()
+
+
+def test_parse_bridges():
+    assert parse_bridges(["a=http://h:1/", " b=https://h:2"]) == {
+        "a": "http://h:1", "b": "https://h:2"
+    }
+    for bad in (["a"], ["a/b=http://h:1"], ["a=h:1"], ["a=http://h:1", "a=http://h:2"]):
+        with pytest.raises(ValueError):
+            parse_bridges(bad)
+
+
+async def test_routes_requests_to_each_arm(bridges):
+    gateway = Gateway(bridges)
+    async with await _gateway_client(gateway) as client:
+        try:
+            assert (await client.post("/arms/left/connect", json={"robot": "piper"})).is_success
+            assert (await client.post("/arms/right/connect", json={"robot": "nero"})).is_success
+            resp = await client.post("/arms/right/move", json={"mode": "J", "target": [0.1] * 7})
+            assert resp.status_code == 200 and "Server-Timing" in resp.headers
+            left = (await client.get("/arms/left/status")).json()
+            right = (await client.get("/arms/right/status")).json()
+            assert (left["dof"], right["dof"]) == (6, 7)
+            assert right["joint_angles"] == pytest.approx([0.1] * 7)
+
+            resp = await client.post("/arms/left/move", json={"mode": "J", "target": [9.0] * 6})
+            assert resp.status_code == 422  # the bridge's answer is passed through
+            resp = await client.get("/arms/left/status", params={"changed_since": 0,
+                                                                 "timeout": 0})
+            assert resp.status_code == 200
+            assert (await client.get("/arms/middle/status")).status_code == 404
+
+            fleet = (await client.get("/fleet")).json()
+            assert fleet["healthy"] == 2 and fleet["bridges"]["left"]["requests"] == 4
+        finally:
+            for arm_id in bridges:
+                await client.post(f"/arms/{arm_id}/disconnect")
+    await gateway.close()
+
+
+async def test_fleet_status_fans_out_with_per_bridge_timeouts(bridges, silent_port):
+    gateway = Gateway({**bridges, "stuck": f"http://{HOST}:{silent_port}"},
+                      health_timeout=0.2, eject_after=3)
+    async with await _gateway_client(gateway) as client:
+        start = time.monotonic()
+        fleet = (await client.get("/fleet/status", params={"timeout": 0.3})).json()
+        assert time.monotonic() - start < 0.6  # one timeout, not one per bridge in turn
+    await gateway.close()
+
+    assert fleet["ok"] == 2 and fleet["total"] == 3
+    assert fleet["arms"]["left"]["ok"] and fleet["arms"]["left"]["status"]["seq"] >= 0
+    assert fleet["arms"]["stuck"] == {"ok": False, "error": "timed out after 0.3s",
+                                      "elapsed_ms": pytest.approx(300, abs=100)}
+
+
+async def test_failing_bridge_is_ejected_and_rejoins(bridges):
+    port = _free_port()
+    gateway = Gateway({"left": bridges["left"], "late": f"http://{HOST}:{port}"},
+                      health_interval=0.1, health_timeout=0.5, eject_after=2)
+    async with await _gateway_client(gateway) as client:
+        deadline = time.monotonic() + 5
+        while (await client.get("/fleet")).json()["healthy"] != 1:
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+        start = time.monotonic()
+        resp = await client.get("/arms/late/status")
+        assert time.monotonic() - start < 0.1
+        assert resp.status_code == 503 and resp.headers["Retry-After"] == "1"
+        fleet = (await client.get("/fleet/status")).json()
+        assert fleet["ok"] == 1 and fleet["arms"]["late"]["error"].startswith("ejected")
+
+        proc = _start_bridge(port)
+        try:
+            _wait_up(port)
+            deadline = time.monotonic() + 5
+            while (snap := (await client.get("/fleet")).json())["healthy"] != 2:
+                assert time.monotonic() < deadline
+                await asyncio.sleep(0.05)
+            assert snap["bridges"]["late"]["ejections"] == 1
+            assert (await client.get("/arms/late/status")).status_code == 200
+        finally:
+            proc.terminate()
+            proc.wait()
+    await gateway.close()
@@ -0,0 +1,110 @@
+"""Tests for the capsule self-collision model."""
+
+import numpy as np
+import pytest
+
+from bridge.kinematics import (
+    ARM_MODELS,
+    NERO_MODEL,
+    PIPER_MODEL,
+    interpolate_joints,
+    segment_distances,
+)
+from bridge.models import DOF_MAP, MotionMode, RobotType
+from bridge.safety import JOINT_LIMITS_MAP, SafetyConfig, SafetyError, SafetyValidator
+
+PIPER_FOLDED = [0.0, 2.0, 2.5, 0.0, 0.0, 0.0]  # forearm folded back through the base
+
+
+@pytest.fixture
+def validator():
+    return SafetyValidator(SafetyConfig(enabled=True, max_speed_percent=80))
+
+
+def test_models_match_dof():
+    for robot, model in ARM_MODELS.items():
+        assert model.dof == DOF_MAP[robot]
+
+
+def test_zero_pose_points_straight_up():
+    points = PIPER_MODEL.points([0.0] * 6)[0]
+    assert points.shape == (8, 3)
+    assert points[-1] == pytest.approx([0.0, 0.0, 0.123 + 0.285 + 0.25 + 0.091])
+    assert not NERO_MODEL.self_collisions(np.zeros((1, 7)))[0]
+
+
+def test_folded_configuration_detected():
+    assert PIPER_MODEL.colliding_pair(PIPER_FOLDED) == ("base", "forearm")
+    assert PIPER_MODEL.colliding_pair([0.0, 2.0, 1.0, 0.0, 0.0, 0.0]) is None
+
+
+def test_batch_matches_single_checks():
+    q = np.random.default_rng(3).uniform(-2.0, 2.0, (500, 6))
+    q[::25, 1:3] = [2.0, 2.5]  # fold every 25th configuration
+    mask = PIPER_MODEL.self_collisions(q)
+    assert mask.any() and not mask.all()
+    for k in range(0, 500, 5):
+        assert mask[k] == (PIPER_MODEL.colliding_pair(q[k]) is not None)
+
+
+def test_segment_distances_against_sampling():
+    rng = np.random.default_rng(5)
+    seg = rng.normal(size=(50, 4, 3))
+    dist = segment_distances(seg[:, 0], seg[:, 1], seg[:, 2], seg[:, 3])
+    s = np.linspace(0.0, 1.0, 401)[:, None]
+    for k in range(50):
+        a = seg[k, 0] + s * (seg[k, 1] - seg[k, 0])
+        b = seg[k, 2] + s * (seg[k, 3] - seg[k, 2])
+        sampled = np.linalg.norm(a[:, None] - b[None], axis=2).min()
+        assert dist[k] == pytest.approx(sampled, abs=5e-3)
+        assert dist[k] <= sampled + 1e-9
+
+
+def test_interpolate_joints_step():
+    path = interpolate_joints([0.0, 0.0], [1.0, -0.5], max_step=0.1)
+    assert len(path) == 11
+    assert np.abs(np.diff(path, axis=0)).max() <= 0.1 + 1e-12
+    assert path[-1] == pytest.approx([1.0, -0.5])
+
+
+# --- Safety integration ---
+
+
+def test_joint_move_self_collision_rejected(validator: SafetyValidator):
+    with pytest.raises(SafetyError, match="Self-collision between base and forearm"):
+        validator.validate_joint_move(RobotType.PIPER, PIPER_FOLDED)
+
+
+def test_trajectory_reports_first_bad_point(validator: SafetyValidator):
+    trajectory = [[0.0] * 6, PIPER_FOLDED, [0.0] * 6]
+    with pytest.raises(SafetyError, match="Trajectory point 1 of 3: Self-collision"):
+        validator.validate_joint_trajectory(RobotType.PIPER, trajectory)
+    with pytest.raises(SafetyError, match="point 1 of 2: Joint 2"):
+        validator.validate_joint_trajectory(RobotType.PIPER, [[0.0] * 6, [0.0, 3.0, 0, 0, 0, 0]])
+    validator.validate_joint_trajectory(RobotType.PIPER, interpolate_joints([0.0] * 6, [0.5] * 6))
+
+
+def test_joint_move_checks_path_from_start(validator: SafetyValidator):
+    target = [0.0, 2.0, 1.0, 0.0, 0.0, 0.0]
+    validator.validate_move(RobotType.PIPER, MotionMode.J, target, start=[0.0] * 6)
+    with pytest.raises(SafetyError, match="Trajectory point 1 of 3: Self-collision"):
+        validator.validate_joint_trajectory(
+            RobotType.PIPER, [[0.0] * 6, PIPER_FOLDED, [0.0] * 6], from_start=True
+        )
+
+
+def test_flagged_start_can_move_to_clear_target(validator: SafetyValidator):
+    for target in ([0.0] * 6, [0.0, 2.0, 1.0, 0.0, 0.0, 0.0]):
+        validator.validate_move(RobotType.PIPER, MotionMode.J, target, start=PIPER_FOLDED)
+    deeper = [0.0, 2.0, 2.9, 0.0, 0.0, 0.0]
+    assert PIPER_MODEL.clearances([deeper]).min() < PIPER_MODEL.clearances([PIPER_FOLDED]).min()
+    with pytest.raises(SafetyError, match="overlap more than at the start"):
+        validator.validate_joint_trajectory(
+            RobotType.PIPER, [PIPER_FOLDED, deeper, [0.0] * 6], from_start=True
+        )
+    beyond_limit = [0.0] * 5 + [JOINT_LIMITS_MAP[RobotType.PIPER].limits[5][1] + 0.05]
+    validator.validate_move(RobotType.PIPER, MotionMode.J, [0.0] * 6, start=beyond_limit)
+
+
+def test_self_collision_skipped_when_disabled():
+    SafetyValidator(SafetyConfig(enabled=False)).validate_joint_move(RobotType.PIPER, PIPER_FOLDED)
@@ -0,0 +1,84 @@
+"""Tests for per-stage move latency (bridge.latency, Server-Timing on /move)."""
+
+import os
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.latency import LatencyHistograms, MoveTiming, feedback_moment, server_timing
+from bridge.server import app
+
+
+def test_stages_and_server_timing():
+    timing = MoveTiming(received=10.0)
+    assert timing.stages() == {}
+    timing.validated, timing.returned = 10.002, 10.0025
+    assert timing.stages() == {"validate": 2.0, "command": 0.5, "total": 2.5}
+    timing.moving, timing.finished = 10.0125, 10.5125
+    stages = timing.stages()
+    assert stages["motion_start"] == 10.0 and stages["motion"] == 500.0
+    assert stages["total"] == 512.5
+    assert server_timing(stages) == (
+        "validate;dur=2, command;dur=0.5, motion_start;dur=10, motion;dur=500, total;dur=512.5"
+    )
+
+
+def test_feedback_moment_uses_plausible_stamps_only():
+    observed = time.monotonic()
+    wall = time.time()
+    assert feedback_moment(wall - 0.004, observed) == pytest.approx(observed - 0.004, abs=1e-3)
+    assert feedback_moment(None, observed) == observed
+    assert feedback_moment(wall + 1.0, observed) == observed  # from the future
+    assert feedback_moment(123.0, observed) == observed  # another clock base
+
+
+def test_histogram_percentiles():
+    hist = LatencyHistograms(buckets=(1, 10, 100))
+    hist.record({"validate": 0.5, "motion": 50.0})
+    for ms in (0.2, 0.3, 5.0, 250.0):
+        hist.record({"validate": ms})
+    snap = hist.snapshot()
+    assert snap["le_ms"] == [1, 10, 100]
+    validate = snap["stages"]["validate"]
+    assert validate["counts"] == [3, 1, 0, 1] and validate["count"] == 5
+    assert validate["p50_ms"] == 1 and validate["p95_ms"] == 250.0
+    assert validate["mean_ms"] == pytest.approx(51.2)
+    assert snap["stages"]["motion"]["p50_ms"] == 50.0  # capped at the max seen
+    assert snap["stages"]["command"]["count"] == 0
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(arm_manager, "_create_driver",
+                        lambda: arm_manager.MockArmDriver(realtime=True))
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+        await c.post("/disconnect")
+    _srv._manager = None
+
+
+async def test_move_reports_stage_latency(client: AsyncClient):
+    resp = await client.post("/move", json={"mode": "J", "target": [0.2] + [0.0] * 5})
+    latency = resp.json()["data"]["latency"]
+    assert list(latency) == ["validate", "command", "motion_start", "motion", "total"]
+    assert latency["motion"] > 100  # 0.2 rad at 80% of the mock's 1.5 rad/s
+    assert latency["total"] == pytest.approx(sum(v for k, v in latency.items() if k != "total"),
+                                             abs=0.01)
+    timing = dict(item.split(";dur=") for item in resp.headers["Server-Timing"].split(", "))
+    assert {k: float(v) for k, v in timing.items()} == latency
+
+    resp = await client.post("/move", json={"mode": "J", "target": [0.0] * 6, "wait": False})
+    assert "motion" not in resp.json()["data"]["latency"]
+    assert "command;dur=" in resp.headers["Server-Timing"]
+    await client.get(f"/motions/{resp.json()['data']['motion_id']}/wait")
+
+    stages = (await client.get("/metrics")).json()["latency"]["stages"]
+    assert stages["validate"]["count"] == 2 and stages["motion"]["count"] == 2
@@ -0,0 +1,78 @@
+"""Tests for the off-thread sampled logging pipeline."""
+
+import io
+import json
+import logging
+import logging.config
+import threading
+import time
+
+import pytest
+
+from bridge import logs
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    logs.flush()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _record(lineno: int = 1, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("bridge.test", level, "driver.py", lineno, "move_j(%s)", ([0.1],),
+                             None)
+
+
+def test_sampling_is_per_call_site():
+    sampler = logs.SamplingFilter(rate=100, period=0.05)  # 5 records per 50 ms window
+    assert sum(sampler.filter(_record()) for _ in range(20)) == 5
+    assert sampler.filter(_record(lineno=2))  # another call site has its own budget
+    assert sampler.filter(_record(level=logging.WARNING))
+    time.sleep(0.06)
+    record = _record()
+    assert sampler.filter(record) and record.sampled_out == 15
+    assert logs.SamplingFilter(rate=0).filter(_record())
+
+
+def test_pipeline_formats_off_the_calling_thread(root_logger):
+    formatted_on = []
+
+    class Joints:
+        def __str__(self):
+            formatted_on.append(threading.current_thread().name)
+            return "[0.1, 0.2]"
+
+    out = io.StringIO()
+    logs.install(rate=5, stream=out)
+    log = logging.getLogger("bridge.drivers.mock_driver")
+    for _ in range(10):
+        log.info("MockDriver: move_j(%s)", Joints())
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        log.exception("failed")
+    log.debug("not at INFO")
+    logs.flush()
+
+    assert formatted_on and threading.current_thread().name not in formatted_on
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(lines) == 6
+    assert lines[0]["message"] == "MockDriver: move_j([0.1, 0.2])"
+    assert lines[0]["level"] == "INFO" and lines[0]["logger"] == "bridge.drivers.mock_driver"
+    assert lines[0]["thread"] == "MainThread"
+    assert lines[-1]["level"] == "ERROR" and "RuntimeError: boom" in lines[-1]["exception"]
+
+
+def test_uvicorn_config_routes_through_pipeline(root_logger, monkeypatch):
+    monkeypatch.setenv("CLAWARM_LOG_FORMAT", "text")
+    logging.config.dictConfig(logs.uvicorn_log_config())
+    (handler,) = root_logger.handlers
+    assert isinstance(handler, logs.DeferredQueueHandler)
+    assert logging.getLogger("uvicorn.access").level == logging.INFO
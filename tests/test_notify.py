@@ -0,0 +1,149 @@
+"""Tests for motion handles, long-poll waits and the status change feed."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.arm_manager import ArmManager
+from bridge.models import MotionMode, RobotType
+from bridge.notify import MotionState, MotionTracker, StatusFeed
+from bridge.server import app
+
+TARGET = [0.3] + [0.0] * 5  # ~0.4 s on the realtime Piper mock at default speed
+
+
+@pytest.fixture
+def realtime(monkeypatch):
+    monkeypatch.setenv("CLAWARM_MOCK_REALTIME", "true")
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+
+
+@pytest.fixture
+def manager(realtime):
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    yield mgr
+    mgr.disconnect()
+
+
+@pytest.fixture
+async def client(realtime):
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+    _srv._manager = None
+
+
+def test_tracker_settles_each_motion_once():
+    tracker = MotionTracker(history=3)
+    first = tracker.start({"mode": "J"})
+    second = tracker.start({"mode": "J"})
+    assert first.state == MotionState.SUPERSEDED
+    assert tracker.wait(first.id, 0)["state"] == "superseded"
+
+    assert tracker.wait(second.id, 0.01)["state"] == "running"
+    tracker.finish(second, completed=True)
+    tracker.stop_all()  # already settled: stays completed
+    assert tracker.wait(second.id, 0)["state"] == "completed"
+
+    third = tracker.start({"mode": "L"})
+    tracker.stop_all()
+    assert third.state == MotionState.STOPPED
+
+    for _ in range(3):
+        tracker.start({"mode": "J"})
+    assert tracker.get(first.id) is None  # aged out of the history
+    assert tracker.wait(999, 0) is None
+
+
+async def test_feed_numbers_changes_and_wakes_waiters():
+    feed = StatusFeed()
+    assert feed.observe({"joints": [0.0]}) == 1
+    assert feed.observe({"joints": [0.0]}) == 1
+    waiter = feed.waiter()
+    assert feed.waiting
+    threading.Thread(target=feed.observe, args=({"joints": [0.1]},)).start()
+    assert await asyncio.wait_for(waiter, 1.0) == 2
+    assert feed.latest == {"joints": [0.1], "seq": 2}
+    assert not feed.waiting
+
+
+async def test_unwaited_move_can_be_awaited(manager: ArmManager):
+    report = await manager.amove(MotionMode.J, TARGET, wait=False)
+    assert report["completed"] is None
+    pending = await manager.await_motion(report["motion_id"], 0.01)
+    assert pending["state"] == "running"
+
+    done = await manager.await_motion(report["motion_id"], 5.0)
+    assert done["state"] == "completed" and done["completed"] is True
+    assert done["elapsed"] >= done["estimated_duration"] * 0.5
+    assert manager.get_status()["joint_angles"] == pytest.approx(TARGET)
+
+
+def test_sync_watcher_and_supersede(manager: ArmManager):
+    first = manager.move(MotionMode.J, TARGET, wait=False)
+    second = manager.move(MotionMode.J, [0.0] * 6, wait=False)
+    assert manager.wait_motion(first["motion_id"], 1.0)["state"] == "superseded"
+    assert manager.wait_motion(second["motion_id"], 5.0)["state"] == "completed"
+
+
+async def test_estop_settles_pending_motion(manager: ArmManager):
+    report = await manager.amove(MotionMode.J, TARGET, wait=False)
+    await manager.astop(emergency=True)
+    assert (await manager.await_motion(report["motion_id"], 1.0))["state"] == "stopped"
+
+
+async def test_await_status_blocks_until_change(manager: ArmManager):
+    seq = (await manager.aget_status())["seq"]
+    start = time.monotonic()
+    unchanged = await manager.await_status(seq, 0.1)
+    assert unchanged["seq"] == seq and time.monotonic() - start >= 0.1
+
+    waiter = asyncio.ensure_future(manager.await_status(seq, 5.0))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    await manager.amove(MotionMode.J, TARGET, wait=False)
+    changed = await asyncio.wait_for(waiter, 1.0)
+    assert changed["seq"] > seq
+
+
+async def test_motion_wait_endpoint(client: AsyncClient):
+    await client.post("/connect", json={"robot": "piper"})
+    resp = await client.post("/move", json={"mode": "J", "target": TARGET, "wait": False})
+    motion_id = resp.json()["data"]["motion_id"]
+    assert f"id={motion_id}" in resp.json()["message"]
+
+    resp = await client.get(f"/motions/{motion_id}/wait", params={"timeout": 5})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["state"] == "completed"
+    assert resp.json()["message"] == f"Motion {motion_id}: completed"
+
+    assert (await client.get("/motions/999/wait", params={"timeout": 0})).status_code == 404
+    assert (await client.get(f"/motions/{motion_id}/wait?timeout=120")).status_code == 422
+
+
+async def test_status_changed_since_endpoint(client: AsyncClient):
+    await client.post("/connect", json={"robot": "piper"})
+    seq = (await client.get("/status")).json()["seq"]
+    resp = await client.get("/status", params={"changed_since": seq, "timeout": 0.05})
+    assert resp.json()["seq"] == seq
+
+    waiting = asyncio.ensure_future(
+        client.get("/status", params={"changed_since": seq, "timeout": 5})
+    )
+    await asyncio.sleep(0.05)
+    await client.post("/move", json={"mode": "J", "target": TARGET, "wait": False})
+    resp = await asyncio.wait_for(waiting, 2.0)
+    assert resp.json()["seq"] > seq
+
+    msgpack = {"Accept": "application/msgpack"}
+    resp = await client.get("/status?changed_since=x", headers=msgpack)
+    assert resp.status_code == 422
@@ -0,0 +1,205 @@
+"""Tests for the shared-memory telemetry block and the driver owner process."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager, telemetry
+from bridge.admission import Cancelled, Throttled
+from bridge.arm_manager import ArmManager
+from bridge.models import MotionMode, RobotType
+from bridge.owner import DriverOwner, RemoteAdmission
+from bridge.safety import SafetyError
+from bridge.state import JointState, Pose
+from bridge.telemetry import TelemetryBlock, TelemetryError
+
+STATUS = {
+    "connected": True,
+    "enabled": True,
+    "needs_enable": False,
+    "robot_type": "nero",
+    "dof": 7,
+    "joint_angles": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7],
+    "flange_pose": [0.3, 0.0, 0.4, 0.0, 0.0, 0.0],
+    "motion_status": 1,
+    "seq": 5,
+}
+
+
+def fast_manager() -> ArmManager:
+    """Owner-process factory: skip the real mode-switch delays."""
+    arm_manager.MODE_SWITCH_DELAY = 0
+    return ArmManager()
+
+
+@pytest.fixture
+def block():
+    block = TelemetryBlock(create=True)
+    yield block
+    block.close()
+
+
+@pytest.fixture(scope="module")
+def owner():
+    with DriverOwner(fast_manager) as owner:
+        yield owner
+
+
+def test_block_round_trip(block: TelemetryBlock):
+    seq, _, status = block.read()
+    assert seq == 0 and status == {"connected": False, "enabled": False, "seq": 0}
+
+    assert block.publish(STATUS) == 2
+    reader = TelemetryBlock(block.name)
+    seq, _, status = reader.read()
+    assert seq == 2
+    assert isinstance(status["joint_angles"], JointState)
+    assert isinstance(status["flange_pose"], Pose)
+    assert status == pytest.approx(STATUS)
+    reader.close()
+
+    block.publish({**STATUS, "joint_angles": None, "motion_status": None})
+    status = block.read()[2]
+    assert status["joint_angles"] is None and status["motion_status"] is None
+
+
+def test_reader_never_sees_a_torn_write(block: TelemetryBlock):
+    done = threading.Event()
+
+    def writer():
+        for i in range(5000):
+            block.publish({**STATUS, "joint_angles": [float(i)] * 7, "flange_pose": [i] * 6})
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not done.is_set():
+        _, _, status = block.read()
+        if status["connected"]:
+            assert len(set(status["joint_angles"] + status["flange_pose"])) == 1
+    thread.join()
+
+
+def test_read_gives_up_while_write_in_progress(block: TelemetryBlock, monkeypatch):
+    monkeypatch.setattr(telemetry, "READ_TIMEOUT", 0.01)
+    telemetry._SEQ.pack_into(block._buf, 0, 1)
+    with pytest.raises(TelemetryError):
+        block.read()
+
+
+def test_owner_round_trip(owner: DriverOwner):
+    remote = owner.remote()
+    try:
+        assert not remote.connected
+        assert "piper" in remote.connect(RobotType.PIPER)
+        # The owner publishes before it replies, so reads already see the connection.
+        assert remote.connected and remote.enabled
+        assert remote.robot_type == RobotType.PIPER and remote.dof == 6
+
+        report = remote.move(MotionMode.J, [0.1, 0, 0, 0, 0, 0], speed_percent=20)
+        assert report["completed"] is True
+        assert remote.get_status()["joint_angles"] == pytest.approx([0.1, 0, 0, 0, 0, 0])
+
+        with pytest.raises(SafetyError):
+            remote.move(MotionMode.J, [10.0, 0, 0, 0, 0, 0])
+
+        batch = remote.run_batch([{"op": "speed", "speed_percent": 30}, {"op": "status"}])
+        assert batch["completed"] and batch["ops"][0]["result"] == {"speed_percent": 30}
+
+        assert remote.metrics()["telemetry"]["seq"] > 0
+        assert remote.stop(emergency=True) == "EMERGENCY STOP executed"
+        assert remote.disconnect() == "Disconnected"
+        assert not remote.connected
+    finally:
+        remote.close()
+
+
+async def test_async_api_and_concurrent_workers(owner: DriverOwner):
+    first, second = owner.remote(), owner.remote()
+    try:
+        await first.aget_status()
+        first.connect(RobotType.NERO)
+        status = await second.aget_status()
+        assert status["robot_type"] == "nero" and status["dof"] == 7
+
+        seq = (await first.aget_status())["seq"]
+        report = await second.amove(MotionMode.J, [0.2] + [0.0] * 6, wait=False)
+        assert (await first.await_status(seq, 1.0))["seq"] != seq
+        motion = await first.await_motion(report["motion_id"], 1.0)
+        assert motion["state"] == "completed"
+        assert await first.await_motion(999, 0) is None
+        assert (await first.aget_status())["joint_angles"][0] == pytest.approx(0.2)
+        assert await first.adisable() is True
+        assert not second.enabled
+        assert await second.aenable() is True
+        assert await first.astop() == "Arm disabled"
+    finally:
+        first.disconnect()
+        first.close()
+        second.close()
+
+
+async def test_workers_share_the_arms_admission(owner: DriverOwner, caplog):
+    remotes = [owner.remote(), owner.remote()]
+    first, second = (RemoteAdmission(remote) for remote in remotes)
+    try:
+        for i in range(20):  # one client's burst, spread over both workers
+            await (first, second)[i % 2].acheck("agent")
+        with pytest.raises(Throttled, match="client 'agent'") as exc:
+            await second.acheck("agent")
+        assert exc.value.retry_after > 0
+        with pytest.raises(Throttled, match="the arm"):  # 40 tokens for the arm, not per worker
+            for i in range(60):
+                await (first, second)[i % 2].acheck(f"client-{i}")
+
+        await first.queue.acquire()
+        waiting = asyncio.ensure_future(second.queue.acquire())
+        await asyncio.sleep(0.05)
+        snapshot = (await second.asnapshot())["queue"]
+        assert snapshot["busy"] and snapshot["depth"] == 1
+        await first.queue.arelease()
+        await asyncio.wait_for(waiting, 1.0)  # the slot passed to the other worker
+
+        waiting = asyncio.ensure_future(first.queue.acquire())
+        await asyncio.sleep(0.05)
+        assert await second.queue.aclear("stopped") == 1
+        with pytest.raises(Cancelled, match="stopped"):
+            await asyncio.wait_for(waiting, 1.0)
+        await second.queue.arelease()
+        assert not (await first.asnapshot())["queue"]["busy"]
+
+        def unavailable(*args):
+            raise RuntimeError("Driver owner unavailable: gone")
+
+        remotes[0]._call = unavailable
+        await first.queue.arelease()  # logged, not raised: the command has already run
+        assert "Releasing the motion queue slot failed" in caplog.text
+    finally:
+        for remote in remotes:
+            remote.close()
+
+
+async def test_scripts_hold_the_owners_motion_queue_slot(owner: DriverOwner, monkeypatch):
+    for name, value in owner.env().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(_srv, "_manager", None)
+    monkeypatch.setattr(_srv, "_admission", None)
+    remote = owner.remote()
+    admission = RemoteAdmission(remote)
+    async with AsyncClient(transport=ASGITransport(app=_srv.app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        script = asyncio.ensure_future(c.post("/scripts/run", json={
+            "source": "import time\ntime.sleep(0.3)\n"}))
+        await asyncio.sleep(0.15)
+        assert admission.snapshot()["queue"]["busy"]  # seen by every worker, not just this one
+        assert (await script).status_code == 200
+        assert not admission.snapshot()["queue"]["busy"]
+        await c.post("/disconnect")
+    _srv._manager.close()
+    remote.close()
@@ -0,0 +1,134 @@
+"""Tests for reachability voxel maps and their use in safety validation."""
+
+import math
+import os
+
+import numpy as np
+import pytest
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from bridge import arm_manager
+from bridge.arm_manager import ArmManager, manager_from_env
+from bridge.models import MotionMode, RobotType
+from bridge.reachability import (
+    UNREACHABLE,
+    ReachabilityMap,
+    _close,
+    build_map,
+    load_maps,
+    main,
+    save_map,
+)
+from bridge.safety import SafetyConfig, SafetyError, SafetyValidator
+from bridge.sequence import Step
+
+VOXEL = 0.04
+REACHABLE = [0.3, 0.0, 0.3, 0.0, math.pi, 0.0]
+BEYOND = [0.98, 0.0, 0.25, 0.0, math.pi, 0.0]  # inside the workspace box, out of reach
+
+
+@pytest.fixture(scope="module")
+def piper_map(tmp_path_factory) -> tuple:
+    grid, meta = build_map(RobotType.PIPER, samples=100_000, voxel=VOXEL, workers=1)
+    directory = tmp_path_factory.mktemp("reachability")
+    save_map(directory, grid, meta)
+    return directory, grid, meta
+
+
+def test_map_covers_the_reach_but_not_the_base(piper_map):
+    _, grid, meta = piper_map
+    rmap = ReachabilityMap(grid, meta["origin"], meta["voxel"])
+    assert rmap.lookup(REACHABLE[:3]) > 0
+    assert rmap.lookup([0.0, 0.0, 0.0]) == UNREACHABLE  # inside the base
+    assert rmap.lookup(BEYOND[:3]) == UNREACHABLE
+    assert rmap.lookup([5.0, 0.0, 0.0]) == UNREACHABLE  # outside the grid
+    assert meta["reachable_voxels"] == int((grid >= 0).sum())
+
+
+def test_lookup_many_matches_lookup(piper_map):
+    _, grid, meta = piper_map
+    rmap = ReachabilityMap(grid, meta["origin"], meta["voxel"])
+    points = np.random.default_rng(1).uniform(-1.0, 1.0, size=(500, 3))
+    assert rmap.lookup_many(points).tolist() == [rmap.lookup(p) for p in points]
+
+
+def test_saved_maps_are_memory_mapped_and_shared_by_variants(piper_map):
+    directory, grid, _ = piper_map
+    maps = load_maps(directory)
+    assert isinstance(maps[RobotType.PIPER].grid, np.memmap)
+    assert np.array_equal(maps[RobotType.PIPER].grid, grid)
+    assert maps[RobotType.PIPER_H] is maps[RobotType.PIPER]
+    assert RobotType.NERO not in maps
+
+
+def test_pool_build_matches_serial_build():
+    serial, _ = build_map(RobotType.NERO, samples=20_000, voxel=0.05, workers=1, seed=3)
+    pooled, _ = build_map(RobotType.NERO, samples=20_000, voxel=0.05, workers=2, seed=3)
+    assert np.array_equal(serial, pooled)
+
+
+def test_close_fills_holes_but_not_the_outside():
+    grid = np.full((5, 5, 5), UNREACHABLE)
+    grid[1:4, 1:4, 1:4] = 0.5
+    grid[2, 2, 2] = UNREACHABLE  # a sampling hole
+    closed = _close(grid)
+    assert closed[2, 2, 2] == 0.5
+    assert (closed[0] == UNREACHABLE).all()
+    assert np.array_equal(closed[grid >= 0], grid[grid >= 0])
+
+
+def test_validator_rejects_unreachable_positions(piper_map):
+    directory, _, _ = piper_map
+    v = SafetyValidator(SafetyConfig(reachability=load_maps(directory)))
+    v.validate_move(RobotType.PIPER, MotionMode.P, REACHABLE)
+    with pytest.raises(SafetyError, match="reachable workspace of piper"):
+        v.validate_move(RobotType.PIPER, MotionMode.P, BEYOND)
+    # Both ends reachable, but the straight line passes through the base.
+    opposite = [-0.3, 0.0, 0.05, 0.0, math.pi, 0.0]
+    low = [0.3, 0.0, 0.05, 0.0, math.pi, 0.0]
+    v.validate_move(RobotType.PIPER, MotionMode.P, opposite)
+    with pytest.raises(SafetyError, match="reachable"):
+        v.validate_move(RobotType.PIPER, MotionMode.L, opposite, start=low)
+    # An arm that is somewhere the map calls unreachable may still move back in a line.
+    v.validate_move(RobotType.PIPER, MotionMode.L, REACHABLE, start=BEYOND)
+    # No map for NERO: only the workspace box applies.
+    v.validate_move(RobotType.NERO, MotionMode.P, BEYOND)
+    SafetyValidator(
+        SafetyConfig(enabled=False, reachability=load_maps(directory))
+    ).validate_move(RobotType.PIPER, MotionMode.P, BEYOND)
+
+
+def test_validator_min_manipulability(piper_map):
+    directory, _, _ = piper_map
+    v = SafetyValidator(SafetyConfig(reachability=load_maps(directory), min_manipulability=1.0))
+    with pytest.raises(SafetyError, match="singularity"):
+        v.validate_move(RobotType.PIPER, MotionMode.P, REACHABLE)
+
+
+def test_manager_from_env_loads_maps(piper_map, monkeypatch):
+    directory, _, _ = piper_map
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setenv("CLAWARM_REACHABILITY", str(directory))
+    mgr = manager_from_env()
+    mgr.connect(RobotType.PIPER)
+    mgr.move(MotionMode.P, REACHABLE)
+    with pytest.raises(SafetyError, match="reachable"):
+        mgr.move(MotionMode.P, BEYOND)
+    with pytest.raises(SafetyError, match="reachable"):
+        mgr.move_sequence([Step(MotionMode.L, [0.6, 0.0, 0.3, 0.0, math.pi, 0.0]),
+                           Step(MotionMode.L, BEYOND)])
+    assert mgr.get_status()["flange_pose"][:3] == pytest.approx(REACHABLE[:3])
+    mgr.disconnect()
+
+
+def test_manager_without_maps_is_unchanged():
+    mgr = ArmManager()
+    assert mgr._safety.config.reachability == {}
+
+
+def test_cli_writes_maps(tmp_path, capsys):
+    main(["--out", str(tmp_path), "--robot", "nero", "--samples", "5000", "--voxel", "0.1",
+          "--workers", "1"])
+    assert (tmp_path / "nero.npy").exists() and (tmp_path / "nero.json").exists()
+    assert "reachable" in capsys.readouterr().out
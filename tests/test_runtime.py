@@ -0,0 +1,63 @@
+"""Tests for the clawarm.runtime script helpers (mock driver)."""
+
+import os
+import runpy
+import time
+from pathlib import Path
+
+import pytest
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from bridge import arm_manager
+from bridge.arm_manager import ArmManager
+from bridge.drivers.mock_driver import MockArmDriver
+from bridge.models import RobotType
+from clawarm import runtime
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+def test_connect_skips_only_the_sleep_before_the_mode_switch():
+    assert arm_manager.MODE_SWITCH_DELAY >= 1.0
+    start = time.monotonic()
+    with runtime.connect("piper", speed=50) as arm:
+        elapsed = time.monotonic() - start
+        assert arm_manager.MODE_SWITCH_DELAY <= elapsed < arm_manager.MODE_SWITCH_DELAY + 0.5
+        assert (arm.robot, arm.dof) == ("piper", 6)
+        assert arm.set_speed(95) == 80  # capped by the safety limit
+
+
+def test_adaptive_connect_waits_for_telemetry(monkeypatch):
+    reads = []
+
+    class SlowStart(MockArmDriver):
+        def get_motion_status(self):
+            reads.append(time.monotonic())
+            return None if len(reads) < 3 else super().get_motion_status()
+
+    monkeypatch.setattr(arm_manager, "_create_driver", SlowStart)
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER, adaptive=True)
+    assert len(reads) == 3 and mgr.enabled
+    mgr.disconnect()
+
+
+def test_moves_wait_and_validate():
+    with runtime.connect("piper", speed=80) as arm:
+        assert arm.move_j([0.3, 0.0, 0.0, 0.0, 0.0, 0.0]) is True
+        assert arm.joint_angles()[0] == pytest.approx(0.3)
+        assert arm.move_p([0.3, 0.0, 0.3, 0.0, 3.1416, 0.0])
+        assert arm.flange_pose()[:3] == pytest.approx([0.3, 0.0, 0.3])
+        with pytest.raises(runtime.SafetyError):
+            arm.move_j([9.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        assert arm.joint_angles()[0] == pytest.approx(0.3)
+        manager = arm._manager
+    assert not manager.connected
+
+
+def test_hello_arm_example_runs_on_the_mock(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["hello_arm.py", "--robot", "piper"])
+    runpy.run_path(str(EXAMPLES / "hello_arm.py"), run_name="__main__")
+    out = capsys.readouterr().out
+    assert "Home position reached" in out and out.endswith("Done.\n")
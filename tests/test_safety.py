@@ -116,3 +116,21 @@ def test_validate_move_arc(validator: SafetyValidator):
     mid = [0.3, 0.05, 0.3, 0.0, 0.0, 0.0]
     end = [0.3, 0.0, 0.3, 0.0, 0.0, 0.0]
     validator.validate_move(RobotType.NERO, MotionMode.C, start, mid, end)
+
+
+# --- Path validation ---
+
+
+def test_validate_cartesian_path(validator: SafetyValidator):
+    path = [
+        [0.3, 0.0, 0.3, 0.0, 0.0, 0.0],
+        [0.3, 0.2, 0.3, 0.0, 0.0, 0.0],
+        [0.5, 0.2, 0.3, 0.0, 0.0, 0.0],
+    ]
+    validator.validate_cartesian_path(path, blend_radius=0.05)
+
+
+def test_validate_cartesian_path_rejects_waypoint(validator: SafetyValidator):
+    path = [[0.3, 0.0, 0.3, 0.0, 0.0, 0.0], [0.3, 0.0, 1.5, 0.0, 0.0, 0.0]]
+    with pytest.raises(SafetyError, match="Z="):
+        validator.validate_cartesian_path(path)
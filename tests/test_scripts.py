@@ -0,0 +1,176 @@
+"""Tests for running clawarm.runtime scripts inside the bridge (POST /scripts/run)."""
+
+import asyncio
+import json
+import os
+import re
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.admission import Admission
+from bridge.scripts import SAFE_BUILTINS, ScriptError, check_script
+from bridge.server import app
+
+SCRIPT = """\
+import math
+from clawarm import runtime
+
+
+def main():
+    with runtime.connect("piper", speed=50) as arm:
+        print("dof", arm.dof)
+        arm.move_j([0.2] + [0.0] * (arm.dof - 1))
+        arm.move_p([0.3, 0.0, 0.3, 0.0, math.pi, 0.0])
+        print("pose", [round(v, 3) for v in arm.flange_pose()[:3]])
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+@pytest.mark.parametrize("source, problem", [
+    ("import os", "import of 'os'"),
+    ("from pyAgxArm import AgxArmFactory", "import from 'pyAgxArm'"),
+    ("x = ().__class__", "attribute '__class__'"),
+    ("open('/etc/passwd')", "open()"),
+    ("def g():\n    yield 1\nf = g().gi_frame", "attribute 'gi_frame'"),
+    ("try:\n    pass\nexcept:\n    pass", "bare except"),
+    ("'{0._manager._driver}'.format(arm)", "format field {0._manager._driver}"),
+    ("'{0:{1[0]}}'.format(1, 'x')", "format field {1[0]}"),
+    ("t = '{0.x}'\nt.format(1)", "format() is only allowed on string literals"),
+    ("str.format_map('{x}', {})", "format_map() is only allowed on string literals"),
+    ("print(", "Syntax error"),
+])
+def test_check_script_rejects(source, problem):
+    with pytest.raises(ScriptError, match=re.escape(problem)):
+        check_script(source)
+
+
+def test_check_script_accepts_generated_scripts():
+    check_script(SCRIPT)
+    check_script("print('{:.3f} at {}'.format(1.0, 'x'))")
+    assert "format" not in SAFE_BUILTINS
+    check_script("import clawarm.runtime as rt\nimport time\ntime.sleep(0)")
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+    _srv._manager = None
+
+
+async def _run(client: AsyncClient, source: str, **params) -> list[dict]:
+    resp = await client.post("/scripts/run", json={"source": source, **params})
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+async def test_script_runs_against_the_connected_arm(client: AsyncClient):
+    events = await _run(client, SCRIPT)
+    kinds = [e["event"] for e in events]
+    assert kinds == ["start", "output", "move", "move", "output", "end"]
+    assert events[0]["robot"] == "piper"
+    assert events[1]["text"] == "dof 6"
+    assert events[2]["motion"]["mode"] == "J" and events[2]["motion"]["completed"] is True
+    assert events[4]["text"] == "pose [0.3, 0.0, 0.3]"
+    end = events[-1]
+    assert end["ok"] is True and end["error"] is None and end["moves"] == 2
+    assert [e["t"] for e in events] == sorted(e["t"] for e in events)
+    # The arm stays connected for the bridge after the script's ``with`` block.
+    status = (await client.get("/status")).json()
+    assert status["connected"] and status["enabled"]
+
+
+async def test_unsafe_move_ends_the_script(client: AsyncClient):
+    source = (
+        "from clawarm import runtime\n"
+        "arm = runtime.connect()\n"
+        "arm.move_j([9.0, 0, 0, 0, 0, 0])\n"
+        "print('not reached')\n"
+    )
+    events = await _run(client, source)
+    end = events[-1]
+    assert end["ok"] is False and end["moves"] == 0
+    assert end["error"].startswith("line 3: SafetyError:")
+    assert "output" not in [e["event"] for e in events]
+
+
+async def test_script_is_aborted_at_its_timeout(client: AsyncClient):
+    events = await _run(client, "while True:\n    pass\n", timeout=0.2)
+    assert events[-1]["error"] == "Aborted: timed out after 0.2s"
+    events = await _run(client, "import time\ntime.sleep(30)\n", timeout=0.2)
+    assert events[-1]["error"] == "Aborted: timed out after 0.2s"
+    assert events[-1]["elapsed"] < 1.0
+    events = await _run(client, "try:\n    while True:\n        pass\nexcept Exception:\n"
+                                "    print('swallowed')\n", timeout=0.2)
+    assert events[-1]["error"].startswith("Aborted")
+
+
+async def test_long_ranges_fail_instead_of_running_in_c(client: AsyncClient):
+    events = await _run(client, "print(sum(range(10)))\nsum(range(10**12))\n", timeout=0.2)
+    assert events[1]["text"] == "45"
+    assert events[-1]["error"] == "line 2: ValueError: range() is limited to 1000000 items" \
+        " in scripts"
+    assert events[-1]["elapsed"] < 0.2
+
+
+async def test_script_holds_the_motion_queue_slot(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(_srv, "_admission", Admission(client_rate=5, client_burst=2, arm_rate=0,
+                                                       queue_depth=0))
+    source = (
+        "import time\n"
+        "from clawarm import runtime\n"
+        "arm = runtime.connect()\n"
+        "for a in (0.1, 0.2, 0.3):\n"
+        "    arm.move_j([a, 0, 0, 0, 0, 0])\n"
+        "time.sleep(0.5)\n"
+    )
+
+    async def move_later():
+        await asyncio.sleep(0.3)
+        return await client.post("/move", json={"mode": "J", "target": [0.0] * 6})
+
+    resp, move = await asyncio.gather(client.post("/scripts/run", json={"source": source},
+                                                  headers={"X-Client-ID": "script"}),
+                                      move_later())
+    end = json.loads(resp.text.splitlines()[-1])
+    assert end["ok"] is True and end["moves"] == 3
+    assert move.status_code == 429 and "queue full" in move.json()["detail"]
+    # The request and the first move emptied the client's bucket; later moves waited.
+    assert _srv._admission.snapshot()["throttled"]["client"] >= 2
+    assert not _srv._admission.snapshot()["queue"]["busy"]
+
+
+async def test_script_for_another_robot_fails(client: AsyncClient):
+    events = await _run(client, "from clawarm import runtime\nruntime.connect('nero')\n")
+    assert "asks for nero but the bridge is connected to piper" in events[-1]["error"]
+
+
+async def test_rejections(client: AsyncClient):
+    resp = await client.post("/scripts/run", json={"source": "import subprocess"})
+    assert resp.status_code == 422 and "Script rejected" in resp.json()["detail"]
+
+    async def later():
+        await asyncio.sleep(0.1)
+        return await client.post("/scripts/run", json={"source": "x = 1"})
+
+    first, resp = await asyncio.gather(
+        client.post("/scripts/run", json={"source": "import time\ntime.sleep(0.5)\n"}),
+        later(),
+    )
+    assert first.status_code == 200 and resp.status_code == 409
+
+    await client.post("/disconnect")
+    resp = await client.post("/scripts/run", json={"source": "x = 1"})
+    assert resp.status_code == 400
@@ -0,0 +1,105 @@
+"""Tests for the blended waypoint sequence executor."""
+
+import pytest
+
+from bridge import arm_manager, sequence
+from bridge.arm_manager import ArmManager
+from bridge.drivers.mock_driver import MockArmDriver
+from bridge.models import MotionMode, RobotType
+from bridge.sequence import SequenceExecutor, Step, cartesian_runs
+
+ORIENTATION = [0.0, 3.14159, 0.0]
+
+
+def _pose(x, y, z):
+    return [x, y, z, *ORIENTATION]
+
+
+def _square(mode=MotionMode.L):
+    return [
+        Step(mode=mode, target=_pose(0.30, 0.05, 0.30)),
+        Step(mode=mode, target=_pose(0.35, 0.05, 0.30)),
+        Step(mode=mode, target=_pose(0.35, 0.00, 0.30)),
+        Step(mode=mode, target=_pose(0.30, 0.00, 0.30)),
+    ]
+
+
+@pytest.fixture
+def driver():
+    d = MockArmDriver(realtime=True)
+    d.connect("nero", "can0", "socketcan")
+    d.enable()
+    d.set_speed_percent(100)
+    d._flange_pose = _pose(0.30, 0.00, 0.30)
+    return d
+
+
+def test_unblended_sequence_reaches_every_waypoint(driver: MockArmDriver):
+    result = SequenceExecutor(driver, blend_radius=0.0).run(_square())
+    assert result.completed
+    assert result.blended == 0
+    assert driver.get_flange_pose()[:3] == pytest.approx([0.30, 0.00, 0.30])
+
+
+def test_blending_cuts_cycle_time(driver: MockArmDriver):
+    stopped = SequenceExecutor(driver, blend_radius=0.0).run(_square())
+    blended = SequenceExecutor(driver, blend_radius=0.02).run(_square())
+    assert blended.completed
+    assert blended.blended == 3  # every corner except the final waypoint
+    assert blended.cycle_time < stopped.cycle_time
+    assert driver.get_motion_status() == 0
+
+
+def test_no_blend_across_mode_change(driver: MockArmDriver):
+    steps = _square(MotionMode.L)
+    steps[2] = Step(mode=MotionMode.P, target=steps[2].target)
+    result = SequenceExecutor(driver, blend_radius=0.02).run(steps)
+    assert result.completed
+    assert result.blended == 1
+
+
+def test_blocking_mock_sequence_completes():
+    d = MockArmDriver()
+    d.connect("piper", "can0", "socketcan")
+    d.enable()
+    steps = [Step(mode=MotionMode.J, target=[0.1] * 6), *_square()]
+    result = SequenceExecutor(d, blend_radius=0.02).run(steps)
+    assert result.completed
+    assert d.get_joint_angles() == pytest.approx([0.1] * 6)
+
+
+def test_step_timeout_applies_per_step_unless_a_timeout_is_given(driver: MockArmDriver):
+    asked = []
+
+    def step_timeout(step):
+        asked.append(step.target)
+        return 0.001
+
+    steps = _square()[1:]
+    result = SequenceExecutor(driver, step_timeout=step_timeout).run(steps)
+    assert result.completed_steps == 0 and asked == [steps[0].target]
+    result = SequenceExecutor(driver, timeout=5.0, step_timeout=step_timeout).run(steps)
+    assert result.completed and len(asked) == 1
+
+
+def test_manager_sequence_waits_on_predicted_durations(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(arm_manager, "_create_driver", lambda: MockArmDriver(realtime=True))
+    monkeypatch.setattr(sequence, "DEFAULT_STEP_TIMEOUT", 0.05)  # must not be what it uses
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    try:
+        steps = [Step(MotionMode.J, [0.3] * 6, speed_percent=20), Step(MotionMode.J, [0.0] * 6)]
+        result = mgr.move_sequence(steps)
+        assert result["completed"] and result["cycle_time"] > 0.1
+        assert not mgr.move_sequence(steps, timeout=0.1)["completed"]
+    finally:
+        mgr.disconnect()
+
+
+def test_cartesian_runs_split_on_mode():
+    steps = _square()
+    steps.insert(2, Step(mode=MotionMode.J, target=[0.0] * 7))
+    start = _pose(0.3, 0.0, 0.3)
+    runs = list(cartesian_runs(steps, start))
+    assert runs == [[start, steps[0].target, steps[1].target], [steps[3].target, steps[4].target]]
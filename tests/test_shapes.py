@@ -0,0 +1,170 @@
+"""Tests for the shape compiler and POST /shapes."""
+
+import math
+import os
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.frames import rpy_to_matrix
+from bridge.models import MotionMode
+from bridge.safety import SafetyConfig, SafetyValidator
+from bridge.server import app
+from bridge.shapes import ShapeError, _spiral_fit, compile_shapes
+from bridge.zones import Sphere, Zone
+
+ORIGIN = [0.0, 0.0, 0.3]
+FLAT = [0.0, 0.0, 0.0]
+CIRCLE = {"kind": "circle", "center": [0.3, 0.0], "radius": 0.05, "start_angle": 0.0,
+          "clockwise": False}
+SPIRAL = {"kind": "spiral", "center": [0.3, 0.0], "start_radius": 0.01, "end_radius": 0.06,
+          "turns": 3, "start_angle": 0.0, "clockwise": False}
+
+
+def _modes(steps):
+    return [step.mode for step in steps]
+
+
+def test_circle_is_two_arcs_on_the_circle():
+    steps, summary = compile_shapes([CIRCLE], ORIGIN, FLAT)
+    assert _modes(steps) == [MotionMode.P, MotionMode.C, MotionMode.C]
+    assert summary["shapes"] == [{"kind": "circle", "lines": 0, "arcs": 2, "travel": True}]
+    for step in steps[1:]:
+        for point in (step.target, step.mid_point, step.end_point):
+            assert math.dist(point[:2], [0.3, 0.0]) == pytest.approx(0.05)
+            assert point[2:] == pytest.approx([0.3, 0.0, math.pi, 0.0])
+    assert steps[2].end_point[:2] == pytest.approx([0.35, 0.0])
+    assert steps[1].mid_point[:2] == pytest.approx([0.3, 0.05])  # counter-clockwise
+
+
+def test_arc_splits_into_half_turns():
+    arc = {"kind": "arc", "center": [0.3, 0.0], "radius": 0.05, "start_angle": 0.0,
+           "sweep": -1.5 * math.pi}
+    steps, _ = compile_shapes([arc], ORIGIN, FLAT)
+    assert _modes(steps) == [MotionMode.P, MotionMode.C, MotionMode.C]
+    assert steps[-1].end_point[:2] == pytest.approx([0.3, 0.05])
+    with pytest.raises(ShapeError, match="zero"):
+        compile_shapes([{**arc, "sweep": 0.0}], ORIGIN, FLAT)
+
+
+@pytest.mark.parametrize("tolerance", [0.002, 0.0005, 0.0001])
+def test_spiral_uses_fewest_pieces_within_tolerance(tolerance):
+    steps, summary = compile_shapes([SPIRAL], ORIGIN, FLAT, tolerance=tolerance)
+    pieces = summary["shapes"][0]["arcs"]
+    assert pieces >= 6  # at most half a turn per arc
+    assert _spiral_fit(SPIRAL, pieces)[2] <= tolerance
+    if pieces > 6:
+        assert _spiral_fit(SPIRAL, pieces - 1)[2] > tolerance
+    assert steps[-1].end_point[:2] == pytest.approx([0.36, 0.0])
+
+
+def test_raster_alternates_passes():
+    raster = {"kind": "raster", "corner": [0.25, -0.05], "width": 0.1, "height": 0.02,
+              "spacing": 0.01, "angle": 0.0}
+    steps, summary = compile_shapes([raster], ORIGIN, FLAT)
+    assert summary["shapes"][0]["lines"] == 5  # 3 passes, 2 step-overs
+    xy = [step.target[:2] for step in steps]
+    assert np.array(xy) == pytest.approx(np.array([
+        [0.25, -0.05], [0.35, -0.05], [0.35, -0.04], [0.25, -0.04], [0.25, -0.03],
+        [0.35, -0.03],
+    ]))
+
+
+def test_polyline_fillets_are_tangent_arcs():
+    square = {"kind": "polyline", "points": [[0.25, -0.05], [0.35, -0.05], [0.35, 0.05],
+                                              [0.25, 0.05]], "corner_radius": 0.01,
+              "closed": True}
+    steps, summary = compile_shapes([square], ORIGIN, FLAT)
+    assert summary["shapes"][0] == {"kind": "polyline", "lines": 5, "arcs": 4, "travel": True}
+    assert steps[0].target[:2] == pytest.approx([0.3, -0.05])  # middle of the first edge
+    first_arc = steps[2]
+    assert first_arc.target[:2] == pytest.approx([0.34, -0.05])
+    assert first_arc.end_point[:2] == pytest.approx([0.35, -0.04])
+    center = [0.34, -0.04]
+    assert math.dist(first_arc.mid_point[:2], center) == pytest.approx(0.01)
+    assert steps[-1].target[:2] == pytest.approx([0.3, -0.05])
+
+    sharp, summary = compile_shapes([{**square, "corner_radius": 0.0}], ORIGIN, FLAT)
+    assert summary["shapes"][0]["arcs"] == 0 and len(sharp) == 1 + 5
+
+
+def test_plane_maps_shapes_and_orientation():
+    upright = {"origin": [0.3, 0.0, 0.3], "rotation": [math.pi / 2, 0.0, 0.0]}  # x-z plane
+    steps, _ = compile_shapes(
+        [{**CIRCLE, "center": [0.0, 0.0]}], upright["origin"], upright["rotation"]
+    )
+    for step in steps[1:]:
+        assert step.mid_point[1] == pytest.approx(0.0)  # stays in the plane
+    assert steps[1].mid_point[:3] == pytest.approx([0.3, 0.0, 0.35])
+    # The tool points into the plane: along +y for the x-z plane rotated this way.
+    assert rpy_to_matrix(steps[0].target[3:])[:, 2] == pytest.approx([0.0, 1.0, 0.0])
+
+    steps, _ = compile_shapes([CIRCLE], ORIGIN, FLAT, orientation=[0.1, 0.2, 0.3])
+    assert steps[1].end_point[3:] == [0.1, 0.2, 0.3]
+
+
+def test_consecutive_shapes_share_endpoints_without_travel():
+    line = {"kind": "polyline", "points": [[0.2, 0.0], [0.35, 0.0]], "corner_radius": 0.0,
+            "closed": False}
+    steps, summary = compile_shapes([line, CIRCLE], ORIGIN, FLAT, speed_percent=30)
+    assert summary["shapes"][1]["travel"] is False
+    assert _modes(steps) == [MotionMode.P, MotionMode.L, MotionMode.C, MotionMode.C]
+    assert steps[0].speed_percent == 30
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+    _srv._manager = None
+
+
+async def test_shapes_endpoint_runs_the_segments(client: AsyncClient):
+    resp = await client.post("/shapes", json={
+        "shapes": [CIRCLE, SPIRAL], "plane": {"origin": ORIGIN},
+    })
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["message"].startswith("2 shape(s) in ")
+    data = body["data"]
+    assert data["completed"] is True
+    assert [s["kind"] for s in data["shapes"]] == ["circle", "spiral"]
+    status = (await client.get("/status")).json()
+    assert status["flange_pose"][:3] == pytest.approx([0.36, 0.0, 0.3])
+
+
+async def test_shapes_are_validated_before_anything_moves(client: AsyncClient):
+    far = {**CIRCLE, "center": [0.98, 0.0]}  # the arc leaves the workspace at x = 1.03
+    resp = await client.post("/shapes", json={"shapes": [CIRCLE, far], "plane": {"origin": ORIGIN}})
+    assert resp.status_code == 422 and "Safety violation" in resp.json()["detail"]
+    status = (await client.get("/status")).json()
+    assert status["flange_pose"][:3] == pytest.approx([0.0, 0.0, 0.0])
+
+    dense = {"kind": "raster", "corner": [0.0, 0.0], "width": 0.1, "height": 1.0,
+             "spacing": 0.001}
+    resp = await client.post("/shapes", json={"shapes": [dense], "plane": {"origin": ORIGIN}})
+    assert resp.status_code == 422 and "passes" in resp.json()["detail"]
+
+    resp = await client.post("/shapes", json={"shapes": [{"kind": "star"}]})
+    assert resp.status_code == 422
+
+
+async def test_shapes_check_every_edge_against_zones(client: AsyncClient):
+    # The fillet before the right-hand edge is an arc, so the edge is an L move after a C.
+    square = {"kind": "polyline", "points": [[0.25, -0.05], [0.35, -0.05], [0.35, 0.05],
+                                              [0.25, 0.05]], "corner_radius": 0.01,
+              "closed": True}
+    zones = [Zone("clamp", Sphere(center=(0.35, 0.0, 0.3), radius=0.005))]
+    _srv._manager._safety = SafetyValidator(SafetyConfig(zones=zones))
+    resp = await client.post("/shapes", json={"shapes": [square], "plane": {"origin": ORIGIN}})
+    assert resp.status_code == 422 and "clamp" in resp.json()["detail"]
+    status = (await client.get("/status")).json()
+    assert status["flange_pose"][:3] == pytest.approx([0.0, 0.0, 0.0])
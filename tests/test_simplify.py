@@ -0,0 +1,114 @@
+"""Tests for RDP waypoint simplification."""
+
+import math
+import os
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.models import MotionMode
+from bridge.sequence import Step
+from bridge.server import app
+from bridge.simplify import simplify_path, simplify_steps
+
+DOWN = [0.0, math.pi, 0.0]
+
+
+def _noisy_line(n=500, noise=0.0002, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.2, 0.4, n)
+    poses = np.column_stack([x, np.zeros(n), np.full(n, 0.3), np.tile(DOWN, (n, 1))])
+    poses[1:-1, :3] += rng.uniform(-noise, noise, size=(n - 2, 3))
+    return poses
+
+
+def test_collinear_points_collapse_to_endpoints():
+    result = simplify_path(_noisy_line(), tolerance=0.001)
+    assert result.keep.tolist() == [0, 499]
+    assert result.compression_ratio == 250
+    assert 0 < result.max_error <= 0.001
+
+
+def test_corners_are_kept_and_error_bounded():
+    square = [[0.2, 0.0, 0.3], [0.3, 0.0, 0.3], [0.3, 0.1, 0.3], [0.2, 0.1, 0.3]]
+    dense = np.concatenate([
+        np.linspace(a, b, 50, endpoint=False) for a, b in zip(square, square[1:])
+    ] + [np.array(square[-1:])])
+    poses = np.column_stack([dense, np.tile(DOWN, (len(dense), 1))])
+    result = simplify_path(poses, tolerance=0.0005)
+    assert poses[result.keep, :3] == pytest.approx(np.array(square))
+    assert result.max_error == pytest.approx(0.0, abs=1e-12)
+
+
+def test_circle_error_within_tolerance():
+    theta = np.linspace(0, 2 * np.pi, 2000)
+    poses = np.column_stack([0.3 + 0.05 * np.cos(theta), 0.05 * np.sin(theta),
+                             np.full_like(theta, 0.3), np.tile(DOWN, (len(theta), 1))])
+    for tolerance in (0.002, 0.0002):
+        result = simplify_path(poses, tolerance)
+        # A chord with sagitta tol spans 2*acos(1 - tol/r); RDP should be near that count.
+        optimal = 2 * np.pi / (2 * np.arccos(1 - tolerance / 0.05))
+        assert len(result.keep) <= 2 * optimal + 2
+        assert result.max_error <= tolerance
+
+
+def test_orientation_tolerance_keeps_twisting_points():
+    n = 100
+    poses = _noisy_line(n, noise=0.0)
+    poses[:, 5] = np.concatenate([np.zeros(n // 2), np.full(n - n // 2, 0.3)])  # yaw step
+    assert len(simplify_path(poses, 0.001, orientation_tolerance=None).keep) == 2
+    result = simplify_path(poses, 0.001, orientation_tolerance=0.01)
+    assert len(result.keep) > 2
+    assert result.max_orientation_error <= 0.01
+
+
+def test_simplify_steps_runs_and_anchor():
+    line = _noisy_line(20, noise=0.0).tolist()
+    steps = [Step(MotionMode.L, pose) for pose in line]
+    steps.insert(10, Step(MotionMode.J, [0.0] * 6))  # breaks the run
+    steps.append(Step(MotionMode.L, line[-1], speed_percent=50))  # different speed
+    out, report = simplify_steps(steps, 0.001, start_pose=line[0])
+    # Anchored at the start pose, the first run keeps only its end; after the joint move
+    # the pose is unknown so the second run keeps its first waypoint.
+    assert [s.mode for s in out] == [MotionMode.L, MotionMode.J, MotionMode.L, MotionMode.L,
+                                     MotionMode.L]
+    assert out[0].target == line[9] and out[2].target == line[10]
+    assert out[-1].speed_percent == 50
+    assert report["input_steps"] == 22 and report["output_steps"] == 5
+    assert report["compression_ratio"] == pytest.approx(4.4)
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+    _srv._manager = None
+
+
+async def test_sequence_endpoint_reports_simplification(client: AsyncClient):
+    steps = [{"mode": "L", "target": pose} for pose in _noisy_line(200).tolist()]
+    resp = await client.post("/move/sequence", json={"steps": steps, "simplify_tolerance": 0.001})
+    assert resp.status_code == 200
+    body = resp.json()
+    data = body["data"]
+    assert data["completed"] is True and data["steps"] == data["simplification"]["output_steps"]
+    assert data["simplification"]["input_steps"] == 200
+    assert data["simplification"]["compression_ratio"] >= 50
+    assert "simplified 200 to" in body["message"]
+    status = (await client.get("/status")).json()
+    assert status["flange_pose"][:3] == pytest.approx([0.4, 0.0, 0.3])
+
+
+async def test_simplified_path_still_safety_checked(client: AsyncClient):
+    steps = [{"mode": "L", "target": [0.3, 0.0, 0.3, *DOWN]},
+             {"mode": "L", "target": [0.3, 0.0, 1.5, *DOWN]}]
+    resp = await client.post("/move/sequence", json={"steps": steps, "simplify_tolerance": 0.01})
+    assert resp.status_code == 422
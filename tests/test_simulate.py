@@ -0,0 +1,136 @@
+"""Tests for the sequence dry run (bridge.simulate, POST /simulate)."""
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.estimator import peak_speed, ramp_time, trapezoid_time
+from bridge.kinematics import PIPER_MODEL, solve_position
+from bridge.server import app
+
+DOWN = [0.0, math.pi, 0.0]
+SEQUENCE = [
+    {"mode": "J", "target": [0.3, 0.2, 0.0, 0.0, 0.0, 0.0]},
+    {"mode": "P", "target": [0.3, 0.0, 0.3, *DOWN]},
+    {"mode": "L", "target": [0.3, 0.1, 0.3, *DOWN]},
+    {"mode": "L", "target": [0.2, 0.1, 0.3, *DOWN]},
+    {"mode": "L", "target": [0.2, 0.0, 0.3, *DOWN], "speed_percent": 50},
+    {"mode": "J", "target": [0.0] * 6},
+]
+
+
+@pytest.mark.parametrize("distance", [0.01, 0.2, 1.0])
+def test_ramp_time_and_peak_speed(distance):
+    speed, accel = 0.4, 1.2
+    assert 2 * ramp_time(distance / 2, speed, accel) == pytest.approx(
+        trapezoid_time(distance, speed, accel)
+    )
+    assert peak_speed(distance, speed, accel) == pytest.approx(
+        min(speed, math.sqrt(2 * accel * distance / 2))
+    )
+
+
+def test_solve_position_stays_near_seed():
+    seed = [0.1, 0.6, -0.8, 0.0, 0.5, 0.0]
+    target = PIPER_MODEL.points(seed)[0, -1] + [0.01, 0.0, -0.01]
+    q = solve_position(PIPER_MODEL, target, seed)
+    assert np.linalg.norm(PIPER_MODEL.points(q)[0, -1] - target) < 1e-4
+    assert np.abs(q - seed).max() < 0.1
+    assert solve_position(PIPER_MODEL, [2.0, 0.0, 0.0], seed) is None
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+    _srv._manager = None
+
+
+async def _simulate(client: AsyncClient, steps: list[dict], **params) -> dict:
+    resp = await client.post("/simulate", json={"steps": steps, **params})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def test_simulate_predicts_timeline_without_moving(client: AsyncClient):
+    start = time.monotonic()
+    body = await _simulate(client, SEQUENCE)
+    elapsed = time.monotonic() - start
+    data = body["data"]
+    assert body["ok"] is True and data["safe"] is True and data["violations"] == []
+    timeline = data["timeline"]
+    assert [e["mode"] for e in timeline] == ["J", "P", "L", "L", "L", "J"]
+    assert timeline[0]["start"] == 0.0
+    for prev, nxt in zip(timeline, timeline[1:]):
+        assert nxt["start"] == prev["end"]
+    assert data["cycle_time"] == timeline[-1]["end"] > 3 * elapsed
+    assert [e["speed_percent"] for e in timeline] == [80, 80, 80, 80, 50, 50]
+
+    # 0.3 rad at 80% of Piper's 3 rad/s, 6 rad/s^2 never reaches cruise speed.
+    assert timeline[0]["peak_joint_velocities"][:2] == pytest.approx([1.2, 0.8])
+    assert timeline[0]["peak_linear_velocity"] is None
+    assert all(e["peak_joint_velocities"] is not None for e in timeline)
+    assert timeline[2]["peak_linear_velocity"] == pytest.approx(
+        peak_speed(0.1, 0.5 * 0.8, 1.5 * 0.8), abs=1e-4
+    )
+    assert data["peak_joint_velocities"] == [
+        max(e["peak_joint_velocities"][k] for e in timeline) for k in range(6)
+    ]
+
+    status = (await client.get("/status")).json()
+    assert status["joint_angles"] == [0.0] * 6 and status["flange_pose"] == [0.0] * 6
+
+
+async def test_blending_shortens_predicted_cycle(client: AsyncClient):
+    stopped = (await _simulate(client, SEQUENCE))["data"]
+    blended = (await _simulate(client, SEQUENCE, blend_radius=0.02))["data"]
+    assert [e["blended"] for e in blended["timeline"]] == [False] * 3 + [True] + [False] * 2
+    assert blended["cycle_time"] < stopped["cycle_time"]
+
+
+async def test_all_violations_are_reported(client: AsyncClient):
+    steps = [
+        {"mode": "J", "target": [9.0, 0.0, 0.0, 0.0, 0.0, 0.0]},
+        {"mode": "J", "target": [0.2, 2.0, 2.5, 0.0, 0.0, 0.0]},
+        {"mode": "P", "target": [5.0, 0.0, 0.3, *DOWN]},
+    ]
+    body = await _simulate(client, steps, timeout=1.0)
+    assert body["ok"] is False and "3 safety violation(s)" in body["message"]
+    violations = body["data"]["violations"]
+    assert [(v["step"], v["check"]) for v in violations] == [(0, "move"), (1, "move"),
+                                                             (2, "move")]
+    assert "out of range" in violations[0]["error"]
+    assert "Self-collision" in violations[1]["error"]
+    assert "outside workspace" in violations[2]["error"]
+    assert [e["exceeds_timeout"] for e in body["data"]["timeline"]] == [True, True, True]
+
+    resp = await client.post("/move/sequence", json={"steps": steps})
+    assert resp.status_code == 422  # the real run stops at the first violation
+
+
+async def test_simulate_without_connected_arm(client: AsyncClient):
+    await client.post("/disconnect")
+    _srv._manager = None
+    resp = await client.post("/simulate", json={"steps": SEQUENCE})
+    assert resp.status_code == 400
+
+    steps = [{"mode": "J", "target": [0.2] + [0.0] * 6}]
+    body = await _simulate(client, steps, robot="nero")
+    assert body["data"]["robot"] == "nero"
+    assert len(body["data"]["peak_joint_velocities"]) == 7
+
+    resp = await client.post(
+        "/simulate", json={"steps": steps, "robot": "nero", "start_joints": [0.0] * 6}
+    )
+    assert resp.status_code == 422 and "start_joints has 6 values" in resp.json()["detail"]
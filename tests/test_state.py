@@ -0,0 +1,111 @@
+"""Tests for the JointState / Pose value types and where they turn into plain lists."""
+
+import json
+import pickle
+import struct
+from collections.abc import Sequence
+
+import can
+import msgpack
+import numpy as np
+import pytest
+
+from bridge import codec
+from bridge.drivers import can_protocol as proto
+from bridge.drivers.can_driver import FeedbackCache, FeedbackListener
+from bridge.drivers.mock_driver import MockArmDriver
+from bridge.models import ResultResponse, StatusResponse
+from bridge.state import JointState, Pose, jsonable, plain
+
+
+def test_values_behave_like_a_read_only_sequence():
+    joints = JointState([0.1, -0.2, 0.3])
+    assert isinstance(joints, Sequence)
+    assert len(joints) == 3 and joints[1] == -0.2 and joints[-1] == 0.3
+    assert list(joints) == joints.tolist() == [0.1, -0.2, 0.3]
+    assert -0.2 in joints and joints.index(0.3) == 2 and joints.count(0.1) == 1
+    assert list(reversed(joints)) == [0.3, -0.2, 0.1]
+    assert joints == [0.1, -0.2, 0.3] and joints == (0.1, -0.2, 0.3)
+    assert joints == JointState([0.1, -0.2, 0.3]) and joints != JointState([0.1])
+    assert joints == pytest.approx([0.1, -0.2, 0.3])
+    assert {"joints": joints} == pytest.approx({"joints": [0.1, -0.2, 0.3]})
+    assert repr(joints) == "JointState([0.1, -0.2, 0.3])"
+    with pytest.raises(TypeError):
+        joints[0] = 1.0
+    with pytest.raises(AttributeError):
+        joints.extra = 1
+
+
+def test_slicing_and_concatenation_act_like_a_tuple():
+    joints, pose = JointState([0.1, -0.2]), Pose([0.3, 0.0, 0.2, 0.0, 1.57, 0.0])
+    assert pose[:3] == (0.3, 0.0, 0.2) and type(pose[:3]) is tuple
+    assert joints[::-1] == (-0.2, 0.1)
+    assert joints + [1.0] == [0.1, -0.2, 1.0] and [1.0] + joints == [1.0, 0.1, -0.2]
+    assert joints + (1.0,) == (0.1, -0.2, 1.0) and (1.0,) + joints == (1.0, 0.1, -0.2)
+    assert type(joints + pose) is tuple and len(joints + pose) == 8
+    assert [*pose[:3], *joints] == [0.3, 0.0, 0.2, 0.1, -0.2]
+    with pytest.raises(TypeError):
+        joints + 1.0
+
+
+def test_numpy_reads_the_buffer_in_place():
+    pose = Pose([0.3, 0.0, 0.2, 0.0, 1.57, 0.0])
+    view = pose.view()
+    assert view.dtype == float and view.tolist() == pose.tolist()
+    assert np.shares_memory(view, pose.view())
+    assert np.asarray(pose).tolist() == pose.tolist()  # as a sequence, copied
+    with pytest.raises(ValueError):
+        view[0] = 1.0
+
+
+def test_bytes_and_pickle_round_trip():
+    joints = JointState([0.5, -1.25])
+    assert joints.tobytes() == struct.pack("<2d", 0.5, -1.25)
+    assert JointState.frombytes(joints.tobytes()) == joints
+    copy = pickle.loads(pickle.dumps(joints))
+    assert type(copy) is JointState and copy == joints
+
+
+def test_converted_to_lists_at_the_edges():
+    joints, pose = JointState([0.1, 0.2]), Pose([0.3] * 6)
+    report = {"joint_angles": joints, "steps": [{"flange_pose": pose}], "ok": True}
+    assert plain(report) == {"joint_angles": [0.1, 0.2], "steps": [{"flange_pose": [0.3] * 6}],
+                             "ok": True}
+    assert json.loads(json.dumps(report, default=jsonable)) == plain(report)
+    assert msgpack.unpackb(msgpack.packb(report, default=jsonable)) == plain(report)
+
+    status = StatusResponse(connected=True, enabled=True, joint_angles=[0.1, 0.2],
+                            flange_pose=pose)
+    assert isinstance(status.joint_angles, JointState) and status.flange_pose is pose
+    assert json.loads(status.model_dump_json())["joint_angles"] == [0.1, 0.2]
+    result = ResultResponse(ok=True, message="done", data=report)
+    assert json.loads(result.model_dump_json())["data"] == plain(report)
+    assert codec.pack_floats(joints) == codec.pack_floats([0.1, 0.2])
+
+
+def test_mock_driver_shares_one_snapshot_until_the_arm_moves():
+    driver = MockArmDriver()
+    driver.connect("piper", "can0", "socketcan")
+    first = driver.get_joint_angles()
+    assert isinstance(first, JointState) and driver.get_joint_angles() is first
+    assert isinstance(driver.get_flange_pose(), Pose)
+    driver.move_j([0.1] * 6)
+    assert driver.get_joint_angles() == pytest.approx([0.1] * 6)
+    assert first == [0.0] * 6  # a reader's earlier snapshot does not change
+
+
+def test_can_feedback_cache_rebuilds_after_new_frames():
+    cache = FeedbackCache(dof=2)
+    listener = FeedbackListener(cache)
+
+    def feedback(joints):
+        for fid, data in proto.joint_frames(joints, proto.ID_JOINT_FEEDBACK):
+            listener.on_message_received(can.Message(arbitration_id=fid, data=data))
+
+    assert cache.joint_angles() is None
+    feedback([0.1, 0.2])
+    first = cache.joint_angles()
+    assert first == pytest.approx([0.1, 0.2], abs=1e-4) and cache.joint_angles() is first
+    feedback([0.3, 0.2])
+    assert cache.joint_angles() == pytest.approx([0.3, 0.2], abs=1e-4)
+    assert first == pytest.approx([0.1, 0.2], abs=1e-4)
@@ -0,0 +1,186 @@
+"""Tests for the feedback staleness watchdog (bridge.watchdog)."""
+
+import math
+import os
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+import bridge.server as _srv
+from bridge import arm_manager
+from bridge.drivers.base import FeedbackClock, Freshness
+from bridge.drivers.mock_driver import MockArmDriver
+from bridge.server import app
+from bridge.watchdog import ArmDegradedError, FeedbackWatchdog
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_feedback_clock_ages_from_the_last_change():
+    clock = FeedbackClock()
+    assert clock.age(None) == math.inf
+    assert clock.age(1000.0) < 0.01  # the clock base of the stamp does not matter
+    time.sleep(0.05)
+    assert clock.age(1000.0) >= 0.05
+    assert clock.age(1000.5) < 0.01
+
+
+def test_reconnects_with_exponential_backoff():
+    state = {"age": 0.0, "fail": 3}
+    attempts = []
+
+    def reconnect():
+        attempts.append(time.monotonic())
+        if state["fail"]:
+            state["fail"] -= 1
+            raise RuntimeError("no response")
+        state["age"] = 0.0
+
+    dog = FeedbackWatchdog(lambda: Freshness(state["age"]), reconnect, stale_after=0.05,
+                           interval=0.005, backoff=0.02, max_backoff=0.05)
+    dog.start()
+    try:
+        state["age"] = 1.0
+        _wait_for(lambda: dog.degraded)
+        with pytest.raises(ArmDegradedError, match="stale"):
+            dog.check()
+        _wait_for(lambda: not dog.degraded)
+    finally:
+        dog.stop()
+
+    gaps = [b - a for a, b in zip(attempts, attempts[1:])]
+    assert len(attempts) == 4
+    assert gaps[0] >= 0.02 and gaps[1] >= 0.04 and gaps[2] >= 0.05  # capped at max_backoff
+    snap = dog.snapshot()
+    assert snap["state"] == "ok" and snap["stale_events"] == 1 and snap["recoveries"] == 1
+    assert snap["reconnect_attempts"] == 4 and snap["last_error"] == "no response"
+    assert snap["last_recovery_s"] >= sum(gaps) - 0.001  # rounded to ms
+    dog.check()
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setenv("CLAWARM_FEEDBACK_TIMEOUT", "0.1")
+    monkeypatch.setenv("CLAWARM_RECONNECT_MAX_BACKOFF", "0.2")
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(MockArmDriver, "_link_down", (0.0, 0.0))
+    _srv._manager = None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.post("/connect", json={"robot": "piper"})
+        yield c
+        await c.post("/disconnect")
+    _srv._manager = None
+
+
+async def _watchdog(client: AsyncClient) -> dict:
+    return (await client.get("/metrics")).json()["watchdog"]
+
+
+async def _until(client: AsyncClient, state: str) -> dict:
+    deadline = time.monotonic() + 5.0
+    while (snap := await _watchdog(client))["state"] != state:
+        assert time.monotonic() < deadline, snap
+        time.sleep(0.01)
+    return snap
+
+
+async def test_link_loss_rejects_moves_and_recovers(client: AsyncClient):
+    assert (await _watchdog(client))["state"] == "ok"
+    MockArmDriver.drop_link(0.6)
+    await _until(client, "degraded")
+
+    start = time.monotonic()
+    resp = await client.post("/move", json={"mode": "J", "target": [0.1] + [0.0] * 5})
+    assert time.monotonic() - start < 0.1
+    assert resp.status_code == 503 and "stale" in resp.json()["detail"]
+    assert int(resp.headers["Retry-After"]) >= 1
+    resp = await client.post("/move/sequence", json={"steps": [{"mode": "J",
+                                                                "target": [0.0] * 6}]})
+    assert resp.status_code == 503
+
+    snap = await _until(client, "ok")
+    assert snap["stale_events"] == 1 and snap["recoveries"] == 1
+    assert snap["reconnect_attempts"] >= 2  # connect fails while the link is down
+    assert 0.4 <= snap["last_recovery_s"] < 2.0
+    status = (await client.get("/status")).json()
+    assert status["connected"] and not status["enabled"] and status["needs_enable"]
+    resp = await client.post("/move", json={"mode": "J", "target": [0.1] + [0.0] * 5})
+    assert resp.status_code == 500 and "not enabled" in resp.json()["detail"]
+    assert (await client.post("/enable")).status_code == 200
+    assert not (await client.get("/status")).json()["needs_enable"]
+    resp = await client.post("/move", json={"mode": "J", "target": [0.1] + [0.0] * 5})
+    assert resp.status_code == 200
+
+
+async def test_reconnect_enables_again_only_when_configured(monkeypatch, client: AsyncClient):
+    await client.post("/disconnect")
+    monkeypatch.setenv("CLAWARM_RECONNECT_ENABLE", "true")
+    _srv._manager = None
+    await client.post("/connect", json={"robot": "piper"})
+    MockArmDriver.drop_link(0.2)
+    await _until(client, "degraded")
+    await _until(client, "ok")
+    status = (await client.get("/status")).json()
+    assert status["connected"] and status["enabled"] and not status["needs_enable"]
+
+
+async def test_reconnect_keeps_the_arm_disabled_after_a_stop(client: AsyncClient):
+    await client.post("/stop", json={"action": "emergency_stop"})
+    MockArmDriver.drop_link(0.2)
+    await _until(client, "degraded")
+    await _until(client, "ok")
+    status = (await client.get("/status")).json()
+    assert status["connected"] and not status["enabled"] and not status["needs_enable"]
+
+
+async def test_in_flight_wait_gives_up_when_feedback_goes_stale(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(MockArmDriver, "_link_down", (0.0, 0.0))
+    monkeypatch.setattr(arm_manager, "_create_driver", lambda: MockArmDriver(realtime=True))
+    mgr = arm_manager.ArmManager(feedback_timeout=0.1)
+    mgr.connect(arm_manager.RobotType.PIPER)
+    try:
+        mgr.set_speed(10)  # 1.2 rad at 0.15 rad/s: an 8 s move
+        motion = mgr.move(arm_manager.MotionMode.J, [1.2] + [0.0] * 5, wait=False)
+        MockArmDriver.drop_link(0.3)
+        start = time.monotonic()
+        settled = mgr.wait_motion(motion["motion_id"], timeout=5.0)
+        assert time.monotonic() - start < 1.0
+        assert settled["state"] in ("failed", "stopped")
+    finally:
+        mgr.disconnect()
+
+
+def test_reconnect_waits_for_commands_and_reopens_like_connect(monkeypatch):
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(MockArmDriver, "_link_down", (0.0, 0.0))
+    opened, monitors = [], []
+    open_ = arm_manager.ArmManager._open
+    monkeypatch.setattr(arm_manager.ArmManager, "_open",
+                        lambda self, adaptive, enable=True: opened.append(adaptive)
+                        or open_(self, adaptive, enable))
+    monkeypatch.setattr(arm_manager.ArmManager, "_start_can_monitor",
+                        lambda self, channel, interface: monitors.append(channel))
+    mgr = arm_manager.ArmManager(can_monitor=True, feedback_timeout=0.1)
+    mgr.connect(arm_manager.RobotType.PIPER, "can1")
+    try:
+        first = mgr._driver
+        with mgr._lock:  # a command being sent
+            MockArmDriver.drop_link(0.3)
+            _wait_for(lambda: mgr.degraded)
+            time.sleep(0.3)  # the link is back, but the swap waits for the lock
+            assert mgr._driver is first
+        _wait_for(lambda: not mgr.degraded)
+        assert mgr._driver is not first
+        assert opened[0] is False and set(opened) == {False}
+        assert monitors == ["can1"] * (1 + mgr.metrics()["watchdog"]["reconnect_attempts"])
+    finally:
+        mgr.disconnect()
@@ -0,0 +1,291 @@
+"""Tests for keep-out / keep-in zones and their AABB tree."""
+
+import json
+import math
+import os
+import random
+
+import pytest
+
+os.environ["CLAWARM_MOCK"] = "true"
+
+from bridge.arm_manager import ArmManager
+from bridge.models import MotionMode, RobotType
+from bridge.safety import SafetyConfig, SafetyError, SafetyValidator, arc_points
+from bridge.zones import (
+    Box,
+    Cylinder,
+    Sphere,
+    Zone,
+    ZoneKind,
+    ZoneSet,
+    ZoneTree,
+    load_zones,
+    zone_from_dict,
+)
+
+POSE_TAIL = [0.0, 3.14, 0.0]
+
+
+def _pose(x, y, z):
+    return [x, y, z, *POSE_TAIL]
+
+
+@pytest.fixture
+def validator():
+    zones = [
+        Zone("fixture", Box(min=(0.2, -0.05, 0.0), max=(0.3, 0.05, 0.2))),
+        Zone("camera", Sphere(center=(0.0, 0.4, 0.4), radius=0.02)),
+        Zone("post", Cylinder(center=(-0.3, 0.0), radius=0.04, z_min=0.0, z_max=0.6)),
+    ]
+    return SafetyValidator(SafetyConfig(zones=zones))
+
+
+# --- Shapes ---
+
+
+def test_shape_containment():
+    assert Box((0, 0, 0), (1, 1, 1)).contains((0.5, 0.5, 1.0))
+    assert not Box((0, 0, 0), (1, 1, 1)).contains((0.5, 1.1, 0.5))
+    assert Sphere((0, 0, 0), 0.1).contains((0.06, 0.06, 0.0))
+    assert not Sphere((0, 0, 0), 0.1).contains((0.08, 0.08, 0.0))
+    cyl = Cylinder((0, 0), 0.1, 0.0, 0.5)
+    assert cyl.contains((0.05, 0.05, 0.25))
+    assert not cyl.contains((0.05, 0.05, 0.6))
+
+
+def test_segment_intersection_misses_corners():
+    # Passes through the sphere's and cylinder's bounding boxes but not the shapes.
+    assert not Sphere((0, 0, 0), 0.1).intersects_segment((0.09, -0.2, 0.09), (0.09, 0.2, 0.09))
+    cyl = Cylinder((0, 0), 0.1, 0.0, 0.5)
+    assert not cyl.intersects_segment((0.09, -0.2, 0.2), (0.2, 0.09, 0.2))
+    assert cyl.intersects_segment((-0.2, 0.0, 0.7), (0.2, 0.0, 0.3))
+    assert not cyl.intersects_segment((-0.2, 0.0, 0.9), (0.2, 0.0, 0.6))
+    assert Box((0, 0, 0), (1, 1, 1)).intersects_segment((-1, 0.5, 0.5), (2, 0.5, 0.5))
+
+
+def test_tree_matches_linear_scan():
+    rng = random.Random(7)
+    zones = [
+        Zone(f"s{i}", Sphere(tuple(rng.uniform(-1, 1) for _ in range(3)), rng.uniform(0.01, 0.1)))
+        for i in range(300)
+    ]
+    tree = ZoneTree(zones)
+    for _ in range(200):
+        p = tuple(rng.uniform(-1, 1) for _ in range(3))
+        q = tuple(rng.uniform(-1, 1) for _ in range(3))
+        assert {z.name for z in tree.query_point(p)} == {
+            z.name for z in zones if z.shape.contains(p)
+        }
+        assert {z.name for z in tree.query_segment(p, q)} == {
+            z.name for z in zones if z.shape.intersects_segment(p, q)
+        }
+
+
+def test_empty_tree():
+    assert ZoneTree([]).query_point((0, 0, 0)) == []
+    assert not ZoneSet([])
+
+
+# --- Keep-in ---
+
+
+def test_keep_in_segment_across_overlapping_zones():
+    zones = ZoneSet([
+        Zone("left", Box((0.0, -0.1, 0.0), (0.3, 0.1, 0.5)), ZoneKind.KEEP_IN),
+        Zone("right", Box((0.2, -0.1, 0.0), (0.5, 0.1, 0.5)), ZoneKind.KEEP_IN),
+        Zone("far", Box((0.6, -0.1, 0.0), (0.9, 0.1, 0.5)), ZoneKind.KEEP_IN),
+    ])
+    assert zones.point_violation((0.1, 0.0, 0.2)) is None
+    assert zones.point_violation((0.55, 0.0, 0.2)) == "outside every keep-in zone"
+    assert zones.segment_violation((0.1, 0.0, 0.2), (0.4, 0.0, 0.2)) is None
+    assert zones.segment_violation((0.1, 0.0, 0.2), (0.7, 0.0, 0.2)) == "leaves every keep-in zone"
+
+
+# --- Safety integration ---
+
+
+def test_segment_checks_zones_by_identity_not_name():
+    left = Zone("zone", Box((0.0, 0.0, 0.0), (0.1, 0.1, 0.1)), ZoneKind.KEEP_IN)
+    right = Zone("zone", Box((0.2, 0.0, 0.0), (0.3, 0.1, 0.1)), ZoneKind.KEEP_IN)
+    assert ZoneSet([left, right]).segment_violation((0.05, 0.05, 0.05), (0.25, 0.05, 0.05))
+
+    here = Zone("zone", Box((0.0, 0.0, 0.0), (0.1, 0.1, 0.1)))
+    beyond = Zone("zone", Box((0.2, 0.0, 0.0), (0.3, 0.1, 0.1)))
+    violation = ZoneSet([here, beyond]).segment_violation(
+        (0.05, 0.05, 0.05), (0.4, 0.05, 0.05), leaving=True
+    )
+    assert violation == "crosses keep-out zone 'zone'"
+
+
+def test_point_in_keep_out_rejected(validator: SafetyValidator):
+    with pytest.raises(SafetyError, match="keep-out zone 'fixture'"):
+        validator.validate_cartesian_move(_pose(0.25, 0.0, 0.1))
+    validator.validate_cartesian_move(_pose(0.25, 0.0, 0.3))
+
+
+def test_segment_through_keep_out_rejected(validator: SafetyValidator):
+    with pytest.raises(SafetyError, match="crosses keep-out zone 'fixture'"):
+        validator.validate_cartesian_segment(_pose(0.15, 0.0, 0.1), _pose(0.35, 0.0, 0.1))
+    validator.validate_cartesian_segment(_pose(0.15, 0.0, 0.3), _pose(0.35, 0.0, 0.3))
+
+
+def test_linear_move_checked_from_start(validator: SafetyValidator):
+    with pytest.raises(SafetyError, match="post"):
+        validator.validate_move(
+            RobotType.PIPER, MotionMode.L, _pose(-0.4, 0.0, 0.3), start=_pose(-0.2, 0.0, 0.3)
+        )
+    # A point-to-point move only reaches the target, so only the target is checked.
+    validator.validate_move(
+        RobotType.PIPER, MotionMode.P, _pose(-0.4, 0.0, 0.3), start=_pose(-0.2, 0.0, 0.3)
+    )
+
+
+def test_linear_move_may_leave_where_it_starts(validator: SafetyValidator):
+    outside_box, inside_fixture = _pose(1.05, 0.0, 0.3), _pose(0.25, 0.0, 0.1)
+    validator.validate_move(RobotType.PIPER, MotionMode.L, _pose(0.2, 0.0, 0.3),
+                            start=outside_box)
+    validator.validate_move(RobotType.PIPER, MotionMode.L, _pose(0.25, 0.0, 0.3),
+                            start=inside_fixture)
+    with pytest.raises(SafetyError, match="keep-out zone 'fixture'"):  # the target still counts
+        validator.validate_move(RobotType.PIPER, MotionMode.L, _pose(0.26, 0.0, 0.1),
+                                start=_pose(0.25, 0.0, 0.3))
+
+    keep_in = ZoneSet([Zone("cell", Box((0.0, -0.2, 0.0), (0.4, 0.2, 0.5)), ZoneKind.KEEP_IN)])
+    assert keep_in.segment_violation((0.6, 0.0, 0.2), (0.2, 0.0, 0.2), leaving=True) is None
+    assert keep_in.segment_violation((0.6, 0.0, 0.2), (0.2, 0.0, 0.2)) is not None
+    assert keep_in.segment_violation(
+        (0.6, 0.0, 0.2), (-0.2, 0.0, 0.2), leaving=True
+    ) == "leaves every keep-in zone"
+
+
+def test_arc_through_keep_out_rejected(validator: SafetyValidator):
+    # Start, mid and end are all clear; the arc between them passes through the camera.
+    with pytest.raises(SafetyError, match="camera"):
+        validator.validate_move(
+            RobotType.PIPER, MotionMode.C,
+            _pose(-0.1, 0.3, 0.4), _pose(-0.0707, 0.3707, 0.4), _pose(0.1, 0.3, 0.4),
+        )
+    validator.validate_move(
+        RobotType.PIPER, MotionMode.C,
+        _pose(-0.1, 0.3, 0.4), _pose(0.0, 0.2, 0.4), _pose(0.1, 0.3, 0.4),
+    )
+
+
+def test_arc_points_lie_on_circle():
+    points = arc_points([1, 0, 0], [0, 1, 0], [-1, 0, 0], segments=8)
+    assert all(math.isclose(math.hypot(p[0], p[1]), 1.0) for p in points)
+    assert all(p[1] >= -1e-9 for p in points)  # passes through mid, not the other half
+    assert points[0] == pytest.approx([1, 0, 0]) and points[-1] == pytest.approx([-1, 0, 0])
+
+
+def test_blended_corner_checked_against_zones():
+    # The small sphere sits inside the cut corner: clear of both segments and the chord.
+    zones = [Zone("bolt", Sphere(center=(0.29, 0.01, 0.3), radius=0.005))]
+    v = SafetyValidator(SafetyConfig(zones=zones))
+    path = [_pose(0.0, 0.0, 0.3), _pose(0.3, 0.0, 0.3), _pose(0.3, 0.3, 0.3)]
+    v.validate_cartesian_path(path)
+    with pytest.raises(SafetyError, match="bolt"):
+        v.validate_cartesian_path(path, blend_radius=0.05)
+
+
+def test_zones_ignored_when_safety_disabled():
+    zones = [Zone("all", Box((-1, -1, -1), (1, 1, 1)))]
+    SafetyValidator(SafetyConfig(enabled=False, zones=zones)).validate_cartesian_move(
+        _pose(0.0, 0.0, 0.3)
+    )
+
+
+def test_manager_checks_linear_path_from_current_pose(monkeypatch):
+    from bridge import arm_manager
+
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(arm_manager, "POST_MOVE_DELAY", 0)
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    pose = mgr.get_status()["flange_pose"]
+    ahead = [pose[0] + 0.2, *pose[1:]]
+    mid = [(a + b) / 2 for a, b in zip(pose[:3], ahead[:3])]
+    zones = [Zone("block", Sphere(center=tuple(mid), radius=0.02))]
+    mgr._safety = SafetyValidator(SafetyConfig(zones=zones))
+    with pytest.raises(SafetyError, match="block"):
+        mgr.move(MotionMode.L, ahead, wait=False)
+    mgr.move(MotionMode.P, ahead, wait=False)
+    mgr.disconnect()
+
+
+def test_sequence_may_leave_the_pose_it_starts_in(monkeypatch):
+    from bridge import arm_manager
+    from bridge.models import MoveStep
+
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(arm_manager, "POST_MOVE_DELAY", 0)
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    x, y, z = mgr.get_status()["flange_pose"][:3]
+    zones = [Zone("stand", Box((x - 0.05, y - 0.05, z - 0.05), (x + 0.05, y + 0.05, z + 0.05)))]
+    mgr._safety = SafetyValidator(SafetyConfig(zones=zones))
+    out = [MoveStep(mode=MotionMode.L, target=_pose(0.2, 0.0, 0.3)),
+           MoveStep(mode=MotionMode.L, target=_pose(0.3, 0.0, 0.3))]
+    mgr.move_sequence(out)  # starts inside the zone, like a single move may
+    assert mgr.get_status()["flange_pose"][:3] == pytest.approx([0.3, 0.0, 0.3])
+    back = [MoveStep(mode=MotionMode.L, target=_pose(0.2, 0.0, 0.3)),
+            MoveStep(mode=MotionMode.L, target=_pose(x + 0.1, y, z))]
+    with pytest.raises(SafetyError, match="stand"):  # but may not come back through it
+        mgr.move_sequence([*back, MoveStep(mode=MotionMode.L, target=_pose(x - 0.1, y, z))])
+    mgr.disconnect()
+
+
+def test_sequence_checks_linear_entry_after_other_modes(monkeypatch):
+    from bridge import arm_manager
+    from bridge.models import MoveStep
+
+    monkeypatch.setattr(arm_manager, "MODE_SWITCH_DELAY", 0)
+    monkeypatch.setattr(arm_manager, "POST_MOVE_DELAY", 0)
+    mgr = ArmManager()
+    mgr.connect(RobotType.PIPER)
+    a, b = _pose(0.3, 0.1, 0.3), _pose(0.3, -0.1, 0.3)
+    zones = [Zone("block", Sphere(center=(0.3, 0.0, 0.3), radius=0.02))]
+    mgr._safety = SafetyValidator(SafetyConfig(zones=zones))
+    with pytest.raises(SafetyError, match="block"):
+        mgr.move_sequence([MoveStep(mode=MotionMode.P, target=a),
+                           MoveStep(mode=MotionMode.L, target=b)])
+    arc = MoveStep(mode=MotionMode.C, target=b, mid_point=_pose(0.35, -0.15, 0.3),
+                   end_point=_pose(0.3, -0.2, 0.3))
+    with pytest.raises(SafetyError, match="block"):
+        mgr.move_sequence([MoveStep(mode=MotionMode.P, target=a), arc])
+    mgr.move_sequence([MoveStep(mode=MotionMode.P, target=a),
+                       MoveStep(mode=MotionMode.L, target=_pose(0.4, 0.1, 0.3))])
+    mgr.disconnect()
+
+
+# --- Loading ---
+
+
+def test_load_zones(tmp_path):
+    path = tmp_path / "zones.json"
+    path.write_text(json.dumps({"zones": [
+        {"name": "table", "box": {"min": [-1, -1, -0.1], "max": [1, 1, 0.0]}},
+        {"name": "cell", "kind": "keep_in", "sphere": {"center": [0, 0, 0.3], "radius": 0.8}},
+        {"name": "post", "cylinder": {"center": [0.4, 0], "radius": 0.03,
+                                      "z_min": 0, "z_max": 1}},
+    ]}))
+    zones = load_zones(path)
+    assert [z.name for z in zones] == ["table", "cell", "post"]
+    assert zones[1].kind == ZoneKind.KEEP_IN
+    assert isinstance(zones[2].shape, Cylinder)
+
+
+def test_load_zones_rejects_duplicate_names(tmp_path):
+    path = tmp_path / "zones.json"
+    path.write_text(json.dumps([
+        {"box": {"min": [0, 0, 0], "max": [0.1, 0.1, 0.1]}},
+        {"box": {"min": [0.2, 0, 0], "max": [0.3, 0.1, 0.1]}},
+    ]))
+    with pytest.raises(ValueError, match="Duplicate zone name 'zone'"):
+        load_zones(path)
+
+
+def test_zone_without_shape_rejected():
+    with pytest.raises(ValueError, match="needs one of"):
+        zone_from_dict({"name": "nothing"})